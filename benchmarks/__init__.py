@@ -0,0 +1 @@
+"""Benchmarks for the NetConfigAPI hot path."""
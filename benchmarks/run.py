@@ -0,0 +1,338 @@
+"""Micro-benchmarks and an in-process load generator for the API hot path.
+
+Run with ``invoke bench`` or ``python -m benchmarks.run --help``. Results are
+written as JSON so runs from different commits can be compared with
+``--baseline``.
+"""
+
+import argparse
+import asyncio
+import ipaddress
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from netconfig_api.api.responses import ModelResponse
+from netconfig_api.inventory.index import InventoryIndex
+from netconfig_api.inventory.selectors import parse_selector
+from netconfig_api.main import app
+from netconfig_api.models.requests import (
+    BatchHostnameResponse,
+    Device,
+    HostnameRequest,
+    HostnameResponse,
+)
+from netconfig_api.services.network_config import NetworkConfigService
+from netconfig_api.utils.device_platforms import (
+    HOSTNAME_OPERATION,
+    get_command_template,
+    get_hostname_command_template,
+)
+
+REQUEST_PAYLOAD = {
+    "name": "bench-rtr",
+    "device": "192.168.1.1",
+    "platform": "cisco_ios"
+}
+
+
+def _device(index: int) -> str:
+    """Return a distinct device address for each index."""
+    return str(ipaddress.IPv4Address(0x0A000000 + index + 1))
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of a list of samples.
+
+    Args:
+        samples: Measured values
+        fraction: Percentile as a fraction, e.g. 0.95
+
+    Returns:
+        The sample at the requested rank, or 0.0 if there are no samples
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples_us: list[float]) -> dict[str, float]:
+    """Summarize per-call timings in microseconds."""
+    return {
+        "iterations": len(samples_us),
+        "mean_us": statistics.fmean(samples_us),
+        "min_us": min(samples_us),
+        "p50_us": percentile(samples_us, 0.50),
+        "p99_us": percentile(samples_us, 0.99),
+    }
+
+
+def bench_sync(func: Callable[[], object], iterations: int, repeat: int = 5) -> dict[str, float]:
+    """Time a synchronous callable, reporting per-call statistics.
+
+    Each of ``repeat`` rounds runs ``iterations`` calls; statistics are over
+    the per-call mean of each round, which smooths out timer resolution.
+    """
+    rounds = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        rounds.append((time.perf_counter() - started) / iterations * 1e6)
+    result = summarize(rounds)
+    result["iterations"] = iterations * repeat
+    return result
+
+
+async def bench_async(
+    func: Callable[[int], Awaitable[object]],
+    iterations: int
+) -> dict[str, float]:
+    """Time an async callable sequentially, one sample per call."""
+    samples = []
+    for index in range(iterations):
+        started = time.perf_counter()
+        await func(index)
+        samples.append((time.perf_counter() - started) * 1e6)
+    return summarize(samples)
+
+
+def _batch_response(size: int) -> BatchHostnameResponse:
+    """Build a batch response with ``size`` results for serialization benchmarks."""
+    results = [
+        HostnameResponse(
+            success=True,
+            message=f"Hostname 'bench-rtr' configured successfully on {_device(index)}",
+            device=_device(index),
+            hostname="bench-rtr"
+        )
+        for index in range(size)
+    ]
+    return BatchHostnameResponse(
+        results=results,
+        total=size,
+        succeeded=size,
+        failed=0,
+        elapsed_ms=1.0,
+        mean_device_ms=1.0,
+        max_device_ms=1.0
+    )
+
+
+def _inventory(size: int) -> InventoryIndex:
+    """Build an inventory index of ``size`` devices spread over 10 sites and 3 roles."""
+    platforms = ("cisco_ios", "juniper_junos", "arista_eos")
+    roles = ("leaf", "spine", "border")
+    index = InventoryIndex()
+    index.load(
+        Device.model_construct(
+            ip=ipaddress.IPv4Address(_device(i)),
+            platform=platforms[i % 3],
+            hostname=f"rtr{i}",
+            site=f"dc{i % 10}",
+            role=roles[i % 7 % 3]
+        )
+        for i in range(size)
+    )
+    return index
+
+
+async def run_micro(iterations: int, inventory_size: int = 100_000) -> dict[str, dict[str, float]]:
+    """Run micro-benchmarks of the individual hot-path stages."""
+    service = NetworkConfigService(state_ttl=0.0)
+    single = _batch_response(1).results[0]
+    batch = _batch_response(1000)
+    batch_iterations = max(1, iterations // 1000)
+    inventory = _inventory(inventory_size)
+    selector = parse_selector("site=dc1 AND role=leaf")
+    select_iterations = max(1, iterations // 100)
+
+    async def configure(index: int) -> object:
+        request = HostnameRequest(name="bench-rtr", device=_device(index), platform="cisco_ios")
+        return await service.configure_hostname(request)
+
+    return {
+        "hostname_request_validation": bench_sync(
+            lambda: HostnameRequest.model_validate(REQUEST_PAYLOAD),
+            iterations
+        ),
+        "get_hostname_command_template": bench_sync(
+            lambda: get_hostname_command_template("juniper_junos"),
+            iterations
+        ),
+        "get_command_template": bench_sync(
+            lambda: get_command_template("juniper_junos", HOSTNAME_OPERATION),
+            iterations
+        ),
+        "configure_hostname": await bench_async(configure, iterations),
+        # FastAPI's default path: jsonable_encoder, then stdlib json
+        "serialize_response_default": bench_sync(
+            lambda: JSONResponse(jsonable_encoder(single)),
+            iterations
+        ),
+        "serialize_response_fast": bench_sync(lambda: ModelResponse(single), iterations),
+        "serialize_batch_1000_default": bench_sync(
+            lambda: JSONResponse(jsonable_encoder(batch)),
+            batch_iterations
+        ),
+        "serialize_batch_1000_fast": bench_sync(
+            lambda: ModelResponse(batch),
+            batch_iterations
+        ),
+        # Resolving a selector to a device bitmap, then materializing the devices
+        "inventory_resolve_selector": bench_sync(
+            lambda: selector.evaluate(inventory),
+            iterations
+        ),
+        "inventory_select_devices": bench_sync(
+            lambda: inventory.select(selector),
+            select_iterations
+        ),
+    }
+
+
+async def run_load(
+    target: FastAPI,
+    requests: int,
+    concurrency: int,
+    path: str = "/api/v1/hostname"
+) -> dict[str, float]:
+    """Drive the ASGI app in-process and report latency percentiles and throughput.
+
+    Args:
+        target: ASGI application under test
+        requests: Total number of requests to send
+        concurrency: Number of concurrent clients
+        path: Route to POST to
+
+    Returns:
+        Latency percentiles in milliseconds, requests per second and error count
+    """
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    transport = httpx.ASGITransport(app=target)  # type: ignore[arg-type]
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            nonlocal errors
+            for index in counter:
+                payload = {**REQUEST_PAYLOAD, "device": _device(index)}
+                started = time.perf_counter()
+                response = await client.post(path, json=payload)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "elapsed_s": elapsed,
+        "requests_per_second": requests / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "max_ms": max(latencies, default=0.0),
+    }
+
+
+def _git_commit() -> str | None:
+    """Return the current git commit, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Describe how each timing changed relative to a baseline run.
+
+    Args:
+        current: Results of this run
+        baseline: Results of an earlier run
+
+    Returns:
+        One human-readable line per metric present in both runs
+    """
+    lines = []
+    for section in ("micro", "load"):
+        for name, metrics in current.get(section, {}).items():
+            previous = baseline.get(section, {}).get(name)
+            if not isinstance(metrics, dict) or not isinstance(previous, dict):
+                continue
+            for metric, value in metrics.items():
+                before = previous.get(metric)
+                if metric == "iterations" or not before:
+                    continue
+                change = (value - before) / before * 100
+                lines.append(f"{section}.{name}.{metric}: {before:.2f} -> {value:.2f} ({change:+.1f}%)")
+    return lines
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmark suite."""
+    load = await run_load(app, args.requests, args.concurrency)
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "micro": await run_micro(args.iterations, args.inventory_size),
+        "load": {"hostname": load},
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=10000, help="micro-benchmark iterations")
+    parser.add_argument("--requests", type=int, default=5000, help="load-test requests")
+    parser.add_argument("--concurrency", type=int, default=50, help="load-test concurrent clients")
+    parser.add_argument("--inventory-size", type=int, default=100_000, help="devices in the inventory benchmarks")
+    parser.add_argument("--output", type=Path, default=Path("bench-results.json"), help="JSON results file")
+    parser.add_argument("--baseline", type=Path, help="earlier results file to compare against")
+    parser.add_argument("--log-level", default="WARNING", help="application log level during the run")
+    args = parser.parse_args(argv)
+
+    logging.getLogger().setLevel(args.log_level.upper())
+
+    results = asyncio.run(run(args))
+    args.output.write_text(json.dumps(results, indent=2) + "\n")
+    print(json.dumps(results, indent=2))
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        print(f"\nCompared with {args.baseline} (commit {baseline.get('commit')}):")
+        for line in compare(results, baseline):
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
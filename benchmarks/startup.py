@@ -0,0 +1,212 @@
+"""Cold-start profile: import time and time to the first served request.
+
+Run with ``invoke startup-profile`` or ``python -m benchmarks.startup --help``.
+Every measurement starts a fresh interpreter, as an autoscaled worker or a
+short-lived job would. The report lists the slowest imports from
+``python -X importtime`` and the median time from process start until the
+application is imported and until its first configuration request has been
+answered. The exit status is non-zero if a median exceeds its budget.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_MODULE = "netconfig_api.main"
+
+# Milliseconds from process start; enforced by tests/test_startup.py
+STARTUP_BUDGET_MS = {
+    "import_ms": 1500.0,
+    "first_request_ms": 2500.0,
+}
+
+# Modules loaded on first use that importing the application must not pull in
+LAZY_MODULES = (
+    "netconfig_api.transports.simulated",
+)
+
+# Imports the app, then starts it and sends one hostname push in-process.
+# Prints wall-clock times so the parent can measure from before the spawn.
+_FIRST_REQUEST = """
+import asyncio, json, sys, time
+from netconfig_api.main import app
+imported = time.time()
+lazy_loaded = [name for name in sys.argv[1:] if name in sys.modules]
+import httpx
+
+async def first_request():
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://startup") as client:
+            response = await client.post(
+                "/api/v1/hostname",
+                json={"name": "startup", "device": "192.0.2.1", "platform": "cisco_ios"}
+            )
+            response.raise_for_status()
+            return time.time()
+
+answered = asyncio.run(first_request())
+print(json.dumps({"imported": imported, "answered": answered, "lazy_loaded": lazy_loaded}))
+"""
+
+
+def parse_importtime(output: str) -> list[dict[str, Any]]:
+    """Parse the ``-X importtime`` report written to stderr.
+
+    Args:
+        output: Interpreter stderr
+
+    Returns:
+        One entry per imported module with its own and cumulative
+        milliseconds, in import order
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|", 2)
+        imports.append({
+            "module": name.strip(),
+            "self_ms": int(own) / 1000,
+            "cumulative_ms": int(cumulative) / 1000,
+        })
+    return imports
+
+
+def profile_imports(module: str = APP_MODULE) -> list[dict[str, Any]]:
+    """Import a module in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Parsed import timings, see :func:`parse_importtime`
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return parse_importtime(completed.stderr)
+
+
+def measure_first_request() -> dict[str, Any]:
+    """Start a fresh interpreter and time its import and first request.
+
+    Returns:
+        Milliseconds from spawning the process until the application was
+        imported and until the first request was answered, and which of
+        ``LAZY_MODULES`` the import loaded
+    """
+    started = time.time()
+    completed = subprocess.run(
+        [sys.executable, "-c", _FIRST_REQUEST, *LAZY_MODULES],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    result = json.loads(completed.stdout.splitlines()[-1])
+    return {
+        "import_ms": (result["imported"] - started) * 1000,
+        "first_request_ms": (result["answered"] - started) * 1000,
+        "lazy_loaded": result["lazy_loaded"],
+    }
+
+
+def by_package(imports: list[dict[str, Any]]) -> dict[str, float]:
+    """Total each top-level package's own import time, slowest first."""
+    totals: dict[str, float] = defaultdict(float)
+    for entry in imports:
+        totals[entry["module"].split(".", 1)[0]] += entry["self_ms"]
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def check_budget(results: dict[str, Any], budget: dict[str, float]) -> list[str]:
+    """List every budget the results exceed.
+
+    Args:
+        results: Profile with a value for each budgeted key
+        budget: Maximum milliseconds per key
+
+    Returns:
+        One message per violation; empty if within budget
+    """
+    violations = [
+        f"{key}: {results[key]:.0f} ms exceeds budget of {limit:.0f} ms"
+        for key, limit in budget.items()
+        if results[key] > limit
+    ]
+    violations.extend(
+        f"{module} is imported at startup instead of on first use"
+        for module in results.get("lazy_loaded", [])
+    )
+    return violations
+
+
+def run(runs: int = 5, top: int = 15) -> dict[str, Any]:
+    """Profile imports and measure cold starts.
+
+    Args:
+        runs: Fresh interpreters to time; medians are reported
+        top: Slowest modules to list
+
+    Returns:
+        The startup profile
+    """
+    imports = profile_imports()
+    samples = [measure_first_request() for _ in range(runs)]
+    return {
+        "python": sys.version.split()[0],
+        "runs": runs,
+        "import_ms": statistics.median(sample["import_ms"] for sample in samples),
+        "first_request_ms": statistics.median(sample["first_request_ms"] for sample in samples),
+        "lazy_loaded": sorted({name for sample in samples for name in sample["lazy_loaded"]}),
+        "packages_ms": dict(list(by_package(imports).items())[:top]),
+        "slowest_imports": sorted(imports, key=lambda entry: entry["self_ms"], reverse=True)[:top],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point.
+
+    Returns:
+        Exit status: 0 within budget, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="cold starts to time")
+    parser.add_argument("--top", type=int, default=15, help="slowest modules and packages to list")
+    parser.add_argument("--output", type=Path, help="also write the profile to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.runs, args.top)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    print(f"Slowest imports of {APP_MODULE} (self / cumulative ms):")
+    for entry in results["slowest_imports"]:
+        print(f"  {entry['self_ms']:8.1f} {entry['cumulative_ms']:8.1f}  {entry['module']}")
+    print("\nImport time by package (ms):")
+    for package, elapsed in results["packages_ms"].items():
+        print(f"  {elapsed:8.1f}  {package}")
+    print(f"\nMedian of {results['runs']} cold starts:")
+    for key, limit in STARTUP_BUDGET_MS.items():
+        print(f"  {key}: {results[key]:.0f} ms (budget {limit:.0f} ms)")
+
+    violations = check_budget(results, STARTUP_BUDGET_MS)
+    for violation in violations:
+        print(f"OVER BUDGET: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
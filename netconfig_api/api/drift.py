@@ -0,0 +1,68 @@
+"""Configuration drift report API endpoints."""
+
+from fastapi import APIRouter, HTTPException, status
+from pydantic import IPvAnyAddress
+
+from netconfig_api.api.hostname import service
+from netconfig_api.api.responses import ModelResponse
+from netconfig_api.models.requests import DriftReport, DriftResult
+from netconfig_api.services.drift import DriftScanner
+
+router = APIRouter()
+drift_scanner = DriftScanner(service)
+
+
+@router.get(
+    "/drift",
+    response_model=DriftReport,
+    status_code=status.HTTP_200_OK,
+    summary="Get the drift report",
+    description="Get devices whose running config differs from the inventory's desired state"
+)
+async def get_drift_report() -> ModelResponse:
+    """Get the drift scanner's latest report.
+
+    Returns:
+        Pre-serialized DriftReport listing devices with drift or failed checks
+    """
+    return ModelResponse(drift_scanner.report())
+
+
+@router.get(
+    "/drift/{ip}",
+    response_model=DriftResult,
+    status_code=status.HTTP_200_OK,
+    summary="Get a device's drift check",
+    description="Get the latest drift check of one device",
+    responses={
+        404: {
+            "description": "Device not checked yet",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Device 192.168.1.1 has not been checked for drift"
+                    }
+                }
+            }
+        }
+    }
+)
+async def get_device_drift(ip: IPvAnyAddress) -> ModelResponse:
+    """Get the latest drift check of a device.
+
+    Args:
+        ip: IP address of the device
+
+    Returns:
+        Pre-serialized DriftResult
+
+    Raises:
+        HTTPException: If the device has not been checked
+    """
+    result = drift_scanner.result(str(ip))
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Device {ip} has not been checked for drift"
+        )
+    return ModelResponse(result)
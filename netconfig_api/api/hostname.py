@@ -1,16 +1,48 @@
 """Hostname configuration API endpoint."""
 
+import json
 import logging
+import os
+from collections.abc import AsyncIterator, Awaitable
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Header, HTTPException, Query, Request, status
+from pydantic import ValidationError
 
-from netconfig_api.models.requests import HostnameRequest, HostnameResponse
+from netconfig_api.api.responses import (
+    NDJSON_MEDIA_TYPE,
+    DuplexStreamingResponse,
+    ModelResponse,
+)
+from netconfig_api.inventory.selectors import SelectorError
+from netconfig_api.inventory.store import InventoryStore
+from netconfig_api.models.requests import (
+    BatchHostnameRequest,
+    BatchHostnameResponse,
+    HostnameRequest,
+    HostnameResponse,
+)
+from netconfig_api.services.inventory import InventoryService
 from netconfig_api.services.network_config import NetworkConfigService
+from netconfig_api.snapshots.store import ConfigSnapshotStore
+from netconfig_api.transports.pool import ConnectionPool
+from netconfig_api.transports.registry import LazyTransport
+from netconfig_api.utils.streaming import bounded_as_completed, iter_lines
+from netconfig_api.utils.tracing import TRACER
+from netconfig_api.utils.validation import format_validation_error
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-service = NetworkConfigService()
+# Share one inventory database between workers with NETCONFIG_INVENTORY_DB,
+# and one config snapshot history with NETCONFIG_SNAPSHOT_DIR. The transport
+# named by NETCONFIG_TRANSPORT is imported when the first session is opened.
+service = NetworkConfigService(
+    pool=ConnectionPool(LazyTransport(os.getenv("NETCONFIG_TRANSPORT", "simulated"))),
+    inventory=InventoryService(
+        InventoryStore(os.getenv("NETCONFIG_INVENTORY_DB", ":memory:"))
+    ),
+    config_snapshots=ConfigSnapshotStore(os.getenv("NETCONFIG_SNAPSHOT_DIR"))
+)
 
 
 @router.post(
@@ -62,7 +94,19 @@ service = NetworkConfigService()
         }
     }
 )
-async def configure_hostname(request: HostnameRequest) -> HostnameResponse:
+async def configure_hostname(
+    request: HostnameRequest,
+    idempotency_key: str | None = Header(
+        default=None,
+        alias="Idempotency-Key",
+        max_length=255,
+        description="Client-chosen key; retries with the same key are not pushed again"
+    ),
+    dry_run: bool = Query(
+        default=False,
+        description="Return the commands and diff without contacting the device"
+    )
+) -> ModelResponse:
     """Configure hostname on a network device.
 
     Args:
@@ -70,37 +114,23 @@ async def configure_hostname(request: HostnameRequest) -> HostnameResponse:
             - name: Hostname to set (1-63 chars, alphanumeric and hyphens)
             - device: IP address of the network device
             - platform: Device platform (cisco_ios, juniper_junos, etc.)
+        idempotency_key: Optional key identifying retries of the same request
+        dry_run: Plan the change instead of applying it
 
     Returns:
-        HostnameResponse with configuration result
+        Pre-serialized HostnameResponse with configuration result
 
     Raises:
         HTTPException: For various error conditions
     """
-    logger.info(
-        "Received hostname configuration request for device %s",
-        request.device
-    )
+    # Everything since the request started was reading and validating the body
+    TRACER.record("validation")
 
+    # The service logs the outcome of every request
     try:
-        response = await service.configure_hostname(request)
-
-        # Log the result
-        if response.success:
-            logger.info(
-                "Successfully configured hostname '%s' on device %s",
-                request.name,
-                request.device
-            )
-        else:
-            logger.warning(
-                "Failed to configure hostname '%s' on device %s: %s",
-                request.name,
-                request.device,
-                response.message
-            )
-
-        return response
+        with TRACER.span("hostname.handler"):
+            response = await service.configure_hostname(request, idempotency_key, dry_run)
+        return ModelResponse(response)
 
     except ValueError as e:
         # Handle validation errors from the service
@@ -116,3 +146,204 @@ async def configure_hostname(request: HostnameRequest) -> HostnameResponse:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
         ) from e
+
+
+@router.post(
+    "/hostname:batch",
+    response_model=BatchHostnameResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Configure hostnames on many devices",
+    description="Configure hostnames on a batch of network devices concurrently",
+    responses={
+        200: {
+            "description": "Per-device results and aggregate timings",
+            "model": BatchHostnameResponse
+        },
+        400: {
+            "description": "Invalid selector",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Expected '=' or '!=' after 'site', got 'dc1'"
+                    }
+                }
+            }
+        },
+        422: {
+            "description": "Validation error",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": [
+                            {
+                                "loc": ["body", "requests", 0, "name"],
+                                "msg": "field required",
+                                "type": "value_error.missing"
+                            }
+                        ]
+                    }
+                }
+            }
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Internal server error"
+                    }
+                }
+            }
+        }
+    }
+)
+async def configure_hostname_batch(
+    batch: BatchHostnameRequest,
+    dry_run: bool = Query(
+        default=False,
+        description="Plan every device's commands and diff without contacting any device"
+    )
+) -> ModelResponse:
+    """Configure hostnames on a batch of network devices.
+
+    Args:
+        batch: Batch request containing:
+            - requests: Hostname configuration requests, one per device
+            - selector: Or an inventory selector choosing the devices
+            - concurrency: Maximum number of devices configured at once
+        dry_run: Plan the changes instead of applying them
+
+    Returns:
+        Pre-serialized BatchHostnameResponse with per-device results and
+        aggregate timings
+
+    Raises:
+        HTTPException: If the batch could not be processed
+    """
+    logger.info(
+        "Received batch hostname configuration request for %s",
+        f"selector {batch.selector!r}" if batch.selector else f"{len(batch.requests)} devices"
+    )
+
+    try:
+        response = await service.configure_hostname_batch(batch, dry_run)
+
+        logger.info(
+            "Batch hostname configuration finished: %d succeeded, %d failed in %.1f ms",
+            response.succeeded,
+            response.failed,
+            response.elapsed_ms
+        )
+
+        return ModelResponse(response)
+
+    except SelectorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
+    except Exception as e:
+        logger.exception("Unexpected error configuring hostname batch: %s", str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        ) from e
+
+
+@router.post(
+    "/hostname:stream",
+    response_class=DuplexStreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream hostname configuration results",
+    description=(
+        "Configure hostnames from an NDJSON request body, streaming one NDJSON "
+        "result line per device as each configuration completes"
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                NDJSON_MEDIA_TYPE: {
+                    "schema": HostnameRequest.model_json_schema()
+                }
+            }
+        }
+    },
+    responses={
+        200: {
+            "description": "One HostnameResponse per line, in completion order",
+            "content": {
+                NDJSON_MEDIA_TYPE: {
+                    "schema": HostnameResponse.model_json_schema()
+                }
+            }
+        }
+    }
+)
+async def configure_hostname_stream(
+    request: Request,
+    concurrency: int = Query(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum number of devices configured concurrently"
+    )
+) -> DuplexStreamingResponse:
+    """Configure hostnames from a streamed NDJSON body.
+
+    Each request line is validated and dispatched as soon as it is read, and
+    each result is written as soon as its device finishes, so neither the
+    request nor the response is buffered in full. Lines that fail validation
+    produce an unsuccessful result line rather than aborting the stream.
+
+    Args:
+        request: Incoming request whose body is NDJSON HostnameRequest objects
+        concurrency: Maximum number of devices configured at once
+
+    Returns:
+        DuplexStreamingResponse emitting one HostnameResponse per line
+    """
+    logger.info(
+        "Received streaming hostname configuration request (concurrency: %d)",
+        concurrency
+    )
+
+    async def body() -> AsyncIterator[bytes]:
+        jobs = _stream_jobs(request)
+        async for response in bounded_as_completed(jobs, concurrency):
+            yield response.model_dump_json().encode() + b"\n"
+
+    return DuplexStreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
+
+
+async def _stream_jobs(request: Request) -> AsyncIterator[Awaitable[HostnameResponse]]:
+    """Turn each NDJSON body line into a pending configuration job."""
+    line_number = 0
+    try:
+        async for line in iter_lines(request.stream()):
+            line_number += 1
+            try:
+                hostname_request = HostnameRequest.model_validate_json(line)
+            except ValidationError as e:
+                yield _invalid_line(line_number, line, format_validation_error(e))
+                continue
+            yield service.configure_hostname(hostname_request)
+    except ValueError as e:
+        yield _invalid_line(line_number + 1, b"", str(e))
+
+
+async def _invalid_line(line_number: int, line: bytes, reason: str) -> HostnameResponse:
+    """Build the result line reported for a request line that failed validation."""
+    logger.warning("Invalid streaming request on line %d: %s", line_number, reason)
+    try:
+        raw = json.loads(line)
+    except ValueError:
+        raw = None
+    if not isinstance(raw, dict):
+        raw = {}
+    return HostnameResponse(
+        success=False,
+        message=f"Invalid request on line {line_number}: {reason}",
+        device=str(raw.get("device", "")),
+        hostname=str(raw.get("name", ""))
+    )
@@ -0,0 +1,311 @@
+"""Device inventory API endpoints."""
+
+import logging
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import IPvAnyAddress
+
+from netconfig_api.api.hostname import service
+from netconfig_api.api.responses import (
+    NDJSON_MEDIA_TYPE,
+    DuplexStreamingResponse,
+    ModelResponse,
+)
+from netconfig_api.inventory.bulk import (
+    DEFAULT_BATCH_SIZE,
+    export_devices,
+    import_devices,
+    parse_rows,
+)
+from netconfig_api.inventory.selectors import SelectorError
+from netconfig_api.models.requests import (
+    Device,
+    DeviceList,
+    ImportRowError,
+    ImportSummary,
+    InventoryFormat,
+)
+from netconfig_api.utils.streaming import iter_lines
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+CSV_MEDIA_TYPE = "text/csv"
+
+INVALID_SELECTOR_RESPONSE: dict[int | str, dict] = {
+    400: {
+        "description": "Invalid selector",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Unknown field 'rack'; expected one of ip, hostname, site, role, platform"
+                }
+            }
+        }
+    }
+}
+
+NOT_FOUND_RESPONSE: dict[int | str, dict] = {
+    404: {
+        "description": "Device not found",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Device 192.168.1.1 not found"
+                }
+            }
+        }
+    }
+}
+
+
+@router.put(
+    "/inventory/devices",
+    response_model=Device,
+    status_code=status.HTTP_200_OK,
+    summary="Add or replace a device",
+    description="Add a device to the inventory, replacing any record with the same IP"
+)
+async def put_device(device: Device) -> ModelResponse:
+    """Add or replace a device in the inventory.
+
+    Args:
+        device: Device record
+
+    Returns:
+        Pre-serialized stored Device
+    """
+    service.inventory.upsert([device])
+    logger.info("Stored inventory device %s", device.ip)
+    return ModelResponse(device)
+
+
+@router.get(
+    "/inventory/devices",
+    response_model=DeviceList,
+    status_code=status.HTTP_200_OK,
+    summary="Query devices",
+    description="List inventory devices, optionally filtered by a selector",
+    responses=INVALID_SELECTOR_RESPONSE
+)
+async def list_devices(
+    selector: str = Query(
+        default="*",
+        max_length=1024,
+        description="Selector such as 'site=dc1 AND role=leaf'; '*' matches every device"
+    ),
+    limit: int = Query(
+        default=1000,
+        ge=1,
+        le=100000,
+        description="Maximum number of devices to return"
+    )
+) -> ModelResponse:
+    """List the devices matching a selector.
+
+    Args:
+        selector: Selector expression
+        limit: Maximum number of devices to return
+
+    Returns:
+        Pre-serialized DeviceList ordered by IP address
+
+    Raises:
+        HTTPException: If the selector is invalid
+    """
+    devices = _select_sorted(selector)
+    return ModelResponse(DeviceList(devices=devices[:limit], total=len(devices)))
+
+
+@router.post(
+    "/inventory/devices:import",
+    response_class=DuplexStreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Bulk import devices",
+    description=(
+        "Add or replace devices from a streamed CSV or JSONL body, writing them in "
+        "batched transactions and streaming back one NDJSON line per rejected row "
+        "followed by a summary line"
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                NDJSON_MEDIA_TYPE: {"schema": Device.model_json_schema()},
+                CSV_MEDIA_TYPE: {"schema": {"type": "string"}}
+            }
+        }
+    },
+    responses={
+        200: {
+            "description": "ImportRowError lines as rows are rejected, then an ImportSummary",
+            "content": {
+                NDJSON_MEDIA_TYPE: {
+                    "example": (
+                        '{"line":12,"error":"platform: Value error, Unsupported platform: foo"}\n'
+                        '{"imported":99999,"failed":1,"batches":100,"elapsed_ms":2150.4}\n'
+                    )
+                }
+            }
+        }
+    }
+)
+async def import_inventory(
+    request: Request,
+    fmt: InventoryFormat | None = Query(
+        default=None,
+        alias="format",
+        description="Body format; defaults to csv for text/csv bodies and jsonl otherwise"
+    ),
+    batch_size: int = Query(
+        default=DEFAULT_BATCH_SIZE,
+        ge=1,
+        le=10000,
+        description="Devices written per transaction"
+    )
+) -> DuplexStreamingResponse:
+    """Bulk import devices from a streamed body.
+
+    The body is parsed line by line as it arrives, so files of any size are
+    imported in constant memory.
+
+    Args:
+        request: Incoming request whose body is CSV (with a header row) or JSONL
+        fmt: Body format
+        batch_size: Devices written per transaction
+
+    Returns:
+        DuplexStreamingResponse emitting rejected rows and a final summary
+    """
+    if fmt is None:
+        content_type = request.headers.get("content-type", "")
+        fmt = InventoryFormat.CSV if content_type.startswith(CSV_MEDIA_TYPE) else InventoryFormat.JSONL
+    logger.info("Received inventory import (format: %s, batch size: %d)", fmt.value, batch_size)
+
+    async def body() -> AsyncIterator[bytes]:
+        rows = parse_rows(iter_lines(request.stream()), fmt)
+        result: ImportRowError | ImportSummary
+        async for result in import_devices(service.inventory, rows, batch_size):
+            yield result.model_dump_json().encode() + b"\n"
+
+    return DuplexStreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get(
+    "/inventory/devices:export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Bulk export devices",
+    description="Stream inventory devices matching a selector as CSV or JSONL",
+    responses={
+        200: {
+            "description": "Devices ordered by IP address",
+            "content": {
+                NDJSON_MEDIA_TYPE: {"schema": Device.model_json_schema()},
+                CSV_MEDIA_TYPE: {"schema": {"type": "string"}}
+            }
+        },
+        **INVALID_SELECTOR_RESPONSE
+    }
+)
+async def export_inventory(
+    fmt: InventoryFormat = Query(
+        default=InventoryFormat.JSONL,
+        alias="format",
+        description="Output format"
+    ),
+    selector: str = Query(
+        default="*",
+        max_length=1024,
+        description="Selector choosing the devices to export"
+    )
+) -> StreamingResponse:
+    """Stream inventory devices as CSV or JSONL.
+
+    Args:
+        fmt: Output format
+        selector: Selector expression
+
+    Returns:
+        StreamingResponse with the encoded devices
+
+    Raises:
+        HTTPException: If the selector is invalid
+    """
+    devices = _select_sorted(selector)
+    logger.info("Exporting %d inventory devices as %s", len(devices), fmt.value)
+    media_type = CSV_MEDIA_TYPE if fmt is InventoryFormat.CSV else NDJSON_MEDIA_TYPE
+    return StreamingResponse(export_devices(devices, fmt), media_type=media_type)
+
+
+@router.get(
+    "/inventory/devices/{ip}",
+    response_model=Device,
+    status_code=status.HTTP_200_OK,
+    summary="Get a device",
+    description="Get an inventory device by IP address",
+    responses=NOT_FOUND_RESPONSE
+)
+async def get_device(ip: IPvAnyAddress) -> ModelResponse:
+    """Get an inventory device.
+
+    Args:
+        ip: IP address of the device
+
+    Returns:
+        Pre-serialized Device
+
+    Raises:
+        HTTPException: If the device is not in the inventory
+    """
+    device = service.inventory.get(str(ip))
+    if device is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Device {ip} not found"
+        )
+    return ModelResponse(device)
+
+
+@router.delete(
+    "/inventory/devices/{ip}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete a device",
+    description="Remove a device from the inventory",
+    responses=NOT_FOUND_RESPONSE
+)
+async def delete_device(ip: IPvAnyAddress) -> Response:
+    """Remove a device from the inventory.
+
+    Args:
+        ip: IP address of the device
+
+    Returns:
+        Empty response
+
+    Raises:
+        HTTPException: If the device is not in the inventory
+    """
+    if not service.inventory.delete(str(ip)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Device {ip} not found"
+        )
+    logger.info("Deleted inventory device %s", ip)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def _select_sorted(selector: str) -> list[Device]:
+    """Resolve a selector to devices ordered by IP, mapping errors to 400."""
+    try:
+        devices = service.inventory.select(selector)
+    except SelectorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
+    devices.sort(key=lambda device: (device.ip.version, device.ip))
+    return devices
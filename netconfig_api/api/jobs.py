@@ -0,0 +1,186 @@
+"""Background configuration job API endpoints."""
+
+import logging
+
+from fastapi import APIRouter, HTTPException, status
+
+from netconfig_api.api.hostname import service
+from netconfig_api.models.requests import (
+    BatchHostnameRequest,
+    BatchHostnameResponse,
+    HostnameRequest,
+    HostnameResponse,
+    JobResponse,
+)
+from netconfig_api.services.jobs import (
+    Job,
+    JobManager,
+    JobOperation,
+    JobQueueClosedError,
+    JobQueueFullError,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+job_manager = JobManager()
+
+SUBMIT_RESPONSES: dict[int | str, dict] = {
+    202: {
+        "description": "Job accepted",
+        "model": JobResponse
+    },
+    429: {
+        "description": "Job queue is full",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Job queue is full (1000 jobs queued)"
+                }
+            }
+        }
+    },
+    503: {
+        "description": "Job queue is not accepting jobs",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Job queue is not accepting jobs"
+                }
+            }
+        }
+    }
+}
+
+
+@router.post(
+    "/jobs/hostname",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue a hostname configuration job",
+    description="Queue hostname configuration on a network device and return immediately",
+    responses=SUBMIT_RESPONSES
+)
+async def submit_hostname_job(request: HostnameRequest) -> JobResponse:
+    """Queue hostname configuration on a network device.
+
+    Args:
+        request: Hostname configuration request
+
+    Returns:
+        JobResponse for the queued job
+
+    Raises:
+        HTTPException: 429 if the queue is full, 503 if it is shutting down
+    """
+    job = _submit(lambda: service.configure_hostname(request))
+    logger.info("Queued hostname job %s for device %s", job.id, request.device)
+    return _to_response(job)
+
+
+@router.post(
+    "/jobs/hostname:batch",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue a batch hostname configuration job",
+    description="Queue hostname configuration on many devices and return immediately",
+    responses=SUBMIT_RESPONSES
+)
+async def submit_hostname_batch_job(batch: BatchHostnameRequest) -> JobResponse:
+    """Queue hostname configuration on a batch of network devices.
+
+    Args:
+        batch: Batch hostname configuration request
+
+    Returns:
+        JobResponse for the queued job
+
+    Raises:
+        HTTPException: 429 if the queue is full, 503 if it is shutting down
+    """
+    job = _submit(lambda: service.configure_hostname_batch(batch))
+    logger.info(
+        "Queued batch hostname job %s for %s",
+        job.id,
+        f"selector {batch.selector!r}" if batch.selector else f"{len(batch.requests)} devices"
+    )
+    return _to_response(job)
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get job status",
+    description="Get the status and, once finished, the result of a job",
+    responses={
+        200: {
+            "description": "Job status",
+            "model": JobResponse
+        },
+        404: {
+            "description": "Job not found",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Job not found"
+                    }
+                }
+            }
+        }
+    }
+)
+async def get_job(job_id: str) -> JobResponse:
+    """Get the status of a job.
+
+    Args:
+        job_id: Job identifier returned on submission
+
+    Returns:
+        JobResponse with the job status and result
+
+    Raises:
+        HTTPException: 404 if the job is unknown
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return _to_response(job)
+
+
+def _submit(operation: JobOperation) -> Job:
+    """Submit an operation to the job manager, mapping errors to HTTP responses."""
+    try:
+        return job_manager.submit(operation)
+    except JobQueueFullError as e:
+        logger.warning("Rejected job: %s", str(e))
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        ) from e
+    except JobQueueClosedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        ) from e
+
+
+def _to_response(job: Job) -> JobResponse:
+    """Convert a Job into its API representation."""
+    # Jobs queued through this API only produce these results
+    result = job.result
+    if not isinstance(result, (HostnameResponse, BatchHostnameResponse)):
+        result = None
+    return JobResponse(
+        id=job.id,
+        status=job.status,
+        submitted_at=job.submitted_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        result=result,
+        error=job.error
+    )
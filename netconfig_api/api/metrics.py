@@ -0,0 +1,80 @@
+"""Prometheus metrics endpoint and request instrumentation."""
+
+import time
+
+from fastapi import APIRouter, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from netconfig_api.utils.metrics import CONTENT_TYPE, REGISTRY, Counter, Histogram
+
+router = APIRouter()
+
+REQUEST_SECONDS = Histogram(
+    "netconfig_http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route"]
+)
+REQUESTS = Counter(
+    "netconfig_http_requests_total",
+    "HTTP requests by route and status code",
+    ["method", "route", "status"]
+)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency and status per route.
+
+    Requests are labelled with the matched route template (e.g.
+    ``/api/v1/jobs/{job_id}``) rather than the raw path, so label cardinality
+    stays bounded. Requests that match no route share the ``unmatched`` label.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time the request and record it once the response has been sent."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            route = scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            REQUEST_SECONDS.labels(method, route_path).observe(elapsed)
+            REQUESTS.labels(method, route_path, str(status_code)).inc()
+
+
+@router.get(
+    "/metrics",
+    response_class=Response,
+    summary="Prometheus metrics",
+    description="Metrics in Prometheus text exposition format",
+    responses={
+        200: {
+            "description": "Prometheus metrics",
+            "content": {CONTENT_TYPE: {}}
+        }
+    }
+)
+async def metrics() -> Response:
+    """Expose collected metrics for scraping.
+
+    Returns:
+        Response with metrics in Prometheus text format
+    """
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,109 @@
+"""Catalog operation API endpoints, generated from the operation catalog."""
+
+from fastapi import APIRouter, status
+
+from netconfig_api.api.hostname import service
+from netconfig_api.api.responses import ModelResponse
+from netconfig_api.models.operations import (
+    OPERATION_MODELS,
+    ChangeSetRequest,
+    OperationRequest,
+)
+from netconfig_api.models.requests import (
+    ChangeSetResponse,
+    OperationInfo,
+    OperationResponse,
+)
+from netconfig_api.utils.device_platforms import (
+    HOSTNAME_OPERATION,
+    OPERATIONS,
+    OperationDefinition,
+)
+
+router = APIRouter()
+
+# Hostname keeps its dedicated endpoints, which add batches, dry runs,
+# streaming and drift tracking on top of the generic path
+_DEDICATED_OPERATIONS = frozenset({HOSTNAME_OPERATION})
+
+_OPERATION_INFO = [
+    OperationInfo(
+        name=name,
+        description=operation.description,
+        platforms=sorted(operation.templates),
+        parameters=OPERATION_MODELS[name].model_json_schema()
+    )
+    for name, operation in OPERATIONS.items()
+]
+
+
+@router.get(
+    "/operations",
+    response_model=list[OperationInfo],
+    status_code=status.HTTP_200_OK,
+    summary="List catalog operations",
+    description="List the operations in the catalog, their platforms and request schemas"
+)
+async def list_operations() -> list[OperationInfo]:
+    """List the operations in the catalog.
+
+    Returns:
+        One OperationInfo per catalog operation
+    """
+    return _OPERATION_INFO
+
+
+@router.post(
+    "/change-sets",
+    response_model=ChangeSetResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Apply several operations to a device at once",
+    description=(
+        "Merge several catalog operations into one config block and apply it "
+        "to the device in one session and one commit"
+    )
+)
+async def apply_change_set(request: ChangeSetRequest) -> ModelResponse:
+    """Apply several catalog operations to a device in one session.
+
+    Args:
+        request: Change set containing:
+            - device: IP address of the network device
+            - platform: Device platform, or looked up in the inventory
+            - operations: Catalog operations and their parameters, in order
+
+    Returns:
+        Pre-serialized ChangeSetResponse with per-operation results
+    """
+    return ModelResponse(await service.configure_change_set(request))
+
+
+def _add_operation_route(
+    operation: OperationDefinition,
+    model: type[OperationRequest]
+) -> None:
+    """Register the POST route of one catalog operation."""
+    name = operation.name
+
+    async def apply_operation(request: model) -> ModelResponse:  # type: ignore[valid-type]
+        return ModelResponse(await service.configure_operation(name, request))
+
+    apply_operation.__doc__ = f"{operation.description} on a network device."
+    router.add_api_route(
+        f"/operations/{name}",
+        apply_operation,
+        methods=["POST"],
+        response_model=OperationResponse,
+        status_code=status.HTTP_200_OK,
+        summary=operation.description,
+        description=(
+            f"{operation.description}. Supported platforms: "
+            f"{', '.join(sorted(operation.templates))}"
+        ),
+        name=f"apply_{name}"
+    )
+
+
+for _name, _operation in OPERATIONS.items():
+    if _name not in _DEDICATED_OPERATIONS:
+        _add_operation_route(_operation, OPERATION_MODELS[_name])
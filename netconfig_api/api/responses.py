@@ -0,0 +1,69 @@
+"""Response classes for fast JSON serialization and streaming."""
+
+import functools
+import importlib
+import os
+from types import ModuleType
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from starlette.types import Receive, Scope, Send
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Serialize responses with Pydantic/orjson unless NETCONFIG_FAST_JSON=0
+FAST_JSON = os.getenv("NETCONFIG_FAST_JSON", "1").lower() not in ("0", "false", "no")
+
+
+@functools.cache
+def _orjson() -> ModuleType | None:
+    """Import orjson on first use, so startup does not pay for it.
+
+    Returns:
+        The orjson module, or None if it is not installed
+    """
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+
+
+class ModelResponse(JSONResponse):
+    """JSON response that serializes Pydantic models straight to bytes.
+
+    Handlers that return ``ModelResponse(model)`` bypass FastAPI's
+    ``jsonable_encoder`` pass and response-model re-validation: the model is
+    serialized once by Pydantic's compiled serializer. Other content, such as
+    the dicts FastAPI produces when this is the app's default response class,
+    is encoded with orjson when it is installed and the standard library
+    otherwise. With ``NETCONFIG_FAST_JSON=0`` everything is encoded the way
+    FastAPI's standard ``JSONResponse`` would.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the response body."""
+        if not FAST_JSON:
+            return super().render(jsonable_encoder(content))
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        orjson = _orjson()
+        if orjson is not None:
+            body: bytes = orjson.dumps(content)
+            return body
+        return super().render(content)
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """Streaming response that can be sent while the request body is still read.
+
+    Starlette's StreamingResponse watches ``receive`` for client disconnects,
+    which consumes request body messages the handler has not read yet. This
+    variant leaves ``receive`` to the body reader, which raises on disconnect.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
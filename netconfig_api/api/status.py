@@ -0,0 +1,56 @@
+"""Operational status API endpoints."""
+
+from fastapi import APIRouter, status
+
+from netconfig_api.api.hostname import service
+from netconfig_api.models.requests import BreakerStats, ConcurrencyStats, SchedulerStats
+
+router = APIRouter()
+
+
+@router.get(
+    "/status/scheduler",
+    response_model=SchedulerStats,
+    status_code=status.HTTP_200_OK,
+    summary="Get device scheduler status",
+    description="Get per-device queue depths and write coalescing counters"
+)
+async def get_scheduler_status() -> SchedulerStats:
+    """Get the status of the per-device operation scheduler.
+
+    Returns:
+        SchedulerStats with counters and per-device queue depths
+    """
+    return service.scheduler.stats()
+
+
+@router.get(
+    "/status/concurrency",
+    response_model=ConcurrencyStats,
+    status_code=status.HTTP_200_OK,
+    summary="Get adaptive concurrency limits",
+    description="Get the current in-flight limits per platform and per device"
+)
+async def get_concurrency_status() -> ConcurrencyStats:
+    """Get the state of the adaptive concurrency controller.
+
+    Returns:
+        ConcurrencyStats with the global cap and per-platform and per-device limits
+    """
+    return service.concurrency.stats()
+
+
+@router.get(
+    "/status/breakers",
+    response_model=BreakerStats,
+    status_code=status.HTTP_200_OK,
+    summary="Get device circuit breakers",
+    description="Get the circuit breaker state of every device with recent failures"
+)
+async def get_breaker_status() -> BreakerStats:
+    """Get the state of the per-device circuit breakers.
+
+    Returns:
+        BreakerStats with the number of open breakers and per-device state
+    """
+    return service.breakers.stats()
@@ -0,0 +1,66 @@
+"""Request tracing middleware."""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from netconfig_api.utils.logs import REQUEST_ID
+from netconfig_api.utils.tracing import TRACER, SpanKind
+
+
+class TracingMiddleware:
+    """ASGI middleware opening the root span of each sampled request.
+
+    The trace of an incoming W3C ``traceparent`` header is continued, along
+    with its ``tracestate``. The span is named after the matched route
+    template and records the status code and request ID. Requests that are
+    not sampled pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request inside its root span."""
+        if scope["type"] != "http" or not TRACER.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        tracestate = ""
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+            elif name == b"tracestate":
+                tracestate = value.decode("latin-1")
+
+        method = scope["method"]
+        span = TRACER.start_trace(
+            method,
+            traceparent,
+            tracestate,
+            kind=SpanKind.SERVER,
+            **{
+                "http.method": method,
+                "http.target": scope["path"],
+                "request.id": REQUEST_ID.get()
+            }
+        )
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    span.update_name(f"{method} {route}")
+                    span.set_attribute("http.route", route)
+                span.set_attribute("http.status_code", status_code)
+                if status_code >= 500:
+                    span.set_error(f"HTTP {status_code}")
@@ -0,0 +1,35 @@
+"""Multi-device transaction API endpoints."""
+
+from fastapi import APIRouter, status
+
+from netconfig_api.api.hostname import service
+from netconfig_api.api.responses import ModelResponse
+from netconfig_api.models.requests import TransactionRequest, TransactionResponse
+from netconfig_api.services.transactions import TransactionCoordinator
+
+router = APIRouter()
+transaction_coordinator = TransactionCoordinator(service)
+
+
+@router.post(
+    "/transactions",
+    response_model=TransactionResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Apply a change to several devices atomically",
+    description=(
+        "Prepare every device in parallel, commit in parallel, and roll back "
+        "the changed devices if any commit fails"
+    )
+)
+async def run_transaction(request: TransactionRequest) -> ModelResponse:
+    """Apply hostname changes to several devices, all or nothing.
+
+    Args:
+        request: Transaction containing:
+            - requests: Hostname changes, at most one per device
+            - confirm_timeout: Seconds commit-confirmed devices wait for confirmation
+
+    Returns:
+        Pre-serialized TransactionResponse with the outcome and per-phase timings
+    """
+    return ModelResponse(await transaction_coordinator.run(request))
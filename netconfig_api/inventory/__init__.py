@@ -0,0 +1 @@
+"""Device inventory storage, indexing and selectors."""
@@ -0,0 +1,215 @@
+"""Streaming bulk import and export of inventory records in CSV and JSONL."""
+
+import csv
+import io
+import logging
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from pydantic import ValidationError
+
+from netconfig_api.models.requests import (
+    Device,
+    ImportRowError,
+    ImportSummary,
+    InventoryFormat,
+)
+from netconfig_api.services.inventory import InventoryService
+from netconfig_api.utils.validation import format_validation_error
+
+logger = logging.getLogger(__name__)
+
+CSV_FIELDS = ("ip", "platform", "hostname", "site", "role")
+REQUIRED_CSV_FIELDS = ("ip", "platform")
+
+DEFAULT_BATCH_SIZE = 1000
+EXPORT_CHUNK_SIZE = 1000
+
+ParsedRow = tuple[int, Device | str]
+
+
+async def parse_jsonl(lines: AsyncIterable[bytes]) -> AsyncIterator[ParsedRow]:
+    """Validate one Device per JSONL line.
+
+    Args:
+        lines: Non-blank input lines
+
+    Yields:
+        ``(line number, Device)`` for valid lines and ``(line number, error)``
+        for invalid ones
+    """
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        try:
+            yield line_number, Device.model_validate_json(line)
+        except ValidationError as e:
+            yield line_number, format_validation_error(e)
+
+
+async def parse_csv(lines: AsyncIterable[bytes]) -> AsyncIterator[ParsedRow]:
+    """Validate one Device per CSV row, after a header row naming the columns.
+
+    Columns may appear in any order; ``ip`` and ``platform`` are required and
+    empty cells are treated as missing values. Quoted values may not contain
+    line breaks.
+
+    Args:
+        lines: Non-blank input lines, starting with the header
+
+    Yields:
+        ``(line number, Device)`` for valid rows and ``(line number, error)``
+        for invalid ones
+
+    Raises:
+        ValueError: If the header is missing or names unknown columns
+    """
+    iterator = aiter(lines)
+    try:
+        header = _csv_row(await anext(iterator))
+    except StopAsyncIteration:
+        return
+    columns = [column.strip().lower() for column in header]
+    unknown = [column for column in columns if column not in CSV_FIELDS]
+    missing = [field for field in REQUIRED_CSV_FIELDS if field not in columns]
+    if unknown or missing:
+        raise ValueError(
+            f"Invalid CSV header: unknown columns {unknown}, missing columns {missing}"
+        )
+
+    line_number = 1
+    async for line in iterator:
+        line_number += 1
+        try:
+            row = _csv_row(line)
+        except UnicodeDecodeError:
+            yield line_number, "Row is not valid UTF-8"
+            continue
+        if len(row) != len(columns):
+            yield line_number, f"Expected {len(columns)} columns, got {len(row)}"
+            continue
+        record = {column: value or None for column, value in zip(columns, row, strict=True)}
+        try:
+            yield line_number, Device.model_validate(record)
+        except ValidationError as e:
+            yield line_number, format_validation_error(e)
+
+
+def _csv_row(line: bytes) -> list[str]:
+    """Split a single CSV line into cells."""
+    return next(csv.reader([line.decode()]), [])
+
+
+async def import_devices(
+    inventory: InventoryService,
+    rows: AsyncIterable[ParsedRow],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[ImportRowError | ImportSummary]:
+    """Write parsed rows to the inventory in batched transactions.
+
+    Invalid rows are reported as soon as they are read; valid rows are
+    written ``batch_size`` at a time, each batch in one transaction, and the
+    inventory index is updated once at the end. A problem that stops parsing,
+    such as a bad header or an overlong line, is reported as an error on the
+    line where it happened and ends the import; batches already written are
+    kept.
+
+    Args:
+        inventory: Inventory to write to
+        rows: Parsed rows, e.g. from :func:`parse_csv` or :func:`parse_jsonl`
+        batch_size: Devices written per transaction
+
+    Yields:
+        An ImportRowError per invalid row, then a final ImportSummary
+    """
+    started = time.perf_counter()
+    batch: list[Device] = []
+    imported = failed = batches = 0
+    line_number = 0
+
+    with inventory.bulk_upsert() as write:
+
+        def flush() -> None:
+            nonlocal imported, batches
+            if batch:
+                imported += write(batch)
+                batches += 1
+                batch.clear()
+
+        try:
+            async for line_number, parsed in rows:
+                if isinstance(parsed, str):
+                    failed += 1
+                    yield ImportRowError(line=line_number, error=parsed)
+                    continue
+                batch.append(parsed)
+                if len(batch) >= batch_size:
+                    flush()
+        except ValueError as e:
+            failed += 1
+            yield ImportRowError(line=line_number + 1, error=str(e))
+        flush()
+
+    logger.info(
+        "Imported %d inventory devices in %d batches (%d rows failed)",
+        imported,
+        batches,
+        failed
+    )
+    yield ImportSummary(
+        imported=imported,
+        failed=failed,
+        batches=batches,
+        elapsed_ms=(time.perf_counter() - started) * 1000
+    )
+
+
+def parse_rows(lines: AsyncIterable[bytes], fmt: InventoryFormat) -> AsyncIterator[ParsedRow]:
+    """Pick the parser for an import format."""
+    if fmt is InventoryFormat.CSV:
+        return parse_csv(lines)
+    return parse_jsonl(lines)
+
+
+def export_devices(
+    devices: Iterable[Device],
+    fmt: InventoryFormat,
+    chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Encode devices as CSV or JSONL, a chunk of records at a time.
+
+    Args:
+        devices: Devices to export
+        fmt: Output format
+        chunk_size: Records encoded per yielded chunk
+
+    Yields:
+        Encoded chunks; CSV output starts with a header row
+    """
+    encode = _csv_chunk if fmt is InventoryFormat.CSV else _jsonl_chunk
+    if fmt is InventoryFormat.CSV:
+        yield (",".join(CSV_FIELDS) + "\r\n").encode()
+    chunk: list[Device] = []
+    for device in devices:
+        chunk.append(device)
+        if len(chunk) >= chunk_size:
+            yield encode(chunk)
+            chunk = []
+    if chunk:
+        yield encode(chunk)
+
+
+def _jsonl_chunk(devices: list[Device]) -> bytes:
+    """Encode devices as JSON lines."""
+    return "".join(device.model_dump_json() + "\n" for device in devices).encode()
+
+
+def _csv_chunk(devices: list[Device]) -> bytes:
+    """Encode devices as CSV rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        (str(device.ip), device.platform, device.hostname or "", device.site or "", device.role or "")
+        for device in devices
+    )
+    return buffer.getvalue().encode()
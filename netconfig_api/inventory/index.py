@@ -0,0 +1,197 @@
+"""In-memory bitmap indexes over the device inventory."""
+
+import re
+from collections.abc import Iterable
+
+from netconfig_api.inventory.selectors import Selector
+from netconfig_api.models.requests import Device
+
+# Low-cardinality attributes get bitmap indexes; IP and hostname, which are
+# (nearly) unique per device, get hash indexes instead
+BITMAP_FIELDS = ("site", "role", "platform")
+
+_SET_BIT = re.compile("1")
+
+
+class InventoryIndex:
+    """Hash indexes on IP and hostname plus bitmap indexes on site, role and platform.
+
+    Every device occupies a numbered slot, and each indexed attribute value
+    maps to an integer bitmap with the bits of the devices that have it set.
+    Selectors therefore resolve with a handful of bitwise operations on
+    Python integers, whose cost grows with the inventory size in machine
+    words rather than with the number of devices (about 1.5k words for 100k
+    devices). Only materializing the matching devices is linear in matches.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._devices: dict[str, Device] = {}
+        self._slots: dict[str, int] = {}
+        self._by_slot: list[Device | None] = []
+        self._free: list[int] = []
+        self._hostnames: dict[str, set[int]] = {}
+        self._bitmaps: dict[str, dict[str, int]] = {}
+        self._everything = 0
+        self.clear()
+
+    def __len__(self) -> int:
+        """Return the number of indexed devices."""
+        return len(self._devices)
+
+    def get(self, ip: str) -> Device | None:
+        """Look up a device by IP address."""
+        return self._devices.get(ip)
+
+    def devices(self) -> list[Device]:
+        """Return every indexed device."""
+        return list(self._devices.values())
+
+    def clear(self) -> None:
+        """Remove every device."""
+        self._devices = {}
+        self._slots = {}
+        self._by_slot = []
+        self._free = []
+        self._hostnames = {}
+        self._bitmaps = {field: {} for field in BITMAP_FIELDS}
+        self._everything = 0
+
+    def load(self, devices: Iterable[Device]) -> None:
+        """Replace the index contents, building each bitmap in one pass.
+
+        Args:
+            devices: Devices to index; a later record for an IP replaces an earlier one
+        """
+        self.clear()
+        self._devices = {str(device.ip): device for device in devices}
+        self._by_slot = list(self._devices.values())
+        self._slots = {ip: slot for slot, ip in enumerate(self._devices)}
+
+        values: dict[str, dict[str, list[int]]] = {field: {} for field in BITMAP_FIELDS}
+        for slot, device in enumerate(self._devices.values()):
+            if device.hostname is not None:
+                self._hostnames.setdefault(device.hostname, set()).add(slot)
+            for field in BITMAP_FIELDS:
+                value = getattr(device, field)
+                if value is not None:
+                    values[field].setdefault(value, []).append(slot)
+
+        size = len(self._by_slot)
+        for field, slots_by_value in values.items():
+            self._bitmaps[field] = {
+                value: _bitmap(slots, size) for value, slots in slots_by_value.items()
+            }
+        self._everything = (1 << size) - 1
+
+    def add(self, device: Device) -> None:
+        """Index a device, replacing any earlier record for its IP.
+
+        Args:
+            device: Device to index
+        """
+        ip = str(device.ip)
+        self.remove(ip)
+        if self._free:
+            slot = self._free.pop()
+            self._by_slot[slot] = device
+        else:
+            slot = len(self._by_slot)
+            self._by_slot.append(device)
+        self._devices[ip] = device
+        self._slots[ip] = slot
+
+        if device.hostname is not None:
+            self._hostnames.setdefault(device.hostname, set()).add(slot)
+        bit = 1 << slot
+        self._everything |= bit
+        for field in BITMAP_FIELDS:
+            value = getattr(device, field)
+            if value is not None:
+                bitmaps = self._bitmaps[field]
+                bitmaps[value] = bitmaps.get(value, 0) | bit
+
+    def remove(self, ip: str) -> Device | None:
+        """Remove a device from every index.
+
+        Args:
+            ip: IP address of the device
+
+        Returns:
+            The removed device, or None if it was not indexed
+        """
+        device = self._devices.pop(ip, None)
+        if device is None:
+            return None
+        slot = self._slots.pop(ip)
+        self._by_slot[slot] = None
+        self._free.append(slot)
+
+        if device.hostname is not None:
+            slots = self._hostnames[device.hostname]
+            slots.discard(slot)
+            if not slots:
+                del self._hostnames[device.hostname]
+        mask = ~(1 << slot)
+        self._everything &= mask
+        for field in BITMAP_FIELDS:
+            value = getattr(device, field)
+            if value is not None:
+                bitmaps = self._bitmaps[field]
+                remaining = bitmaps[value] & mask
+                if remaining:
+                    bitmaps[value] = remaining
+                else:
+                    del bitmaps[value]
+        return device
+
+    def everything(self) -> int:
+        """Return the bitmap of every device."""
+        return self._everything
+
+    def lookup(self, field: str, value: str) -> int:
+        """Return the bitmap of devices whose field equals value.
+
+        Args:
+            field: One of ip, hostname, site, role or platform
+            value: Value to match exactly
+
+        Returns:
+            Bitmap with one bit set per matching device slot
+        """
+        if field == "ip":
+            slot = self._slots.get(value)
+            return 0 if slot is None else 1 << slot
+        if field == "hostname":
+            return sum(1 << slot for slot in self._hostnames.get(value, ()))
+        return self._bitmaps[field].get(value, 0)
+
+    def count(self, selector: Selector) -> int:
+        """Count the devices matching a selector without materializing them."""
+        return selector.evaluate(self).bit_count()
+
+    def select(self, selector: Selector) -> list[Device]:
+        """Resolve a selector to devices.
+
+        Args:
+            selector: Parsed selector
+
+        Returns:
+            Matching devices in slot order
+        """
+        by_slot = self._by_slot
+        return [by_slot[slot] for slot in _iter_slots(selector.evaluate(self))]  # type: ignore[misc]
+
+
+def _bitmap(slots: Iterable[int], size: int) -> int:
+    """Build a bitmap with the given slots set."""
+    data = bytearray((size >> 3) + 1)
+    for slot in slots:
+        data[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(data, "little")
+
+
+def _iter_slots(bitmap: int) -> list[int]:
+    """Return the set bit positions of a bitmap in increasing order."""
+    # Scanning the binary string in C is far faster than testing bits in Python
+    return [match.start() for match in _SET_BIT.finditer(format(bitmap, "b")[::-1])]
@@ -0,0 +1,236 @@
+"""Selector expressions that pick devices out of the inventory.
+
+A selector is a boolean expression over device attributes::
+
+    site=dc1 AND role=leaf
+    platform=juniper_junos OR (site=dc2 AND NOT role=spine)
+    role=leaf,spine AND site!=lab
+
+``field=a,b`` matches any of the listed values and ``*`` matches every device.
+Keywords are case-insensitive. Parsed selectors are cached, so evaluating a
+selector that was seen before is only bitwise operations over index bitmaps.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Protocol
+
+SELECTOR_FIELDS = ("ip", "hostname", "site", "role", "platform")
+
+_TOKEN = re.compile(r"\s*(?:(\()|(\))|(!=|=)|([^\s()=!]+))")
+_KEYWORDS = ("AND", "OR", "NOT")
+# Parentheses and NOT nest by recursion, so deeper selectors are rejected
+# before they can exhaust the interpreter stack
+MAX_SELECTOR_DEPTH = 32
+
+
+class SelectorError(ValueError):
+    """Raised when a selector expression cannot be parsed."""
+
+
+class SelectorIndex(Protocol):
+    """Lookups a selector needs from the inventory index."""
+
+    def everything(self) -> int:
+        """Return the bitmap of every device."""
+
+    def lookup(self, field: str, value: str) -> int:
+        """Return the bitmap of devices whose field equals value."""
+
+
+class Selector(ABC):
+    """A parsed selector expression."""
+
+    @abstractmethod
+    def evaluate(self, index: SelectorIndex) -> int:
+        """Resolve the selector to a device bitmap.
+
+        Args:
+            index: Inventory index to evaluate against
+
+        Returns:
+            Bitmap with one bit set per matching device slot
+        """
+
+
+@dataclass(frozen=True)
+class _All(Selector):
+    """Matches every device."""
+
+    def evaluate(self, index: SelectorIndex) -> int:
+        return index.everything()
+
+
+@dataclass(frozen=True)
+class _Match(Selector):
+    """``field=value[,value...]`` or its negation."""
+
+    field: str
+    values: tuple[str, ...]
+    negate: bool = False
+
+    def evaluate(self, index: SelectorIndex) -> int:
+        matched = 0
+        for value in self.values:
+            matched |= index.lookup(self.field, value)
+        if self.negate:
+            return index.everything() & ~matched
+        return matched
+
+
+@dataclass(frozen=True)
+class _Not(Selector):
+    """Devices not matched by the operand."""
+
+    operand: Selector
+
+    def evaluate(self, index: SelectorIndex) -> int:
+        return index.everything() & ~self.operand.evaluate(index)
+
+
+@dataclass(frozen=True)
+class _And(Selector):
+    """Devices matched by every operand."""
+
+    operands: tuple[Selector, ...]
+
+    def evaluate(self, index: SelectorIndex) -> int:
+        matched = self.operands[0].evaluate(index)
+        for operand in self.operands[1:]:
+            if not matched:
+                break
+            matched &= operand.evaluate(index)
+        return matched
+
+
+@dataclass(frozen=True)
+class _Or(Selector):
+    """Devices matched by any operand."""
+
+    operands: tuple[Selector, ...]
+
+    def evaluate(self, index: SelectorIndex) -> int:
+        matched = 0
+        for operand in self.operands:
+            matched |= operand.evaluate(index)
+        return matched
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split a selector into parentheses, operators, keywords and words."""
+    tokens: list[str] = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise SelectorError(f"Unexpected character at position {position}: {text[position:]!r}")
+        tokens.append(next(group for group in match.groups() if group is not None))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser; NOT binds tighter than AND, AND than OR."""
+
+    def __init__(self, tokens: list[str]) -> None:
+        self.tokens = tokens
+        self.position = 0
+        self.depth = 0
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _keyword(self, keyword: str) -> bool:
+        token = self._peek()
+        if token is not None and token.upper() == keyword:
+            self.position += 1
+            return True
+        return False
+
+    def _next(self, expected: str) -> str:
+        token = self._peek()
+        if token is None:
+            raise SelectorError(f"Expected {expected} at end of selector")
+        self.position += 1
+        return token
+
+    def _nest(self) -> None:
+        self.depth += 1
+        if self.depth > MAX_SELECTOR_DEPTH:
+            raise SelectorError(f"Selector nests deeper than {MAX_SELECTOR_DEPTH} levels")
+
+    def parse(self) -> Selector:
+        selector = self._or()
+        if self._peek() is not None:
+            raise SelectorError(f"Unexpected token {self._peek()!r}")
+        return selector
+
+    def _or(self) -> Selector:
+        operands = [self._and()]
+        while self._keyword("OR"):
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else _Or(tuple(operands))
+
+    def _and(self) -> Selector:
+        operands = [self._not()]
+        while self._keyword("AND"):
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else _And(tuple(operands))
+
+    def _not(self) -> Selector:
+        if self._keyword("NOT"):
+            self._nest()
+            selector: Selector = _Not(self._not())
+            self.depth -= 1
+            return selector
+        return self._atom()
+
+    def _atom(self) -> Selector:
+        token = self._next("a condition")
+        if token == "(":
+            self._nest()
+            selector = self._or()
+            if self._next("')'") != ")":
+                raise SelectorError("Expected ')'")
+            self.depth -= 1
+            return selector
+        if token == "*":
+            return _All()
+        if token.upper() in _KEYWORDS or token in ("=", "!=", ")"):
+            raise SelectorError(f"Expected a condition, got {token!r}")
+
+        field = token.lower()
+        if field not in SELECTOR_FIELDS:
+            raise SelectorError(
+                f"Unknown field {token!r}; expected one of {', '.join(SELECTOR_FIELDS)}"
+            )
+        operator = self._next("'=' or '!='")
+        if operator not in ("=", "!="):
+            raise SelectorError(f"Expected '=' or '!=' after {token!r}, got {operator!r}")
+        value = self._next("a value")
+        values = tuple(part for part in value.split(",") if part)
+        if value in ("(", ")", "=", "!=") or not values:
+            raise SelectorError(f"Expected a value after {token}{operator}")
+        return _Match(field, values, negate=operator == "!=")
+
+
+@lru_cache(maxsize=1024)
+def parse_selector(text: str) -> Selector:
+    """Parse a selector expression.
+
+    Args:
+        text: Selector such as ``site=dc1 AND role=leaf``
+
+    Returns:
+        The parsed Selector
+
+    Raises:
+        SelectorError: If the expression is not a valid selector
+    """
+    tokens = _tokenize(text)
+    if not tokens:
+        raise SelectorError("Selector is empty")
+    return _Parser(tokens).parse()
@@ -0,0 +1,131 @@
+"""SQLite-backed persistent store for device inventory records."""
+
+import contextlib
+import sqlite3
+from collections.abc import Iterable, Iterator
+from ipaddress import ip_address
+
+from netconfig_api.models.requests import Device
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS devices (
+    ip TEXT PRIMARY KEY,
+    platform TEXT NOT NULL,
+    hostname TEXT,
+    site TEXT,
+    role TEXT
+);
+CREATE INDEX IF NOT EXISTS devices_hostname ON devices (hostname);
+CREATE INDEX IF NOT EXISTS devices_site ON devices (site);
+CREATE INDEX IF NOT EXISTS devices_role ON devices (role);
+CREATE INDEX IF NOT EXISTS devices_platform ON devices (platform);
+"""
+
+_UPSERT = """
+INSERT INTO devices (ip, platform, hostname, site, role) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (ip) DO UPDATE SET
+    platform = excluded.platform,
+    hostname = excluded.hostname,
+    site = excluded.site,
+    role = excluded.role
+"""
+
+
+class InventoryStore:
+    """Durable table of devices in a local SQLite database.
+
+    The store is the source of truth; lookups are served from an in-memory
+    index built from it (see :class:`~netconfig_api.inventory.index.InventoryIndex`).
+    The database is opened on first use, so a store created before the server
+    forks its workers gives each worker its own connection.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """Initialize the store.
+
+        Args:
+            path: SQLite database file, or ``:memory:`` for a private in-memory database
+        """
+        self.path = path
+        self._db: sqlite3.Connection | None = None
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Open or create the database on first use."""
+        if self._db is None:
+            # Only used from one thread at a time (the event loop's), which may
+            # not be the thread that opened it
+            self._db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            if self.path != ":memory:":
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def upsert_many(self, devices: Iterable[Device]) -> int:
+        """Insert or replace devices in a single transaction.
+
+        Args:
+            devices: Devices to write
+
+        Returns:
+            Number of devices written
+        """
+        rows = [
+            (str(device.ip), device.platform, device.hostname, device.site, device.role)
+            for device in devices
+        ]
+        with self._transaction():
+            self._connection.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def delete(self, ip: str) -> bool:
+        """Delete a device.
+
+        Args:
+            ip: IP address of the device
+
+        Returns:
+            True if the device existed
+        """
+        with self._transaction():
+            cursor = self._connection.execute("DELETE FROM devices WHERE ip = ?", (ip,))
+        return cursor.rowcount > 0
+
+    def iter_devices(self) -> Iterator[Device]:
+        """Yield every stored device.
+
+        Rows were validated when written, so they are not validated again.
+        """
+        cursor = self._connection.execute(
+            "SELECT ip, platform, hostname, site, role FROM devices"
+        )
+        for ip, platform, hostname, site, role in cursor:
+            yield Device.model_construct(
+                ip=ip_address(ip),
+                platform=platform,
+                hostname=hostname,
+                site=site,
+                role=role
+            )
+
+    def data_version(self) -> int:
+        """Return a value that changes whenever another connection commits."""
+        return int(self._connection.execute("PRAGMA data_version").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block inside BEGIN/COMMIT, rolling back if it raises."""
+        self._connection.execute("BEGIN")
+        try:
+            yield self._connection
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
@@ -6,14 +6,30 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+from netconfig_api.api.drift import drift_scanner
+from netconfig_api.api.drift import router as drift_router
 from netconfig_api.api.hostname import router as hostname_router
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+from netconfig_api.api.hostname import service as network_config_service
+from netconfig_api.api.inventory import router as inventory_router
+from netconfig_api.api.jobs import job_manager
+from netconfig_api.api.jobs import router as jobs_router
+from netconfig_api.api.metrics import MetricsMiddleware
+from netconfig_api.api.metrics import router as metrics_router
+from netconfig_api.api.operations import router as operations_router
+from netconfig_api.api.request_ids import RequestIdMiddleware
+from netconfig_api.api.responses import FAST_JSON, ModelResponse
+from netconfig_api.api.status import router as status_router
+from netconfig_api.api.tracing import TracingMiddleware
+from netconfig_api.api.transactions import router as transactions_router
+from netconfig_api.utils.logs import LogSettings, configure_logging
+from netconfig_api.utils.tracing import TRACER, TraceSettings, configure_tracing
+
+# Log through a background writer thread, configured by NETCONFIG_LOG_*
+configure_logging(LogSettings.from_env())
+# Export sampled request traces, configured by NETCONFIG_TRACE_*
+configure_tracing(TraceSettings.from_env())
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +38,15 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
     logger.info("Starting NetConfigAPI application")
+    await network_config_service.start()
+    await job_manager.start()
+    await drift_scanner.start()
     yield
     logger.info("Shutting down NetConfigAPI application")
+    await drift_scanner.close()
+    await job_manager.close()
+    await network_config_service.close()
+    TRACER.shutdown()
 
 
 app = FastAPI(
@@ -33,7 +56,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ModelResponse if FAST_JSON else JSONResponse
 )
 
 # Add CORS middleware
@@ -45,12 +69,55 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Record request latency per route
+app.add_middleware(MetricsMiddleware)
+
+# Trace sampled requests, continuing the caller's W3C trace context
+app.add_middleware(TracingMiddleware)
+
+# Tag every request's log records with its X-Request-ID
+app.add_middleware(RequestIdMiddleware)
+
 # Include API routers
 app.include_router(
     hostname_router,
     prefix="/api/v1",
     tags=["hostname"]
 )
+app.include_router(
+    operations_router,
+    prefix="/api/v1",
+    tags=["operations"]
+)
+app.include_router(
+    inventory_router,
+    prefix="/api/v1",
+    tags=["inventory"]
+)
+app.include_router(
+    jobs_router,
+    prefix="/api/v1",
+    tags=["jobs"]
+)
+app.include_router(
+    transactions_router,
+    prefix="/api/v1",
+    tags=["transactions"]
+)
+app.include_router(
+    drift_router,
+    prefix="/api/v1",
+    tags=["drift"]
+)
+app.include_router(
+    status_router,
+    prefix="/api/v1",
+    tags=["status"]
+)
+app.include_router(
+    metrics_router,
+    tags=["metrics"]
+)
 
 
 @app.get("/")
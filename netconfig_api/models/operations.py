@@ -0,0 +1,136 @@
+"""Request models generated from the operation catalog."""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+from pydantic import (
+    BaseModel,
+    Field,
+    IPvAnyAddress,
+    PrivateAttr,
+    create_model,
+    model_validator,
+)
+
+from netconfig_api.utils.device_platforms import OPERATIONS, OperationDefinition
+
+_FIELD_TYPES: dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "ip": IPvAnyAddress,
+}
+
+
+class OperationRequest(BaseModel):
+    """Base of every generated operation request model.
+
+    Each catalog operation's model adds one required field per parameter,
+    with the constraints declared in the catalog.
+    """
+
+    device: IPvAnyAddress = Field(
+        ...,
+        description="IP address of the network device"
+    )
+    platform: str | None = Field(
+        default=None,
+        description=(
+            "Network device platform (e.g., cisco_ios, juniper_junos). "
+            "Looked up in the device inventory when omitted."
+        )
+    )
+
+    def parameters(self) -> dict[str, str]:
+        """Get the operation's parameter values as template strings."""
+        return {
+            name: str(getattr(self, name))
+            for name in type(self).model_fields
+            if name not in OperationRequest.model_fields
+        }
+
+
+def build_operation_model(operation: OperationDefinition) -> type[OperationRequest]:
+    """Generate the request model for a catalog operation.
+
+    Args:
+        operation: Operation definition from the catalog
+
+    Returns:
+        A subclass of OperationRequest, named after the operation, e.g.
+        ``NtpServerRequest`` for ``ntp_server``
+    """
+    fields: dict[str, Any] = {}
+    for name, schema in operation.parameters.items():
+        constraints = {key: value for key, value in schema.items() if key != "type"}
+        fields[name] = (_FIELD_TYPES[schema["type"]], Field(..., **constraints))
+    model_name = "".join(part.capitalize() for part in operation.name.split("_")) + "Request"
+    model: type[OperationRequest] = create_model(
+        model_name,
+        __base__=OperationRequest,
+        **fields
+    )
+    model.__doc__ = f"Request model for the {operation.name} operation: {operation.description}."
+    return model
+
+
+OPERATION_MODELS: Mapping[str, type[OperationRequest]] = MappingProxyType({
+    name: build_operation_model(operation) for name, operation in OPERATIONS.items()
+})
+
+
+class ChangeSetOperation(BaseModel):
+    """One operation in a change set."""
+
+    operation: str = Field(
+        ...,
+        description="Catalog operation name, e.g. ntp_server"
+    )
+    parameters: dict[str, Any] = Field(
+        default_factory=dict,
+        description="The operation's parameters, as in its own request body"
+    )
+
+
+class ChangeSetRequest(BaseModel):
+    """Request model for applying several catalog operations to one device at once."""
+
+    device: IPvAnyAddress = Field(
+        ...,
+        description="IP address of the network device"
+    )
+    platform: str | None = Field(
+        default=None,
+        description=(
+            "Network device platform (e.g., cisco_ios, juniper_junos). "
+            "Looked up in the device inventory when omitted."
+        )
+    )
+    operations: list[ChangeSetOperation] = Field(
+        ...,
+        description="Operations to apply, in order",
+        min_length=1,
+        max_length=100
+    )
+
+    _requests: list[OperationRequest] = PrivateAttr(default_factory=list)
+
+    @model_validator(mode="after")
+    def _check_operations(self) -> "ChangeSetRequest":
+        """Validate each operation's parameters against its generated model."""
+        requests: list[OperationRequest] = []
+        for item in self.operations:
+            model = OPERATION_MODELS.get(item.operation)
+            if model is None:
+                raise ValueError(f"Unknown operation: {item.operation}")
+            requests.append(model.model_validate({
+                **item.parameters,
+                "device": self.device,
+                "platform": self.platform
+            }))
+        self._requests = requests
+        return self
+
+    def requests(self) -> list[OperationRequest]:
+        """Get the validated request of each operation, in order."""
+        return self._requests
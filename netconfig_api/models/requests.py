@@ -1,6 +1,13 @@
 """Request and response models for the NetConfigAPI."""
 
-from pydantic import BaseModel, Field, IPvAnyAddress
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field, IPvAnyAddress, field_validator, model_validator
+
+from netconfig_api.utils.device_platforms import validate_platform
+
+HOSTNAME_PATTERN = r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$"
 
 
 class HostnameRequest(BaseModel):
@@ -11,15 +18,18 @@ class HostnameRequest(BaseModel):
         description="The hostname to set on the device",
         min_length=1,
         max_length=63,
-        pattern=r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$"
+        pattern=HOSTNAME_PATTERN
     )
     device: IPvAnyAddress = Field(
         ...,
         description="IP address of the network device"
     )
-    platform: str = Field(
-        ...,
-        description="Network device platform (e.g., cisco_ios, juniper_junos)"
+    platform: str | None = Field(
+        default=None,
+        description=(
+            "Network device platform (e.g., cisco_ios, juniper_junos). "
+            "Looked up in the device inventory when omitted."
+        )
     )
 
 
@@ -42,3 +52,632 @@ class HostnameResponse(BaseModel):
         ...,
         description="The hostname that was configured"
     )
+    cached: bool = Field(
+        default=False,
+        description=(
+            "True if no push was made because the device already had this "
+            "hostname or the request was a retry of an earlier one"
+        )
+    )
+    dry_run: bool = Field(
+        default=False,
+        description="True if this is a plan only and nothing was pushed"
+    )
+    commands: list[str] | None = Field(
+        default=None,
+        description="Commands a dry run would send to the device"
+    )
+    diff: list[str] | None = Field(
+        default=None,
+        description=(
+            "Dry-run diff against the device's last-known running configuration: "
+            "'-' lines would be replaced, '+' lines added. Empty if nothing would change."
+        )
+    )
+    changed: bool | None = Field(
+        default=None,
+        description=(
+            "Whether a dry run would change the device. True when its running "
+            "value is not known."
+        )
+    )
+
+
+class BatchHostnameRequest(BaseModel):
+    """Request model for configuring hostnames on many devices at once."""
+
+    requests: list[HostnameRequest] = Field(
+        default_factory=list,
+        description="Hostname configuration requests, one per device",
+        max_length=10000
+    )
+    selector: str | None = Field(
+        default=None,
+        description=(
+            "Inventory selector, e.g. 'site=dc1 AND role=leaf'. Each matching "
+            "device is configured with its hostname from the inventory. "
+            "Used instead of requests."
+        ),
+        min_length=1,
+        max_length=1024
+    )
+    concurrency: int = Field(
+        default=100,
+        description="Maximum number of devices configured concurrently",
+        ge=1,
+        le=1000
+    )
+
+    @model_validator(mode="after")
+    def _check_target(self) -> "BatchHostnameRequest":
+        """Require exactly one of requests or selector."""
+        if bool(self.requests) == (self.selector is not None):
+            raise ValueError("Provide either a non-empty requests list or a selector")
+        return self
+
+
+class BatchHostnameResponse(BaseModel):
+    """Response model for batch hostname configuration."""
+
+    results: list[HostnameResponse] = Field(
+        ...,
+        description="Per-device results, in the same order as the request"
+    )
+    total: int = Field(
+        ...,
+        description="Number of devices in the batch"
+    )
+    succeeded: int = Field(
+        ...,
+        description="Number of devices configured successfully"
+    )
+    failed: int = Field(
+        ...,
+        description="Number of devices that failed to configure"
+    )
+    elapsed_ms: float = Field(
+        ...,
+        description="Wall-clock time taken by the whole batch in milliseconds"
+    )
+    mean_device_ms: float = Field(
+        ...,
+        description="Mean time spent configuring a single device in milliseconds"
+    )
+    max_device_ms: float = Field(
+        ...,
+        description="Slowest single device configuration time in milliseconds"
+    )
+    changed: int | None = Field(
+        default=None,
+        description="Number of devices a dry run would change"
+    )
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a background configuration job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class JobResponse(BaseModel):
+    """Response model describing a background configuration job."""
+
+    id: str = Field(
+        ...,
+        description="Unique job identifier"
+    )
+    status: JobStatus = Field(
+        ...,
+        description="Current job status"
+    )
+    submitted_at: datetime = Field(
+        ...,
+        description="When the job was accepted"
+    )
+    started_at: datetime | None = Field(
+        default=None,
+        description="When a worker started the job"
+    )
+    finished_at: datetime | None = Field(
+        default=None,
+        description="When the job finished"
+    )
+    result: HostnameResponse | BatchHostnameResponse | None = Field(
+        default=None,
+        description="Configuration result, once the job has completed"
+    )
+    error: str | None = Field(
+        default=None,
+        description="Error message if the job failed to run"
+    )
+
+
+class SchedulerStats(BaseModel):
+    """Response model describing the per-device operation scheduler."""
+
+    executed: int = Field(
+        ...,
+        description="Number of operations executed against devices"
+    )
+    coalesced: int = Field(
+        ...,
+        description="Number of operations superseded by a newer pending write"
+    )
+    active_devices: int = Field(
+        ...,
+        description="Number of devices with an operation running or pending"
+    )
+    queue_depths: dict[str, int] = Field(
+        ...,
+        description="Pending operations waiting for each busy device"
+    )
+
+
+class BreakerState(str, Enum):
+    """States of a device's circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class DeviceBreaker(BaseModel):
+    """Circuit breaker state of one device."""
+
+    state: BreakerState = Field(
+        ...,
+        description="closed: operations run; open: they fail fast; half_open: one probe is running"
+    )
+    consecutive_failures: int = Field(
+        ...,
+        description="Failed operations since the last success"
+    )
+    trips: int = Field(
+        ...,
+        description="Times the breaker has opened since the last success"
+    )
+    retry_at: datetime | None = Field(
+        default=None,
+        description="When an open breaker will let a probe through"
+    )
+
+
+class BreakerStats(BaseModel):
+    """Response model describing per-device circuit breakers."""
+
+    open: int = Field(
+        ...,
+        description="Number of devices whose breaker is open or half-open"
+    )
+    devices: dict[str, DeviceBreaker] = Field(
+        ...,
+        description="Breaker of each device with failures since its last success"
+    )
+
+
+class ConcurrencyLimit(BaseModel):
+    """Current adaptive concurrency limit of a device or platform."""
+
+    limit: int = Field(
+        ...,
+        description="Operations allowed in flight at once"
+    )
+    in_flight: int = Field(
+        ...,
+        description="Operations currently in flight"
+    )
+    latency_ms: float | None = Field(
+        default=None,
+        description="Smoothed latency of successful operations in milliseconds"
+    )
+    baseline_ms: float | None = Field(
+        default=None,
+        description="Estimated latency without load in milliseconds"
+    )
+    error_rate: float = Field(
+        ...,
+        description="Smoothed fraction of operations that failed"
+    )
+
+
+class ConcurrencyStats(BaseModel):
+    """Response model describing the adaptive concurrency controller."""
+
+    max_in_flight: int = Field(
+        ...,
+        description="Fixed cap on operations in flight across all devices"
+    )
+    in_flight: int = Field(
+        ...,
+        description="Operations currently in flight across all devices"
+    )
+    waiting: int = Field(
+        ...,
+        description="Operations waiting for capacity"
+    )
+    platforms: dict[str, ConcurrencyLimit] = Field(
+        ...,
+        description="Limit of each platform that has been used"
+    )
+    devices: dict[str, ConcurrencyLimit] = Field(
+        ...,
+        description="Limit of each device with operations in flight or a reduced limit"
+    )
+
+
+class Device(BaseModel):
+    """A network device record in the inventory."""
+
+    ip: IPvAnyAddress = Field(
+        ...,
+        description="IP address of the network device"
+    )
+    platform: str = Field(
+        ...,
+        description="Network device platform (e.g., cisco_ios, juniper_junos)"
+    )
+    hostname: str | None = Field(
+        default=None,
+        description="Desired hostname of the device",
+        min_length=1,
+        max_length=63,
+        pattern=HOSTNAME_PATTERN
+    )
+    site: str | None = Field(
+        default=None,
+        description="Site the device is installed at, e.g. dc1",
+        min_length=1,
+        max_length=64
+    )
+    role: str | None = Field(
+        default=None,
+        description="Role of the device, e.g. leaf or spine",
+        min_length=1,
+        max_length=64
+    )
+
+    @field_validator("platform")
+    @classmethod
+    def _check_platform(cls, platform: str) -> str:
+        """Reject platforms without command templates."""
+        if not validate_platform(platform):
+            raise ValueError(f"Unsupported platform: {platform}")
+        return platform
+
+
+class DeviceList(BaseModel):
+    """Response model for an inventory query."""
+
+    devices: list[Device] = Field(
+        ...,
+        description="Matching devices, ordered by IP address"
+    )
+    total: int = Field(
+        ...,
+        description="Number of matching devices, including any beyond the limit"
+    )
+
+
+class InventoryFormat(str, Enum):
+    """File formats for inventory import and export."""
+
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+class ImportRowError(BaseModel):
+    """A row that could not be imported into the inventory."""
+
+    line: int = Field(
+        ...,
+        description="Line number of the row in the uploaded file, counting non-blank lines"
+    )
+    error: str = Field(
+        ...,
+        description="Why the row was rejected"
+    )
+
+
+class ImportSummary(BaseModel):
+    """Final line of an inventory import."""
+
+    imported: int = Field(
+        ...,
+        description="Number of devices written to the inventory"
+    )
+    failed: int = Field(
+        ...,
+        description="Number of rows rejected"
+    )
+    batches: int = Field(
+        ...,
+        description="Number of transactions the devices were written in"
+    )
+    elapsed_ms: float = Field(
+        ...,
+        description="Time taken by the import in milliseconds"
+    )
+
+
+class DriftResult(BaseModel):
+    """Latest drift check of one device."""
+
+    device: str = Field(
+        ...,
+        description="IP address of the device"
+    )
+    checked_at: datetime = Field(
+        ...,
+        description="When the device's running config was last read"
+    )
+    drifted: bool = Field(
+        ...,
+        description="Whether the running config differs from the desired state"
+    )
+    diff: list[str] = Field(
+        default_factory=list,
+        description=(
+            "Running lines that differ ('-') and the desired lines in their place ('+')"
+        )
+    )
+    snapshot_id: int | None = Field(
+        default=None,
+        description="Config snapshot the check was made against"
+    )
+    error: str | None = Field(
+        default=None,
+        description="Why the device could not be checked"
+    )
+
+
+class DriftReport(BaseModel):
+    """Response model for the drift scanner's report."""
+
+    checked: int = Field(
+        ...,
+        description="Number of devices checked at least once"
+    )
+    drifted: int = Field(
+        ...,
+        description="Number of devices whose last check found drift"
+    )
+    errors: int = Field(
+        ...,
+        description="Number of devices whose last check failed"
+    )
+    passes: int = Field(
+        ...,
+        description="Number of completed scans of the whole inventory"
+    )
+    last_pass_at: datetime | None = Field(
+        default=None,
+        description="When the last full scan completed"
+    )
+    results: list[DriftResult] = Field(
+        ...,
+        description="Devices with drift or a failed check, ordered by IP address"
+    )
+
+
+class TransactionRequest(BaseModel):
+    """Request model for an all-or-nothing change across several devices."""
+
+    requests: list[HostnameRequest] = Field(
+        ...,
+        description="Hostname changes, at most one per device",
+        min_length=1,
+        max_length=1000
+    )
+    confirm_timeout: float = Field(
+        default=120.0,
+        description=(
+            "Seconds a commit-confirmed device waits for confirmation before "
+            "rolling itself back"
+        ),
+        gt=0,
+        le=3600
+    )
+
+    @model_validator(mode="after")
+    def _check_devices(self) -> "TransactionRequest":
+        """Reject transactions that change one device twice."""
+        devices = [str(request.device) for request in self.requests]
+        if len(set(devices)) != len(devices):
+            raise ValueError("Each device may appear only once in a transaction")
+        return self
+
+
+class TransactionState(str, Enum):
+    """Outcomes of a multi-device transaction."""
+
+    COMMITTED = "committed"
+    ABORTED = "aborted"
+    ROLLED_BACK = "rolled_back"
+    FAILED = "failed"
+
+
+class TransactionDeviceStatus(str, Enum):
+    """Where one device ended up in a transaction."""
+
+    PREPARED = "prepared"
+    COMMITTED = "committed"
+    ROLLED_BACK = "rolled_back"
+    FAILED = "failed"
+    ROLLBACK_FAILED = "rollback_failed"
+
+
+class TransactionDeviceResult(BaseModel):
+    """Outcome of a transaction on one device."""
+
+    device: str = Field(
+        ...,
+        description="IP address of the device"
+    )
+    hostname: str = Field(
+        ...,
+        description="Hostname the transaction sets"
+    )
+    platform: str | None = Field(
+        default=None,
+        description="Device platform"
+    )
+    status: TransactionDeviceStatus = Field(
+        ...,
+        description=(
+            "prepared: staged but not changed; committed: changed; rolled_back: "
+            "changed and restored; failed: this device failed; rollback_failed: "
+            "changed and could not be restored"
+        )
+    )
+    commands: list[str] = Field(
+        default_factory=list,
+        description="Configuration commands the transaction applies"
+    )
+    rollback_commands: list[str] = Field(
+        default_factory=list,
+        description="Commands that restore the device's previous configuration"
+    )
+    error: str | None = Field(
+        default=None,
+        description="Why the device failed"
+    )
+
+
+class TransactionTimings(BaseModel):
+    """Wall-clock time of each transaction phase in milliseconds."""
+
+    prepare_ms: float = Field(
+        ...,
+        description="Validating, reading running configs and staging commands"
+    )
+    commit_ms: float = Field(
+        ...,
+        description="Applying the commands on every device"
+    )
+    confirm_ms: float = Field(
+        ...,
+        description="Confirming commit-confirmed devices"
+    )
+    rollback_ms: float = Field(
+        ...,
+        description="Restoring committed devices after a failure"
+    )
+    total_ms: float = Field(
+        ...,
+        description="Whole transaction"
+    )
+
+
+class TransactionResponse(BaseModel):
+    """Response model for a multi-device transaction."""
+
+    id: str = Field(
+        ...,
+        description="Unique transaction identifier"
+    )
+    state: TransactionState = Field(
+        ...,
+        description=(
+            "committed: every device changed; aborted: a device failed before "
+            "anything changed; rolled_back: a commit failed and every changed "
+            "device was restored; failed: a changed device could not be restored"
+        )
+    )
+    message: str = Field(
+        ...,
+        description="Summary of the outcome"
+    )
+    results: list[TransactionDeviceResult] = Field(
+        ...,
+        description="Per-device outcomes, in the same order as the request"
+    )
+    timings: TransactionTimings = Field(
+        ...,
+        description="Time taken by each phase"
+    )
+
+
+class OperationResponse(BaseModel):
+    """Response model for a catalog operation."""
+
+    success: bool = Field(
+        ...,
+        description="Whether the operation was applied"
+    )
+    message: str = Field(
+        ...,
+        description="Status message describing the result"
+    )
+    device: str = Field(
+        ...,
+        description="IP address of the configured device"
+    )
+    operation: str = Field(
+        ...,
+        description="Catalog operation that was applied"
+    )
+    commands: list[str] = Field(
+        default_factory=list,
+        description="Configuration commands rendered for the device"
+    )
+    cached: bool = Field(
+        default=False,
+        description="True if no push was made because the device already had this configuration"
+    )
+
+
+class OperationInfo(BaseModel):
+    """Description of a catalog operation."""
+
+    name: str = Field(
+        ...,
+        description="Operation name, used in its route"
+    )
+    description: str = Field(
+        ...,
+        description="What the operation configures"
+    )
+    platforms: list[str] = Field(
+        ...,
+        description="Platforms with a template for the operation"
+    )
+    parameters: dict = Field(
+        ...,
+        description="JSON schema of the operation's request body"
+    )
+
+
+class ChangeSetResponse(BaseModel):
+    """Response model for a change set applied to one device."""
+
+    success: bool = Field(
+        ...,
+        description="Whether every operation is configured on the device"
+    )
+    message: str = Field(
+        ...,
+        description="Status message describing the result"
+    )
+    device: str = Field(
+        ...,
+        description="IP address of the device"
+    )
+    platform: str | None = Field(
+        default=None,
+        description="Device platform the commands were rendered for"
+    )
+    commands: list[str] = Field(
+        default_factory=list,
+        description="Config block sent to the device in one session, empty if nothing changed"
+    )
+    results: list[OperationResponse] = Field(
+        ...,
+        description="Per-operation results, in the same order as the request"
+    )
+    elapsed_ms: float = Field(
+        ...,
+        description="Time taken by the change set in milliseconds"
+    )
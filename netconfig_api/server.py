@@ -0,0 +1,365 @@
+"""Production server launcher for NetConfigAPI.
+
+Runs the application under uvicorn in a single worker process by default.
+Several workers can be run with ``NETCONFIG_WORKERS``, but some state is
+kept in each worker's memory (see :data:`PER_WORKER_STATE`), so a request
+may reach a worker that knows nothing of an earlier one. The inventory and
+config snapshots are shared once ``NETCONFIG_INVENTORY_DB`` and
+``NETCONFIG_SNAPSHOT_DIR`` point at files on a common disk.
+
+The application is imported once in the supervisor before workers are
+forked, so workers share its memory copy-on-write and start instantly. With
+``SO_REUSEPORT`` each worker binds its own listening socket and the kernel
+spreads connections across them. Workers that exit, for example after serving
+``max_requests`` requests, are replaced; ``SIGHUP`` replaces every worker one
+at a time and ``SIGTERM``/``SIGINT`` shut down gracefully.
+
+All settings are read from ``NETCONFIG_*`` environment variables; see
+:meth:`ServerSettings.from_env`.
+"""
+
+import logging
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from multiprocessing.process import BaseProcess
+from types import FrameType
+from typing import Any
+
+import uvicorn
+
+from netconfig_api.utils.logs import LogSettings, configure_logging
+
+logger = logging.getLogger(__name__)
+
+APP_PATH = "netconfig_api.main:app"
+
+# State each worker process keeps to itself
+PER_WORKER_STATE = (
+    "background jobs",
+    "Idempotency-Key results",
+    "per-device operation ordering",
+    "circuit breakers",
+    "applied-state cache",
+    "adaptive concurrency limits",
+    "drift scanner state",
+    "Prometheus metrics",
+)
+
+
+def available_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _env_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class ServerSettings:
+    """Settings for the production server."""
+
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 1
+    loop: str = "auto"
+    http: str = "auto"
+    reuse_port: bool = True
+    preload: bool = True
+    backlog: int = 2048
+    keepalive_timeout: int = 5
+    max_requests: int = 0
+    max_requests_jitter: int = 0
+    graceful_timeout: float = 30.0
+    log_level: str = "info"
+    access_log: bool = False
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> "ServerSettings":
+        """Build settings from environment variables.
+
+        Recognized variables (all optional):
+
+        - ``NETCONFIG_HOST`` / ``NETCONFIG_PORT``: listen address
+        - ``NETCONFIG_WORKERS``: worker processes, or ``auto`` for one per CPU;
+          see :data:`PER_WORKER_STATE` before running more than one
+        - ``NETCONFIG_LOOP``: ``auto``, ``uvloop`` or ``asyncio``
+        - ``NETCONFIG_HTTP``: ``auto``, ``httptools`` or ``h11``
+        - ``NETCONFIG_REUSE_PORT``: bind one socket per worker with SO_REUSEPORT
+        - ``NETCONFIG_PRELOAD``: import the app before forking workers
+        - ``NETCONFIG_BACKLOG``: listen backlog
+        - ``NETCONFIG_KEEPALIVE_TIMEOUT``: HTTP keep-alive timeout in seconds
+        - ``NETCONFIG_MAX_REQUESTS``: recycle a worker after this many requests (0 disables)
+        - ``NETCONFIG_MAX_REQUESTS_JITTER``: random extra requests per worker, so
+          workers do not all recycle at once
+        - ``NETCONFIG_GRACEFUL_TIMEOUT``: seconds to wait for workers to finish on shutdown
+        - ``NETCONFIG_LOG_LEVEL``: log level; see also :meth:`LogSettings.from_env`
+        - ``NETCONFIG_ACCESS_LOG``: enable uvicorn access logging
+
+        Args:
+            environ: Environment to read; defaults to ``os.environ``
+
+        Returns:
+            ServerSettings populated from the environment
+
+        Raises:
+            ValueError: If a variable has an invalid value
+        """
+        env = os.environ if environ is None else environ
+        values: dict[str, Any] = {}
+
+        def read(name: str, key: str, convert: Any) -> None:
+            raw = env.get(f"NETCONFIG_{name}")
+            if raw is None or raw == "":
+                return
+            try:
+                values[key] = convert(raw)
+            except ValueError as e:
+                raise ValueError(f"Invalid NETCONFIG_{name}: {raw!r}") from e
+
+        read("HOST", "host", str)
+        read("PORT", "port", int)
+        read("WORKERS", "workers", lambda raw: available_cpus() if raw == "auto" else int(raw))
+        read("LOOP", "loop", lambda raw: _choice(raw, ("auto", "uvloop", "asyncio")))
+        read("HTTP", "http", lambda raw: _choice(raw, ("auto", "httptools", "h11")))
+        read("REUSE_PORT", "reuse_port", _env_bool)
+        read("PRELOAD", "preload", _env_bool)
+        read("BACKLOG", "backlog", int)
+        read("KEEPALIVE_TIMEOUT", "keepalive_timeout", int)
+        read("MAX_REQUESTS", "max_requests", int)
+        read("MAX_REQUESTS_JITTER", "max_requests_jitter", int)
+        read("GRACEFUL_TIMEOUT", "graceful_timeout", float)
+        read("LOG_LEVEL", "log_level", str.lower)
+        read("ACCESS_LOG", "access_log", _env_bool)
+
+        settings = cls(**values)
+        if settings.workers < 1:
+            raise ValueError("NETCONFIG_WORKERS must be at least 1")
+        return settings
+
+
+def _choice(raw: str, choices: tuple[str, ...]) -> str:
+    """Validate that a value is one of the allowed choices."""
+    value = raw.strip().lower()
+    if value not in choices:
+        raise ValueError(f"expected one of {', '.join(choices)}")
+    return value
+
+
+def bind_socket(settings: ServerSettings) -> socket.socket:
+    """Create the listening socket for a worker or for all workers.
+
+    Args:
+        settings: Server settings
+
+    Returns:
+        A bound, inheritable TCP socket
+    """
+    family = socket.AF_INET6 if ":" in settings.host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if settings.reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((settings.host, settings.port))
+    sock.set_inheritable(True)
+    return sock
+
+
+def build_config(settings: ServerSettings, app: Any, max_requests: int | None) -> uvicorn.Config:
+    """Build the uvicorn configuration for one worker.
+
+    Args:
+        settings: Server settings
+        app: ASGI application object, or its import string when not preloaded
+        max_requests: Requests after which the worker exits, or None
+
+    Returns:
+        uvicorn Config
+    """
+    return uvicorn.Config(
+        app,
+        host=settings.host,
+        port=settings.port,
+        loop=settings.loop,
+        http=settings.http,
+        lifespan="on",
+        backlog=settings.backlog,
+        timeout_keep_alive=settings.keepalive_timeout,
+        timeout_graceful_shutdown=int(settings.graceful_timeout),
+        limit_max_requests=max_requests,
+        log_level=settings.log_level,
+        access_log=settings.access_log,
+        # uvicorn's loggers propagate to the application's queued handler
+        log_config=None
+    )
+
+
+def _worker_max_requests(settings: ServerSettings) -> int | None:
+    """Pick this worker's request limit, spreading recycling with jitter."""
+    if settings.max_requests <= 0:
+        return None
+    return settings.max_requests + random.randint(0, max(0, settings.max_requests_jitter))
+
+
+def run_worker(settings: ServerSettings, app: Any, shared: socket.socket | None) -> None:
+    """Serve requests in a worker process until told to stop.
+
+    Args:
+        settings: Server settings
+        app: ASGI application object, or its import string when not preloaded
+        shared: Socket bound by the supervisor, or None to bind one with SO_REUSEPORT
+    """
+    for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+        signal.signal(signum, signal.SIG_DFL)
+    sock = shared if shared is not None else bind_socket(settings)
+    server = uvicorn.Server(build_config(settings, app, _worker_max_requests(settings)))
+    server.run(sockets=[sock])
+
+
+class Supervisor:
+    """Pre-fork supervisor that keeps a fixed number of workers running."""
+
+    def __init__(self, settings: ServerSettings, app: Any) -> None:
+        """Initialize the supervisor.
+
+        Args:
+            settings: Server settings
+            app: ASGI application object, or its import string when not preloaded
+        """
+        self.settings = settings
+        self.app = app
+        self.workers: list[BaseProcess] = []
+        self._context = multiprocessing.get_context("fork")
+        self._shared = None if settings.reuse_port else bind_socket(settings)
+        self._should_exit = False
+        self._should_recycle = False
+
+    def run(self) -> None:
+        """Start the workers and supervise them until shutdown is requested."""
+        signal.signal(signal.SIGTERM, self._handle_exit)
+        signal.signal(signal.SIGINT, self._handle_exit)
+        signal.signal(signal.SIGHUP, self._handle_recycle)
+
+        logger.info(
+            "Starting %d workers on %s:%d (reuse_port=%s, preload=%s)",
+            self.settings.workers,
+            self.settings.host,
+            self.settings.port,
+            self.settings.reuse_port,
+            self.settings.preload
+        )
+        self.workers = [self._spawn() for _ in range(self.settings.workers)]
+
+        while not self._should_exit:
+            self._replace_exited()
+            if self._should_recycle:
+                self._should_recycle = False
+                self._recycle_all()
+            time.sleep(0.2)
+
+        self._shutdown()
+
+    def _spawn(self) -> BaseProcess:
+        """Fork a new worker process."""
+        process = self._context.Process(
+            target=run_worker,
+            args=(self.settings, self.app, self._shared),
+            daemon=False
+        )
+        process.start()
+        logger.info("Started worker %s", process.pid)
+        return process
+
+    def _replace_exited(self) -> None:
+        """Replace workers that exited, e.g. after reaching max_requests."""
+        for index, process in enumerate(self.workers):
+            if not process.is_alive() and not self._should_exit:
+                logger.info("Worker %s exited with %s; replacing", process.pid, process.exitcode)
+                process.join()
+                self.workers[index] = self._spawn()
+
+    def _recycle_all(self) -> None:
+        """Replace each worker in turn so capacity never drops to zero."""
+        logger.info("Recycling all workers")
+        for index, old in enumerate(list(self.workers)):
+            self.workers[index] = self._spawn()
+            self._stop([old])
+
+    def _stop(self, processes: list[BaseProcess]) -> None:
+        """Ask workers to stop, killing any that outlive the graceful timeout."""
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + self.settings.graceful_timeout
+        for process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning("Worker %s did not stop in time; killing", process.pid)
+                process.kill()
+                process.join()
+
+    def _shutdown(self) -> None:
+        """Stop every worker and release the shared socket."""
+        logger.info("Shutting down %d workers", len(self.workers))
+        self._stop(self.workers)
+        if self._shared is not None:
+            self._shared.close()
+
+    def _handle_exit(self, signum: int, frame: FrameType | None) -> None:
+        """Signal handler requesting shutdown."""
+        self._should_exit = True
+
+    def _handle_recycle(self, signum: int, frame: FrameType | None) -> None:
+        """Signal handler requesting a rolling restart of the workers."""
+        self._should_recycle = True
+
+
+def main() -> None:
+    """Run the production server configured from the environment."""
+    settings = ServerSettings.from_env()
+    configure_logging(LogSettings.from_env())
+
+    if settings.preload:
+        # pylint: disable=import-outside-toplevel
+        from netconfig_api.api.hostname import service
+        from netconfig_api.main import app
+        from netconfig_api.transports.registry import LazyTransport
+
+        # Load the transport now too, so forked workers share it copy-on-write
+        if isinstance(service.pool.transport, LazyTransport):
+            service.pool.transport.load()
+        target: Any = app
+    else:
+        target = APP_PATH
+
+    if settings.workers > 1:
+        logger.warning(
+            "Running %d workers: %s are kept per worker and not shared between them",
+            settings.workers,
+            ", ".join(PER_WORKER_STATE)
+        )
+        if not os.getenv("NETCONFIG_INVENTORY_DB"):
+            logger.warning(
+                "NETCONFIG_INVENTORY_DB is not set; each worker has its own in-memory inventory"
+            )
+
+    if settings.workers == 1 and settings.max_requests <= 0:
+        uvicorn.Server(
+            build_config(settings, target, _worker_max_requests(settings))
+        ).run(sockets=[bind_socket(settings)])
+        return
+
+    Supervisor(settings, target).run()
+
+
+if __name__ == "__main__":
+    main()
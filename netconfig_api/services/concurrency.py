@@ -0,0 +1,292 @@
+"""Adaptive per-device, per-platform and global concurrency limits."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterator
+
+from netconfig_api.models.requests import ConcurrencyLimit, ConcurrencyStats
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest sample in the smoothed latency and error rate. Errors
+# are smoothed over more samples so one failure does not look like a trend.
+_SMOOTHING = 0.2
+_ERROR_SMOOTHING = 0.05
+# How quickly the no-load baseline follows latencies above it
+_BASELINE_RISE = 0.01
+
+
+class AIMDLimit:
+    """Concurrency limit adjusted by additive increase, multiplicative decrease.
+
+    Each operation that completes without error and within ``tolerance``
+    times the baseline latency raises the limit by ``1 / limit``, about one
+    extra slot per limit's worth of operations. A slow operation, or a failure
+    while the smoothed error rate is above ``error_threshold``, multiplies the
+    limit by ``backoff``, at most once per smoothed latency so that one
+    congested burst is not punished repeatedly. The baseline tracks the
+    fastest recent successful latency, rising only slowly, so it approximates
+    the target's latency when it is not under load.
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        minimum: float = 1.0,
+        maximum: float = 1024.0,
+        backoff: float = 0.5,
+        tolerance: float = 2.0,
+        error_threshold: float = 0.0
+    ) -> None:
+        """Initialize the limit.
+
+        Args:
+            initial: Starting limit
+            minimum: Floor the limit never drops below
+            maximum: Ceiling the limit never rises above
+            backoff: Factor applied to the limit on congestion
+            tolerance: Latency, as a multiple of the baseline, treated as congestion
+            error_threshold: Smoothed error rate above which failures are
+                treated as congestion; 0 makes every failure count
+        """
+        self.limit = initial
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.error_threshold = error_threshold
+        self.in_flight = 0
+        self.error_rate = 0.0
+        self.latency: float | None = None
+        self.baseline: float | None = None
+        self._last_decrease = float("-inf")
+
+    @property
+    def available(self) -> bool:
+        """Whether another operation may start."""
+        return self.in_flight < int(self.limit)
+
+    @property
+    def idle(self) -> bool:
+        """Whether nothing is in flight and the limit has fully recovered."""
+        return self.in_flight == 0 and self.limit >= self.initial
+
+    def record(self, latency: float, failed: bool) -> None:
+        """Adjust the limit after an operation finishes.
+
+        Args:
+            latency: Seconds the operation took
+            failed: Whether the operation failed
+        """
+        self.error_rate += _ERROR_SMOOTHING * (float(failed) - self.error_rate)
+        if failed:
+            # Failures are often fast (refused connections) and say nothing
+            # about how long a working operation takes
+            congested = self.error_rate > self.error_threshold
+        elif self.latency is None or self.baseline is None:
+            self.latency = self.baseline = latency
+            congested = False
+        else:
+            self.latency += _SMOOTHING * (latency - self.latency)
+            if latency < self.baseline:
+                self.baseline = latency
+            else:
+                self.baseline += _BASELINE_RISE * (latency - self.baseline)
+            congested = latency > self.tolerance * self.baseline
+
+        if congested:
+            now = time.monotonic()
+            if now - self._last_decrease >= (self.latency or 0.0):
+                self.limit = max(self.minimum, self.limit * self.backoff)
+                self._last_decrease = now
+        else:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+
+    def stats(self) -> ConcurrencyLimit:
+        """Describe the current limit."""
+        return ConcurrencyLimit(
+            limit=int(self.limit),
+            in_flight=self.in_flight,
+            latency_ms=None if self.latency is None else self.latency * 1000,
+            baseline_ms=None if self.baseline is None else self.baseline * 1000,
+            error_rate=self.error_rate
+        )
+
+
+class ConcurrencySlot:
+    """A slot held for one operation, timing the part that adjusts the limits."""
+
+    __slots__ = ("started",)
+
+    def __init__(self) -> None:
+        """Start timing when the slot is granted."""
+        self.started = time.perf_counter()
+
+    def mark_started(self) -> None:
+        """Measure the operation's latency from now.
+
+        Called once the device session is acquired, so that waiting for the
+        pool and opening a new session are not mistaken for congestion.
+        """
+        self.started = time.perf_counter()
+
+
+class ConcurrencyController:
+    """Caps in-flight device operations per device, per platform and globally.
+
+    Device and platform limits adapt independently (see :class:`AIMDLimit`),
+    so a slow platform such as Junos, whose commits take seconds, settles at
+    a lower concurrency than a fast one without holding the fast one back,
+    and a struggling device is throttled without slowing its platform. The
+    global cap is fixed. Device limits that have fully recovered and have
+    nothing in flight are dropped, so only devices under load or recently
+    throttled are tracked.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 1024,
+        max_per_platform: int = 512,
+        initial_per_platform: int = 64,
+        max_per_device: int = 2,
+        backoff: float = 0.5,
+        tolerance: float = 2.0,
+        platform_error_threshold: float = 0.1
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            max_in_flight: Operations in flight across all devices
+            max_per_platform: Ceiling of each platform's adaptive limit
+            initial_per_platform: Starting limit of each platform
+            max_per_device: Ceiling and starting limit of each device
+            backoff: Factor applied to a limit on congestion
+            tolerance: Latency, as a multiple of the baseline, treated as congestion
+            platform_error_threshold: Error rate above which a platform's
+                failures reduce its limit. Any failure reduces a device's limit,
+                but a few unreachable devices should not slow their platform.
+        """
+        self.max_in_flight = max_in_flight
+        self.max_per_platform = max_per_platform
+        self.initial_per_platform = initial_per_platform
+        self.max_per_device = max_per_device
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.platform_error_threshold = platform_error_threshold
+        self.in_flight = 0
+        self.waiting = 0
+
+        self._condition = asyncio.Condition()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._platforms: dict[str, AIMDLimit] = {}
+        self._devices: dict[str, AIMDLimit] = {}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, device_ip: str, platform: str) -> AsyncIterator[ConcurrencySlot]:
+        """Hold a slot for one operation on a device, waiting for capacity.
+
+        The time from :meth:`ConcurrencySlot.mark_started` (or from admission
+        if it is not called) to the end of the block, and whether the block
+        raised, adjust the device's and platform's limits.
+
+        Args:
+            device_ip: IP address of the device
+            platform: Device platform
+
+        Yields:
+            The held slot, once the operation may proceed
+        """
+        device_limit, platform_limit = await self._acquire(device_ip, platform)
+        slot = ConcurrencySlot()
+        record = True
+        failed = False
+        try:
+            yield slot
+        except asyncio.CancelledError:
+            # Cancellation says nothing about the device
+            record = False
+            raise
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            latency = time.perf_counter() - slot.started
+            async with self._condition:
+                self.in_flight -= 1
+                device_limit.in_flight -= 1
+                platform_limit.in_flight -= 1
+                if record:
+                    previous = int(platform_limit.limit)
+                    device_limit.record(latency, failed)
+                    platform_limit.record(latency, failed)
+                    if int(platform_limit.limit) < previous:
+                        logger.info(
+                            "Reducing %s concurrency to %d",
+                            platform,
+                            int(platform_limit.limit)
+                        )
+                if device_limit.idle:
+                    self._devices.pop(device_ip, None)
+                self._condition.notify_all()
+
+    def stats(self) -> ConcurrencyStats:
+        """Describe the current limits and how much of them is in use."""
+        return ConcurrencyStats(
+            max_in_flight=self.max_in_flight,
+            in_flight=self.in_flight,
+            waiting=self.waiting,
+            platforms={
+                platform: limit.stats() for platform, limit in sorted(self._platforms.items())
+            },
+            devices={
+                device: limit.stats() for device, limit in sorted(self._devices.items())
+            }
+        )
+
+    async def _acquire(self, device_ip: str, platform: str) -> tuple[AIMDLimit, AIMDLimit]:
+        """Wait until the device, its platform and the fleet all have capacity."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop and self.in_flight == 0:
+            # The condition binds to the loop that first waits on it. An idle
+            # controller can move to a new loop, e.g. when the app is restarted.
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        async with self._condition:
+            while True:
+                device_limit = self._devices.get(device_ip)
+                if device_limit is None:
+                    device_limit = self._devices[device_ip] = AIMDLimit(
+                        initial=self.max_per_device,
+                        maximum=self.max_per_device,
+                        backoff=self.backoff,
+                        tolerance=self.tolerance
+                    )
+                platform_limit = self._platforms.get(platform)
+                if platform_limit is None:
+                    platform_limit = self._platforms[platform] = AIMDLimit(
+                        initial=min(self.initial_per_platform, self.max_per_platform),
+                        maximum=self.max_per_platform,
+                        backoff=self.backoff,
+                        tolerance=self.tolerance,
+                        error_threshold=self.platform_error_threshold
+                    )
+                if (
+                    self.in_flight < self.max_in_flight
+                    and platform_limit.available
+                    and device_limit.available
+                ):
+                    break
+                self.waiting += 1
+                try:
+                    await self._condition.wait()
+                finally:
+                    self.waiting -= 1
+
+            self.in_flight += 1
+            device_limit.in_flight += 1
+            platform_limit.in_flight += 1
+            return device_limit, platform_limit
+
@@ -0,0 +1,271 @@
+"""Incremental drift detection against the inventory's desired state."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from ipaddress import ip_address
+
+from netconfig_api.models.requests import Device, DriftReport, DriftResult
+from netconfig_api.services.network_config import NetworkConfigService
+from netconfig_api.utils.device_platforms import (
+    HOSTNAME_OPERATION,
+    get_command_template,
+)
+from netconfig_api.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+DRIFT_CHECKS = Counter(
+    "netconfig_drift_checks_total",
+    "Drift checks by result",
+    ["result"]
+)
+
+_UNCHANGED_CHECK = DRIFT_CHECKS.labels("unchanged")
+_CLEAN_CHECK = DRIFT_CHECKS.labels("clean")
+_DRIFTED_CHECK = DRIFT_CHECKS.labels("drifted")
+_ERROR_CHECK = DRIFT_CHECKS.labels("error")
+
+# A desired config line and the prefix that identifies the running line it
+# replaces, e.g. ("hostname ", "hostname rtr-1")
+DesiredLine = tuple[str, str]
+
+
+@dataclass
+class _Check:
+    """Last check of a device and the hashes it was made against."""
+
+    key: tuple[str, int]
+    result: DriftResult
+
+
+def _utcnow() -> datetime:
+    """Return the current time in UTC."""
+    return datetime.now(timezone.utc)
+
+
+class DriftScanner:
+    """Background scanner comparing running configs with desired state.
+
+    The fleet is scanned in waves of at most ``wave_size`` devices, one wave
+    every ``wave_interval`` seconds, so scanning never floods devices or the
+    connection pool. Devices whose hostname was pushed or failed since the
+    last wave are checked first; the rest of the inventory is walked in
+    passes started at most every ``pass_interval`` seconds.
+
+    Each check captures the running config as a snapshot. If the snapshot's
+    digest and the hash of the desired lines match the previous check, the
+    previous verdict stands and the config is never read back or diffed.
+    """
+
+    def __init__(
+        self,
+        service: NetworkConfigService,
+        wave_size: int = 100,
+        concurrency: int = 10,
+        wave_interval: float = 1.0,
+        pass_interval: float = 300.0
+    ) -> None:
+        """Initialize the scanner.
+
+        Args:
+            service: Service whose inventory, devices and snapshots are scanned
+            wave_size: Maximum devices checked per wave
+            concurrency: Maximum devices checked at once within a wave
+            wave_interval: Seconds between waves
+            pass_interval: Minimum seconds between starts of full inventory passes
+        """
+        self.service = service
+        self.wave_size = wave_size
+        self.concurrency = concurrency
+        self.wave_interval = wave_interval
+        self.pass_interval = pass_interval
+        self.passes = 0
+        self.last_pass_at: datetime | None = None
+
+        self._checks: dict[str, _Check] = {}
+        self._priority: OrderedDict[str, None] = OrderedDict()
+        self._pending: deque[str] = deque()
+        self._in_pass = False
+        self._pass_started: float | None = None
+        self._seen_version = 0
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start scanning in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._scan_forever(), name="drift-scanner")
+            logger.info("Started drift scanner")
+
+    async def close(self) -> None:
+        """Stop the background scan."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+            logger.info("Stopped drift scanner")
+
+    async def scan_wave(self) -> int:
+        """Check the next wave of devices.
+
+        Returns:
+            Number of devices checked
+        """
+        devices = self._next_wave()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def check(device: Device) -> None:
+            async with semaphore:
+                await self._check(device)
+
+        await asyncio.gather(*(check(device) for device in devices))
+        if self._in_pass and not self._pending:
+            self._finish_pass()
+        return len(devices)
+
+    def result(self, device: str) -> DriftResult | None:
+        """Get the last drift check of a device.
+
+        Args:
+            device: IP address of the device
+
+        Returns:
+            The DriftResult, or None if the device has not been checked
+        """
+        check = self._checks.get(device)
+        return None if check is None else check.result
+
+    def report(self) -> DriftReport:
+        """Summarize the last check of every scanned device.
+
+        Returns:
+            DriftReport listing devices with drift or a failed check
+        """
+        results = [check.result for check in self._checks.values()]
+        flagged = sorted(
+            (result for result in results if result.drifted or result.error is not None),
+            key=lambda result: ip_address(result.device)
+        )
+        return DriftReport(
+            checked=len(results),
+            drifted=sum(1 for result in results if result.drifted),
+            errors=sum(1 for result in results if result.error is not None),
+            passes=self.passes,
+            last_pass_at=self.last_pass_at,
+            results=flagged
+        )
+
+    async def _scan_forever(self) -> None:
+        """Run waves until cancelled."""
+        while True:
+            try:
+                await self.scan_wave()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.exception("Drift scan wave failed: %s", str(e))
+            await asyncio.sleep(self.wave_interval)
+
+    def _next_wave(self) -> list[Device]:
+        """Pick the devices for the next wave, recently changed devices first."""
+        snapshots = self.service.snapshots
+        for changed_ip in snapshots.changed_since(self._seen_version):
+            self._priority[changed_ip] = None
+        self._seen_version = snapshots.version
+
+        now = time.monotonic()
+        if not self._in_pass and (
+            self._pass_started is None or now - self._pass_started >= self.pass_interval
+        ):
+            self._pending.extend(str(device.ip) for device in self.service.inventory.select("*"))
+            self._in_pass = True
+            self._pass_started = now
+
+        inventory = self.service.inventory
+        wave: dict[str, Device] = {}
+        while len(wave) < self.wave_size and (self._priority or self._pending):
+            if self._priority:
+                ip, _ = self._priority.popitem(last=False)
+            else:
+                ip = self._pending.popleft()
+            device = inventory.get(ip)
+            if device is None:
+                # No longer in the inventory, so there is no desired state
+                self._checks.pop(ip, None)
+                continue
+            wave[ip] = device
+        return list(wave.values())
+
+    def _finish_pass(self) -> None:
+        """Record the end of a full inventory pass."""
+        self._in_pass = False
+        self.passes += 1
+        self.last_pass_at = _utcnow()
+
+    def _desired_lines(self, device: Device) -> list[DesiredLine]:
+        """Render the config lines the inventory says a device should have."""
+        desired: list[DesiredLine] = []
+        if device.hostname is not None:
+            template = get_command_template(device.platform, HOSTNAME_OPERATION)
+            if template is not None:
+                prefix = template.template.split("{", 1)[0]
+                line = self.service.renderer.render(template, {"hostname": device.hostname})
+                desired.append((prefix, line))
+        return desired
+
+    async def _check(self, device: Device) -> None:
+        """Check one device and record the result."""
+        ip = str(device.ip)
+        desired = self._desired_lines(device)
+        try:
+            snapshot = await self.service.capture_config(ip, device.platform)
+        except Exception as e:  # pylint: disable=broad-except
+            _ERROR_CHECK.inc()
+            logger.warning("Drift check of %s failed: %s", ip, e)
+            self._checks[ip] = _Check(
+                key=("", 0),
+                result=DriftResult(device=ip, checked_at=_utcnow(), drifted=False, error=str(e))
+            )
+            return
+
+        key = (snapshot.digest, hash(tuple(desired)))
+        previous = self._checks.get(ip)
+        if previous is not None and previous.key == key:
+            _UNCHANGED_CHECK.inc()
+            previous.result = previous.result.model_copy(update={"checked_at": _utcnow()})
+            return
+
+        config = await asyncio.to_thread(self.service.config_snapshots.read, snapshot.id)
+        running = config.splitlines()
+        present = set(running)
+        diff: list[str] = []
+        for prefix, line in desired:
+            if line not in present:
+                diff.extend(f"-{actual}" for actual in running if actual.startswith(prefix))
+                diff.append(f"+{line}")
+
+        if diff:
+            _DRIFTED_CHECK.inc()
+            logger.info("Drift detected on %s: %s", ip, "; ".join(diff))
+            # The device no longer runs what was last pushed to it, so a
+            # reconciling push must not be skipped as unchanged and a dry run
+            # must not report the pushed hostname as already configured
+            self.service.applied_state.pop((ip, device.platform, HOSTNAME_OPERATION))
+            if self.service.snapshots.get(ip, HOSTNAME_OPERATION) is not None:
+                # Forgetting counts as a change, so only forget a known value
+                self.service.snapshots.forget(ip, HOSTNAME_OPERATION)
+        else:
+            _CLEAN_CHECK.inc()
+        self._checks[ip] = _Check(
+            key=key,
+            result=DriftResult(
+                device=ip,
+                checked_at=_utcnow(),
+                drifted=bool(diff),
+                diff=diff,
+                snapshot_id=snapshot.id
+            )
+        )
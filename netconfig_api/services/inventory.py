@@ -0,0 +1,152 @@
+"""Device inventory service."""
+
+import contextlib
+import itertools
+import logging
+from collections.abc import Callable, Iterable, Iterator
+
+from netconfig_api.inventory.index import InventoryIndex
+from netconfig_api.inventory.selectors import parse_selector
+from netconfig_api.inventory.store import InventoryStore
+from netconfig_api.models.requests import Device
+
+logger = logging.getLogger(__name__)
+
+
+class InventoryService:
+    """Device inventory persisted in SQLite and served from in-memory indexes.
+
+    Writes go to the store first and then to the index. Reads are answered by
+    the index; if another process has committed to the same database file
+    since the last read, the index is rebuilt from the store first.
+    """
+
+    def __init__(self, store: InventoryStore | None = None) -> None:
+        """Initialize the service. The index is built from the store on first use.
+
+        Args:
+            store: Backing store. Defaults to a private in-memory database.
+        """
+        self.store = store or InventoryStore()
+        self.index = InventoryIndex()
+        self._data_version = -1
+
+    def __len__(self) -> int:
+        """Return the number of devices in the inventory."""
+        self._refresh()
+        return len(self.index)
+
+    def get(self, ip: str) -> Device | None:
+        """Look up a device by IP address.
+
+        Args:
+            ip: IP address of the device
+
+        Returns:
+            The Device, or None if it is not in the inventory
+        """
+        self._refresh()
+        return self.index.get(ip)
+
+    def count(self, selector: str) -> int:
+        """Count the devices matching a selector.
+
+        Args:
+            selector: Selector such as ``site=dc1 AND role=leaf``
+
+        Returns:
+            Number of matching devices
+
+        Raises:
+            SelectorError: If the selector is invalid
+        """
+        parsed = parse_selector(selector)
+        self._refresh()
+        return self.index.count(parsed)
+
+    def select(self, selector: str) -> list[Device]:
+        """Find the devices matching a selector.
+
+        Args:
+            selector: Selector such as ``site=dc1 AND role=leaf``
+
+        Returns:
+            Matching devices in no particular order
+
+        Raises:
+            SelectorError: If the selector is invalid
+        """
+        parsed = parse_selector(selector)
+        self._refresh()
+        return self.index.select(parsed)
+
+    def upsert(self, devices: Iterable[Device]) -> int:
+        """Add or replace devices.
+
+        All devices are written in one transaction.
+
+        Args:
+            devices: Devices to write
+
+        Returns:
+            Number of devices written
+        """
+        devices = list(devices)
+        count = self.store.upsert_many(devices)
+        self._refresh()
+        if len(devices) > len(self.index) // 2:
+            # Rebuilding every bitmap once is cheaper than many incremental updates
+            self.index.load(itertools.chain(self.index.devices(), devices))
+        else:
+            for device in devices:
+                self.index.add(device)
+        return count
+
+    @contextlib.contextmanager
+    def bulk_upsert(self) -> Iterator[Callable[[list[Device]], int]]:
+        """Write devices in many batches, indexing them once at the end.
+
+        Each call of the yielded writer is one store transaction. The index is
+        rebuilt in a single pass when the block exits, which is much cheaper
+        than updating it per device, so lookups see the new devices only
+        once the whole block has been written.
+
+        Yields:
+            A writer taking a batch of devices and returning the number written
+        """
+        self._refresh()
+        written: list[Device] = []
+
+        def write(devices: list[Device]) -> int:
+            count = self.store.upsert_many(devices)
+            written.extend(devices)
+            return count
+
+        try:
+            yield write
+        finally:
+            if written:
+                self.index.load(itertools.chain(self.index.devices(), written))
+
+    def delete(self, ip: str) -> bool:
+        """Remove a device.
+
+        Args:
+            ip: IP address of the device
+
+        Returns:
+            True if the device was in the inventory
+        """
+        deleted = self.store.delete(ip)
+        self._refresh()
+        self.index.remove(ip)
+        return deleted
+
+    def _refresh(self) -> None:
+        """Rebuild the index if the database was changed by another connection."""
+        version = self.store.data_version()
+        if version == self._data_version:
+            return
+        self.index.load(self.store.iter_devices())
+        self._data_version = version
+        logger.info("Loaded %d devices into the inventory index", len(self.index))
@@ -0,0 +1,225 @@
+"""Background job queue for long-running configuration pushes."""
+
+import asyncio
+import contextlib
+import logging
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from pydantic import BaseModel
+
+from netconfig_api.models.requests import JobStatus
+
+logger = logging.getLogger(__name__)
+
+JobOperation = Callable[[], Awaitable[BaseModel]]
+
+
+class JobQueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class JobQueueClosedError(Exception):
+    """Raised when a job is submitted while the queue is not accepting work."""
+
+
+def _utcnow() -> datetime:
+    """Return the current time in UTC."""
+    return datetime.now(timezone.utc)
+
+
+@dataclass(eq=False)
+class Job:
+    """A unit of work queued for a background worker."""
+
+    operation: JobOperation
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: JobStatus = JobStatus.QUEUED
+    submitted_at: datetime = field(default_factory=_utcnow)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: BaseModel | None = None
+    error: str | None = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a terminal state."""
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+
+class JobManager:
+    """Bounded job queue drained by a pool of asyncio workers.
+
+    Submitting a job never waits on a device: the job is queued and its ID is
+    returned immediately. When the queue is full, submission fails fast so
+    callers can apply backpressure. On shutdown, queued jobs are given a grace
+    period to drain before the workers are cancelled.
+    """
+
+    def __init__(
+        self,
+        workers: int = 32,
+        max_queued: int = 1000,
+        max_retained: int = 10000
+    ) -> None:
+        """Initialize the job manager.
+
+        Args:
+            workers: Number of concurrent worker tasks
+            max_queued: Maximum number of jobs waiting for a worker
+            max_retained: Maximum number of jobs kept for status lookups
+        """
+        self.workers = workers
+        self.max_queued = max_queued
+        self.max_retained = max_retained
+
+        self._queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=max_queued)
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._accepting = False
+
+    @property
+    def queued(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        """Start the worker tasks and begin accepting jobs."""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"job-worker-{index}")
+            for index in range(self.workers)
+        ]
+        self._accepting = True
+        logger.info("Started %d job workers", self.workers)
+
+    async def close(self, drain_timeout: float = 30.0) -> None:
+        """Stop accepting jobs, drain the queue and stop the workers.
+
+        Args:
+            drain_timeout: Seconds to wait for queued and running jobs to finish
+        """
+        self._accepting = False
+        if not self._tasks:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Job queue did not drain within %.1fs; cancelling %d queued jobs",
+                drain_timeout,
+                self._queue.qsize()
+            )
+
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            self._finish(job, error="Job cancelled during shutdown")
+            self._queue.task_done()
+        logger.info("Stopped job workers")
+
+    def submit(self, operation: JobOperation) -> Job:
+        """Queue an operation to run on a background worker.
+
+        Args:
+            operation: Zero-argument callable returning the awaitable to run
+
+        Returns:
+            The queued Job
+
+        Raises:
+            JobQueueClosedError: If the manager is not accepting jobs
+            JobQueueFullError: If the queue is at capacity
+        """
+        if not self._accepting:
+            raise JobQueueClosedError("Job queue is not accepting jobs")
+
+        job = Job(operation=operation)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull as e:
+            raise JobQueueFullError(
+                f"Job queue is full ({self.max_queued} jobs queued)"
+            ) from e
+
+        self._jobs[job.id] = job
+        self._prune()
+        logger.debug("Queued job %s", job.id)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Look up a job by ID.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The Job, or None if it is unknown or has been pruned
+        """
+        return self._jobs.get(job_id)
+
+    async def _work(self) -> None:
+        """Run queued jobs until cancelled."""
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        """Run a single job and record its outcome."""
+        job.status = JobStatus.RUNNING
+        job.started_at = _utcnow()
+        try:
+            result = await job.operation()
+        except asyncio.CancelledError:
+            self._finish(job, error="Job cancelled during shutdown")
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            logger.exception("Job %s failed: %s", job.id, str(e))
+            self._finish(job, error=str(e))
+        else:
+            self._finish(job, result=result)
+
+    def _finish(
+        self,
+        job: Job,
+        result: BaseModel | None = None,
+        error: str | None = None
+    ) -> None:
+        """Move a job into its terminal state."""
+        job.result = result
+        job.error = error
+        job.status = JobStatus.FAILED if error is not None else JobStatus.COMPLETED
+        job.finished_at = _utcnow()
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs once more than max_retained are kept.
+
+        Unfinished jobs are skipped rather than stopping the pass, so a long
+        running job does not keep every later finished job alive.
+        """
+        excess = len(self._jobs) - self.max_retained
+        if excess <= 0:
+            return
+        expired = []
+        for job_id, job in self._jobs.items():
+            if job.finished:
+                expired.append(job_id)
+                if len(expired) == excess:
+                    break
+        for job_id in expired:
+            del self._jobs[job_id]
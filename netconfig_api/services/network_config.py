@@ -1,69 +1,467 @@
 """Network configuration service for device management."""
 
+import asyncio
+import itertools
 import logging
+import time
+from collections.abc import Awaitable, Callable
+from ipaddress import ip_address
+from typing import TypeVar
 
-from netconfig_api.models.requests import HostnameRequest, HostnameResponse
+from netconfig_api.models.operations import ChangeSetRequest, OperationRequest
+from netconfig_api.models.requests import (
+    BatchHostnameRequest,
+    BatchHostnameResponse,
+    ChangeSetResponse,
+    HostnameRequest,
+    HostnameResponse,
+    OperationResponse,
+)
+from netconfig_api.services.concurrency import ConcurrencyController
+from netconfig_api.services.inventory import InventoryService
+from netconfig_api.services.retry import CircuitBreakers, RetryPolicy
+from netconfig_api.services.scheduler import DeviceScheduler
+from netconfig_api.services.state import StateSnapshotStore
+from netconfig_api.snapshots.store import ConfigSnapshot, ConfigSnapshotStore
+from netconfig_api.transports.base import (
+    DeviceRejectedError,
+    DeviceSession,
+    TransportError,
+)
+from netconfig_api.transports.pool import ConnectionPool
+from netconfig_api.transports.registry import LazyTransport
+from netconfig_api.utils.cache import TTLCache
 from netconfig_api.utils.device_platforms import (
-    get_hostname_command_template,
-    validate_platform,
+    HOSTNAME_OPERATION,
+    OPERATIONS,
+    SUPPORTED_PLATFORMS,
+    CommandTemplate,
+    get_command_template,
 )
+from netconfig_api.utils.metrics import Counter, Histogram
+from netconfig_api.utils.rendering import CommandRenderer
+from netconfig_api.utils.tracing import TRACER, SpanKind
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+SNAPSHOT_OPERATION = "snapshot"
+
+CONFIGURE_PHASE_SECONDS = Histogram(
+    "netconfig_configure_phase_seconds",
+    "Time spent in each phase of a device configuration",
+    ["phase"]
+)
+CONFIGURE_RESULTS = Counter(
+    "netconfig_configure_results_total",
+    "Device configuration results by platform and outcome",
+    ["platform", "outcome"]
+)
+
+_VALIDATION_PHASE = CONFIGURE_PHASE_SECONDS.labels("validation")
+_RENDER_PHASE = CONFIGURE_PHASE_SECONDS.labels("render")
+_CONCURRENCY_WAIT_PHASE = CONFIGURE_PHASE_SECONDS.labels("concurrency_wait")
+_TRANSPORT_WAIT_PHASE = CONFIGURE_PHASE_SECONDS.labels("transport_wait")
+_DEVICE_EXECUTION_PHASE = CONFIGURE_PHASE_SECONDS.labels("device_execution")
+_RETRY_BACKOFF_PHASE = CONFIGURE_PHASE_SECONDS.labels("retry_backoff")
+
+_UNSUPPORTED_RESULT = CONFIGURE_RESULTS.labels("unsupported", "unsupported")
+_RESULTS = {
+    platform: {
+        outcome: CONFIGURE_RESULTS.labels(platform, outcome)
+        for outcome in ("success", "failure", "error", "unchanged")
+    }
+    for platform in SUPPORTED_PLATFORMS
+}
+
+
+def _target(operation: str, params: dict[str, str]) -> str:
+    """Name the object an operation configures, e.g. ``vlan[10]``.
+
+    Changes to one target on a device are coalesced; changes to different
+    targets are all applied.
+    """
+    key = OPERATIONS[operation].key
+    return f"{operation}[{','.join(params[name] for name in key)}]"
+
 
 class NetworkConfigService:
     """Service for configuring network devices."""
 
-    def __init__(self) -> None:
-        """Initialize the network configuration service."""
-        pass
+    def __init__(
+        self,
+        pool: ConnectionPool | None = None,
+        scheduler: DeviceScheduler | None = None,
+        inventory: InventoryService | None = None,
+        renderer: CommandRenderer | None = None,
+        snapshots: StateSnapshotStore | None = None,
+        config_snapshots: ConfigSnapshotStore | None = None,
+        concurrency: ConcurrencyController | None = None,
+        retry: RetryPolicy | None = None,
+        breakers: CircuitBreakers | None = None,
+        state_ttl: float = 300.0,
+        idempotency_ttl: float = 86400.0,
+        cache_size: int = 100_000
+    ) -> None:
+        """Initialize the network configuration service.
+
+        Args:
+            pool: Connection pool used to reach devices. Defaults to a pool
+                over the in-process simulated transport, loaded on first use.
+            scheduler: Scheduler serializing operations per device
+            inventory: Device inventory used to look up platforms and resolve
+                selectors. Defaults to an empty in-memory inventory.
+            renderer: Cache of rendered command sets shared by single and
+                batch pushes
+            snapshots: Last-known running values that dry runs diff against
+            config_snapshots: History of captured running configs. Defaults to
+                a store in a private temporary directory.
+            concurrency: Adaptive limits on operations in flight per device,
+                per platform and globally
+            retry: Timeout and retry policy for each device operation
+            breakers: Per-device circuit breakers that fail operations on
+                dead devices fast
+            state_ttl: Seconds a value applied to a device is trusted before
+                an identical request is pushed again
+            idempotency_ttl: Seconds an Idempotency-Key result is replayed
+            cache_size: Maximum entries in each of the state and idempotency caches
+        """
+        self.pool = pool or ConnectionPool(LazyTransport("simulated"))
+        self.scheduler = scheduler or DeviceScheduler()
+        self.inventory = inventory or InventoryService()
+        self.renderer = renderer or CommandRenderer()
+        self.snapshots = snapshots or StateSnapshotStore()
+        self.config_snapshots = config_snapshots or ConfigSnapshotStore()
+        self.concurrency = concurrency or ConcurrencyController()
+        self.retry = retry or RetryPolicy()
+        self.breakers = breakers or CircuitBreakers()
+        self.applied_state: TTLCache[tuple[str, str, str], str] = TTLCache(
+            maxsize=cache_size,
+            ttl=state_ttl
+        )
+        self._idempotency: TTLCache[str, tuple[str, HostnameResponse]] = TTLCache(
+            maxsize=cache_size,
+            ttl=idempotency_ttl
+        )
+        self._idempotent_inflight: dict[str, tuple[str, asyncio.Task[HostnameResponse]]] = {}
+        self._change_set_ids = itertools.count()
+
+    async def start(self) -> None:
+        """Start background maintenance of device sessions."""
+        await self.pool.start()
+
+    async def close(self) -> None:
+        """Close all device sessions and the config snapshot store."""
+        await self.pool.close()
+        self.config_snapshots.close()
+
+    async def capture_config(
+        self,
+        device_ip: str,
+        platform: str | None = None
+    ) -> ConfigSnapshot:
+        """Read a device's running config and store it as a snapshot.
+
+        The read is serialized with other operations on the device, and
+        concurrent captures of one device are coalesced. It is retried and
+        guarded by the device's circuit breaker like a configuration push.
+        Compression and storage run in a worker thread.
+
+        Args:
+            device_ip: IP address of the device
+            platform: Device platform; looked up in the inventory when omitted
+
+        Returns:
+            The stored snapshot, which is the device's previous one if its
+            config has not changed
+
+        Raises:
+            ValueError: If the address is invalid or the platform is unknown
+            TransportError: If the config could not be read
+        """
+        device_ip = str(ip_address(device_ip))
+        if platform is None:
+            device = self.inventory.get(device_ip)
+            if device is None:
+                raise ValueError(
+                    f"No platform given and device {device_ip} is not in the inventory"
+                )
+            platform = device.platform
+        device_platform = platform
+
+        async def capture() -> ConfigSnapshot:
+            config = await self.run_on_device(
+                device_ip,
+                device_platform,
+                lambda session: session.get_config()
+            )
+            return await asyncio.to_thread(self.config_snapshots.put, device_ip, config)
+
+        return await self.scheduler.run(device_ip, SNAPSHOT_OPERATION, capture)
 
-    async def configure_hostname(self, request: HostnameRequest) -> HostnameResponse:
+    async def configure_hostname(
+        self,
+        request: HostnameRequest,
+        idempotency_key: str | None = None,
+        dry_run: bool = False
+    ) -> HostnameResponse:
         """Configure hostname on a network device.
 
         Args:
             request: Hostname configuration request
+            idempotency_key: Optional client-supplied key. A retry with the same
+                key replays the earlier successful result instead of pushing again.
+            dry_run: Return the commands and diff that would be applied
+                without contacting the device. The idempotency key is ignored.
 
         Returns:
             HostnameResponse with configuration result
 
         Raises:
-            ValueError: If platform is not supported
+            ValueError: If the idempotency key was used for a different request
         """
-        logger.info(
+        with TRACER.span(
+            "configure_hostname",
+            device=request.device,
+            platform=request.platform,
+            dry_run=dry_run
+        ) as span:
+            if dry_run:
+                response = self._plan_hostnames([request])[0]
+            elif idempotency_key is not None:
+                response = await self._configure_hostname_idempotent(request, idempotency_key)
+            else:
+                response = await self._configure_hostname(request)
+            span.set_attribute("success", response.success)
+            if not response.success:
+                span.set_error(response.message)
+            return response
+
+    async def _configure_hostname_idempotent(
+        self,
+        request: HostnameRequest,
+        idempotency_key: str
+    ) -> HostnameResponse:
+        """Configure hostname at most once per idempotency key.
+
+        A retry that arrives while the original is still running waits for the
+        original's result. Only successful results are remembered, so a retry
+        after a failure makes a fresh attempt.
+        """
+        fingerprint = request.model_dump_json()
+
+        replay = self._idempotency.get(idempotency_key)
+        if replay is not None:
+            self._check_fingerprint(idempotency_key, replay[0], fingerprint)
+            logger.info("Replaying result for idempotency key %s", idempotency_key)
+            return replay[1].model_copy(update={"cached": True})
+
+        inflight = self._idempotent_inflight.get(idempotency_key)
+        if inflight is not None:
+            self._check_fingerprint(idempotency_key, inflight[0], fingerprint)
+            response = await asyncio.shield(inflight[1])
+            return response.model_copy(update={"cached": True})
+
+        task = asyncio.create_task(self._configure_hostname(request))
+        self._idempotent_inflight[idempotency_key] = (fingerprint, task)
+        task.add_done_callback(
+            lambda done: self._remember_idempotent(idempotency_key, fingerprint, done)
+        )
+        return await asyncio.shield(task)
+
+    def _remember_idempotent(
+        self,
+        idempotency_key: str,
+        fingerprint: str,
+        task: "asyncio.Task[HostnameResponse]"
+    ) -> None:
+        """Record the outcome of an idempotent request once it finishes."""
+        del self._idempotent_inflight[idempotency_key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        response = task.result()
+        if response.success:
+            self._idempotency.set(idempotency_key, (fingerprint, response))
+
+    @staticmethod
+    def _check_fingerprint(idempotency_key: str, expected: str, actual: str) -> None:
+        """Reject reuse of an idempotency key for a different request."""
+        if expected != actual:
+            raise ValueError(
+                f"Idempotency-Key '{idempotency_key}' was already used for a different request"
+            )
+
+    async def _configure_hostname(self, request: HostnameRequest) -> HostnameResponse:
+        """Validate, schedule and apply a hostname change.
+
+        Args:
+            request: Hostname configuration request
+
+        Returns:
+            HostnameResponse with configuration result
+        """
+        logger.debug(
             "Configuring hostname '%s' on device %s (platform: %s)",
             request.name,
             request.device,
             request.platform
         )
 
-        # Validate platform
-        if not validate_platform(request.platform):
+        started = time.perf_counter()
+        request, command_template = self.resolve_template(request)
+        _VALIDATION_PHASE.observe(time.perf_counter() - started)
+        if command_template is None:
+            _UNSUPPORTED_RESULT.inc()
+            return self._unsupported(request)
+
+        # Pushes to one device are serialized; a pending hostname change that
+        # is superseded before it starts is never sent.
+        return await self.scheduler.run(
+            str(request.device),
+            HOSTNAME_OPERATION,
+            lambda: self._apply_hostname(request, command_template)
+        )
+
+    def resolve_template(
+        self,
+        request: HostnameRequest
+    ) -> tuple[HostnameRequest, CommandTemplate | None]:
+        """Fill in the platform from the inventory and look up its hostname template.
+
+        Returns:
+            The request with its platform resolved, and the compiled template,
+            or None if the platform is unknown or unsupported
+        """
+        if request.platform is None:
+            device = self.inventory.get(str(request.device))
+            if device is not None:
+                request = request.model_copy(update={"platform": device.platform})
+        if request.platform is None:
+            return request, None
+        return request, get_command_template(request.platform, HOSTNAME_OPERATION)
+
+    @staticmethod
+    def _unsupported(request: HostnameRequest) -> HostnameResponse:
+        """Build the result for a request whose platform has no hostname template."""
+        if request.platform is None:
+            error_msg = f"No platform given and device {request.device} is not in the inventory"
+        else:
             error_msg = f"Unsupported platform: {request.platform}"
-            logger.error(error_msg)
+        logger.error(error_msg)
+        return HostnameResponse(
+            success=False,
+            message=error_msg,
+            device=str(request.device),
+            hostname=request.name
+        )
+
+    def _plan_hostnames(
+        self,
+        requests: list[HostnameRequest | HostnameResponse]
+    ) -> list[HostnameResponse]:
+        """Plan hostname changes without opening any device sessions.
+
+        New and last-known commands for the whole list are rendered in one
+        batched pass, so planning costs a dictionary lookup and a cached
+        render per device.
+
+        Args:
+            requests: Hostname requests, or results already decided for a device
+
+        Returns:
+            One dry-run result per request, in order
+        """
+        started = time.perf_counter()
+        results: list[HostnameResponse | None] = [None] * len(requests)
+        planned: list[tuple[int, HostnameRequest, str | None]] = []
+        items: list[tuple[CommandTemplate, dict[str, str]]] = []
+        for index, request in enumerate(requests):
+            if isinstance(request, HostnameResponse):
+                results[index] = request
+                continue
+            request, command_template = self.resolve_template(request)
+            if command_template is None:
+                results[index] = self._unsupported(request)
+                continue
+            previous = self.snapshots.get(str(request.device), HOSTNAME_OPERATION)
+            planned.append((index, request, previous))
+            items.append((command_template, {"hostname": request.name}))
+            if previous is not None:
+                items.append((command_template, {"hostname": previous}))
+        rendered = iter(self.renderer.render_batch(items))
+        _RENDER_PHASE.observe(time.perf_counter() - started)
+
+        for index, request, previous in planned:
+            new_lines = next(rendered).splitlines()
+            old_lines = [] if previous is None else next(rendered).splitlines()
+            diff = [f"-{line}" for line in old_lines if line not in new_lines]
+            diff += [f"+{line}" for line in new_lines if line not in old_lines]
+            changed = previous != request.name
+            results[index] = HostnameResponse(
+                success=True,
+                message=(
+                    f"Dry run: hostname on {request.device} would change to '{request.name}'"
+                    if changed else
+                    f"Dry run: hostname '{request.name}' already configured on {request.device}"
+                ),
+                device=str(request.device),
+                hostname=request.name,
+                dry_run=True,
+                commands=new_lines,
+                diff=diff,
+                changed=changed
+            )
+        return [result for result in results if result is not None]
+
+    async def _apply_hostname(
+        self,
+        request: HostnameRequest,
+        command_template: CommandTemplate
+    ) -> HostnameResponse:
+        """Render and push a hostname change to a device.
+
+        Args:
+            request: Hostname configuration request
+            command_template: Hostname template for the request's platform
+
+        Returns:
+            HostnameResponse with configuration result
+        """
+        platform = command_template.platform
+        results = _RESULTS[platform]
+        state_key = (str(request.device), platform, HOSTNAME_OPERATION)
+        if self.applied_state.get(state_key) == request.name:
+            results["unchanged"].inc()
+            message = f"Hostname '{request.name}' already configured on {request.device}"
+            logger.info(message)
             return HostnameResponse(
-                success=False,
-                message=error_msg,
+                success=True,
+                message=message,
                 device=str(request.device),
-                hostname=request.name
+                hostname=request.name,
+                cached=True
             )
 
         try:
             # Generate configuration command
-            command_template = get_hostname_command_template(request.platform)
-            command = command_template.format(hostname=request.name)
+            started = time.perf_counter()
+            with TRACER.span("render", platform=platform):
+                command = self.renderer.render(command_template, {"hostname": request.name})
+            _RENDER_PHASE.observe(time.perf_counter() - started)
 
             logger.debug("Generated command: %s", command)
 
-            # In a real implementation, this would connect to the device
-            # and execute the command. For now, we simulate success.
-            success = await self._simulate_device_configuration(
+            success = await self._execute_device_configuration(
                 device_ip=str(request.device),
                 command=command,
-                platform=request.platform
+                platform=platform
             )
 
             if success:
+                results["success"].inc()
+                self.applied_state.set(state_key, request.name)
+                self.snapshots.set(str(request.device), HOSTNAME_OPERATION, request.name)
                 message = f"Hostname '{request.name}' configured successfully on {request.device}"
                 logger.info(message)
                 return HostnameResponse(
@@ -73,6 +471,9 @@ class NetworkConfigService:
                     hostname=request.name
                 )
             else:
+                results["failure"].inc()
+                self.applied_state.pop(state_key)
+                self.snapshots.forget(str(request.device), HOSTNAME_OPERATION)
                 error_msg = f"Failed to configure hostname on device {request.device}"
                 logger.error(error_msg)
                 return HostnameResponse(
@@ -83,6 +484,9 @@ class NetworkConfigService:
                 )
 
         except Exception as e:
+            results["error"].inc()
+            self.applied_state.pop(state_key)
+            self.snapshots.forget(str(request.device), HOSTNAME_OPERATION)
             error_msg = f"Error configuring hostname: {str(e)}"
             logger.exception(error_msg)
             return HostnameResponse(
@@ -92,42 +496,611 @@ class NetworkConfigService:
                 hostname=request.name
             )
 
-    async def _simulate_device_configuration(
+    async def configure_operation(
+        self,
+        operation: str,
+        request: OperationRequest
+    ) -> OperationResponse:
+        """Apply a catalog operation to a device.
+
+        Changes to the same object on a device (the same VLAN, the same NTP
+        server) are serialized and coalesced like hostname changes, and a
+        change whose rendered commands were already applied is not pushed
+        again.
+
+        Args:
+            operation: Catalog operation name
+            request: Request of the operation's generated model
+
+        Returns:
+            OperationResponse with the result
+
+        Raises:
+            KeyError: If the operation is not in the catalog
+        """
+        device_ip = str(request.device)
+        logger.info("Applying %s on device %s", operation, device_ip)
+
+        started = time.perf_counter()
+        platform = self._platform(device_ip, request.platform)
+        command_template = None if platform is None else get_command_template(platform, operation)
+        _VALIDATION_PHASE.observe(time.perf_counter() - started)
+        if command_template is None:
+            _UNSUPPORTED_RESULT.inc()
+            error_msg = self._unsupported_operation(device_ip, platform, operation)
+            logger.error(error_msg)
+            return OperationResponse(
+                success=False,
+                message=error_msg,
+                device=device_ip,
+                operation=operation
+            )
+
+        params = request.parameters()
+        return await self.scheduler.run(
+            device_ip,
+            _target(operation, params),
+            lambda: self._apply_operation(device_ip, command_template, params)
+        )
+
+    async def _apply_operation(
+        self,
+        device_ip: str,
+        command_template: CommandTemplate,
+        params: dict[str, str]
+    ) -> OperationResponse:
+        """Render and push a catalog operation to a device.
+
+        Args:
+            device_ip: IP address of the device
+            command_template: The operation's template for the device's platform
+            params: Template parameter values
+
+        Returns:
+            OperationResponse with the result
+        """
+        operation = command_template.operation
+        results = _RESULTS[command_template.platform]
+
+        started = time.perf_counter()
+        command = self.renderer.render(command_template, params)
+        _RENDER_PHASE.observe(time.perf_counter() - started)
+        commands = command.splitlines()
+
+        state_key, value = self._applied_value(device_ip, command_template, params, command)
+        if self.applied_state.get(state_key) == value:
+            results["unchanged"].inc()
+            message = f"{operation} already configured on {device_ip}"
+            logger.info(message)
+            return OperationResponse(
+                success=True,
+                message=message,
+                device=device_ip,
+                operation=operation,
+                commands=commands,
+                cached=True
+            )
+
+        try:
+            success = await self._execute_device_configuration(
+                device_ip=device_ip,
+                command=command,
+                platform=command_template.platform
+            )
+        except Exception as e:
+            results["error"].inc()
+            self._forget_applied(state_key)
+            error_msg = f"Error applying {operation}: {str(e)}"
+            logger.exception(error_msg)
+            return OperationResponse(
+                success=False,
+                message=error_msg,
+                device=device_ip,
+                operation=operation,
+                commands=commands
+            )
+
+        if success:
+            results["success"].inc()
+            self._record_applied(state_key, value)
+            message = f"{operation} applied successfully on {device_ip}"
+            logger.info(message)
+        else:
+            results["failure"].inc()
+            self._forget_applied(state_key)
+            message = f"Failed to apply {operation} on device {device_ip}"
+            logger.error(message)
+        return OperationResponse(
+            success=success,
+            message=message,
+            device=device_ip,
+            operation=operation,
+            commands=commands
+        )
+
+    async def configure_change_set(self, request: ChangeSetRequest) -> ChangeSetResponse:
+        """Apply several catalog operations to one device in a single session.
+
+        The operations' commands are rendered in one batch, merged into one
+        config block in request order and sent in one ``send_config`` call,
+        so the device sees a single session and a single commit instead of
+        one per operation. Operations whose commands were already applied
+        are left out of the block. If any operation has no template for the
+        device's platform, nothing is applied.
+
+        Args:
+            request: Operations for one device
+
+        Returns:
+            ChangeSetResponse with the block sent and per-operation results
+        """
+        device_ip = str(request.device)
+        names = [item.operation for item in request.operations]
+        logger.info("Applying change set %s on device %s", ", ".join(names), device_ip)
+
+        started = time.perf_counter()
+        platform = self._platform(device_ip, request.platform)
+        templates = [
+            None if platform is None else get_command_template(platform, name) for name in names
+        ]
+        _VALIDATION_PHASE.observe(time.perf_counter() - started)
+        if platform is None or None in templates:
+            _UNSUPPORTED_RESULT.inc()
+            results = [
+                OperationResponse(
+                    success=False,
+                    message=(
+                        self._unsupported_operation(device_ip, platform, name)
+                        if template is None else
+                        f"{name} not applied: the change set has unsupported operations"
+                    ),
+                    device=device_ip,
+                    operation=name
+                )
+                for name, template in zip(names, templates, strict=True)
+            ]
+            error_msg = results[templates.index(None)].message
+            logger.error(error_msg)
+            return ChangeSetResponse(
+                success=False,
+                message=error_msg,
+                device=device_ip,
+                platform=platform,
+                results=results,
+                elapsed_ms=(time.perf_counter() - started) * 1000
+            )
+
+        items = [
+            (template, operation_request.parameters())
+            for template, operation_request in zip(templates, request.requests(), strict=True)
+            if template is not None
+        ]
+        # Change sets differ from each other, so each gets its own queue entry
+        # on the device and none is coalesced away
+        return await self.scheduler.run(
+            device_ip,
+            f"change_set:{next(self._change_set_ids)}",
+            lambda: self._apply_change_set(device_ip, items, started)
+        )
+
+    async def _apply_change_set(
+        self,
+        device_ip: str,
+        items: list[tuple[CommandTemplate, dict[str, str]]],
+        started: float
+    ) -> ChangeSetResponse:
+        """Render a change set, merge it into one block and push it.
+
+        Args:
+            device_ip: IP address of the device
+            items: Template and parameters of each operation, in order
+            started: ``time.perf_counter()`` when the request arrived
+
+        Returns:
+            ChangeSetResponse with the block sent and per-operation results
+        """
+        platform = items[0][0].platform
+        results = _RESULTS[platform]
+
+        render_started = time.perf_counter()
+        rendered = self.renderer.render_batch(items)
+        _RENDER_PHASE.observe(time.perf_counter() - render_started)
+
+        outcomes: list[OperationResponse | None] = [None] * len(items)
+        pending: list[tuple[int, tuple[str, str, str], str]] = []
+        block: list[str] = []
+        for index, ((template, params), command) in enumerate(zip(items, rendered, strict=True)):
+            state_key, value = self._applied_value(device_ip, template, params, command)
+            if self.applied_state.get(state_key) == value:
+                results["unchanged"].inc()
+                outcomes[index] = OperationResponse(
+                    success=True,
+                    message=f"{template.operation} already configured on {device_ip}",
+                    device=device_ip,
+                    operation=template.operation,
+                    commands=command.splitlines(),
+                    cached=True
+                )
+            else:
+                pending.append((index, state_key, value))
+                block.extend(command.splitlines())
+
+        success = True
+        error: str | None = None
+        if block:
+            try:
+                success = await self._execute_device_configuration(
+                    device_ip=device_ip,
+                    command="\n".join(block),
+                    platform=platform
+                )
+            except Exception as e:
+                success = False
+                error = f"Error applying change set: {str(e)}"
+                logger.exception(error)
+
+        for index, state_key, value in pending:
+            operation = items[index][0].operation
+            if success:
+                results["success"].inc()
+                self._record_applied(state_key, value)
+                message = f"{operation} applied successfully on {device_ip}"
+            else:
+                results["error" if error else "failure"].inc()
+                self._forget_applied(state_key)
+                message = error or f"Failed to apply {operation} on device {device_ip}"
+            outcomes[index] = OperationResponse(
+                success=success,
+                message=message,
+                device=device_ip,
+                operation=operation,
+                commands=rendered[index].splitlines()
+            )
+
+        if not block:
+            message = f"All {len(items)} operations already configured on {device_ip}"
+            logger.info(message)
+        elif success:
+            message = (
+                f"Applied {len(pending)} of {len(items)} operations on {device_ip} "
+                "in one commit"
+            )
+            logger.info(message)
+        elif error is not None:
+            message = error
+        else:
+            message = f"Failed to apply change set on device {device_ip}"
+            logger.error(message)
+        return ChangeSetResponse(
+            success=success,
+            message=message,
+            device=device_ip,
+            platform=platform,
+            commands=block,
+            results=[outcome for outcome in outcomes if outcome is not None],
+            elapsed_ms=(time.perf_counter() - started) * 1000
+        )
+
+    def _platform(self, device_ip: str, platform: str | None) -> str | None:
+        """Return the given platform, or the device's platform from the inventory."""
+        if platform is None:
+            device = self.inventory.get(device_ip)
+            if device is not None:
+                return device.platform
+        return platform
+
+    @staticmethod
+    def _unsupported_operation(device_ip: str, platform: str | None, operation: str) -> str:
+        """Describe why an operation has no template for a device."""
+        if platform is None:
+            return f"No platform given and device {device_ip} is not in the inventory"
+        return f"Operation '{operation}' is not supported on platform {platform}"
+
+    @staticmethod
+    def _applied_value(
+        device_ip: str,
+        command_template: CommandTemplate,
+        params: dict[str, str],
+        command: str
+    ) -> tuple[tuple[str, str, str], str]:
+        """Get the applied-state key of an operation and the value it records.
+
+        Hostnames are recorded by name, under the same key as hostname
+        requests, so both paths see each other's changes. Other operations
+        record their rendered commands under their target object.
+        """
+        operation = command_template.operation
+        if operation == HOSTNAME_OPERATION:
+            return (device_ip, command_template.platform, HOSTNAME_OPERATION), params["hostname"]
+        return (device_ip, command_template.platform, _target(operation, params)), command
+
+    def _record_applied(self, state_key: tuple[str, str, str], value: str) -> None:
+        """Remember a value applied to a device."""
+        self.applied_state.set(state_key, value)
+        device_ip, _, operation = state_key
+        if operation == HOSTNAME_OPERATION:
+            self.snapshots.set(device_ip, HOSTNAME_OPERATION, value)
+
+    def _forget_applied(self, state_key: tuple[str, str, str]) -> None:
+        """Forget what is applied to a device after a failed or unknown push."""
+        self.applied_state.pop(state_key)
+        device_ip, _, operation = state_key
+        if operation == HOSTNAME_OPERATION:
+            self.snapshots.forget(device_ip, HOSTNAME_OPERATION)
+
+    async def configure_hostname_batch(
+        self,
+        batch: BatchHostnameRequest,
+        dry_run: bool = False
+    ) -> BatchHostnameResponse:
+        """Configure hostnames on many devices concurrently.
+
+        Each request is dispatched through :meth:`configure_hostname`, with at
+        most ``batch.concurrency`` devices in flight at any one time. A batch
+        given as a selector configures every matching inventory device with
+        its inventory hostname.
+
+        Args:
+            batch: Batch of hostname configuration requests
+            dry_run: Plan every device's commands and diff in one pass without
+                contacting any device
+
+        Returns:
+            BatchHostnameResponse with per-device results and aggregate timings
+
+        Raises:
+            SelectorError: If the batch selector is invalid
+        """
+        requests: list[HostnameRequest | HostnameResponse] = list(batch.requests)
+        if batch.selector is not None:
+            requests = self._selector_requests(batch.selector)
+
+        if dry_run:
+            return self._plan_hostname_batch(requests)
+
+        logger.info(
+            "Configuring hostnames on %d devices (concurrency: %d)",
+            len(requests),
+            batch.concurrency
+        )
+
+        self._compile_batch(requests)
+
+        semaphore = asyncio.Semaphore(batch.concurrency)
+        durations: list[float] = [0.0] * len(requests)
+
+        async def run(index: int, request: HostnameRequest | HostnameResponse) -> HostnameResponse:
+            if isinstance(request, HostnameResponse):
+                return request
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    return await self.configure_hostname(request)
+                finally:
+                    durations[index] = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(run(index, request) for index, request in enumerate(requests))
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        succeeded = sum(1 for result in results if result.success)
+        return BatchHostnameResponse(
+            results=list(results),
+            total=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            elapsed_ms=elapsed_ms,
+            mean_device_ms=sum(durations) / len(durations) if durations else 0.0,
+            max_device_ms=max(durations, default=0.0)
+        )
+
+    def _plan_hostname_batch(
+        self,
+        requests: list[HostnameRequest | HostnameResponse]
+    ) -> BatchHostnameResponse:
+        """Dry-run a batch, reporting how many devices would change."""
+        logger.info("Planning hostnames on %d devices", len(requests))
+        started = time.perf_counter()
+        results = self._plan_hostnames(requests)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        succeeded = sum(1 for result in results if result.success)
+        return BatchHostnameResponse(
+            results=results,
+            total=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            elapsed_ms=elapsed_ms,
+            mean_device_ms=0.0,
+            max_device_ms=0.0,
+            changed=sum(1 for result in results if result.changed)
+        )
+
+    def _compile_batch(self, requests: list[HostnameRequest | HostnameResponse]) -> None:
+        """Render the commands for a whole batch up front, grouped by platform.
+
+        Every device sharing a platform and hostname is rendered once, and the
+        results land in the renderer's cache so each device push only looks
+        its commands up. Requests that fail validation are left for
+        :meth:`configure_hostname` to report.
+        """
+        started = time.perf_counter()
+        items: list[tuple[CommandTemplate, dict[str, str]]] = []
+        for request in requests:
+            if isinstance(request, HostnameResponse) or request.platform is None:
+                continue
+            command_template = get_command_template(request.platform, HOSTNAME_OPERATION)
+            if command_template is not None:
+                items.append((command_template, {"hostname": request.name}))
+        self.renderer.render_batch(items)
+        _RENDER_PHASE.observe(time.perf_counter() - started)
+
+    def _selector_requests(self, selector: str) -> list[HostnameRequest | HostnameResponse]:
+        """Build a hostname request for each inventory device matching a selector.
+
+        Devices without a hostname in the inventory get a failed result instead.
+        """
+        requests: list[HostnameRequest | HostnameResponse] = []
+        for device in self.inventory.select(selector):
+            if device.hostname is None:
+                requests.append(HostnameResponse(
+                    success=False,
+                    message=f"Device {device.ip} has no hostname in the inventory",
+                    device=str(device.ip),
+                    hostname=""
+                ))
+            else:
+                # Inventory records are validated on write
+                requests.append(HostnameRequest.model_construct(
+                    name=device.hostname,
+                    device=device.ip,
+                    platform=device.platform
+                ))
+        return requests
+
+    async def _execute_device_configuration(
         self,
         device_ip: str,
         command: str,
         platform: str
     ) -> bool:
-        """Simulate device configuration for demonstration purposes.
-
-        In a real implementation, this would use libraries like:
-        - netmiko for SSH connections
-        - napalm for vendor-agnostic device management
-        - ncclient for NETCONF
+        """Apply configuration commands over a pooled device session.
 
         Args:
             device_ip: IP address of the device
-            command: Configuration command to execute
+            command: Configuration commands to execute, one per line
             platform: Device platform
 
         Returns:
             True if configuration was successful, False otherwise
         """
-        logger.debug(
-            "Simulating configuration on %s (%s): %s",
-            device_ip,
-            platform,
-            command
-        )
-
-        # Simulate different success rates based on device IP
-        # This is just for demonstration purposes
-        if device_ip.endswith('.254'):
-            # Simulate unreachable device
+        try:
+            await self.run_on_device(
+                device_ip,
+                platform,
+                lambda session: session.send_config(command.splitlines())
+            )
+        except TransportError as e:
+            logger.warning("Transport error on device %s: %s", device_ip, e)
             return False
-        elif device_ip.startswith('10.'):
-            # Simulate internal network with high success rate
-            return True
-        else:
-            # Default success for demo
-            return True
+        return True
+
+    async def run_on_device(
+        self,
+        device_ip: str,
+        platform: str,
+        operation: Callable[[DeviceSession], Awaitable[T]],
+        retry: RetryPolicy | None = None
+    ) -> T:
+        """Run an operation over a pooled session, with timeouts and retries.
+
+        Each attempt must open or borrow a session and finish the operation
+        within the retry policy's timeout; time spent waiting for a
+        concurrency slot does not count against the device. Failed attempts
+        are retried after a jittered exponential backoff, without holding a
+        concurrency slot, until the attempts are used up, a retry could not
+        finish within the policy's total timeout, or the device's circuit
+        breaker opens. Only connection failures and timeouts are retried and
+        counted against the breaker; a request the device rejects is raised
+        at once.
+
+        Args:
+            device_ip: IP address of the device
+            platform: Device platform
+            operation: Called with the session to do the work
+            retry: Policy for this operation instead of the service's, e.g.
+                a single attempt for a step that must not be repeated
+
+        Returns:
+            The operation's result
+
+        Raises:
+            CircuitOpenError: If the device's breaker is open
+            TransportError: If the last attempt failed or timed out
+        """
+        retry = retry or self.retry
+        attempt = 1
+        deadline = time.monotonic() + retry.total_timeout
+        while True:
+            self.breakers.check(device_ip)
+            try:
+                with TRACER.span(
+                    "device.attempt",
+                    kind=SpanKind.CLIENT,
+                    device=device_ip,
+                    platform=platform,
+                    attempt=attempt
+                ):
+                    result = await self._attempt_on_device(
+                        device_ip,
+                        platform,
+                        operation,
+                        retry.timeout
+                    )
+            except DeviceRejectedError:
+                # The device answered, so it is reachable, and asking again
+                # would only be refused again
+                self.breakers.record_success(device_ip)
+                raise
+            except TransportError as e:
+                self.breakers.record_failure(device_ip)
+                delay = retry.backoff(attempt)
+                if (
+                    attempt >= retry.attempts
+                    or time.monotonic() + delay + retry.timeout > deadline
+                ):
+                    raise
+                logger.info(
+                    "Attempt %d on device %s failed (%s); retrying in %.2fs",
+                    attempt,
+                    device_ip,
+                    e,
+                    delay
+                )
+                with TRACER.span("retry_backoff", delay=delay):
+                    await asyncio.sleep(delay)
+                _RETRY_BACKOFF_PHASE.observe(delay)
+                attempt += 1
+            except BaseException:
+                # Cancelled, or failed for a reason that says nothing about
+                # the device; a half-open breaker must not wait for a verdict
+                self.breakers.release(device_ip)
+                raise
+            else:
+                self.breakers.record_success(device_ip)
+                return result
+
+    async def _attempt_on_device(
+        self,
+        device_ip: str,
+        platform: str,
+        operation: Callable[[DeviceSession], Awaitable[T]],
+        timeout: float
+    ) -> T:
+        """Make one attempt at an operation within the concurrency limits."""
+        started = time.perf_counter()
+        async with self.concurrency.slot(device_ip, platform) as slot:
+            admitted = time.perf_counter()
+            _CONCURRENCY_WAIT_PHASE.observe(admitted - started)
+            TRACER.record("concurrency_wait", admitted - started)
+
+            async def attempt() -> T:
+                async with self.pool.session(device_ip, platform) as session:
+                    # Only command execution counts towards the adaptive limits
+                    slot.mark_started()
+                    acquired = time.perf_counter()
+                    _TRANSPORT_WAIT_PHASE.observe(acquired - admitted)
+                    TRACER.record("session_acquire", acquired - admitted)
+                    with TRACER.span("device.execute"):
+                        result = await operation(session)
+                    _DEVICE_EXECUTION_PHASE.observe(time.perf_counter() - acquired)
+                return result
+
+            try:
+                return await asyncio.wait_for(attempt(), timeout=timeout)
+            except asyncio.TimeoutError as e:
+                raise TransportError(
+                    f"Device {device_ip} did not respond within {timeout:g}s"
+                ) from e
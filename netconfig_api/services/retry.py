@@ -0,0 +1,207 @@
+"""Retry policy and per-device circuit breakers for device operations."""
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from netconfig_api.models.requests import BreakerState, BreakerStats, DeviceBreaker
+from netconfig_api.transports.base import TransportError
+from netconfig_api.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+BREAKER_EVENTS = Counter(
+    "netconfig_breaker_events_total",
+    "Device circuit breaker events",
+    ["event"]
+)
+
+_OPENED = BREAKER_EVENTS.labels("opened")
+_REJECTED = BREAKER_EVENTS.labels("rejected")
+_PROBED = BREAKER_EVENTS.labels("probed")
+_CLOSED = BREAKER_EVENTS.labels("closed")
+
+
+class CircuitOpenError(TransportError):
+    """Raised when a device's circuit breaker rejects an operation without trying it."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How long a device operation may take and how it is retried.
+
+    Retries wait for an exponentially growing delay with full jitter, a
+    random time between zero and ``base_delay * 2 ** (retry - 1)`` capped at
+    ``max_delay``, so retries against a struggling fleet spread out instead
+    of arriving in lockstep. A retry is only started if it can time out
+    within ``total_timeout`` of the first attempt, so a device that does not
+    answer at all costs one timeout rather than one per attempt.
+    """
+
+    attempts: int = 3
+    timeout: float = 30.0
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    total_timeout: float = 45.0
+
+    def backoff(self, retry: int) -> float:
+        """Return the delay before a retry.
+
+        Args:
+            retry: Retry number, starting at 1
+
+        Returns:
+            Seconds to wait
+        """
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * 2 ** (retry - 1)))
+
+
+@dataclass
+class _Breaker:
+    """Failure bookkeeping for one device."""
+
+    state: BreakerState = BreakerState.CLOSED
+    failures: int = 0
+    trips: int = 0
+    open_until: float = 0.0
+
+
+class CircuitBreakers:
+    """Per-device circuit breakers.
+
+    After ``failure_threshold`` consecutive failures a device's breaker
+    opens and operations on it fail immediately with
+    :class:`CircuitOpenError` instead of waiting out more timeouts. Once
+    ``reset_timeout`` has passed, one probe operation is let through
+    (half-open): success closes the breaker, failure reopens it for twice as
+    long, up to ``max_reset_timeout``. Only devices with recent failures are
+    tracked.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        max_reset_timeout: float = 600.0
+    ) -> None:
+        """Initialize the breakers.
+
+        Args:
+            failure_threshold: Consecutive failures that open a device's breaker
+            reset_timeout: Seconds a breaker first stays open before a probe
+            max_reset_timeout: Longest a breaker stays open after repeated failed probes
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self._breakers: dict[str, _Breaker] = {}
+
+    def check(self, device_ip: str) -> None:
+        """Admit an operation on a device or reject it if the breaker is open.
+
+        Args:
+            device_ip: IP address of the device
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a
+                probe already in flight
+        """
+        breaker = self._breakers.get(device_ip)
+        if breaker is None or breaker.state is BreakerState.CLOSED:
+            return
+        if breaker.state is BreakerState.OPEN and time.monotonic() >= breaker.open_until:
+            breaker.state = BreakerState.HALF_OPEN
+            _PROBED.inc()
+            logger.info("Probing device %s after its circuit breaker opened", device_ip)
+            return
+        _REJECTED.inc()
+        raise CircuitOpenError(
+            f"Circuit breaker for device {device_ip} is {breaker.state.value} "
+            f"after {breaker.failures} consecutive failures"
+        )
+
+    def record_success(self, device_ip: str) -> None:
+        """Close a device's breaker after a successful operation.
+
+        Args:
+            device_ip: IP address of the device
+        """
+        breaker = self._breakers.pop(device_ip, None)
+        if breaker is not None and breaker.state is not BreakerState.CLOSED:
+            _CLOSED.inc()
+            logger.info("Circuit breaker for device %s closed", device_ip)
+
+    def release(self, device_ip: str) -> None:
+        """End a probe that finished without showing whether the device works.
+
+        For example, the probe was cancelled or failed before reaching the
+        device. A half-open breaker returns to open with its reset timeout
+        already passed, so the next operation probes the device instead.
+
+        Args:
+            device_ip: IP address of the device
+        """
+        breaker = self._breakers.get(device_ip)
+        if breaker is not None and breaker.state is BreakerState.HALF_OPEN:
+            breaker.state = BreakerState.OPEN
+            breaker.open_until = time.monotonic()
+
+    def record_failure(self, device_ip: str) -> None:
+        """Count a failed operation, opening the breaker at the threshold.
+
+        Args:
+            device_ip: IP address of the device
+        """
+        breaker = self._breakers.get(device_ip)
+        if breaker is None:
+            breaker = self._breakers[device_ip] = _Breaker()
+        breaker.failures += 1
+        if breaker.state is BreakerState.HALF_OPEN or (
+            breaker.state is BreakerState.CLOSED and breaker.failures >= self.failure_threshold
+        ):
+            reset = min(self.max_reset_timeout, self.reset_timeout * 2 ** breaker.trips)
+            breaker.state = BreakerState.OPEN
+            breaker.trips += 1
+            breaker.open_until = time.monotonic() + reset
+            _OPENED.inc()
+            logger.warning(
+                "Circuit breaker for device %s opened for %.0fs after %d consecutive failures",
+                device_ip,
+                reset,
+                breaker.failures
+            )
+
+    def state(self, device_ip: str) -> BreakerState:
+        """Get the state of a device's breaker.
+
+        Args:
+            device_ip: IP address of the device
+
+        Returns:
+            The breaker state; devices without recent failures are closed
+        """
+        breaker = self._breakers.get(device_ip)
+        return BreakerState.CLOSED if breaker is None else breaker.state
+
+    def stats(self) -> BreakerStats:
+        """Describe every device with recent failures."""
+        now = time.monotonic()
+        wall = datetime.now(timezone.utc)
+        devices = {
+            device_ip: DeviceBreaker(
+                state=breaker.state,
+                consecutive_failures=breaker.failures,
+                trips=breaker.trips,
+                retry_at=(
+                    wall + timedelta(seconds=max(0.0, breaker.open_until - now))
+                    if breaker.state is BreakerState.OPEN else None
+                )
+            )
+            for device_ip, breaker in sorted(self._breakers.items())
+        }
+        return BreakerStats(
+            open=sum(1 for breaker in devices.values() if breaker.state is not BreakerState.CLOSED),
+            devices=devices
+        )
@@ -0,0 +1,159 @@
+"""Per-device operation scheduler with write coalescing."""
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from netconfig_api.models.requests import SchedulerStats
+from netconfig_api.utils.tracing import TRACER
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(eq=False)
+class _Pending:
+    """An operation waiting for its device, with every caller awaiting it."""
+
+    func: Callable[[], Awaitable[Any]]
+    # Context of the caller whose func runs, so it logs and traces under
+    # that caller's request rather than the drainer's
+    context: contextvars.Context
+    submitted: float
+    waiters: list["asyncio.Future[Any]"] = field(default_factory=list)
+
+
+class DeviceScheduler:
+    """Serializes operations per device while running devices in parallel.
+
+    Each device has its own FIFO of pending operations drained by a dedicated
+    task, so two sessions never configure the same device at once while
+    different devices proceed independently. An operation submitted while one
+    of the same kind is still pending for that device replaces it
+    (last-writer-wins) and moves to the back of the queue, so it never runs
+    ahead of operations submitted before it: only the newest is executed, and
+    every caller of the coalesced operations receives its result. Operations
+    run in the context of the caller that submitted them, with the time they
+    spent queued recorded as a trace span.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self.executed = 0
+        self.coalesced = 0
+        self._queues: dict[str, OrderedDict[str, _Pending]] = {}
+        self._drainers: dict[str, asyncio.Task[None]] = {}
+
+    async def run(
+        self,
+        device: str,
+        operation: str,
+        func: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run an operation once the device is free.
+
+        Args:
+            device: Normalized device address used as the serialization key
+            operation: Operation kind; pending operations of the same kind
+                on the same device are coalesced
+            func: Zero-argument callable returning the awaitable to run
+
+        Returns:
+            The result of ``func``, or of the newer operation that superseded it
+        """
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+
+        queue = self._queues.get(device)
+        if queue is None:
+            queue = self._queues[device] = OrderedDict()
+
+        pending = queue.get(operation)
+        if pending is None:
+            queue[operation] = _Pending(
+                func,
+                contextvars.copy_context(),
+                time.perf_counter(),
+                [future]
+            )
+        else:
+            logger.debug("Coalescing pending %s operation on %s", operation, device)
+            pending.func = func
+            pending.context = contextvars.copy_context()
+            pending.waiters.append(future)
+            queue.move_to_end(operation)
+            self.coalesced += 1
+
+        if device not in self._drainers:
+            self._drainers[device] = asyncio.create_task(self._drain(device, queue))
+
+        return await future
+
+    def stats(self) -> SchedulerStats:
+        """Snapshot scheduler counters and per-device queue depths."""
+        return SchedulerStats(
+            executed=self.executed,
+            coalesced=self.coalesced,
+            active_devices=len(self._drainers),
+            queue_depths={
+                device: len(queue) for device, queue in self._queues.items() if queue
+            }
+        )
+
+    async def _drain(self, device: str, queue: OrderedDict[str, _Pending]) -> None:
+        """Run a device's pending operations one at a time until none remain."""
+        try:
+            while queue:
+                operation, pending = queue.popitem(last=False)
+                pending.context.run(
+                    TRACER.record,
+                    "scheduler.queue",
+                    time.perf_counter() - pending.submitted,
+                    operation=operation
+                )
+                try:
+                    result = await pending.context.run(_start, pending)
+                except asyncio.CancelledError:
+                    _cancel(pending.waiters)
+                    raise
+                except Exception as e:  # pylint: disable=broad-except
+                    _settle(pending.waiters, exception=e)
+                else:
+                    _settle(pending.waiters, result=result)
+                self.executed += 1
+        finally:
+            del self._queues[device]
+            del self._drainers[device]
+            for pending in queue.values():
+                _cancel(pending.waiters)
+
+
+def _start(pending: _Pending) -> "asyncio.Future[Any]":
+    """Start a pending operation as a task, in a copy of the current context."""
+    return asyncio.ensure_future(pending.func())
+
+
+def _settle(
+    waiters: list["asyncio.Future[Any]"],
+    result: Any = None,
+    exception: BaseException | None = None
+) -> None:
+    """Resolve every caller still waiting on an operation."""
+    for waiter in waiters:
+        if waiter.done():
+            continue
+        if exception is not None:
+            waiter.set_exception(exception)
+        else:
+            waiter.set_result(result)
+
+
+def _cancel(waiters: list["asyncio.Future[Any]"]) -> None:
+    """Cancel every caller still waiting on an operation."""
+    for waiter in waiters:
+        waiter.cancel()
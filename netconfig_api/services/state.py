@@ -0,0 +1,81 @@
+"""Local snapshot store of last-known device running values."""
+
+from collections import OrderedDict
+
+
+class StateSnapshotStore:
+    """Last-known running value of each operation on each device.
+
+    Values are recorded after a push succeeds and dropped when a push fails,
+    since the device may then be in either state. Unlike the service's
+    applied-state cache the snapshots never expire: they are what dry runs
+    diff against, not a reason to skip a push.
+
+    Every change bumps ``version``, so readers such as the drift scanner can
+    ask which devices changed since they last looked.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.version = 0
+        self._values: dict[tuple[str, str], str] = {}
+        self._changes: OrderedDict[str, int] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of device values held."""
+        return len(self._values)
+
+    def get(self, device: str, operation: str) -> str | None:
+        """Get the last-known value of an operation on a device.
+
+        Args:
+            device: Device IP address
+            operation: Operation name, e.g. ``hostname``
+
+        Returns:
+            The last-known value, or None if it is unknown
+        """
+        return self._values.get((device, operation))
+
+    def set(self, device: str, operation: str, value: str) -> None:
+        """Record the value now running on a device.
+
+        Args:
+            device: Device IP address
+            operation: Operation name
+            value: Value the device is running
+        """
+        self._values[(device, operation)] = value
+        self._changed(device)
+
+    def forget(self, device: str, operation: str) -> None:
+        """Mark the value of an operation on a device as unknown.
+
+        Args:
+            device: Device IP address
+            operation: Operation name
+        """
+        self._values.pop((device, operation), None)
+        self._changed(device)
+
+    def changed_since(self, version: int) -> list[str]:
+        """List devices whose values changed after a given version.
+
+        Args:
+            version: A previously read ``version``
+
+        Returns:
+            Changed devices, most recently changed first
+        """
+        devices: list[str] = []
+        for device, changed in reversed(self._changes.items()):
+            if changed <= version:
+                break
+            devices.append(device)
+        return devices
+
+    def _changed(self, device: str) -> None:
+        """Record that a device's values changed."""
+        self.version += 1
+        self._changes[device] = self.version
+        self._changes.move_to_end(device)
@@ -0,0 +1,354 @@
+"""All-or-nothing configuration changes across several devices."""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from netconfig_api.models.requests import (
+    HostnameRequest,
+    TransactionDeviceResult,
+    TransactionDeviceStatus,
+    TransactionRequest,
+    TransactionResponse,
+    TransactionState,
+    TransactionTimings,
+)
+from netconfig_api.services.network_config import NetworkConfigService
+from netconfig_api.transports.base import DeviceSession, TransportError
+from netconfig_api.utils.device_platforms import (
+    COMMIT_CONFIRMED_PLATFORMS,
+    HOSTNAME_OPERATION,
+)
+from netconfig_api.utils.metrics import Counter, Histogram, HistogramChild
+
+logger = logging.getLogger(__name__)
+
+TRANSACTION_PHASE_SECONDS = Histogram(
+    "netconfig_transaction_phase_seconds",
+    "Time spent in each phase of a multi-device transaction",
+    ["phase"]
+)
+TRANSACTIONS = Counter(
+    "netconfig_transactions_total",
+    "Multi-device transactions by outcome",
+    ["state"]
+)
+
+_PREPARE_PHASE = TRANSACTION_PHASE_SECONDS.labels("prepare")
+_COMMIT_PHASE = TRANSACTION_PHASE_SECONDS.labels("commit")
+_CONFIRM_PHASE = TRANSACTION_PHASE_SECONDS.labels("confirm")
+_ROLLBACK_PHASE = TRANSACTION_PHASE_SECONDS.labels("rollback")
+
+_OUTCOMES = {state: TRANSACTIONS.labels(state.value) for state in TransactionState}
+
+_FAILED = TransactionDeviceStatus.FAILED
+_COMMITTED = TransactionDeviceStatus.COMMITTED
+
+
+@dataclass(eq=False)
+class _Participant:
+    """One device's part in a transaction."""
+
+    request: HostnameRequest
+    platform: str = ""
+    # Start of the running lines the commands replace, e.g. "hostname "
+    replaces: str = ""
+    status: TransactionDeviceStatus = TransactionDeviceStatus.PREPARED
+    commands: list[str] = field(default_factory=list)
+    rollback_commands: list[str] = field(default_factory=list)
+    # A confirmed commit is waiting for confirm_commit or rollback_commit
+    pending: bool = False
+    error: str | None = None
+
+    @property
+    def device(self) -> str:
+        """Normalized IP address of the device."""
+        return str(self.request.device)
+
+    def fail(self, error: str) -> None:
+        """Mark the device as failed."""
+        self.status = _FAILED
+        self.error = error
+
+    def stage_rollback(self, config: str) -> None:
+        """Stage the commands that restore the lines the commands replace."""
+        previous = [line for line in config.splitlines() if line.startswith(self.replaces)]
+        self.rollback_commands = previous or [f"no {self.replaces.strip()}"]
+
+
+class TransactionCoordinator:
+    """Applies a change to several devices so that all or none of them keep it.
+
+    A transaction runs in phases, each across every device in parallel:
+
+    - prepare: validate every request, render its commands and read the
+      device's running config, from which rollback commands are staged. If
+      any device cannot be prepared, no device is changed.
+    - commit: re-read the running config and apply the commands in one
+      device step, so the rollback commands restore what the device ran just
+      before the commit even if another write reached it after prepare.
+      Platforms with a candidate configuration (``COMMIT_CONFIRMED_PLATFORMS``)
+      commit with an automatic rollback that the device performs itself
+      unless the commit is confirmed; the others apply the commands directly.
+    - confirm: once every device has committed, make pending commits permanent.
+    - rollback: if a commit or confirmation failed, restore every changed
+      device, rolling back pending commits and sending the staged rollback
+      commands to the rest.
+
+    Device steps go through the service's scheduler and circuit breakers
+    like any other operation on the device, but are attempted only once: a
+    repeated commit could be applied twice, and a failed step is answered by
+    rolling back instead.
+    """
+
+    def __init__(self, service: NetworkConfigService) -> None:
+        """Initialize the coordinator.
+
+        Args:
+            service: Service whose devices, scheduler and state are used
+        """
+        self.service = service
+
+    async def run(self, request: TransactionRequest) -> TransactionResponse:
+        """Apply a transaction.
+
+        Args:
+            request: Changes to apply, at most one per device
+
+        Returns:
+            TransactionResponse with the outcome, per-device results and
+            per-phase timings
+        """
+        transaction_id = uuid.uuid4().hex
+        logger.info(
+            "Starting transaction %s on %d devices",
+            transaction_id,
+            len(request.requests)
+        )
+        started = time.perf_counter()
+        timings = dict.fromkeys(("commit", "confirm", "rollback"), 0.0)
+        once = replace(self.service.retry, attempts=1)
+
+        async def on_device(
+            participant: _Participant,
+            operation: Callable[[DeviceSession], Awaitable[Any]]
+        ) -> Any:
+            # The operation key is unique to the transaction, so its steps
+            # are never coalesced with other writes to the device
+            return await self.service.scheduler.run(
+                participant.device,
+                f"transaction:{transaction_id}",
+                lambda: self.service.run_on_device(
+                    participant.device,
+                    participant.platform,
+                    operation,
+                    retry=once
+                )
+            )
+
+        async def prepare(participant: _Participant) -> None:
+            try:
+                config = await on_device(participant, lambda session: session.get_config())
+            except TransportError as e:
+                participant.fail(str(e))
+                return
+            participant.stage_rollback(config)
+
+        async def commit(participant: _Participant) -> None:
+            confirmed = participant.platform in COMMIT_CONFIRMED_PLATFORMS
+
+            async def apply(session: DeviceSession) -> None:
+                # The device may have been written to since prepare
+                participant.stage_rollback(await session.get_config())
+                if confirmed:
+                    await session.commit_confirmed(participant.commands, request.confirm_timeout)
+                else:
+                    await session.send_config(participant.commands)
+
+            try:
+                await on_device(participant, apply)
+            except TransportError as e:
+                participant.fail(str(e))
+                return
+            participant.status = _COMMITTED
+            participant.pending = confirmed
+
+        async def confirm(participant: _Participant) -> None:
+            try:
+                await on_device(participant, lambda session: session.confirm_commit())
+            except TransportError as e:
+                participant.fail(f"Commit could not be confirmed: {e}")
+                return
+            participant.pending = False
+
+        async def rollback(participant: _Participant) -> None:
+            try:
+                if participant.pending:
+                    await on_device(participant, lambda session: session.rollback_commit())
+                else:
+                    await on_device(
+                        participant,
+                        lambda session: session.send_config(participant.rollback_commands)
+                    )
+            except TransportError as e:
+                participant.status = TransactionDeviceStatus.ROLLBACK_FAILED
+                participant.error = f"Rollback failed: {e}"
+                logger.error(
+                    "Transaction %s could not roll back device %s: %s",
+                    transaction_id,
+                    participant.device,
+                    e
+                )
+                return
+            participant.pending = False
+            participant.status = TransactionDeviceStatus.ROLLED_BACK
+
+        participants = [self._participant(hostname) for hostname in request.requests]
+        if not any(p.status is _FAILED for p in participants):
+            await asyncio.gather(*(prepare(p) for p in participants))
+        prepare_seconds = time.perf_counter() - started
+        _PREPARE_PHASE.observe(prepare_seconds)
+
+        failed = [p for p in participants if p.status is _FAILED]
+        if failed:
+            state = TransactionState.ABORTED
+        else:
+            timings["commit"] = await _phase(_COMMIT_PHASE, commit, participants)
+            if not any(p.status is _FAILED for p in participants):
+                timings["confirm"] = await _phase(
+                    _CONFIRM_PHASE,
+                    confirm,
+                    [p for p in participants if p.pending]
+                )
+            failed = [p for p in participants if p.status is _FAILED]
+            if failed:
+                logger.warning(
+                    "Transaction %s failed on %d devices; rolling back",
+                    transaction_id,
+                    len(failed)
+                )
+                # Devices whose confirmation failed may still have a pending commit
+                timings["rollback"] = await _phase(
+                    _ROLLBACK_PHASE,
+                    rollback,
+                    [p for p in participants if p.pending or p.status is _COMMITTED]
+                )
+                if any(
+                    p.status is TransactionDeviceStatus.ROLLBACK_FAILED for p in participants
+                ):
+                    state = TransactionState.FAILED
+                else:
+                    state = TransactionState.ROLLED_BACK
+            else:
+                state = TransactionState.COMMITTED
+
+        self._record_state(participants)
+        _OUTCOMES[state].inc()
+        message = _summary(state, participants, failed)
+        logger.info("Transaction %s: %s", transaction_id, message)
+        return TransactionResponse(
+            id=transaction_id,
+            state=state,
+            message=message,
+            results=[
+                TransactionDeviceResult(
+                    device=p.device,
+                    hostname=p.request.name,
+                    platform=p.platform or p.request.platform,
+                    status=p.status,
+                    commands=p.commands,
+                    rollback_commands=p.rollback_commands,
+                    error=p.error
+                )
+                for p in participants
+            ],
+            timings=TransactionTimings(
+                prepare_ms=prepare_seconds * 1000,
+                commit_ms=timings["commit"] * 1000,
+                confirm_ms=timings["confirm"] * 1000,
+                rollback_ms=timings["rollback"] * 1000,
+                total_ms=(time.perf_counter() - started) * 1000
+            )
+        )
+
+    def _participant(self, request: HostnameRequest) -> _Participant:
+        """Validate a request and render its commands."""
+        request, template = self.service.resolve_template(request)
+        participant = _Participant(request=request)
+        if template is None:
+            if request.platform is None:
+                participant.fail(
+                    f"No platform given and device {request.device} is not in the inventory"
+                )
+            else:
+                participant.fail(f"Unsupported platform: {request.platform}")
+            return participant
+
+        participant.platform = template.platform
+        participant.replaces = template.template.split("{", 1)[0]
+        participant.commands = self.service.renderer.render(
+            template,
+            {"hostname": request.name}
+        ).splitlines()
+        return participant
+
+    def _record_state(self, participants: list[_Participant]) -> None:
+        """Update the service's record of what each device is configured with."""
+        for participant in participants:
+            if not participant.platform:
+                continue
+            state_key = (participant.device, participant.platform, HOSTNAME_OPERATION)
+            if participant.status is _COMMITTED:
+                self.service.applied_state.set(state_key, participant.request.name)
+                self.service.snapshots.set(
+                    participant.device,
+                    HOSTNAME_OPERATION,
+                    participant.request.name
+                )
+            elif participant.status is not TransactionDeviceStatus.PREPARED:
+                self.service.applied_state.pop(state_key)
+                self.service.snapshots.forget(participant.device, HOSTNAME_OPERATION)
+
+
+async def _phase(
+    histogram: HistogramChild,
+    step: Callable[[_Participant], Awaitable[None]],
+    participants: list[_Participant]
+) -> float:
+    """Run a step on every participant concurrently and time it.
+
+    Returns:
+        Seconds the phase took
+    """
+    started = time.perf_counter()
+    await asyncio.gather(*(step(participant) for participant in participants))
+    elapsed = time.perf_counter() - started
+    histogram.observe(elapsed)
+    return elapsed
+
+
+def _summary(
+    state: TransactionState,
+    participants: list[_Participant],
+    failed: list[_Participant]
+) -> str:
+    """Describe a transaction's outcome."""
+    total = len(participants)
+    if state is TransactionState.COMMITTED:
+        return f"Committed on {total} devices"
+    if state is TransactionState.ABORTED:
+        return (
+            f"Aborted: {len(failed)} of {total} devices could not be prepared; "
+            "no device was changed"
+        )
+    if state is TransactionState.ROLLED_BACK:
+        return (
+            f"Rolled back: {len(failed)} of {total} devices failed to commit; "
+            "changed devices were restored"
+        )
+    stuck = sum(1 for p in participants if p.status is TransactionDeviceStatus.ROLLBACK_FAILED)
+    return f"Failed: {stuck} of {total} devices could not be rolled back and need attention"
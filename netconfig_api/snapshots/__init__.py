@@ -0,0 +1 @@
+"""Content-addressed storage of device running configurations."""
@@ -0,0 +1,412 @@
+"""Deduplicated, compressed store of device running-config snapshots."""
+
+import contextlib
+import hashlib
+import mmap
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    digest BLOB PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    device TEXT NOT NULL,
+    taken_at REAL NOT NULL,
+    digest BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    blocks BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_device ON snapshots (device, id);
+"""
+
+_SNAPSHOT_COLUMNS = "id, device, taken_at, digest, size, length(blocks)"
+
+_DIGEST_SIZE = 32
+# Blocks end before a top-level line whose hash matches this mask, so an edit
+# only changes the block it falls in and every other block is shared with the
+# previous version. Blocks are kept between these sizes.
+_BOUNDARY_MASK = 0x7
+_MIN_BLOCK_LINES = 4
+_MAX_BLOCK_LINES = 128
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+_QUERY_BATCH = 500
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Metadata of one stored running-config version."""
+
+    id: int
+    device: str
+    taken_at: float
+    digest: str
+    size: int
+    blocks: int
+
+
+@dataclass(frozen=True)
+class SnapshotStats:
+    """How much the store holds and how well it deduplicates."""
+
+    snapshots: int
+    blocks: int
+    stored_bytes: int
+
+
+def split_blocks(config: bytes) -> list[bytes]:
+    """Split a configuration into content-defined blocks of whole lines.
+
+    Args:
+        config: Configuration text
+
+    Returns:
+        Blocks which concatenate back to ``config``
+    """
+    blocks: list[bytes] = []
+    block: list[bytes] = []
+    for line in config.splitlines(keepends=True):
+        if block and (
+            len(block) >= _MAX_BLOCK_LINES
+            or (
+                len(block) >= _MIN_BLOCK_LINES
+                and not line[:1].isspace()
+                and zlib.crc32(line) & _BOUNDARY_MASK == 0
+            )
+        ):
+            blocks.append(b"".join(block))
+            block = []
+        block.append(line)
+    if block:
+        blocks.append(b"".join(block))
+    return blocks
+
+
+class ConfigSnapshotStore:
+    """Running-config history stored as deduplicated, compressed line blocks.
+
+    Each configuration is split into blocks of lines, and every distinct block
+    is compressed and appended once to a pack file, addressed by its SHA-256.
+    A snapshot is just the list of its block digests, so a fleet of mostly
+    identical configs, or a device whose config changes a few lines per run,
+    costs little more than the lines that differ. SQLite holds the block and
+    snapshot indexes; the pack file is memory-mapped, so reading or diffing a
+    version touches only its own blocks, never the rest of the history.
+
+    Writers take SQLite's write lock before appending to the pack, so several
+    processes can share one directory. The directory is created on first use;
+    without one, a private temporary directory is used and removed on close.
+    """
+
+    def __init__(self, directory: str | None = None, compression_level: int = 6) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding ``snapshots.db`` and ``blocks.pack``,
+                or None for a private temporary directory
+            compression_level: zlib level used for new blocks
+        """
+        self.directory = directory
+        self.compression_level = compression_level
+        self._tempdir: tempfile.TemporaryDirectory[str] | None = None
+        self._db: sqlite3.Connection | None = None
+        self._pack: int | None = None
+        self._map: mmap.mmap | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Open or create the database and pack file on first use."""
+        if self._db is None:
+            directory = self.directory
+            if directory is None:
+                self._tempdir = tempfile.TemporaryDirectory(prefix="netconfig-snapshots-")
+                directory = self._tempdir.name
+            os.makedirs(directory, exist_ok=True)
+            self._pack = os.open(
+                os.path.join(directory, "blocks.pack"),
+                os.O_RDWR | os.O_CREAT | os.O_APPEND,
+                0o644
+            )
+            # Calls are serialized by self._lock but may come from worker threads
+            self._db = sqlite3.connect(
+                os.path.join(directory, "snapshots.db"),
+                isolation_level=None,
+                check_same_thread=False
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def put(self, device: str, config: str, taken_at: float | None = None) -> ConfigSnapshot:
+        """Store a device's running config, writing only blocks not yet stored.
+
+        If the config is identical to the device's latest snapshot, no new
+        version is recorded and the latest snapshot is returned.
+
+        Args:
+            device: Device IP address
+            config: Running configuration text
+            taken_at: Unix time the config was read; defaults to now
+
+        Returns:
+            The snapshot holding this config
+        """
+        data = config.encode()
+        digest = hashlib.sha256(data).digest()
+        blocks = split_blocks(data)
+        digests = [hashlib.sha256(block).digest() for block in blocks]
+        taken_at = time.time() if taken_at is None else taken_at
+
+        with self._lock, self._transaction() as db:
+            row = db.execute(
+                f"SELECT {_SNAPSHOT_COLUMNS} FROM snapshots WHERE device = ? "
+                "ORDER BY id DESC LIMIT 1",
+                (device,)
+            ).fetchone()
+            if row is not None and row[3] == digest:
+                return self._snapshot(row)
+
+            unique = dict(zip(digests, blocks, strict=True))
+            known = self._known_digests(list(unique))
+            # Opened alongside the database by _connection
+            pack = self._pack
+            if pack is None:
+                raise RuntimeError("Snapshot store is closed")
+            rows: list[tuple[bytes, int, int]] = []
+            for block_digest, block in unique.items():
+                if block_digest in known:
+                    continue
+                compressed = zlib.compress(block, self.compression_level)
+                offset = os.lseek(pack, 0, os.SEEK_END)
+                os.write(pack, compressed)
+                rows.append((block_digest, offset, len(compressed)))
+            db.executemany("INSERT INTO blocks (digest, offset, length) VALUES (?, ?, ?)", rows)
+            cursor = db.execute(
+                "INSERT INTO snapshots (device, taken_at, digest, size, blocks) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (device, taken_at, digest, len(data), b"".join(digests))
+            )
+        return ConfigSnapshot(
+            id=int(cursor.lastrowid or 0),
+            device=device,
+            taken_at=taken_at,
+            digest=digest.hex(),
+            size=len(data),
+            blocks=len(digests)
+        )
+
+    def get(self, snapshot_id: int) -> ConfigSnapshot | None:
+        """Look up a snapshot by id.
+
+        Args:
+            snapshot_id: Snapshot id
+
+        Returns:
+            The snapshot, or None if it does not exist
+        """
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {_SNAPSHOT_COLUMNS} FROM snapshots WHERE id = ?",
+                (snapshot_id,)
+            ).fetchone()
+        return None if row is None else self._snapshot(row)
+
+    def latest(self, device: str) -> ConfigSnapshot | None:
+        """Look up a device's most recent snapshot.
+
+        Args:
+            device: Device IP address
+
+        Returns:
+            The newest snapshot, or None if the device has none
+        """
+        history = self.history(device, limit=1)
+        return history[0] if history else None
+
+    def history(self, device: str, limit: int | None = None) -> list[ConfigSnapshot]:
+        """List a device's snapshots, newest first.
+
+        Args:
+            device: Device IP address
+            limit: Maximum number of snapshots, or None for all
+
+        Returns:
+            Snapshot metadata; no config content is read
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {_SNAPSHOT_COLUMNS} FROM snapshots WHERE device = ? "
+                "ORDER BY id DESC LIMIT ?",
+                (device, -1 if limit is None else limit)
+            ).fetchall()
+        return [self._snapshot(row) for row in rows]
+
+    def read(self, snapshot_id: int) -> str:
+        """Read back the full config of a snapshot.
+
+        Args:
+            snapshot_id: Snapshot id
+
+        Returns:
+            The configuration text
+
+        Raises:
+            KeyError: If the snapshot does not exist
+        """
+        with self._lock:
+            digests = self._block_digests(snapshot_id)
+            return b"".join(self._read_blocks(digests)).decode()
+
+    def diff(self, old_id: int, new_id: int) -> list[str]:
+        """Diff two snapshots line by line.
+
+        Only blocks that differ between the versions are decompressed.
+
+        Args:
+            old_id: Snapshot id of the older version
+            new_id: Snapshot id of the newer version
+
+        Returns:
+            ``-`` lines only in the old version and ``+`` lines only in the new
+            one, in config order; empty if the versions are identical
+
+        Raises:
+            KeyError: If either snapshot does not exist
+        """
+        with self._lock:
+            old = self._block_digests(old_id)
+            new = self._block_digests(new_id)
+            diff: list[str] = []
+            matcher = SequenceMatcher(None, old, new, autojunk=False)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag == "equal":
+                    continue
+                old_lines = b"".join(self._read_blocks(old[i1:i2])).decode().splitlines()
+                new_lines = b"".join(self._read_blocks(new[j1:j2])).decode().splitlines()
+                lines = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+                for line_tag, k1, k2, l1, l2 in lines.get_opcodes():
+                    if line_tag == "equal":
+                        continue
+                    diff.extend(f"-{line}" for line in old_lines[k1:k2])
+                    diff.extend(f"+{line}" for line in new_lines[l1:l2])
+        return diff
+
+    def stats(self) -> SnapshotStats:
+        """Count stored snapshots and blocks and the pack file size."""
+        with self._lock:
+            db = self._connection
+            snapshots = db.execute("SELECT count(*) FROM snapshots").fetchone()[0]
+            blocks, stored = db.execute(
+                "SELECT count(*), coalesce(sum(length), 0) FROM blocks"
+            ).fetchone()
+        return SnapshotStats(snapshots=snapshots, blocks=blocks, stored_bytes=stored)
+
+    def close(self) -> None:
+        """Close the database and pack file, removing a temporary directory."""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._pack is not None:
+                os.close(self._pack)
+                self._pack = None
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+            if self._tempdir is not None:
+                self._tempdir.cleanup()
+                self._tempdir = None
+
+    @staticmethod
+    def _snapshot(row: tuple) -> ConfigSnapshot:
+        """Build snapshot metadata from a row of ``_SNAPSHOT_COLUMNS``."""
+        snapshot_id, device, taken_at, digest, size, blocks_length = row
+        return ConfigSnapshot(
+            id=snapshot_id,
+            device=device,
+            taken_at=taken_at,
+            digest=digest.hex(),
+            size=size,
+            blocks=blocks_length // _DIGEST_SIZE
+        )
+
+    def _known_digests(self, digests: list[bytes]) -> set[bytes]:
+        """Return which of the given block digests are already stored."""
+        known: set[bytes] = set()
+        for start in range(0, len(digests), _QUERY_BATCH):
+            batch = digests[start:start + _QUERY_BATCH]
+            placeholders = ", ".join("?" * len(batch))
+            known.update(
+                row[0] for row in self._connection.execute(
+                    f"SELECT digest FROM blocks WHERE digest IN ({placeholders})",
+                    batch
+                )
+            )
+        return known
+
+    def _block_digests(self, snapshot_id: int) -> list[bytes]:
+        """Return the block digests of a snapshot, in order."""
+        row = self._connection.execute(
+            "SELECT blocks FROM snapshots WHERE id = ?", (snapshot_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Snapshot {snapshot_id} not found")
+        blocks = row[0]
+        return [blocks[start:start + _DIGEST_SIZE] for start in range(0, len(blocks), _DIGEST_SIZE)]
+
+    def _read_blocks(self, digests: list[bytes]) -> Iterator[bytes]:
+        """Decompress blocks straight from the memory-mapped pack file."""
+        locations: dict[bytes, tuple[int, int]] = {}
+        unique = list(dict.fromkeys(digests))
+        for start in range(0, len(unique), _QUERY_BATCH):
+            batch = unique[start:start + _QUERY_BATCH]
+            placeholders = ", ".join("?" * len(batch))
+            for digest, offset, length in self._connection.execute(
+                f"SELECT digest, offset, length FROM blocks WHERE digest IN ({placeholders})",
+                batch
+            ):
+                locations[digest] = (offset, length)
+        end = max((offset + length for offset, length in locations.values()), default=0)
+        pack = self._mapped(end)
+        for digest in digests:
+            offset, length = locations[digest]
+            yield zlib.decompress(pack[offset:offset + length])
+
+    def _mapped(self, end: int) -> mmap.mmap | bytes:
+        """Return a read-only map of the pack file covering at least ``end`` bytes.
+
+        The pack only grows, so the map is replaced only when a block lies past
+        its end (written by this or another process since it was mapped).
+        """
+        if end == 0:
+            return b""
+        if self._map is None or len(self._map) < end:
+            if self._pack is None:
+                raise RuntimeError("Snapshot store is closed")
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._pack, 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block holding SQLite's write lock, rolling back if it raises."""
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._connection
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
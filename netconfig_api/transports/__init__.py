@@ -0,0 +1 @@
+"""Device transports and connection pooling."""
@@ -0,0 +1,114 @@
+"""Transport abstractions for communicating with network devices."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+
+class TransportError(Exception):
+    """Raised when a device cannot be reached or rejects a session operation."""
+
+
+class DeviceRejectedError(TransportError):
+    """Raised when a device answers but refuses the request.
+
+    The device would refuse the same request again, so it is not retried,
+    and since the device did answer it is not counted as a device failure.
+    """
+
+
+class DeviceSession(ABC):
+    """An open management session to a single network device."""
+
+    def __init__(self, device_ip: str, platform: str) -> None:
+        """Initialize the session.
+
+        Args:
+            device_ip: IP address of the device
+            platform: Device platform
+        """
+        self.device_ip = device_ip
+        self.platform = platform
+
+    @abstractmethod
+    async def send_config(self, commands: Sequence[str]) -> None:
+        """Apply configuration commands to the device.
+
+        Args:
+            commands: Configuration commands, in order
+
+        Raises:
+            TransportError: If the commands could not be applied
+        """
+
+    @abstractmethod
+    async def get_config(self) -> str:
+        """Read the device's running configuration.
+
+        Returns:
+            The running configuration text
+
+        Raises:
+            TransportError: If the configuration could not be read
+        """
+
+    async def commit_confirmed(self, commands: Sequence[str], timeout: float) -> None:
+        """Apply commands that the device rolls back unless confirmed in time.
+
+        Platforms with a candidate configuration (Junos ``commit confirmed``)
+        override this; the default rejects the request.
+
+        Args:
+            commands: Configuration commands, in order
+            timeout: Seconds before the device restores its previous configuration
+
+        Raises:
+            TransportError: If the commit failed or is not supported
+        """
+        raise DeviceRejectedError(f"Commit confirmed is not supported on {self.platform}")
+
+    async def confirm_commit(self) -> None:
+        """Make a pending confirmed commit permanent.
+
+        Raises:
+            TransportError: If there is no pending commit or it could not be confirmed
+        """
+        raise DeviceRejectedError(f"Commit confirmed is not supported on {self.platform}")
+
+    async def rollback_commit(self) -> None:
+        """Restore the configuration from before a pending confirmed commit.
+
+        Raises:
+            TransportError: If there is no pending commit or it could not be rolled back
+        """
+        raise DeviceRejectedError(f"Commit confirmed is not supported on {self.platform}")
+
+    @abstractmethod
+    async def keepalive(self) -> None:
+        """Exercise the session so the device does not time it out.
+
+        Raises:
+            TransportError: If the session is no longer usable
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the session and release its resources."""
+
+
+class Transport(ABC):
+    """Factory for device sessions over a particular protocol (SSH, NETCONF, ...)."""
+
+    @abstractmethod
+    async def connect(self, device_ip: str, platform: str) -> DeviceSession:
+        """Open a new session to a device.
+
+        Args:
+            device_ip: IP address of the device
+            platform: Device platform
+
+        Returns:
+            An open DeviceSession
+
+        Raises:
+            TransportError: If the device cannot be reached
+        """
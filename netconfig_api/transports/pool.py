@@ -0,0 +1,270 @@
+"""Connection pool that keeps device sessions open between operations."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+from netconfig_api.transports.base import DeviceSession, Transport, TransportError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class _PooledSession:
+    """A session owned by the pool along with its bookkeeping timestamps."""
+
+    session: DeviceSession
+    last_used: float = field(default_factory=time.monotonic)
+    last_keepalive: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class PoolStats:
+    """Counters describing how effectively the pool reuses sessions."""
+
+    hits: int = 0
+    misses: int = 0
+    waits: int = 0
+    evictions: int = 0
+    keepalive_failures: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of acquisitions served by an already-open session."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ConnectionPool:
+    """Per-device pool of open sessions with global and per-device caps.
+
+    Sessions are returned to the pool after use and reused by later operations
+    on the same device, avoiding a fresh handshake per command. Idle sessions
+    are kept alive with periodic keepalives and closed once they have been idle
+    for longer than ``idle_timeout``. When the global cap is reached, the least
+    recently used idle session of another device is evicted to make room.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        max_sessions_per_device: int = 2,
+        max_sessions: int = 1024,
+        idle_timeout: float = 300.0,
+        keepalive_interval: float = 30.0,
+        maintenance_interval: float = 5.0
+    ) -> None:
+        """Initialize the connection pool.
+
+        Args:
+            transport: Transport used to open new sessions
+            max_sessions_per_device: Maximum open sessions to any one device
+            max_sessions: Maximum open sessions across all devices
+            idle_timeout: Seconds an idle session is kept before being closed
+            keepalive_interval: Seconds between keepalives on idle sessions
+            maintenance_interval: Seconds between background maintenance passes
+        """
+        self.transport = transport
+        self.max_sessions_per_device = max_sessions_per_device
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.keepalive_interval = keepalive_interval
+        self.maintenance_interval = maintenance_interval
+        self.stats = PoolStats()
+
+        self._condition = asyncio.Condition()
+        self._idle: dict[str, list[_PooledSession]] = defaultdict(list)
+        self._lru: OrderedDict[_PooledSession, None] = OrderedDict()
+        self._open: dict[str, int] = defaultdict(int)
+        self._total = 0
+        self._closed = False
+        self._maintenance_task: asyncio.Task[None] | None = None
+
+    @property
+    def open_sessions(self) -> int:
+        """Number of sessions currently open, idle or in use."""
+        return self._total
+
+    @property
+    def idle_sessions(self) -> int:
+        """Number of open sessions waiting in the pool."""
+        return len(self._lru)
+
+    @contextlib.asynccontextmanager
+    async def session(self, device_ip: str, platform: str) -> AsyncIterator[DeviceSession]:
+        """Borrow a session to a device for the duration of the block.
+
+        The session is returned to the pool when the block exits normally and
+        closed if the block raises, since its state can no longer be trusted.
+
+        Args:
+            device_ip: IP address of the device
+            platform: Device platform
+
+        Yields:
+            An open DeviceSession
+
+        Raises:
+            TransportError: If a new session is needed and cannot be opened
+        """
+        pooled = await self._acquire(device_ip, platform)
+        healthy = False
+        try:
+            yield pooled.session
+            healthy = True
+        finally:
+            await self._checkin(pooled, healthy=healthy, used=True)
+
+    async def start(self) -> None:
+        """Start the background keepalive and idle-eviction task."""
+        if self._maintenance_task is None:
+            self._condition = asyncio.Condition()
+            self._closed = False
+            self._maintenance_task = asyncio.create_task(self._maintain_forever())
+
+    async def close(self) -> None:
+        """Stop background maintenance and close every idle session.
+
+        Sessions that are checked out when the pool closes are closed as soon
+        as they are returned.
+        """
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._maintenance_task
+            self._maintenance_task = None
+
+        async with self._condition:
+            self._closed = True
+            idle = list(self._lru)
+            for pooled in idle:
+                self._take_idle(pooled)
+                self._forget(pooled)
+            self._condition.notify_all()
+
+        for pooled in idle:
+            await pooled.session.close()
+
+    async def run_maintenance(self) -> None:
+        """Run one pass of idle eviction and keepalives over idle sessions."""
+        now = time.monotonic()
+        expired: list[_PooledSession] = []
+        due: list[_PooledSession] = []
+
+        async with self._condition:
+            for pooled in list(self._lru):
+                if now - pooled.last_used >= self.idle_timeout:
+                    self._take_idle(pooled)
+                    self._forget(pooled)
+                    expired.append(pooled)
+                elif now - pooled.last_keepalive >= self.keepalive_interval:
+                    self._take_idle(pooled)
+                    due.append(pooled)
+            if expired:
+                self._condition.notify_all()
+
+        for pooled in expired:
+            logger.debug("Evicting idle session to %s", pooled.session.device_ip)
+            self.stats.evictions += 1
+            await pooled.session.close()
+
+        for pooled in due:
+            try:
+                await pooled.session.keepalive()
+            except TransportError as e:
+                logger.debug("Keepalive to %s failed: %s", pooled.session.device_ip, e)
+                self.stats.keepalive_failures += 1
+                await self._checkin(pooled, healthy=False, used=False)
+            else:
+                pooled.last_keepalive = time.monotonic()
+                await self._checkin(pooled, healthy=True, used=False)
+
+    async def _maintain_forever(self) -> None:
+        """Run maintenance passes until cancelled."""
+        while True:
+            await asyncio.sleep(self.maintenance_interval)
+            try:
+                await self.run_maintenance()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Connection pool maintenance failed")
+
+    async def _acquire(self, device_ip: str, platform: str) -> _PooledSession:
+        """Take an idle session or reserve capacity for and open a new one."""
+        victim: _PooledSession | None = None
+
+        async with self._condition:
+            while True:
+                if self._closed:
+                    raise TransportError("Connection pool is closed")
+                idle = self._idle.get(device_ip)
+                if idle:
+                    pooled = idle.pop()
+                    del self._lru[pooled]
+                    self.stats.hits += 1
+                    return pooled
+                if self._open.get(device_ip, 0) < self.max_sessions_per_device:
+                    if self._total < self.max_sessions:
+                        break
+                    if self._lru:
+                        victim, _ = self._lru.popitem(last=False)
+                        self._idle[victim.session.device_ip].remove(victim)
+                        self._forget(victim)
+                        break
+                self.stats.waits += 1
+                await self._condition.wait()
+
+            self._open[device_ip] += 1
+            self._total += 1
+            self.stats.misses += 1
+
+        if victim is not None:
+            self.stats.evictions += 1
+            await victim.session.close()
+
+        try:
+            session = await self.transport.connect(device_ip, platform)
+        except BaseException:
+            async with self._condition:
+                self._release_slot(device_ip)
+                self._condition.notify_all()
+            raise
+
+        return _PooledSession(session)
+
+    async def _checkin(self, pooled: _PooledSession, healthy: bool, used: bool) -> None:
+        """Return a session to the pool, or close it if it is no longer usable."""
+        discard = not healthy
+        async with self._condition:
+            if healthy and not self._closed:
+                if used:
+                    pooled.last_used = time.monotonic()
+                self._idle[pooled.session.device_ip].append(pooled)
+                self._lru[pooled] = None
+            else:
+                self._forget(pooled)
+                discard = True
+            self._condition.notify_all()
+
+        if discard:
+            await pooled.session.close()
+
+    def _take_idle(self, pooled: _PooledSession) -> None:
+        """Remove a session from the idle structures. Caller holds the lock."""
+        del self._lru[pooled]
+        self._idle[pooled.session.device_ip].remove(pooled)
+
+    def _forget(self, pooled: _PooledSession) -> None:
+        """Stop counting a session against the caps. Caller holds the lock."""
+        self._release_slot(pooled.session.device_ip)
+
+    def _release_slot(self, device_ip: str) -> None:
+        """Release one session slot for a device. Caller holds the lock."""
+        self._open[device_ip] -= 1
+        if not self._open[device_ip]:
+            del self._open[device_ip]
+            self._idle.pop(device_ip, None)
+        self._total -= 1
@@ -0,0 +1,88 @@
+"""Transports selectable by name and imported on first use."""
+
+import asyncio
+import importlib
+import logging
+import threading
+import time
+from typing import Any
+
+from netconfig_api.transports.base import DeviceSession, Transport
+
+logger = logging.getLogger(__name__)
+
+# Transport name -> "module:class". Implementations wrapping vendor libraries
+# such as netmiko or ncclient are listed here rather than imported, so
+# processes that never open a session do not pay for loading them.
+TRANSPORTS: dict[str, str] = {
+    "simulated": "netconfig_api.transports.simulated:SimulatedTransport",
+}
+
+
+class LazyTransport(Transport):
+    """Transport that imports and creates its implementation on first connect.
+
+    The import runs in a worker thread so a slow vendor library does not
+    stall the event loop while the first session is opened.
+    """
+
+    def __init__(self, name: str, **options: Any) -> None:
+        """Initialize the transport without importing it.
+
+        Args:
+            name: Transport name, one of ``TRANSPORTS``
+            **options: Keyword arguments for the transport's constructor
+
+        Raises:
+            ValueError: If the transport name is unknown
+        """
+        if name not in TRANSPORTS:
+            raise ValueError(
+                f"Unknown transport: {name}. Available: {', '.join(sorted(TRANSPORTS))}"
+            )
+        self.name = name
+        self.options = options
+        self._transport: Transport | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the implementation has been imported."""
+        return self._transport is not None
+
+    def load(self) -> Transport:
+        """Import and create the implementation if not done yet.
+
+        Returns:
+            The underlying transport
+        """
+        with self._lock:
+            if self._transport is None:
+                started = time.perf_counter()
+                module_name, _, class_name = TRANSPORTS[self.name].partition(":")
+                transport_class = getattr(importlib.import_module(module_name), class_name)
+                self._transport = transport_class(**self.options)
+                logger.info(
+                    "Loaded %s transport in %.1f ms",
+                    self.name,
+                    (time.perf_counter() - started) * 1000
+                )
+            return self._transport
+
+    async def connect(self, device_ip: str, platform: str) -> DeviceSession:
+        """Open a new session to a device, loading the implementation first.
+
+        Args:
+            device_ip: IP address of the device
+            platform: Device platform
+
+        Returns:
+            An open DeviceSession
+
+        Raises:
+            TransportError: If the device cannot be reached
+        """
+        transport = self._transport
+        if transport is None:
+            transport = await asyncio.to_thread(self.load)
+        return await transport.connect(device_ip, platform)
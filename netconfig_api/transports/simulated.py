@@ -0,0 +1,209 @@
+"""In-process simulated transport for testing without real hardware."""
+
+import asyncio
+import logging
+from collections.abc import Sequence
+
+from netconfig_api.transports.base import (
+    DeviceRejectedError,
+    DeviceSession,
+    Transport,
+    TransportError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SimulatedSession(DeviceSession):
+    """Session to a simulated device."""
+
+    def __init__(self, transport: "SimulatedTransport", device_ip: str, platform: str) -> None:
+        """Initialize the simulated session."""
+        super().__init__(device_ip, platform)
+        self._transport = transport
+        self.closed = False
+
+    async def send_config(self, commands: Sequence[str]) -> None:
+        """Simulate applying configuration commands."""
+        if self.closed:
+            raise TransportError(f"Session to {self.device_ip} is closed")
+        logger.debug(
+            "Simulating configuration on %s (%s): %s",
+            self.device_ip,
+            self.platform,
+            "; ".join(commands)
+        )
+        if self._transport.command_latency:
+            await asyncio.sleep(self._transport.command_latency)
+        self._transport.check_commands(self.device_ip, commands)
+        self._transport.commands_sent += len(commands)
+        self._transport.commits += 1
+        running = self._transport.running_config(self.device_ip)
+        for command in commands:
+            _apply_command(running, command)
+
+    async def commit_confirmed(self, commands: Sequence[str], timeout: float) -> None:
+        """Simulate a commit that rolls back unless confirmed within ``timeout``."""
+        if self.closed:
+            raise TransportError(f"Session to {self.device_ip} is closed")
+        if self._transport.command_latency:
+            await asyncio.sleep(self._transport.command_latency)
+        if self.device_ip in self._transport.pending_commits:
+            raise DeviceRejectedError(
+                f"Device {self.device_ip} already has a commit pending confirmation"
+            )
+        self._transport.check_commands(self.device_ip, commands)
+        self._transport.commands_sent += len(commands)
+        self._transport.commits += 1
+        running = self._transport.running_config(self.device_ip)
+        previous = list(running)
+        for command in commands:
+            _apply_command(running, command)
+        handle = asyncio.get_running_loop().call_later(
+            timeout,
+            self._transport.expire_commit,
+            self.device_ip
+        )
+        self._transport.pending_commits[self.device_ip] = (previous, handle)
+
+    async def confirm_commit(self) -> None:
+        """Simulate confirming a pending commit."""
+        if self.closed:
+            raise TransportError(f"Session to {self.device_ip} is closed")
+        pending = self._transport.pending_commits.pop(self.device_ip, None)
+        if pending is None:
+            raise DeviceRejectedError(f"Device {self.device_ip} has no commit pending confirmation")
+        pending[1].cancel()
+
+    async def rollback_commit(self) -> None:
+        """Simulate rolling back a pending commit."""
+        if self.closed:
+            raise TransportError(f"Session to {self.device_ip} is closed")
+        if self.device_ip not in self._transport.pending_commits:
+            raise DeviceRejectedError(f"Device {self.device_ip} has no commit pending confirmation")
+        self._transport.expire_commit(self.device_ip)
+
+    async def get_config(self) -> str:
+        """Return the simulated device's running configuration."""
+        if self.closed:
+            raise TransportError(f"Session to {self.device_ip} is closed")
+        if self._transport.command_latency:
+            await asyncio.sleep(self._transport.command_latency)
+        return "".join(f"{line}\n" for line in self._transport.running_config(self.device_ip))
+
+    async def keepalive(self) -> None:
+        """Simulate a keepalive round trip."""
+        if self.closed:
+            raise TransportError(f"Session to {self.device_ip} is closed")
+        self._transport.keepalives += 1
+
+    async def close(self) -> None:
+        """Close the simulated session."""
+        if not self.closed:
+            self.closed = True
+            self._transport.closes += 1
+
+
+def _apply_command(running: list[str], command: str) -> None:
+    """Apply a command to a simulated config, replacing the line it sets.
+
+    A command replaces the line that matches it in every word but the last
+    (``hostname a`` replaces ``hostname b``), and is appended otherwise.
+    ``no <line>`` removes the lines starting with ``<line>``.
+    """
+    if command.startswith("no "):
+        target = command[3:]
+        running[:] = [
+            line for line in running if line != target and not line.startswith(f"{target} ")
+        ]
+        return
+    key = command.rsplit(" ", 1)[0]
+    for index, line in enumerate(running):
+        if line.rsplit(" ", 1)[0] == key:
+            running[index] = command
+            return
+    running.append(command)
+
+
+class SimulatedTransport(Transport):
+    """Transport that mimics device behaviour and handshake latency in-process.
+
+    Devices whose IP address ends in ``.254`` are treated as unreachable;
+    connecting to one fails after ``unreachable_delay`` seconds, so a dead
+    device can be made to hang like a real connect timeout. Commands
+    containing any of ``reject_commands`` are refused, as a device refuses
+    invalid input, and confirmed commits roll back unless confirmed in time.
+    Each device keeps a running config that applied commands update, starting
+    from ``base_config``. Counters are exposed so tests can observe how often
+    sessions are opened.
+    """
+
+    def __init__(
+        self,
+        handshake_latency: float = 0.0,
+        command_latency: float = 0.0,
+        base_config: Sequence[str] = (),
+        unreachable_delay: float = 0.0,
+        reject_commands: Sequence[str] = ()
+    ) -> None:
+        """Initialize the simulated transport.
+
+        Args:
+            handshake_latency: Seconds to wait when opening a session
+            command_latency: Seconds to wait when applying or reading configuration
+            base_config: Lines every device's running config starts with
+            unreachable_delay: Seconds an unreachable device takes to fail
+            reject_commands: Substrings that make a device refuse a command
+        """
+        self.handshake_latency = handshake_latency
+        self.command_latency = command_latency
+        self.base_config = list(base_config)
+        self.unreachable_delay = unreachable_delay
+        self.reject_commands = list(reject_commands)
+        self.configs: dict[str, list[str]] = {}
+        self.pending_commits: dict[str, tuple[list[str], asyncio.TimerHandle]] = {}
+        self.handshakes = 0
+        self.commands_sent = 0
+        self.commits = 0
+        self.keepalives = 0
+        self.closes = 0
+
+    def running_config(self, device_ip: str) -> list[str]:
+        """Return a device's running config lines, creating it on first use."""
+        running = self.configs.get(device_ip)
+        if running is None:
+            running = self.configs[device_ip] = list(self.base_config)
+        return running
+
+    def check_commands(self, device_ip: str, commands: Sequence[str]) -> None:
+        """Refuse a set of commands if any of them is rejected.
+
+        Raises:
+            DeviceRejectedError: If a command contains a rejected substring
+        """
+        for command in commands:
+            if any(rejected in command for rejected in self.reject_commands):
+                raise DeviceRejectedError(f"Device {device_ip} rejected command: {command}")
+
+    def expire_commit(self, device_ip: str) -> None:
+        """Restore a device's config from before its pending confirmed commit."""
+        pending = self.pending_commits.pop(device_ip, None)
+        if pending is None:
+            return
+        previous, handle = pending
+        handle.cancel()
+        self.running_config(device_ip)[:] = previous
+        logger.debug("Rolled back unconfirmed commit on %s", device_ip)
+
+    async def connect(self, device_ip: str, platform: str) -> DeviceSession:
+        """Open a simulated session, failing for unreachable devices."""
+        if self.handshake_latency:
+            await asyncio.sleep(self.handshake_latency)
+        self.handshakes += 1
+
+        if device_ip.endswith(".254"):
+            if self.unreachable_delay:
+                await asyncio.sleep(self.unreachable_delay)
+            raise TransportError(f"Device {device_ip} is unreachable")
+
+        return SimulatedSession(self, device_ip, platform)
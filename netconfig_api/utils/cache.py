@@ -0,0 +1,77 @@
+"""In-memory caches."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache whose entries also expire after a fixed time-to-live.
+
+    Lookups and inserts are O(1). Expired entries are dropped lazily when they
+    are looked up or pushed out by newer entries.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used entry
+                is evicted once this is exceeded
+            ttl: Seconds an entry stays valid, or None to never expire
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[V, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of entries currently held, including any not yet expired lazily."""
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        """Get a live entry and mark it most recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if absent or expired
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Insert or replace an entry, evicting the least recently used if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        expires = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        self._data[key] = (value, expires)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Remove an entry if present.
+
+        Args:
+            key: Cache key
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._data.clear()
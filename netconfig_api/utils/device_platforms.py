@@ -1,6 +1,14 @@
-"""Device platform utilities."""
+"""Device platform utilities and the operation catalog."""
 
+import json
+import os
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
+from string import Formatter
+from types import MappingProxyType
+from typing import Any
 
 
 class SupportedPlatform(str, Enum):
@@ -13,6 +21,188 @@ class SupportedPlatform(str, Enum):
     ARISTA_EOS = "arista_eos"
 
 
+HOSTNAME_OPERATION = "hostname"
+
+# Operations and their command templates per platform are declared in this
+# catalog; point NETCONFIG_OPERATION_CATALOG at another file to replace it.
+DEFAULT_OPERATION_CATALOG = Path(__file__).with_name("operations.json")
+
+PARAMETER_TYPES = frozenset({"string", "integer", "ip"})
+_PARAMETER_CONSTRAINTS = frozenset({
+    "type", "description", "min_length", "max_length", "pattern", "ge", "le"
+})
+# Request fields every operation has, which parameters may not shadow
+_RESERVED_PARAMETERS = frozenset({"device", "platform"})
+
+
+@dataclass(frozen=True)
+class CommandTemplate:
+    """A platform command template with its precompiled renderer."""
+
+    platform: str
+    operation: str
+    template: str
+    render: Callable[..., str]
+    fields: tuple[str, ...] = ()
+
+
+def compile_template(platform: str, operation: str, template: str) -> CommandTemplate:
+    """Compile a command template once, ahead of any rendering.
+
+    Placeholders are parsed up front so renderers can key caches on exactly
+    the parameters the template uses, in a fixed order.
+
+    Args:
+        platform: Device platform
+        operation: Operation name, e.g. ``hostname``
+        template: ``str.format`` template with named placeholders
+
+    Returns:
+        The compiled CommandTemplate
+
+    Raises:
+        ValueError: If the template is malformed or uses positional placeholders
+    """
+    fields: list[str] = []
+    for _, field, _, _ in Formatter().parse(template):
+        if field is None:
+            continue
+        if not field.isidentifier():
+            raise ValueError(f"Template placeholders must be names, got {{{field}}}: {template}")
+        if field not in fields:
+            fields.append(field)
+    return CommandTemplate(
+        platform=platform,
+        operation=operation,
+        template=template,
+        render=template.format,
+        fields=tuple(fields)
+    )
+
+
+@dataclass(frozen=True)
+class OperationDefinition:
+    """An operation declared in the catalog.
+
+    ``parameters`` maps each parameter name to its schema: a ``type`` from
+    ``PARAMETER_TYPES`` plus optional ``description``, ``min_length``,
+    ``max_length``, ``pattern``, ``ge`` and ``le`` constraints. ``key``
+    names the parameters that identify the configured object (the VLAN ID
+    of a VLAN), so that changes to different objects are never coalesced.
+    """
+
+    name: str
+    description: str
+    parameters: Mapping[str, Mapping[str, Any]]
+    key: tuple[str, ...]
+    templates: Mapping[str, CommandTemplate]
+
+
+SUPPORTED_PLATFORMS: frozenset[str] = frozenset(
+    platform.value for platform in SupportedPlatform
+)
+
+
+def load_operation_catalog(path: str | Path) -> dict[str, OperationDefinition]:
+    """Load and compile an operation catalog.
+
+    Every template is compiled and checked against its operation's
+    parameters here, so a bad catalog fails at startup rather than on the
+    first request that uses it.
+
+    Args:
+        path: JSON file mapping each operation name to its ``description``,
+            ``parameters``, ``key`` and per-platform ``templates``
+
+    Returns:
+        Operation definitions by name
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the catalog is malformed
+    """
+    with open(path, encoding="utf-8") as catalog_file:
+        catalog = json.load(catalog_file)
+    if not isinstance(catalog, dict):
+        raise ValueError(f"Operation catalog {path} must be a JSON object")
+
+    operations: dict[str, OperationDefinition] = {}
+    for name, entry in catalog.items():
+        try:
+            operations[name] = _compile_operation(name, entry)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Malformed operation '{name}' in {path}: {e!r}") from e
+    return operations
+
+
+def _compile_operation(name: str, entry: dict[str, Any]) -> OperationDefinition:
+    """Validate one catalog entry and compile its templates."""
+    if not name.isidentifier():
+        raise ValueError(f"Operation names must be identifiers, got '{name}'")
+
+    parameters: dict[str, Mapping[str, Any]] = {}
+    for parameter, schema in entry["parameters"].items():
+        if not parameter.isidentifier() or parameter in _RESERVED_PARAMETERS:
+            raise ValueError(f"Operation '{name}' has an invalid parameter name '{parameter}'")
+        if schema["type"] not in PARAMETER_TYPES:
+            raise ValueError(
+                f"Parameter '{parameter}' of '{name}' has unknown type '{schema['type']}'"
+            )
+        unknown = set(schema) - _PARAMETER_CONSTRAINTS
+        if unknown:
+            raise ValueError(
+                f"Parameter '{parameter}' of '{name}' has unknown constraints {sorted(unknown)}"
+            )
+        # Values are spliced into device configuration, so free text must
+        # be constrained to characters that cannot start another command
+        if schema["type"] == "string" and "pattern" not in schema:
+            raise ValueError(f"String parameter '{parameter}' of '{name}' needs a pattern")
+        parameters[parameter] = MappingProxyType(dict(schema))
+
+    key = tuple(entry.get("key", ()))
+    if not set(key) <= set(parameters):
+        raise ValueError(f"Key of operation '{name}' names unknown parameters")
+
+    templates: dict[str, CommandTemplate] = {}
+    for platform, template in entry["templates"].items():
+        if platform not in SUPPORTED_PLATFORMS:
+            raise ValueError(f"Operation '{name}' has a template for unknown platform '{platform}'")
+        compiled = compile_template(platform, name, template)
+        if set(compiled.fields) != set(parameters):
+            raise ValueError(
+                f"The {platform} template of '{name}' must use exactly its parameters"
+            )
+        templates[platform] = compiled
+
+    return OperationDefinition(
+        name=name,
+        description=entry.get("description", ""),
+        parameters=MappingProxyType(parameters),
+        key=key,
+        templates=MappingProxyType(templates)
+    )
+
+
+OPERATIONS: Mapping[str, OperationDefinition] = MappingProxyType(
+    load_operation_catalog(
+        os.getenv("NETCONFIG_OPERATION_CATALOG") or DEFAULT_OPERATION_CATALOG
+    )
+)
+
+# Platforms with a candidate configuration that can be committed with an
+# automatic rollback unless the commit is confirmed in time
+COMMIT_CONFIRMED_PLATFORMS: frozenset[str] = frozenset({
+    SupportedPlatform.CISCO_IOSXR.value,
+    SupportedPlatform.JUNIPER_JUNOS.value,
+})
+
+COMMAND_REGISTRY: Mapping[tuple[str, str], CommandTemplate] = MappingProxyType({
+    (platform, operation.name): template
+    for operation in OPERATIONS.values()
+    for platform, template in operation.templates.items()
+})
+
+
 def get_supported_platforms() -> list[str]:
     """Get list of supported platform strings."""
     return [platform.value for platform in SupportedPlatform]
@@ -20,20 +210,30 @@ def get_supported_platforms() -> list[str]:
 
 def validate_platform(platform: str) -> bool:
     """Validate if platform is supported."""
-    return platform in get_supported_platforms()
+    return platform in SUPPORTED_PLATFORMS
+
+
+def get_command_template(platform: str, operation: str) -> CommandTemplate | None:
+    """Look up the command template for a platform and operation.
+
+    This is the hot-path lookup: validity and template come from a single
+    dict access, and the returned template is already compiled.
+
+    Args:
+        platform: Device platform
+        operation: Operation name, e.g. ``hostname``
+
+    Returns:
+        The CommandTemplate, or None if the platform does not support the operation
+    """
+    return COMMAND_REGISTRY.get((platform, operation))
 
 
 def get_hostname_command_template(platform: str) -> str:
     """Get hostname configuration command template for platform."""
-    command_templates: dict[str, str] = {
-        SupportedPlatform.CISCO_IOS: "hostname {hostname}",
-        SupportedPlatform.CISCO_NXOS: "hostname {hostname}",
-        SupportedPlatform.CISCO_IOSXR: "hostname {hostname}",
-        SupportedPlatform.JUNIPER_JUNOS: "set system host-name {hostname}",
-        SupportedPlatform.ARISTA_EOS: "hostname {hostname}",
-    }
-
-    if platform not in command_templates:
+    command_template = COMMAND_REGISTRY.get((platform, HOSTNAME_OPERATION))
+
+    if command_template is None:
         raise ValueError(f"Unsupported platform: {platform}")
 
-    return command_templates[platform]
+    return command_template.template
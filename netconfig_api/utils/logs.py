@@ -0,0 +1,280 @@
+"""Non-blocking, optionally structured logging with request correlation.
+
+Records are put on a bounded queue by the thread that logs them and written
+by a background thread, so the event loop never formats a record or blocks
+on the output stream. Each record carries the ID of the request being served
+(see :data:`REQUEST_ID`). Routine records of a configurable fraction of
+requests can be dropped before they are queued; warnings and errors are
+always kept.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import zlib
+from collections.abc import Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Any
+
+from netconfig_api.utils.metrics import Counter
+
+# ID of the request being served, set by RequestIdMiddleware. Tasks inherit
+# it, so work a request schedules in the background logs under its ID.
+REQUEST_ID: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
+
+LOG_RECORDS_DROPPED = Counter(
+    "netconfig_log_records_dropped_total",
+    "Log records discarded before being written",
+    ["reason"]
+)
+
+_SAMPLED_OUT = LOG_RECORDS_DROPPED.labels("sampled")
+_QUEUE_FULL = LOG_RECORDS_DROPPED.labels("queue_full")
+
+# Attributes every LogRecord has; anything else was passed with ``extra=``
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message", "asctime", "request_id", "taskName"
+}
+
+
+@dataclass(frozen=True)
+class LogSettings:
+    """How application logs are formatted, sampled and buffered."""
+
+    level: str = "info"
+    json_format: bool = False
+    sample_rate: float = 1.0
+    queue_size: int = 10_000
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> "LogSettings":
+        """Build settings from environment variables.
+
+        Recognized variables (all optional):
+
+        - ``NETCONFIG_LOG_LEVEL``: minimum level logged
+        - ``NETCONFIG_LOG_FORMAT``: ``text`` or ``json`` (one object per line)
+        - ``NETCONFIG_LOG_SAMPLE_RATE``: fraction of requests whose info and
+          debug records are written
+        - ``NETCONFIG_LOG_QUEUE_SIZE``: records buffered before new ones are dropped
+
+        Args:
+            environ: Environment to read; defaults to ``os.environ``
+
+        Returns:
+            LogSettings populated from the environment
+
+        Raises:
+            ValueError: If a variable has an invalid value
+        """
+        env = os.environ if environ is None else environ
+        values: dict[str, Any] = {}
+
+        def read(name: str, key: str, convert: Any) -> None:
+            raw = env.get(f"NETCONFIG_{name}")
+            if raw is None or raw == "":
+                return
+            try:
+                values[key] = convert(raw)
+            except ValueError as e:
+                raise ValueError(f"Invalid NETCONFIG_{name}: {raw!r}") from e
+
+        read("LOG_LEVEL", "level", _level)
+        read("LOG_FORMAT", "json_format", _json_format)
+        read("LOG_SAMPLE_RATE", "sample_rate", _fraction)
+        read("LOG_QUEUE_SIZE", "queue_size", _positive)
+        return cls(**values)
+
+
+def _level(raw: str) -> str:
+    """Validate a log level name."""
+    value = raw.strip().lower()
+    if not isinstance(logging.getLevelName(value.upper()), int):
+        raise ValueError("unknown log level")
+    return value
+
+
+def _json_format(raw: str) -> bool:
+    """Parse a log format name into whether it is JSON."""
+    value = raw.strip().lower()
+    if value not in ("text", "json"):
+        raise ValueError("expected text or json")
+    return value == "json"
+
+
+def _fraction(raw: str) -> float:
+    """Parse a number between 0 and 1."""
+    value = float(raw)
+    if not 0.0 <= value <= 1.0:
+        raise ValueError("expected a number between 0 and 1")
+    return value
+
+
+def _positive(raw: str) -> int:
+    """Parse a positive integer."""
+    value = int(raw)
+    if value < 1:
+        raise ValueError("expected a positive integer")
+    return value
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamps records with the current request ID and samples routine ones.
+
+    Whether a request is sampled is decided from its ID, so a request's
+    records are kept or dropped together. Records at WARNING and above, and
+    records logged outside any request, are always kept.
+    """
+
+    def __init__(self, sample_rate: float = 1.0) -> None:
+        """Initialize the filter.
+
+        Args:
+            sample_rate: Fraction of requests whose routine records are kept
+        """
+        super().__init__()
+        self.sample_rate = sample_rate
+        self._threshold = int(sample_rate * 0xFFFFFFFF)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Stamp the record and decide whether to keep it."""
+        request_id = REQUEST_ID.get()
+        record.request_id = request_id or "-"
+        if (
+            request_id is None
+            or record.levelno >= logging.WARNING
+            or self.sample_rate >= 1.0
+            or zlib.crc32(request_id.encode()) <= self._threshold
+        ):
+            return True
+        _SAMPLED_OUT.inc()
+        return False
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as a single-line JSON object.
+
+    Fields passed with ``extra=`` are included alongside the timestamp,
+    level, logger, request ID and message.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize a record."""
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", "-")
+        if request_id != "-":
+            entry["request_id"] = request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class _QueueingHandler(QueueHandler):
+    """Queues records for the writer thread without formatting or blocking."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the arguments now, while they hold the values being logged.
+
+        Formatting, including rendering tracebacks, is left to the writer thread.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record, dropping it if the writer has fallen behind."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _QUEUE_FULL.inc()
+
+
+_settings: LogSettings | None = None
+_handler: _QueueingHandler | None = None
+_listener: QueueListener | None = None
+
+
+def configure_logging(settings: LogSettings | None = None, stream: IO[str] | None = None) -> None:
+    """Route all logging through the queue and its background writer.
+
+    Replaces any handlers on the root logger. Calling it again with the
+    same settings and no stream does nothing, so the server and the
+    application it imports can both call it.
+
+    Args:
+        settings: Logging settings; defaults to ``LogSettings()``
+        stream: Stream the writer thread writes to; defaults to stderr
+    """
+    global _settings, _handler, _listener  # pylint: disable=global-statement
+    settings = settings or LogSettings()
+    if settings == _settings and stream is None and _listener is not None:
+        return
+    stop_logging()
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(JsonFormatter() if settings.json_format else logging.Formatter(TEXT_FORMAT))
+    handler = _QueueingHandler(queue.Queue(settings.queue_size))
+    handler.addFilter(RequestContextFilter(settings.sample_rate))
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+        existing.close()
+    root.addHandler(handler)
+    root.setLevel(settings.level.upper())
+
+    _listener = QueueListener(handler.queue, output)
+    _listener.start()
+    _handler = handler
+    _settings = settings
+
+
+def stop_logging() -> None:
+    """Write every queued record and stop the writer thread."""
+    global _settings, _handler, _listener  # pylint: disable=global-statement
+    if _listener is not None:
+        _listener.stop()
+        for output in _listener.handlers:
+            output.close()
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+    _settings = _handler = _listener = None
+
+
+def _restart_after_fork() -> None:
+    """Give a forked child its own queue and writer thread.
+
+    The parent's writer thread does not exist in the child, and the parent's
+    queue may have been locked by it at the moment of the fork.
+    """
+    global _listener  # pylint: disable=global-statement
+    if _handler is None or _listener is None or _settings is None:
+        return
+    _handler.queue = queue.Queue(_settings.queue_size)
+    _listener = QueueListener(_handler.queue, *_listener.handlers)
+    _listener.start()
+
+
+atexit.register(stop_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
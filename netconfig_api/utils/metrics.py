@@ -0,0 +1,218 @@
+"""Lightweight Prometheus-compatible metrics collectors.
+
+Collectors are updated from the event loop thread only, so they use plain
+attribute updates rather than locks. Labelled children are created once and
+cached; hot paths should bind the children they need ahead of time (see
+``labels``) so that recording a sample is a few integer and float additions
+with no dict or tuple allocation.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from typing import Generic, TypeVar
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class CounterChild:
+    """A single labelled counter value."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        """Initialize the counter at zero."""
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative amount to add
+        """
+        self.value += amount
+
+
+class HistogramChild:
+    """A single labelled histogram with fixed buckets."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            bounds: Sorted upper bounds of the finite buckets
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a sample.
+
+        Args:
+            value: Observed value, e.g. a duration in seconds
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+C = TypeVar("C", CounterChild, HistogramChild)
+
+
+class _Metric(ABC, Generic[C]):
+    """Common behaviour for labelled metric families."""
+
+    kind = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: "Registry | None" = None
+    ) -> None:
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labelnames: tuple[str, ...] = tuple(labelnames)
+        self._children: dict[tuple[str, ...], C] = {}
+        (registry if registry is not None else REGISTRY).register(self)
+
+    @abstractmethod
+    def _new_child(self) -> C:
+        """Create an empty child for a new set of label values."""
+
+    def labels(self, *values: str) -> C:
+        """Get the child for a set of label values, creating it on first use.
+
+        Args:
+            values: One value per label name, in order
+
+        Returns:
+            The cached child, to be kept and reused on hot paths
+
+        Raises:
+            ValueError: If the number of values does not match the label names
+        """
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {values}"
+            )
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _label_text(self, values: tuple[str, ...], extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values, strict=True)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def collect(self) -> Iterator[str]:
+        """Yield the metric family in Prometheus text exposition format."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for values, child in sorted(self._children.items()):
+            yield from self._samples(values, child)
+
+    @abstractmethod
+    def _samples(self, values: tuple[str, ...], child: C) -> Iterator[str]:
+        """Yield the exposition lines of one child."""
+
+
+class Counter(_Metric[CounterChild]):
+    """Monotonically increasing counter family.
+
+    By convention counter names end in ``_total``.
+    """
+
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def _samples(self, values: tuple[str, ...], child: CounterChild) -> Iterator[str]:
+        yield f"{self.name}{self._label_text(values)} {child.value}"
+
+
+class Histogram(_Metric[HistogramChild]):
+    """Histogram family with fixed cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: "Registry | None" = None
+    ) -> None:
+        """Initialize the histogram family.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names
+            buckets: Upper bounds of the finite buckets
+            registry: Registry to add the metric to; defaults to REGISTRY
+        """
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def _samples(self, values: tuple[str, ...], child: HistogramChild) -> Iterator[str]:
+        cumulative = 0
+        for bound, count in zip((*self.buckets, float("inf")), child.counts, strict=True):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            labels = self._label_text(values, f'le="{le}"')
+            yield f"{self.name}_bucket{labels} {cumulative}"
+        yield f"{self.name}_sum{self._label_text(values)} {child.sum}"
+        yield f"{self.name}_count{self._label_text(values)} {child.count}"
+
+
+class Registry:
+    """Collection of metric families exposed together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric[CounterChild] | _Metric[HistogramChild]] = {}
+
+    def register(self, metric: "_Metric[CounterChild] | _Metric[HistogramChild]") -> None:
+        """Add a metric family.
+
+        Args:
+            metric: Metric to add
+
+        Raises:
+            ValueError: If a metric with the same name is already registered
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """Render every registered metric in Prometheus text format."""
+        lines = [line for metric in self._metrics.values() for line in metric.collect()]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+REGISTRY = Registry()
@@ -0,0 +1,98 @@
+"""Cached, batched rendering of command templates."""
+
+from collections.abc import Mapping, Sequence
+
+from netconfig_api.utils.cache import TTLCache
+from netconfig_api.utils.device_platforms import CommandTemplate
+from netconfig_api.utils.metrics import Counter
+
+RenderKey = tuple[str, str, tuple[str, ...]]
+
+RENDER_CACHE_LOOKUPS = Counter(
+    "netconfig_render_cache_lookups_total",
+    "Rendered command cache lookups by result",
+    ["result"]
+)
+
+_CACHE_HIT = RENDER_CACHE_LOOKUPS.labels("hit")
+_CACHE_MISS = RENDER_CACHE_LOOKUPS.labels("miss")
+
+
+class CommandRenderer:
+    """Renders command templates through an LRU cache of rendered command sets.
+
+    Rendered commands are keyed by ``(platform, operation, parameters)``,
+    using only the parameters the template references, so pushing the same
+    change to many devices renders it once per platform.
+    """
+
+    def __init__(self, cache_size: int = 10_000) -> None:
+        """Initialize the renderer.
+
+        Args:
+            cache_size: Maximum number of rendered command sets kept
+        """
+        self._cache: TTLCache[RenderKey, str] = TTLCache(maxsize=cache_size)
+
+    def render(self, template: CommandTemplate, params: Mapping[str, str]) -> str:
+        """Render one command set.
+
+        Args:
+            template: Compiled command template
+            params: Values for the template's placeholders
+
+        Returns:
+            The rendered commands
+
+        Raises:
+            KeyError: If a placeholder has no value in ``params``
+        """
+        key = (template.platform, template.operation, tuple(params[field] for field in template.fields))
+        rendered = self._cache.get(key)
+        if rendered is None:
+            _CACHE_MISS.inc()
+            rendered = template.render(**params)
+            self._cache.set(key, rendered)
+        else:
+            _CACHE_HIT.inc()
+        return rendered
+
+    def render_batch(
+        self,
+        items: Sequence[tuple[CommandTemplate, Mapping[str, str]]]
+    ) -> list[str]:
+        """Render many command sets, grouped by platform and operation.
+
+        Items sharing a template are rendered together, and each distinct
+        parameter set within a group is rendered (or fetched from the cache)
+        only once, however many devices it applies to.
+
+        Args:
+            items: ``(template, params)`` pairs, one per device
+
+        Returns:
+            Rendered commands in the same order as ``items``
+
+        Raises:
+            KeyError: If a placeholder has no value in its ``params``
+        """
+        templates: dict[tuple[str, str], CommandTemplate] = {}
+        groups: dict[tuple[str, str], dict[tuple[str, ...], list[int]]] = {}
+        for position, (template, params) in enumerate(items):
+            group = (template.platform, template.operation)
+            templates[group] = template
+            values = tuple(params[field] for field in template.fields)
+            groups.setdefault(group, {}).setdefault(values, []).append(position)
+
+        rendered: list[str] = [""] * len(items)
+        for group, positions_by_values in groups.items():
+            template = templates[group]
+            for values, positions in positions_by_values.items():
+                commands = self.render(template, dict(zip(template.fields, values, strict=True)))
+                for position in positions:
+                    rendered[position] = commands
+        return rendered
+
+    def clear(self) -> None:
+        """Drop every cached command set."""
+        self._cache.clear()
@@ -0,0 +1,93 @@
+"""Streaming utilities for incremental request and response processing."""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_LINE_BYTES = 64 * 1024
+
+
+async def iter_lines(
+    chunks: AsyncIterable[bytes],
+    max_line_bytes: int = DEFAULT_MAX_LINE_BYTES
+) -> AsyncIterator[bytes]:
+    """Split a stream of byte chunks into non-empty lines.
+
+    Only the current partial line is buffered, so arbitrarily large bodies
+    can be consumed in constant memory.
+
+    Args:
+        chunks: Byte chunks as received from the client
+        max_line_bytes: Maximum length of a single line
+
+    Yields:
+        Each non-blank line with surrounding whitespace stripped
+
+    Raises:
+        ValueError: If a line exceeds ``max_line_bytes``
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield line
+        if len(buffer) > max_line_bytes:
+            raise ValueError(f"Line exceeds {max_line_bytes} bytes")
+
+    buffer = buffer.strip()
+    if buffer:
+        yield buffer
+
+
+async def bounded_as_completed(
+    aws: AsyncIterable[Awaitable[T]],
+    limit: int
+) -> AsyncIterator[T]:
+    """Run awaitables concurrently and yield their results as they finish.
+
+    At most ``limit`` awaitables are pulled from ``aws`` and left unconsumed
+    at any one time, so neither the input nor the output is ever fully
+    buffered. Results are yielded in completion order, not input order.
+
+    Args:
+        aws: Awaitables to run, typically produced lazily from a stream
+        limit: Maximum number of awaitables in flight
+
+    Yields:
+        Results of the awaitables in completion order
+    """
+    semaphore = asyncio.Semaphore(limit)
+    done: asyncio.Queue[asyncio.Future[T] | None] = asyncio.Queue()
+    in_flight: set[asyncio.Future[T]] = set()
+
+    async def feed() -> None:
+        try:
+            async for aw in aws:
+                await semaphore.acquire()
+                future = asyncio.ensure_future(aw)
+                in_flight.add(future)
+                future.add_done_callback(done.put_nowait)
+        finally:
+            done.put_nowait(None)
+
+    feeder = asyncio.create_task(feed())
+    feeding = True
+    try:
+        while feeding or in_flight:
+            future = await done.get()
+            if future is None:
+                feeding = False
+                continue
+            in_flight.discard(future)
+            semaphore.release()
+            yield future.result()
+        await feeder
+    finally:
+        feeder.cancel()
+        for future in in_flight:
+            future.cancel()
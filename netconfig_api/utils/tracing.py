@@ -0,0 +1,601 @@
+"""Lightweight request tracing with W3C trace-context propagation.
+
+A trace is started for each sampled request (see
+:class:`~netconfig_api.api.tracing.TracingMiddleware`), continuing the trace
+of an incoming ``traceparent`` header if there is one. Spans opened while it
+is being served become its children, including spans of work the request
+schedules in other tasks. Finished spans are handed to an exporter: the
+:class:`OTLPExporter` posts them to an OpenTelemetry collector, and the
+:class:`InMemoryExporter` keeps them for tests.
+
+When a request is not sampled, or no exporter is configured, opening a span
+costs one context variable lookup and returns a shared no-op span.
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from enum import IntEnum
+from types import TracebackType
+from typing import Any
+
+from netconfig_api.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+SPANS_DROPPED = Counter(
+    "netconfig_trace_spans_dropped_total",
+    "Finished spans that were not exported",
+    ["reason"]
+)
+
+_QUEUE_FULL = SPANS_DROPPED.labels("queue_full")
+_EXPORT_FAILED = SPANS_DROPPED.labels("export_failed")
+
+_TRACEPARENT = re.compile(r"([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+
+class SpanKind(IntEnum):
+    """Role of a span, numbered as in OTLP."""
+
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """Identity of a span as propagated in ``traceparent``."""
+
+    trace_id: str
+    span_id: str
+    sampled: bool
+    trace_state: str = ""
+
+    @property
+    def traceparent(self) -> str:
+        """The context as a version 00 ``traceparent`` header value."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+def parse_traceparent(value: str, trace_state: str = "") -> SpanContext | None:
+    """Parse a W3C ``traceparent`` header.
+
+    Args:
+        value: Header value, e.g. ``00-<trace id>-<parent id>-01``
+        trace_state: Accompanying ``tracestate`` header, passed through unchanged
+
+    Returns:
+        The remote parent's context, or None if the header is malformed
+    """
+    value = value.strip()
+    match = _TRACEPARENT.match(value)
+    if match is None:
+        return None
+    version, trace_id, span_id, flags = match.groups()
+    # Later versions may append fields; version 00 has exactly four
+    if version == "ff" or (version == "00" and len(value) != match.end()) or (
+        len(value) != match.end() and value[match.end()] != "-"
+    ):
+        return None
+    if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+        return None
+    return SpanContext(trace_id, span_id, bool(int(flags, 16) & 1), trace_state.strip())
+
+
+_CURRENT: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """A timed operation within a trace.
+
+    Used as a context manager: entering makes it the parent of spans opened
+    inside the block, and leaving ends and exports it, recording an
+    exception that escaped the block as an error.
+    """
+
+    __slots__ = (
+        "name", "context", "parent_id", "kind", "start_ns", "end_ns",
+        "attributes", "error", "_tracer", "_token"
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        context: SpanContext,
+        parent_id: str | None,
+        kind: SpanKind,
+        attributes: dict[str, Any],
+        start_ns: int | None = None
+    ) -> None:
+        """Start a span. Use :meth:`Tracer.span` rather than creating one directly."""
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns() if start_ns is None else start_ns
+        self.end_ns: int | None = None
+        self.attributes = attributes
+        self.error: str | None = None
+        self._tracer = tracer
+        self._token: Token[Span | None] | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a value to the span."""
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        """Mark the span as failed."""
+        self.error = message
+
+    def update_name(self, name: str) -> None:
+        """Rename the span, e.g. once the matched route is known."""
+        self.name = name
+
+    def end(self) -> None:
+        """End the span and hand it to the exporter."""
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self._tracer.export(self)
+
+    def __enter__(self) -> "Span":
+        """Make this the current span."""
+        self._token = _CURRENT.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """Restore the previous span and end this one."""
+        if self._token is not None:
+            _CURRENT.reset(self._token)
+            self._token = None
+        if exc is not None and self.error is None:
+            self.error = f"{exc_type.__name__ if exc_type else 'Error'}: {exc}"
+        self.end()
+
+
+class _NoopSpan:
+    """Stand-in for spans of requests that are not traced."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+    def set_error(self, message: str) -> None:
+        """Ignore the error."""
+
+    def update_name(self, name: str) -> None:
+        """Ignore the name."""
+
+    def __enter__(self) -> "_NoopSpan":
+        """Do nothing."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Do nothing."""
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class SpanExporter(ABC):
+    """Destination for finished spans."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Accept a finished span. Must not block."""
+
+    def shutdown(self) -> None:  # noqa: B027 - optional hook, a no-op by default
+        """Flush buffered spans and release resources.
+
+        Exporters that buffer nothing need not override this.
+        """
+
+
+class InMemoryExporter(SpanExporter):
+    """Keeps finished spans in a list, for tests."""
+
+    def __init__(self) -> None:
+        """Initialize an empty exporter."""
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        """Keep the span."""
+        self.spans.append(span)
+
+    def named(self, name: str) -> list[Span]:
+        """Return the finished spans with a name, in the order they ended."""
+        return [span for span in self.spans if span.name == name]
+
+    def clear(self) -> None:
+        """Forget every span."""
+        self.spans.clear()
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """Encode attributes as OTLP key-value pairs, skipping unset values."""
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+def otlp_payload(spans: list[Span], service_name: str) -> dict[str, Any]:
+    """Build an OTLP/HTTP JSON trace export request.
+
+    Args:
+        spans: Finished spans
+        service_name: Value of the ``service.name`` resource attribute
+
+    Returns:
+        The ``ExportTraceServiceRequest`` as a JSON-serializable dict
+    """
+    encoded = []
+    for span in spans:
+        entry: dict[str, Any] = {
+            "traceId": span.context.trace_id,
+            "spanId": span.context.span_id,
+            "name": span.name,
+            "kind": int(span.kind),
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns or span.start_ns),
+            "attributes": _otlp_attributes(span.attributes),
+            "status": (
+                {"code": 2, "message": span.error} if span.error is not None else {"code": 1}
+            ),
+        }
+        if span.parent_id is not None:
+            entry["parentSpanId"] = span.parent_id
+        if span.context.trace_state:
+            entry["traceState"] = span.context.trace_state
+        encoded.append(entry)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+            "scopeSpans": [{"scope": {"name": "netconfig_api"}, "spans": encoded}],
+        }]
+    }
+
+
+class OTLPExporter(SpanExporter):
+    """Posts spans to an OTLP/HTTP collector as JSON from a background thread.
+
+    Spans are queued and sent in batches: once a span arrives, its batch is
+    sent when ``batch_size`` spans are waiting or ``interval`` seconds have
+    passed, whichever comes first, and on shutdown. If the queue is
+    full, or the collector cannot be reached, spans are dropped and counted
+    rather than slowing requests down. The thread starts with the first span,
+    so it also runs in each worker forked after the exporter was created.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str = "netconfig-api",
+        max_queue_size: int = 2048,
+        batch_size: int = 512,
+        interval: float = 5.0,
+        timeout: float = 10.0
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            endpoint: Collector traces URL, e.g. ``http://collector:4318/v1/traces``
+            service_name: Value of the ``service.name`` resource attribute
+            max_queue_size: Spans buffered before new ones are dropped
+            batch_size: Most spans sent in one request
+            interval: Longest a span waits before its batch is sent
+            timeout: Seconds to wait for the collector
+        """
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.interval = interval
+        self.timeout = timeout
+        self._queue: queue.Queue[Span | None] = queue.Queue(max_queue_size)
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Queue a span for the background thread."""
+        if self._thread is None or self._pid != os.getpid():
+            self._start()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            _QUEUE_FULL.inc()
+
+    def shutdown(self) -> None:
+        """Send queued spans and stop the background thread."""
+        thread = self._thread
+        if thread is None or self._pid != os.getpid():
+            return
+        self._queue.put(None)
+        thread.join(self.timeout)
+        self._thread = None
+
+    def _start(self) -> None:
+        """Start the background thread, replacing one inherited from a parent process."""
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(self.max_queue_size)
+                self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Send batches until shut down."""
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            # The first span waits at most an interval for the batch to fill
+            deadline = time.monotonic() + self.interval
+            while len(batch) < self.batch_size:
+                try:
+                    span = self._queue.get(timeout=max(deadline - time.monotonic(), 0.0))
+                except queue.Empty:
+                    break
+                if span is None:
+                    stopping = True
+                    break
+                batch.append(span)
+            self._send(batch)
+
+    def _send(self, spans: list[Span]) -> None:
+        """Post one batch to the collector."""
+        # Imported on first export; it is slow to import and unused without a collector
+        import urllib.request  # pylint: disable=import-outside-toplevel
+
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(otlp_payload(spans, self.service_name)).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except OSError as e:
+            _EXPORT_FAILED.inc(len(spans))
+            logger.warning("Could not export %d spans to %s: %s", len(spans), self.endpoint, e)
+
+
+class Tracer:
+    """Creates spans and samples traces.
+
+    A trace continued from a ``traceparent`` header keeps the caller's
+    sampling decision; a new trace is sampled with probability
+    ``sample_rate``. Nothing is traced without an exporter.
+    """
+
+    def __init__(self, exporter: SpanExporter | None = None, sample_rate: float = 0.0) -> None:
+        """Initialize the tracer.
+
+        Args:
+            exporter: Destination for finished spans, or None to disable tracing
+            sample_rate: Fraction of new traces that are recorded
+        """
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any request can be traced."""
+        return self.exporter is not None
+
+    def configure(self, exporter: SpanExporter | None, sample_rate: float) -> None:
+        """Replace the exporter and sample rate, shutting down the previous exporter.
+
+        Args:
+            exporter: Destination for finished spans, or None to disable tracing
+            sample_rate: Fraction of new traces that are recorded
+        """
+        if self.exporter is not None and self.exporter is not exporter:
+            self.exporter.shutdown()
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    def shutdown(self) -> None:
+        """Flush the exporter."""
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+    def export(self, span: Span) -> None:
+        """Hand a finished span to the exporter."""
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+    def start_trace(
+        self,
+        name: str,
+        traceparent: str | None = None,
+        tracestate: str = "",
+        kind: SpanKind = SpanKind.SERVER,
+        **attributes: Any
+    ) -> Span | _NoopSpan:
+        """Start the root span of a request, continuing the caller's trace if any.
+
+        Args:
+            name: Span name
+            traceparent: Incoming ``traceparent`` header
+            tracestate: Incoming ``tracestate`` header
+            kind: Span kind
+            **attributes: Span attributes
+
+        Returns:
+            The span, or the no-op span if the request is not sampled
+        """
+        if self.exporter is None:
+            return NOOP_SPAN
+        parent = parse_traceparent(traceparent, tracestate) if traceparent else None
+        if parent is not None:
+            if not parent.sampled:
+                return NOOP_SPAN
+            trace_id, parent_id, trace_state = parent.trace_id, parent.span_id, parent.trace_state
+        else:
+            if self.sample_rate <= 0.0 or random.random() >= self.sample_rate:
+                return NOOP_SPAN
+            trace_id, parent_id, trace_state = f"{random.getrandbits(128):032x}", None, ""
+        context = SpanContext(trace_id, _span_id(), True, trace_state)
+        return Span(self, name, context, parent_id, kind, attributes)
+
+    def span(self, name: str, kind: SpanKind = SpanKind.INTERNAL, **attributes: Any) -> Span | _NoopSpan:
+        """Start a child of the current span.
+
+        Args:
+            name: Span name
+            kind: Span kind
+            **attributes: Span attributes
+
+        Returns:
+            The span, or the no-op span if the current request is not traced
+        """
+        parent = _CURRENT.get()
+        if parent is None:
+            return NOOP_SPAN
+        return Span(self, name, _child_context(parent), parent.context.span_id, kind, attributes)
+
+    def record(self, name: str, seconds: float | None = None, **attributes: Any) -> None:
+        """Record a child of the current span that has just finished.
+
+        Used for waits whose start is only known as a duration, such as
+        time spent queued.
+
+        Args:
+            name: Span name
+            seconds: How long ago the span started; None for when the
+                current span started
+            **attributes: Span attributes
+        """
+        parent = _CURRENT.get()
+        if parent is None:
+            return
+        end_ns = time.time_ns()
+        start_ns = parent.start_ns if seconds is None else end_ns - int(seconds * 1e9)
+        span = Span(
+            self,
+            name,
+            _child_context(parent),
+            parent.context.span_id,
+            SpanKind.INTERNAL,
+            attributes,
+            start_ns=start_ns
+        )
+        span.end_ns = end_ns
+        self.export(span)
+
+    @staticmethod
+    def current() -> Span | None:
+        """Return the current span, or None if the request is not traced."""
+        return _CURRENT.get()
+
+
+def _span_id() -> str:
+    """Generate a random span ID."""
+    return f"{random.getrandbits(64):016x}"
+
+
+def _child_context(parent: Span) -> SpanContext:
+    """Build the context of a new child span."""
+    return SpanContext(parent.context.trace_id, _span_id(), True, parent.context.trace_state)
+
+
+@dataclass(frozen=True)
+class TraceSettings:
+    """Where spans are exported and how many requests are traced."""
+
+    endpoint: str | None = None
+    sample_rate: float = 0.0
+    service_name: str = "netconfig-api"
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> "TraceSettings":
+        """Build settings from environment variables.
+
+        Recognized variables (all optional):
+
+        - ``NETCONFIG_TRACE_ENDPOINT``: OTLP/HTTP traces URL; tracing is off without it
+        - ``NETCONFIG_TRACE_SAMPLE_RATE``: fraction of new traces recorded
+        - ``NETCONFIG_TRACE_SERVICE_NAME``: ``service.name`` reported to the collector
+
+        Args:
+            environ: Environment to read; defaults to ``os.environ``
+
+        Returns:
+            TraceSettings populated from the environment
+
+        Raises:
+            ValueError: If a variable has an invalid value
+        """
+        env = os.environ if environ is None else environ
+        values: dict[str, Any] = {}
+        endpoint = env.get("NETCONFIG_TRACE_ENDPOINT")
+        if endpoint:
+            values["endpoint"] = endpoint
+        service_name = env.get("NETCONFIG_TRACE_SERVICE_NAME")
+        if service_name:
+            values["service_name"] = service_name
+        raw = env.get("NETCONFIG_TRACE_SAMPLE_RATE")
+        if raw:
+            try:
+                sample_rate = float(raw)
+            except ValueError as e:
+                raise ValueError(f"Invalid NETCONFIG_TRACE_SAMPLE_RATE: {raw!r}") from e
+            if not 0.0 <= sample_rate <= 1.0:
+                raise ValueError(f"Invalid NETCONFIG_TRACE_SAMPLE_RATE: {raw!r}")
+            values["sample_rate"] = sample_rate
+        return cls(**values)
+
+
+TRACER = Tracer()
+
+
+def configure_tracing(settings: TraceSettings | None = None) -> None:
+    """Configure the application's tracer.
+
+    Args:
+        settings: Tracing settings; defaults to ``TraceSettings()``, which
+            disables tracing
+    """
+    settings = settings or TraceSettings()
+    exporter = (
+        OTLPExporter(settings.endpoint, service_name=settings.service_name)
+        if settings.endpoint else None
+    )
+    TRACER.configure(exporter, settings.sample_rate)
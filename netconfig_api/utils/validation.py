@@ -0,0 +1,18 @@
+"""Validation error helpers."""
+
+from pydantic import ValidationError
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """Flatten a Pydantic validation error into a single-line message.
+
+    Args:
+        error: Validation error raised by a model
+
+    Returns:
+        ``field: message`` pairs joined by semicolons
+    """
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in detail['loc']) or 'body'}: {detail['msg']}"
+        for detail in error.errors()
+    )
@@ -53,6 +53,24 @@ def check_all(ctx):
     test(ctx)
 
 
+@task
+def bench(ctx, iterations=10000, requests=5000, concurrency=50, output="bench-results.json", baseline=None):
+    """Run micro-benchmarks and an in-process load test, writing JSON results."""
+    command = (
+        f"poetry run python -m benchmarks.run --iterations {iterations} "
+        f"--requests {requests} --concurrency {concurrency} --output {output}"
+    )
+    if baseline:
+        command += f" --baseline {baseline}"
+    ctx.run(command)
+
+
+@task
+def startup_profile(ctx, runs=5, top=15):
+    """Report import times and time-to-first-request, failing if over budget."""
+    ctx.run(f"poetry run python -m benchmarks.startup --runs {runs} --top {top}")
+
+
 @task
 def dev(ctx):
     """Start development server."""
@@ -61,8 +79,8 @@ def dev(ctx):
 
 @task
 def serve(ctx):
-    """Start production server."""
-    ctx.run("poetry run uvicorn netconfig_api.main:app --host 0.0.0.0 --port 8000")
+    """Start production server (configured by NETCONFIG_* environment variables)."""
+    ctx.run("poetry run netconfig-api")
 
 
 @task
@@ -126,4 +144,4 @@ def setup(ctx):
     install(ctx)
     print("Running initial tests...")
     test_fast(ctx)
-    print("Setup complete!")
\ No newline at end of file
+    print("Setup complete!")
@@ -0,0 +1,28 @@
+"""Tests for drift report API endpoints."""
+
+from fastapi.testclient import TestClient
+
+from netconfig_api.main import app
+
+client = TestClient(app)
+
+
+class TestDriftAPI:
+    """Test cases for drift report API endpoints."""
+
+    def test_drift_report(self) -> None:
+        """Test the drift report summarizes the scanner's checks."""
+        response = client.get("/api/v1/drift")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["checked"] >= data["drifted"]
+        assert data["checked"] >= data["errors"]
+        assert len(data["results"]) <= data["checked"]
+
+    def test_device_not_checked(self) -> None:
+        """Test an unchecked device returns 404."""
+        response = client.get("/api/v1/drift/10.99.0.1")
+
+        assert response.status_code == 404
+        assert "not been checked" in response.json()["detail"]
@@ -1,5 +1,7 @@
 """Tests for hostname API endpoint."""
 
+import json
+
 from fastapi.testclient import TestClient
 
 from netconfig_api.main import app
@@ -162,3 +164,278 @@ class TestHostnameAPI:
         assert data["success"] is True
         assert data["device"] == "192.168.1.1"
         assert data["hostname"] == "example-rtr"
+
+    def test_configure_hostname_idempotency_key(self) -> None:
+        """Test a retried request with the same Idempotency-Key is replayed."""
+        request_data = {
+            "name": "idempotent-rtr",
+            "device": "10.3.0.1",
+            "platform": "cisco_ios"
+        }
+        headers = {"Idempotency-Key": "api-key-1"}
+
+        first = client.post("/api/v1/hostname", json=request_data, headers=headers)
+        retry = client.post("/api/v1/hostname", json=request_data, headers=headers)
+
+        assert first.status_code == 200
+        assert first.json()["cached"] is False
+        assert retry.status_code == 200
+        assert retry.json()["cached"] is True
+
+    def test_configure_hostname_idempotency_key_conflict(self) -> None:
+        """Test reusing an Idempotency-Key for another request returns 400."""
+        headers = {"Idempotency-Key": "api-key-2"}
+        client.post(
+            "/api/v1/hostname",
+            json={"name": "rtr-a", "device": "10.3.0.2", "platform": "cisco_ios"},
+            headers=headers
+        )
+
+        response = client.post(
+            "/api/v1/hostname",
+            json={"name": "rtr-b", "device": "10.3.0.2", "platform": "cisco_ios"},
+            headers=headers
+        )
+
+        assert response.status_code == 400
+        assert "Idempotency-Key" in response.json()["detail"]
+
+
+    def test_configure_hostname_dry_run(self) -> None:
+        """Test a dry run returns commands and a diff without pushing."""
+        response = client.post(
+            "/api/v1/hostname",
+            params={"dry_run": "true"},
+            json={"name": "plan-rtr", "device": "10.3.0.9", "platform": "cisco_ios"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dry_run"] is True
+        assert data["commands"] == ["hostname plan-rtr"]
+        assert data["diff"] == ["+hostname plan-rtr"]
+        assert data["changed"] is True
+
+
+class TestHostnameBatchAPI:
+    """Test cases for batch hostname API endpoint."""
+
+    def test_configure_hostname_batch_success(self) -> None:
+        """Test batch hostname configuration returns per-device results."""
+        request_data = {
+            "requests": [
+                {
+                    "name": f"leaf-{index}",
+                    "device": f"10.0.0.{index}",
+                    "platform": "arista_eos"
+                }
+                for index in range(1, 21)
+            ],
+            "concurrency": 5
+        }
+
+        response = client.post("/api/v1/hostname:batch", json=request_data)
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["total"] == 20
+        assert data["succeeded"] == 20
+        assert data["failed"] == 0
+        assert [result["hostname"] for result in data["results"]] == [
+            f"leaf-{index}" for index in range(1, 21)
+        ]
+        assert data["elapsed_ms"] >= 0
+        assert data["max_device_ms"] >= data["mean_device_ms"] >= 0
+
+    def test_configure_hostname_batch_dry_run(self) -> None:
+        """Test a batch dry run plans every device and counts changes."""
+        request_data = {
+            "requests": [
+                {"name": f"plan-{index}", "device": f"10.5.0.{index}", "platform": "arista_eos"}
+                for index in range(1, 11)
+            ]
+        }
+
+        response = client.post(
+            "/api/v1/hostname:batch",
+            params={"dry_run": "true"},
+            json=request_data
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 10
+        assert data["changed"] == 10
+        assert all(result["dry_run"] for result in data["results"])
+
+    def test_configure_hostname_batch_mixed_results(self) -> None:
+        """Test batch hostname configuration with failing devices."""
+        request_data = {
+            "requests": [
+                {
+                    "name": "core-1",
+                    "device": "192.168.1.1",
+                    "platform": "cisco_ios"
+                },
+                {
+                    "name": "core-2",
+                    "device": "192.168.1.254",
+                    "platform": "cisco_ios"
+                },
+                {
+                    "name": "core-3",
+                    "device": "192.168.1.3",
+                    "platform": "unsupported_platform"
+                },
+            ]
+        }
+
+        response = client.post("/api/v1/hostname:batch", json=request_data)
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["total"] == 3
+        assert data["succeeded"] == 1
+        assert data["failed"] == 2
+        assert [result["success"] for result in data["results"]] == [True, False, False]
+
+    def test_configure_hostname_batch_validation_errors(self) -> None:
+        """Test batch hostname configuration with validation errors."""
+        test_cases = [
+            # Missing requests
+            {},
+            # Empty batch
+            {"requests": []},
+            # Invalid entry inside the batch
+            {
+                "requests": [
+                    {
+                        "name": "test-router",
+                        "device": "invalid-ip",
+                        "platform": "cisco_ios"
+                    }
+                ]
+            },
+            # Concurrency out of range
+            {
+                "requests": [
+                    {
+                        "name": "test-router",
+                        "device": "10.0.0.1",
+                        "platform": "cisco_ios"
+                    }
+                ],
+                "concurrency": 0
+            },
+            # Both requests and a selector
+            {
+                "requests": [
+                    {
+                        "name": "test-router",
+                        "device": "10.0.0.1",
+                        "platform": "cisco_ios"
+                    }
+                ],
+                "selector": "site=dc1"
+            },
+        ]
+
+        for request_data in test_cases:
+            response = client.post("/api/v1/hostname:batch", json=request_data)
+            assert response.status_code == 422
+
+    def test_configure_hostname_batch_selector(self) -> None:
+        """Test batch hostname configuration targeting inventory devices."""
+        client.put(
+            "/api/v1/inventory/devices",
+            json={
+                "ip": "10.20.0.1",
+                "platform": "arista_eos",
+                "hostname": "lab-leaf1",
+                "site": "lab",
+                "role": "leaf"
+            }
+        )
+
+        response = client.post("/api/v1/hostname:batch", json={"selector": "site=lab"})
+        invalid = client.post("/api/v1/hostname:batch", json={"selector": "site lab"})
+        nested = client.post(
+            "/api/v1/hostname:batch",
+            json={"selector": "(" * 300 + "site=lab" + ")" * 300}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["succeeded"] == 1
+        assert response.json()["results"][0]["hostname"] == "lab-leaf1"
+        assert invalid.status_code == 400
+        assert nested.status_code == 400
+
+
+class TestHostnameStreamAPI:
+    """Test cases for streaming hostname API endpoint."""
+
+    def test_configure_hostname_stream(self) -> None:
+        """Test NDJSON request lines produce NDJSON result lines."""
+        body = "\n".join(
+            json.dumps({
+                "name": f"spine-{index}",
+                "device": f"10.0.1.{index}",
+                "platform": "cisco_nxos"
+            })
+            for index in range(1, 11)
+        )
+
+        response = client.post(
+            "/api/v1/hostname:stream?concurrency=3",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        results = [json.loads(line) for line in response.text.splitlines()]
+
+        assert len(results) == 10
+        assert all(result["success"] for result in results)
+        assert {result["hostname"] for result in results} == {
+            f"spine-{index}" for index in range(1, 11)
+        }
+
+    def test_configure_hostname_stream_invalid_lines(self) -> None:
+        """Test invalid lines are reported without aborting the stream."""
+        body = "\n".join([
+            json.dumps({"name": "ok-rtr", "device": "10.0.0.1", "platform": "cisco_ios"}),
+            json.dumps({"name": "bad-rtr", "device": "invalid-ip", "platform": "cisco_ios"}),
+            "not json",
+        ])
+
+        response = client.post(
+            "/api/v1/hostname:stream",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        results = {
+            result["hostname"]: result
+            for result in (json.loads(line) for line in response.text.splitlines())
+        }
+
+        assert results["ok-rtr"]["success"] is True
+        assert results["bad-rtr"]["success"] is False
+        assert "line 2" in results["bad-rtr"]["message"]
+        assert results["bad-rtr"]["device"] == "invalid-ip"
+        assert results[""]["success"] is False
+        assert "line 3" in results[""]["message"]
+
+    def test_configure_hostname_stream_concurrency_validation(self) -> None:
+        """Test out-of-range concurrency is rejected."""
+        response = client.post(
+            "/api/v1/hostname:stream?concurrency=0",
+            content="",
+            headers={"Content-Type": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 422
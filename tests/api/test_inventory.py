@@ -0,0 +1,133 @@
+"""Tests for inventory API endpoints."""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from netconfig_api.main import app
+
+client = TestClient(app)
+
+
+class TestInventoryAPI:
+    """Test cases for inventory API endpoints."""
+
+    def test_device_lifecycle(self) -> None:
+        """Test adding, reading and deleting a device."""
+        device = {
+            "ip": "10.30.0.1",
+            "platform": "cisco_nxos",
+            "hostname": "api-leaf1",
+            "site": "api",
+            "role": "leaf"
+        }
+
+        created = client.put("/api/v1/inventory/devices", json=device)
+        fetched = client.get("/api/v1/inventory/devices/10.30.0.1")
+        deleted = client.delete("/api/v1/inventory/devices/10.30.0.1")
+        missing = client.get("/api/v1/inventory/devices/10.30.0.1")
+
+        assert created.status_code == 200
+        assert fetched.status_code == 200
+        assert fetched.json() == device
+        assert deleted.status_code == 204
+        assert missing.status_code == 404
+        assert client.delete("/api/v1/inventory/devices/10.30.0.1").status_code == 404
+
+    def test_list_devices_with_selector(self) -> None:
+        """Test listing devices filtered by a selector, sorted by IP."""
+        for last_octet, role in ((10, "leaf"), (2, "leaf"), (3, "spine")):
+            client.put(
+                "/api/v1/inventory/devices",
+                json={
+                    "ip": f"10.31.0.{last_octet}",
+                    "platform": "cisco_ios",
+                    "site": "query",
+                    "role": role
+                }
+            )
+
+        response = client.get(
+            "/api/v1/inventory/devices",
+            params={"selector": "site=query AND role=leaf", "limit": 1}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert [device["ip"] for device in data["devices"]] == ["10.31.0.2"]
+
+    def test_list_devices_invalid_selector(self) -> None:
+        """Test invalid selectors are rejected with 400."""
+        response = client.get("/api/v1/inventory/devices", params={"selector": "rack=a1"})
+
+        assert response.status_code == 400
+        assert "Unknown field" in response.json()["detail"]
+
+    def test_put_device_validation(self) -> None:
+        """Test device records are validated."""
+        invalid_devices = [
+            {"ip": "10.32.0.1", "platform": "unsupported_platform"},
+            {"ip": "not-an-ip", "platform": "cisco_ios"},
+            {"ip": "10.32.0.1", "platform": "cisco_ios", "hostname": "bad_name"},
+        ]
+
+        for device in invalid_devices:
+            response = client.put("/api/v1/inventory/devices", json=device)
+            assert response.status_code == 422
+
+    def test_import_and_export(self) -> None:
+        """Test streaming import reports bad rows and export returns the devices."""
+        body = (
+            "ip,platform,hostname,site,role\n"
+            "10.33.0.1,cisco_ios,bulk1,bulk,leaf\n"
+            "10.33.0.2,unsupported_platform,bulk2,bulk,leaf\n"
+            "10.33.0.3,juniper_junos,bulk3,bulk,spine\n"
+        )
+
+        response = client.post(
+            "/api/v1/inventory/devices:import",
+            content=body,
+            headers={"Content-Type": "text/csv"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["line"] == 3
+        assert lines[-1]["imported"] == 2
+        assert lines[-1]["failed"] == 1
+
+        exported = client.get(
+            "/api/v1/inventory/devices:export",
+            params={"format": "csv", "selector": "site=bulk"}
+        )
+
+        assert exported.status_code == 200
+        assert exported.headers["content-type"].startswith("text/csv")
+        assert exported.text.splitlines() == [
+            "ip,platform,hostname,site,role",
+            "10.33.0.1,cisco_ios,bulk1,bulk,leaf",
+            "10.33.0.3,juniper_junos,bulk3,bulk,spine",
+        ]
+
+    def test_import_jsonl(self) -> None:
+        """Test JSONL is the default import format."""
+        response = client.post(
+            "/api/v1/inventory/devices:import",
+            content='{"ip": "10.34.0.1", "platform": "arista_eos", "site": "jsonl"}\n'
+        )
+
+        assert response.status_code == 200
+        assert json.loads(response.text.splitlines()[-1])["imported"] == 1
+        exported = client.get(
+            "/api/v1/inventory/devices:export",
+            params={"selector": "site=jsonl"}
+        )
+        assert [json.loads(line)["ip"] for line in exported.text.splitlines()] == ["10.34.0.1"]
+
+    def test_export_invalid_selector(self) -> None:
+        """Test export rejects invalid selectors with 400."""
+        response = client.get("/api/v1/inventory/devices:export", params={"selector": "site"})
+
+        assert response.status_code == 400
@@ -0,0 +1,88 @@
+"""Tests for background job API endpoints."""
+
+import time
+
+from fastapi.testclient import TestClient
+
+from netconfig_api.api.jobs import job_manager
+from netconfig_api.main import app
+from netconfig_api.services.jobs import JobQueueFullError
+
+
+def _wait_for_job(client: TestClient, job_id: str) -> dict:
+    """Poll a job until it finishes."""
+    for _ in range(100):
+        data = client.get(f"/api/v1/jobs/{job_id}").json()
+        if data["status"] in ("completed", "failed"):
+            return data
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+class TestJobsAPI:
+    """Test cases for job API endpoints."""
+
+    def test_submit_hostname_job(self, lifespan_client: TestClient) -> None:
+        """Test a hostname job is accepted and later completes."""
+        response = lifespan_client.post(
+            "/api/v1/jobs/hostname",
+            json={"name": "job-rtr", "device": "10.0.0.1", "platform": "cisco_ios"}
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["status"] in ("queued", "running", "completed")
+
+        data = _wait_for_job(lifespan_client, data["id"])
+        assert data["status"] == "completed"
+        assert data["result"]["success"] is True
+        assert data["result"]["hostname"] == "job-rtr"
+
+    def test_submit_hostname_batch_job(self, lifespan_client: TestClient) -> None:
+        """Test a batch hostname job reports the batch result."""
+        response = lifespan_client.post(
+            "/api/v1/jobs/hostname:batch",
+            json={
+                "requests": [
+                    {"name": "job-a", "device": "10.0.0.1", "platform": "cisco_ios"},
+                    {"name": "job-b", "device": "10.0.0.254", "platform": "cisco_ios"},
+                ]
+            }
+        )
+
+        assert response.status_code == 202
+        data = _wait_for_job(lifespan_client, response.json()["id"])
+        assert data["status"] == "completed"
+        assert data["result"]["total"] == 2
+        assert data["result"]["failed"] == 1
+
+    def test_get_unknown_job(self, lifespan_client: TestClient) -> None:
+        """Test looking up an unknown job returns 404."""
+        response = lifespan_client.get("/api/v1/jobs/does-not-exist")
+
+        assert response.status_code == 404
+
+    def test_full_queue_returns_429(self, monkeypatch, lifespan_client: TestClient) -> None:
+        """Test backpressure is reported as 429 with Retry-After."""
+
+        def reject(operation: object) -> None:
+            raise JobQueueFullError("Job queue is full (1000 jobs queued)")
+
+        monkeypatch.setattr(job_manager, "submit", reject)
+        response = lifespan_client.post(
+            "/api/v1/jobs/hostname",
+            json={"name": "job-rtr", "device": "10.0.0.1", "platform": "cisco_ios"}
+        )
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
+
+    def test_submit_without_workers_returns_503(self) -> None:
+        """Test submissions are refused when the workers are not running."""
+        client = TestClient(app)
+        response = client.post(
+            "/api/v1/jobs/hostname",
+            json={"name": "job-rtr", "device": "10.0.0.1", "platform": "cisco_ios"}
+        )
+
+        assert response.status_code == 503
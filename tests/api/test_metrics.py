@@ -0,0 +1,34 @@
+"""Tests for the metrics endpoint."""
+
+from fastapi.testclient import TestClient
+
+from netconfig_api.main import app
+
+client = TestClient(app)
+
+
+class TestMetricsAPI:
+    """Test cases for the metrics endpoint."""
+
+    def test_metrics_endpoint(self) -> None:
+        """Test request, phase and outcome metrics are exposed."""
+        client.post(
+            "/api/v1/hostname",
+            json={"name": "metrics-rtr", "device": "10.4.0.1", "platform": "arista_eos"}
+        )
+        client.get("/api/v1/jobs/unknown")
+        client.get("/does-not-exist")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        text = response.text
+        assert (
+            'netconfig_http_requests_total{method="POST",route="/api/v1/hostname",status="200"}'
+            in text
+        )
+        assert 'route="/api/v1/jobs/{job_id}",status="404"' in text
+        assert 'route="unmatched"' in text
+        assert 'netconfig_configure_phase_seconds_count{phase="device_execution"}' in text
+        assert 'netconfig_configure_results_total{platform="arista_eos",outcome="success"}' in text
@@ -0,0 +1,76 @@
+"""Tests for catalog operation API endpoints."""
+
+from fastapi.testclient import TestClient
+
+from netconfig_api.main import app
+
+client = TestClient(app)
+
+
+class TestOperationsAPI:
+    """Test cases for catalog operation API endpoints."""
+
+    def test_list_operations(self) -> None:
+        """Test the catalog is listed with platforms and request schemas."""
+        response = client.get("/api/v1/operations")
+
+        assert response.status_code == 200
+        operations = {operation["name"]: operation for operation in response.json()}
+        assert "cisco_iosxr" not in operations["vlan"]["platforms"]
+        assert set(operations["vlan"]["parameters"]["properties"]) == {
+            "device", "platform", "vlan_id", "name"
+        }
+
+    def test_apply_operation(self) -> None:
+        """Test a generated route validates and applies its operation."""
+        response = client.post(
+            "/api/v1/operations/ntp_server",
+            json={"device": "10.8.0.1", "platform": "juniper_junos", "server": "10.0.0.100"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["operation"] == "ntp_server"
+        assert data["commands"] == ["set system ntp server 10.0.0.100"]
+
+    def test_apply_operation_validation(self) -> None:
+        """Test catalog constraints reject invalid parameters."""
+        response = client.post(
+            "/api/v1/operations/vlan",
+            json={"device": "10.8.0.1", "platform": "cisco_ios", "vlan_id": 5000, "name": "users"}
+        )
+
+        assert response.status_code == 422
+
+    def test_hostname_has_dedicated_route(self) -> None:
+        """Test hostname is served by its own endpoint rather than a generated one."""
+        response = client.post(
+            "/api/v1/operations/hostname",
+            json={"device": "10.8.0.1", "platform": "cisco_ios", "hostname": "rtr"}
+        )
+
+        assert response.status_code == 404
+
+    def test_apply_change_set(self) -> None:
+        """Test a change set is applied with per-operation results."""
+        response = client.post(
+            "/api/v1/change-sets",
+            json={
+                "device": "10.8.0.2",
+                "platform": "juniper_junos",
+                "operations": [
+                    {"operation": "hostname", "parameters": {"hostname": "edge-2"}},
+                    {"operation": "ntp_server", "parameters": {"server": "10.0.0.100"}}
+                ]
+            }
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["commands"] == [
+            "set system host-name edge-2",
+            "set system ntp server 10.0.0.100"
+        ]
+        assert [result["operation"] for result in data["results"]] == ["hostname", "ntp_server"]
@@ -0,0 +1,32 @@
+"""Tests for per-request correlation IDs."""
+
+from fastapi.testclient import TestClient
+
+from netconfig_api.main import app
+
+client = TestClient(app)
+
+
+class TestRequestIds:
+    """Test cases for the X-Request-ID header."""
+
+    def test_generates_request_id(self) -> None:
+        """Test a request without an ID is given a fresh one."""
+        first = client.get("/health").headers["X-Request-ID"]
+        second = client.get("/health").headers["X-Request-ID"]
+
+        assert len(first) == 32
+        assert first != second
+
+    def test_reuses_client_request_id(self) -> None:
+        """Test a well-formed client ID is echoed back."""
+        response = client.get("/health", headers={"X-Request-ID": "lb-1234.abc"})
+
+        assert response.headers["X-Request-ID"] == "lb-1234.abc"
+
+    def test_replaces_malformed_request_id(self) -> None:
+        """Test an ID that could corrupt log lines is replaced."""
+        response = client.get("/health", headers={"X-Request-ID": "bad id\twith spaces"})
+
+        assert response.headers["X-Request-ID"] != "bad id\twith spaces"
+        assert len(response.headers["X-Request-ID"]) == 32
@@ -0,0 +1,64 @@
+"""Tests for fast JSON response classes."""
+
+import json
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from netconfig_api.api import responses
+from netconfig_api.api.responses import ModelResponse
+from netconfig_api.models.requests import HostnameResponse
+
+
+class TestModelResponse:
+    """Test cases for ModelResponse."""
+
+    def test_renders_model_directly(self) -> None:
+        """Test Pydantic models are serialized without conversion to dict."""
+        model = HostnameResponse(
+            success=True,
+            message="ok",
+            device="10.0.0.1",
+            hostname="fast-rtr"
+        )
+
+        response = ModelResponse(model)
+
+        assert response.media_type == "application/json"
+        assert response.body == model.model_dump_json().encode()
+        assert json.loads(response.body)["hostname"] == "fast-rtr"
+
+    def test_renders_plain_content(self) -> None:
+        """Test non-model content is serialized as JSON."""
+        response = ModelResponse({"status": "healthy", "items": [1, 2]})
+
+        assert json.loads(response.body) == {"status": "healthy", "items": [1, 2]}
+
+    def test_renders_plain_content_without_orjson(self, monkeypatch) -> None:
+        """Test the standard library is used when orjson is not installed."""
+        monkeypatch.setattr(responses, "_orjson", lambda: None)
+
+        response = ModelResponse({"status": "healthy"})
+
+        assert json.loads(response.body) == {"status": "healthy"}
+
+    def test_fast_json_disabled(self, monkeypatch) -> None:
+        """Test NETCONFIG_FAST_JSON=0 encodes models like the standard JSONResponse."""
+        monkeypatch.setattr(responses, "FAST_JSON", False)
+        monkeypatch.setattr(responses, "_orjson", lambda: pytest.fail("orjson used"))
+        monkeypatch.setattr(
+            HostnameResponse,
+            "model_dump_json",
+            lambda *args, **kwargs: pytest.fail("fast serializer used")
+        )
+        model = HostnameResponse(
+            success=True,
+            message="ok",
+            device="10.0.0.1",
+            hostname="std-rtr"
+        )
+
+        response = ModelResponse(model)
+
+        assert response.body == JSONResponse(jsonable_encoder(model)).body
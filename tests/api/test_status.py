@@ -0,0 +1,58 @@
+"""Tests for operational status API endpoints."""
+
+from fastapi.testclient import TestClient
+
+from netconfig_api.main import app
+
+client = TestClient(app)
+
+
+class TestStatusAPI:
+    """Test cases for status API endpoints."""
+
+    def test_scheduler_status(self) -> None:
+        """Test scheduler status reports counters and queue depths."""
+        client.post(
+            "/api/v1/hostname",
+            json={"name": "status-rtr", "device": "10.0.0.1", "platform": "cisco_ios"}
+        )
+
+        response = client.get("/api/v1/status/scheduler")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["executed"] >= 1
+        assert data["coalesced"] >= 0
+        assert data["active_devices"] == 0
+        assert data["queue_depths"] == {}
+
+    def test_concurrency_status(self) -> None:
+        """Test concurrency status reports per-platform limits."""
+        client.post(
+            "/api/v1/hostname",
+            json={"name": "limit-rtr", "device": "10.0.0.2", "platform": "arista_eos"}
+        )
+
+        response = client.get("/api/v1/status/concurrency")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["max_in_flight"] >= 1
+        assert data["in_flight"] == 0
+        assert data["platforms"]["arista_eos"]["limit"] >= 1
+        assert data["platforms"]["arista_eos"]["in_flight"] == 0
+
+    def test_breaker_status(self) -> None:
+        """Test breaker status reports devices with failed operations."""
+        client.post(
+            "/api/v1/hostname",
+            json={"name": "dead-rtr", "device": "10.0.9.254", "platform": "cisco_ios"}
+        )
+
+        response = client.get("/api/v1/status/breakers")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["open"] >= 1
+        assert data["devices"]["10.0.9.254"]["state"] == "open"
+        assert data["devices"]["10.0.9.254"]["retry_at"] is not None
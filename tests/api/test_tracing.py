@@ -0,0 +1,86 @@
+"""Tests for request tracing through the API."""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from netconfig_api.main import app
+from netconfig_api.utils.tracing import TRACER, InMemoryExporter, SpanKind
+
+client = TestClient(app)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemoryExporter]:
+    """Trace every request into an in-memory exporter for the test."""
+    exporter = InMemoryExporter()
+    previous = TRACER.exporter, TRACER.sample_rate
+    TRACER.configure(exporter, 1.0)
+    yield exporter
+    TRACER.configure(*previous)
+
+
+class TestTracingAPI:
+    """Test cases for tracing requests."""
+
+    def test_hostname_span_tree(self, exporter: InMemoryExporter) -> None:
+        """Test a hostname push is traced from the router down to the device."""
+        response = client.post(
+            "/api/v1/hostname",
+            json={"name": "traced-rtr", "device": "10.9.0.1", "platform": "cisco_ios"},
+            headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"}
+        )
+
+        assert response.status_code == 200
+        spans = {span.name: span for span in exporter.spans}
+        assert {span.context.trace_id for span in exporter.spans} == {TRACE_ID}
+
+        root = spans["POST /api/v1/hostname"]
+        assert root.kind is SpanKind.SERVER
+        assert root.parent_id == PARENT_ID
+        assert root.attributes["http.status_code"] == 200
+        assert root.attributes["request.id"] == response.headers["X-Request-ID"]
+
+        def parent(name: str) -> str:
+            return next(
+                span.name for span in exporter.spans
+                if span.context.span_id == spans[name].parent_id
+            )
+
+        assert parent("validation") == "POST /api/v1/hostname"
+        assert parent("hostname.handler") == "POST /api/v1/hostname"
+        assert parent("configure_hostname") == "hostname.handler"
+        assert parent("scheduler.queue") == "configure_hostname"
+        assert parent("render") == "configure_hostname"
+        assert parent("device.attempt") == "configure_hostname"
+        assert parent("concurrency_wait") == "device.attempt"
+        assert parent("session_acquire") == "device.attempt"
+        assert parent("device.execute") == "device.attempt"
+        assert spans["configure_hostname"].attributes["success"] is True
+        assert spans["device.attempt"].kind is SpanKind.CLIENT
+
+    def test_unsampled_request(self, exporter: InMemoryExporter) -> None:
+        """Test a caller's decision not to sample is respected."""
+        client.post(
+            "/api/v1/hostname",
+            json={"name": "untraced-rtr", "device": "10.9.0.2", "platform": "cisco_ios"},
+            headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-00"}
+        )
+
+        assert exporter.spans == []
+
+    def test_failed_push_marks_error(self, exporter: InMemoryExporter) -> None:
+        """Test a push to an unreachable device records failed spans."""
+        client.post(
+            "/api/v1/hostname",
+            json={"name": "dead-rtr", "device": "10.9.0.254", "platform": "cisco_ios"}
+        )
+
+        attempts = exporter.named("device.attempt")
+        assert attempts
+        assert all(span.error is not None for span in attempts)
+        assert exporter.named("configure_hostname")[0].error is not None
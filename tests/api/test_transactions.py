@@ -0,0 +1,46 @@
+"""Tests for multi-device transaction API endpoints."""
+
+from fastapi.testclient import TestClient
+
+from netconfig_api.main import app
+
+client = TestClient(app)
+
+
+class TestTransactionsAPI:
+    """Test cases for transaction API endpoints."""
+
+    def test_transaction_committed(self) -> None:
+        """Test a transaction across two platforms commits and reports timings."""
+        response = client.post(
+            "/api/v1/transactions",
+            json={
+                "requests": [
+                    {"name": "tx-rtr-1", "device": "10.7.0.1", "platform": "cisco_ios"},
+                    {"name": "tx-rtr-2", "device": "10.7.0.2", "platform": "juniper_junos"}
+                ]
+            }
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["state"] == "committed"
+        assert [result["status"] for result in data["results"]] == ["committed", "committed"]
+        assert data["results"][1]["commands"] == ["set system host-name tx-rtr-2"]
+        assert set(data["timings"]) == {
+            "prepare_ms", "commit_ms", "confirm_ms", "rollback_ms", "total_ms"
+        }
+
+    def test_transaction_duplicate_device(self) -> None:
+        """Test a transaction changing one device twice is rejected."""
+        response = client.post(
+            "/api/v1/transactions",
+            json={
+                "requests": [
+                    {"name": "tx-a", "device": "10.7.0.3", "platform": "cisco_ios"},
+                    {"name": "tx-b", "device": "10.7.0.3", "platform": "cisco_ios"}
+                ]
+            }
+        )
+
+        assert response.status_code == 422
@@ -0,0 +1,30 @@
+"""Shared test fixtures."""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from netconfig_api.main import app, network_config_service
+from netconfig_api.services.retry import RetryPolicy
+from netconfig_api.transports.pool import ConnectionPool
+from netconfig_api.transports.registry import LazyTransport
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry failed pushes through the API without waiting out a real backoff."""
+    monkeypatch.setattr(network_config_service, "retry", RetryPolicy(base_delay=0.0))
+
+
+@pytest.fixture
+def lifespan_client(monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    """A client that runs the application lifespan around the test.
+
+    The lifespan closes the connection pool on shutdown. The service is
+    shared by every router and test module, so it is given a private pool
+    for the test and gets its own back, still open, afterwards.
+    """
+    monkeypatch.setattr(network_config_service, "pool", ConnectionPool(LazyTransport("simulated")))
+    with TestClient(app) as client:
+        yield client
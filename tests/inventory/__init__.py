@@ -0,0 +1 @@
+"""Inventory tests module."""
@@ -0,0 +1,149 @@
+"""Tests for bulk inventory import and export."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from netconfig_api.inventory.bulk import (
+    export_devices,
+    import_devices,
+    parse_csv,
+    parse_jsonl,
+    parse_rows,
+)
+from netconfig_api.models.requests import (
+    Device,
+    ImportRowError,
+    ImportSummary,
+    InventoryFormat,
+)
+from netconfig_api.services.inventory import InventoryService
+from netconfig_api.utils.streaming import iter_lines
+
+
+async def _lines(text: str) -> AsyncIterator[bytes]:
+    """Yield the non-blank lines of a text body."""
+    async def chunks() -> AsyncIterator[bytes]:
+        yield text.encode()
+
+    async for line in iter_lines(chunks()):
+        yield line
+
+
+async def _collect(rows: AsyncIterator[tuple[int, Device | str]]) -> list[tuple[int, Device | str]]:
+    """Collect parsed rows into a list."""
+    return [row async for row in rows]
+
+
+class TestParsing:
+    """Test cases for CSV and JSONL parsing."""
+
+    @pytest.mark.asyncio
+    async def test_parse_csv(self) -> None:
+        """Test CSV rows are validated with columns in any order."""
+        rows = await _collect(parse_csv(_lines(
+            "platform,ip,site\n"
+            "cisco_ios,10.0.0.1,dc1\n"
+            "unsupported_platform,10.0.0.2,dc1\n"
+            "arista_eos,10.0.0.3,\n"
+            "arista_eos,10.0.0.4\n"
+        )))
+
+        assert rows[0] == (2, Device(ip="10.0.0.1", platform="cisco_ios", site="dc1"))
+        assert rows[1][0] == 3
+        assert "Unsupported platform" in str(rows[1][1])
+        assert rows[2] == (4, Device(ip="10.0.0.3", platform="arista_eos"))
+        assert rows[3] == (5, "Expected 3 columns, got 2")
+
+    @pytest.mark.asyncio
+    async def test_parse_csv_invalid_header(self) -> None:
+        """Test a header with unknown or missing columns stops parsing."""
+        with pytest.raises(ValueError, match="Invalid CSV header"):
+            await _collect(parse_csv(_lines("ip,rack\n10.0.0.1,a1\n")))
+
+    @pytest.mark.asyncio
+    async def test_parse_csv_empty(self) -> None:
+        """Test an empty body yields nothing."""
+        assert await _collect(parse_csv(_lines(""))) == []
+
+    @pytest.mark.asyncio
+    async def test_parse_jsonl(self) -> None:
+        """Test JSONL lines are validated independently."""
+        rows = await _collect(parse_jsonl(_lines(
+            '{"ip": "2001:db8::1", "platform": "juniper_junos", "hostname": "core1"}\n'
+            '{"ip": "not-an-ip", "platform": "cisco_ios"}\n'
+        )))
+
+        assert rows[0] == (
+            1,
+            Device(ip="2001:db8::1", platform="juniper_junos", hostname="core1")
+        )
+        assert rows[1][0] == 2
+        assert "ip:" in str(rows[1][1])
+
+
+class TestImportExport:
+    """Test cases for batched import and chunked export."""
+
+    @pytest.mark.asyncio
+    async def test_import_devices_in_batches(self) -> None:
+        """Test valid rows are written in batches and errors are reported."""
+        inventory = InventoryService()
+        body = "\n".join(
+            [f'{{"ip": "10.0.0.{i}", "platform": "cisco_ios", "site": "dc1"}}' for i in range(1, 6)]
+            + ['{"ip": "10.0.0.6"}']
+        )
+
+        results = [
+            result
+            async for result in import_devices(
+                inventory,
+                parse_rows(_lines(body), InventoryFormat.JSONL),
+                batch_size=2
+            )
+        ]
+
+        assert results[0] == ImportRowError(line=6, error="platform: Field required")
+        summary = results[-1]
+        assert isinstance(summary, ImportSummary)
+        assert (summary.imported, summary.failed, summary.batches) == (5, 1, 3)
+        assert inventory.count("site=dc1") == 5
+
+    @pytest.mark.asyncio
+    async def test_import_stops_on_fatal_error(self) -> None:
+        """Test a fatal parse error is reported and earlier rows are kept."""
+        inventory = InventoryService()
+
+        results = [
+            result
+            async for result in import_devices(
+                inventory,
+                parse_rows(_lines("ip,color\n"), InventoryFormat.CSV)
+            )
+        ]
+
+        assert isinstance(results[0], ImportRowError)
+        assert results[0].line == 1
+        summary = results[-1]
+        assert isinstance(summary, ImportSummary)
+        assert (summary.imported, summary.failed) == (0, 1)
+
+    def test_export_round_trip(self) -> None:
+        """Test exported CSV and JSONL contain every device."""
+        devices = [
+            Device(ip=f"10.0.0.{i}", platform="cisco_ios", hostname=f"rtr{i}", role="leaf")
+            for i in range(1, 4)
+        ]
+
+        csv_body = b"".join(export_devices(devices, InventoryFormat.CSV, chunk_size=2))
+        jsonl_body = b"".join(export_devices(devices, InventoryFormat.JSONL, chunk_size=2))
+
+        assert csv_body.decode().splitlines() == [
+            "ip,platform,hostname,site,role",
+            "10.0.0.1,cisco_ios,rtr1,,leaf",
+            "10.0.0.2,cisco_ios,rtr2,,leaf",
+            "10.0.0.3,cisco_ios,rtr3,,leaf",
+        ]
+        assert [
+            Device.model_validate_json(line) for line in jsonl_body.splitlines()
+        ] == devices
@@ -0,0 +1,83 @@
+"""Tests for the in-memory inventory index."""
+
+from netconfig_api.inventory.index import InventoryIndex
+from netconfig_api.inventory.selectors import parse_selector
+from netconfig_api.models.requests import Device
+
+
+def _device(index: int, site: str = "dc1", role: str = "leaf") -> Device:
+    """Build a device numbered by index."""
+    return Device(
+        ip=f"10.0.{index // 256}.{index % 256}",
+        platform="cisco_ios",
+        hostname=f"rtr{index}",
+        site=site,
+        role=role
+    )
+
+
+class TestInventoryIndex:
+    """Test cases for InventoryIndex."""
+
+    def test_add_and_get(self) -> None:
+        """Test devices are found by IP and hostname."""
+        index = InventoryIndex()
+        index.add(_device(1))
+
+        assert index.get("10.0.0.1") == _device(1)
+        assert index.get("10.0.0.2") is None
+        assert len(index.select(parse_selector("hostname=rtr1"))) == 1
+
+    def test_add_replaces_existing_record(self) -> None:
+        """Test re-adding an IP updates every index."""
+        index = InventoryIndex()
+        index.add(_device(1, site="dc1"))
+        index.add(_device(1, site="dc2"))
+
+        assert len(index) == 1
+        assert index.count(parse_selector("site=dc1")) == 0
+        assert index.count(parse_selector("site=dc2")) == 1
+
+    def test_remove(self) -> None:
+        """Test removed devices no longer match and their slot is reused."""
+        index = InventoryIndex()
+        index.add(_device(1))
+        index.add(_device(2))
+
+        assert index.remove("10.0.0.1") == _device(1)
+        assert index.remove("10.0.0.1") is None
+        assert index.count(parse_selector("*")) == 1
+        assert index.count(parse_selector("hostname=rtr1")) == 0
+
+        index.add(_device(3))
+        assert {str(device.ip) for device in index.select(parse_selector("role=leaf"))} == {
+            "10.0.0.2",
+            "10.0.0.3",
+        }
+
+    def test_load_matches_incremental_adds(self) -> None:
+        """Test bulk loading builds the same indexes as adding one by one."""
+        devices = [
+            _device(i, site=f"dc{i % 3}", role="leaf" if i % 2 else "spine")
+            for i in range(1000)
+        ]
+        loaded = InventoryIndex()
+        loaded.load(devices)
+        added = InventoryIndex()
+        for device in devices:
+            added.add(device)
+
+        for selector in ("*", "site=dc1 AND role=leaf", "NOT site=dc0", "hostname=rtr999"):
+            parsed = parse_selector(selector)
+            assert loaded.select(parsed) == added.select(parsed)
+        assert loaded.count(parse_selector("site=dc1 AND role=leaf")) == sum(
+            1 for device in devices if device.site == "dc1" and device.role == "leaf"
+        )
+
+    def test_load_keeps_last_record_per_ip(self) -> None:
+        """Test duplicate IPs in a bulk load keep the last record."""
+        index = InventoryIndex()
+        index.load([_device(1, site="dc1"), _device(1, site="dc2")])
+
+        assert len(index) == 1
+        assert index.count(parse_selector("site=dc2")) == 1
@@ -0,0 +1,88 @@
+"""Tests for inventory selector parsing."""
+
+import pytest
+
+from netconfig_api.inventory.index import InventoryIndex
+from netconfig_api.inventory.selectors import (
+    MAX_SELECTOR_DEPTH,
+    SelectorError,
+    parse_selector,
+)
+from netconfig_api.models.requests import Device
+
+
+@pytest.fixture
+def index() -> InventoryIndex:
+    """Create an index with a small fleet."""
+    index = InventoryIndex()
+    index.load([
+        Device(ip="10.0.0.1", platform="cisco_ios", hostname="dc1-leaf1", site="dc1", role="leaf"),
+        Device(ip="10.0.0.2", platform="arista_eos", hostname="dc1-leaf2", site="dc1", role="leaf"),
+        Device(ip="10.0.0.3", platform="juniper_junos", hostname="dc1-spine1", site="dc1", role="spine"),
+        Device(ip="10.0.1.1", platform="cisco_ios", hostname="dc2-leaf1", site="dc2", role="leaf"),
+        Device(ip="10.0.1.2", platform="juniper_junos", site="dc2"),
+    ])
+    return index
+
+
+def _ips(index: InventoryIndex, selector: str) -> set[str]:
+    """Resolve a selector to the matching IPs."""
+    return {str(device.ip) for device in index.select(parse_selector(selector))}
+
+
+class TestSelectors:
+    """Test cases for selector evaluation."""
+
+    @pytest.mark.parametrize(
+        ("selector", "expected"),
+        [
+            ("*", {"10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.1.1", "10.0.1.2"}),
+            ("site=dc1 AND role=leaf", {"10.0.0.1", "10.0.0.2"}),
+            ("site=dc1 and role=leaf and platform=cisco_ios", {"10.0.0.1"}),
+            ("role=spine OR site=dc2", {"10.0.0.3", "10.0.1.1", "10.0.1.2"}),
+            ("role=leaf,spine AND site!=dc1", {"10.0.1.1"}),
+            ("NOT role=leaf", {"10.0.0.3", "10.0.1.2"}),
+            ("site=dc1 AND NOT (role=leaf AND platform=cisco_ios)", {"10.0.0.2", "10.0.0.3"}),
+            ("hostname=dc2-leaf1 OR ip=10.0.1.2", {"10.0.1.1", "10.0.1.2"}),
+            ("ip=192.0.2.1", set()),
+            ("site=dc9 AND role=leaf", set()),
+        ]
+    )
+    def test_evaluate(self, index: InventoryIndex, selector: str, expected: set[str]) -> None:
+        """Test selectors resolve to the expected devices."""
+        assert _ips(index, selector) == expected
+
+    def test_count(self, index: InventoryIndex) -> None:
+        """Test counting matches without materializing devices."""
+        assert index.count(parse_selector("role=leaf")) == 3
+
+    @pytest.mark.parametrize(
+        "selector",
+        [
+            "",
+            "site",
+            "site=",
+            "rack=a1",
+            "site=dc1 AND",
+            "site=dc1 role=leaf",
+            "(site=dc1",
+            "site=dc1)",
+            "site==dc1",
+            "AND site=dc1",
+            "(" * 300 + "site=dc1" + ")" * 300,
+            "NOT " * 300 + "site=dc1",
+        ]
+    )
+    def test_invalid_selector_raises_error(self, selector: str) -> None:
+        """Test malformed selectors are rejected."""
+        with pytest.raises(SelectorError):
+            parse_selector(selector)
+
+    def test_nesting_within_limit(self) -> None:
+        """Test selectors nested up to the depth limit still parse."""
+        parse_selector("(" * MAX_SELECTOR_DEPTH + "site=dc1" + ")" * MAX_SELECTOR_DEPTH)
+        parse_selector("NOT " * MAX_SELECTOR_DEPTH + "site=dc1")
+
+    def test_parse_is_cached(self) -> None:
+        """Test parsing the same selector twice returns the cached result."""
+        assert parse_selector("site=dc1 AND role=leaf") is parse_selector("site=dc1 AND role=leaf")
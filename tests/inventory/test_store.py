@@ -0,0 +1,45 @@
+"""Tests for the SQLite inventory store."""
+
+from pathlib import Path
+
+from netconfig_api.inventory.store import InventoryStore
+from netconfig_api.models.requests import Device
+
+
+class TestInventoryStore:
+    """Test cases for InventoryStore."""
+
+    def test_upsert_and_iterate(self) -> None:
+        """Test devices round-trip through the database."""
+        store = InventoryStore()
+        device = Device(ip="10.0.0.1", platform="cisco_ios", hostname="rtr1", site="dc1")
+
+        assert store.upsert_many([device]) == 1
+        assert store.upsert_many([device.model_copy(update={"role": "leaf"})]) == 1
+
+        assert list(store.iter_devices()) == [device.model_copy(update={"role": "leaf"})]
+
+    def test_delete(self) -> None:
+        """Test deleting reports whether the device existed."""
+        store = InventoryStore()
+        store.upsert_many([Device(ip="10.0.0.1", platform="cisco_ios")])
+
+        assert store.delete("10.0.0.1") is True
+        assert store.delete("10.0.0.1") is False
+        assert list(store.iter_devices()) == []
+
+    def test_data_version_tracks_other_connections(self, tmp_path: Path) -> None:
+        """Test commits from another connection change the data version."""
+        path = str(tmp_path / "inventory.db")
+        reader = InventoryStore(path)
+        writer = InventoryStore(path)
+        version = reader.data_version()
+
+        reader.upsert_many([Device(ip="10.0.0.1", platform="cisco_ios")])
+        assert reader.data_version() == version
+
+        writer.upsert_many([Device(ip="10.0.0.2", platform="cisco_ios")])
+        assert reader.data_version() != version
+
+        reader.close()
+        writer.close()
@@ -0,0 +1,138 @@
+"""Tests for the adaptive concurrency controller."""
+
+import asyncio
+
+import pytest
+
+from netconfig_api.services.concurrency import AIMDLimit, ConcurrencyController
+
+
+class TestAIMDLimit:
+    """Test cases for AIMDLimit."""
+
+    def test_increases_additively(self) -> None:
+        """Test fast successes raise the limit by about one per limit's worth."""
+        limit = AIMDLimit(initial=4, maximum=5)
+        for _ in range(4):
+            limit.record(0.01, failed=False)
+
+        assert 4.9 < limit.limit <= 5
+        for _ in range(20):
+            limit.record(0.01, failed=False)
+        assert limit.limit == 5
+
+    def test_slow_operation_backs_off_once_per_latency(self) -> None:
+        """Test latency far above the baseline halves the limit, once per burst."""
+        limit = AIMDLimit(initial=16)
+        limit.record(0.01, failed=False)
+
+        limit.record(1.0, failed=False)
+        limit.record(1.0, failed=False)
+
+        assert 8 <= limit.limit < 9
+
+    def test_errors_respect_threshold(self) -> None:
+        """Test isolated failures only back off when the threshold is zero."""
+        strict = AIMDLimit(initial=8)
+        tolerant = AIMDLimit(initial=8, error_threshold=0.5)
+
+        strict.record(0.01, failed=True)
+        tolerant.record(0.01, failed=True)
+
+        assert strict.limit == 4
+        assert tolerant.limit > 8
+        assert strict.latency is None
+
+    def test_never_below_minimum(self) -> None:
+        """Test repeated congestion stops at the minimum."""
+        limit = AIMDLimit(initial=2, minimum=1)
+        for _ in range(5):
+            limit.record(0.0, failed=True)
+
+        assert limit.limit == 1
+        assert limit.available
+
+
+class TestConcurrencyController:
+    """Test cases for ConcurrencyController."""
+
+    @pytest.mark.asyncio
+    async def test_caps_in_flight(self) -> None:
+        """Test the global, platform and device caps are never exceeded."""
+        controller = ConcurrencyController(
+            max_in_flight=6,
+            initial_per_platform=4,
+            max_per_platform=4,
+            max_per_device=1
+        )
+        peaks = {"total": 0, "cisco_ios": 0, "10.0.0.1": 0}
+        active = {"total": 0, "cisco_ios": 0, "10.0.0.1": 0}
+
+        async def operation(device: str, platform: str) -> None:
+            async with controller.slot(device, platform):
+                keys = ["total", platform, device]
+                for key in keys:
+                    if key in active:
+                        active[key] += 1
+                        peaks[key] = max(peaks[key], active[key])
+                await asyncio.sleep(0.001)
+                for key in keys:
+                    if key in active:
+                        active[key] -= 1
+
+        await asyncio.gather(
+            *(operation(f"10.0.1.{index}", "cisco_ios") for index in range(10)),
+            *(operation(f"10.0.2.{index}", "juniper_junos") for index in range(10)),
+            *(operation("10.0.0.1", "arista_eos") for _ in range(3))
+        )
+
+        assert peaks == {"total": 6, "cisco_ios": 4, "10.0.0.1": 1}
+        assert controller.in_flight == 0
+        assert controller.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_throttle_device(self) -> None:
+        """Test a failing device is throttled and reported until it recovers."""
+        controller = ConcurrencyController(max_per_device=4)
+
+        with pytest.raises(RuntimeError):
+            async with controller.slot("10.0.0.1", "cisco_ios"):
+                raise RuntimeError("session dropped")
+
+        stats = controller.stats()
+        assert stats.devices["10.0.0.1"].limit == 2
+        assert stats.devices["10.0.0.1"].error_rate > 0
+        assert stats.platforms["cisco_ios"].limit == 64
+
+        for _ in range(10):
+            async with controller.slot("10.0.0.1", "cisco_ios"):
+                pass
+        assert "10.0.0.1" not in controller.stats().devices
+
+    @pytest.mark.asyncio
+    async def test_latency_measured_from_mark_started(self) -> None:
+        """Test time before mark_started, such as opening a session, is not recorded."""
+        controller = ConcurrencyController()
+
+        async with controller.slot("10.0.0.1", "cisco_ios") as slot:
+            await asyncio.sleep(0.05)
+            slot.mark_started()
+
+        baseline = controller.stats().platforms["cisco_ios"].baseline_ms
+        assert baseline is not None and baseline < 25
+
+    def test_usable_from_successive_event_loops(self) -> None:
+        """Test an idle controller can be used again from a new event loop."""
+        controller = ConcurrencyController(max_in_flight=1)
+
+        async def contend() -> None:
+            async def operation() -> None:
+                async with controller.slot("10.0.0.1", "cisco_ios"):
+                    await asyncio.sleep(0.001)
+
+            await asyncio.gather(operation(), operation())
+
+        asyncio.run(contend())
+        asyncio.run(contend())
+
+        assert controller.in_flight == 0
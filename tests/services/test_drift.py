@@ -0,0 +1,137 @@
+"""Tests for the drift scanner."""
+
+import asyncio
+
+import pytest
+
+from netconfig_api.models.requests import Device, HostnameRequest
+from netconfig_api.services.drift import DriftScanner
+from netconfig_api.services.network_config import NetworkConfigService
+from netconfig_api.services.retry import RetryPolicy
+from netconfig_api.transports.pool import ConnectionPool
+from netconfig_api.transports.simulated import SimulatedTransport
+
+
+def _service(transport: SimulatedTransport) -> NetworkConfigService:
+    """Create a service with three inventory devices, one unreachable."""
+    service = NetworkConfigService(
+        pool=ConnectionPool(transport),
+        retry=RetryPolicy(base_delay=0.0)
+    )
+    service.inventory.upsert([
+        Device(ip="10.0.0.1", platform="cisco_ios", hostname="leaf-1"),
+        Device(ip="10.0.0.2", platform="juniper_junos", hostname="leaf-2"),
+        Device(ip="10.0.0.254", platform="cisco_ios", hostname="dead-1"),
+    ])
+    return service
+
+
+class TestDriftScanner:
+    """Test cases for DriftScanner."""
+
+    @pytest.mark.asyncio
+    async def test_scan_reports_drift_and_errors(self) -> None:
+        """Test a full pass finds drifted, clean and unreachable devices."""
+        transport = SimulatedTransport(base_config=["hostname router"])
+        transport.running_config("10.0.0.2")[:] = ["set system host-name leaf-2"]
+        service = _service(transport)
+        scanner = DriftScanner(service)
+
+        assert await scanner.scan_wave() == 3
+        report = scanner.report()
+
+        assert report.checked == 3
+        assert report.drifted == 1
+        assert report.errors == 1
+        assert report.passes == 1
+        assert [result.device for result in report.results] == ["10.0.0.1", "10.0.0.254"]
+        assert report.results[0].diff == ["-hostname router", "+hostname leaf-1"]
+        clean = scanner.result("10.0.0.2")
+        assert clean is not None and clean.drifted is False
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_waves_are_bounded_and_changed_devices_first(self) -> None:
+        """Test waves respect their size and re-check pushed devices first."""
+        transport = SimulatedTransport(base_config=["hostname router"])
+        service = _service(transport)
+        scanner = DriftScanner(service, wave_size=2)
+
+        assert await scanner.scan_wave() == 2
+        assert await scanner.scan_wave() == 1
+        assert scanner.passes == 1
+        assert await scanner.scan_wave() == 0
+
+        await service.configure_hostname(
+            HostnameRequest(name="leaf-1", device="10.0.0.1", platform="cisco_ios")
+        )
+
+        assert await scanner.scan_wave() == 1
+        result = scanner.result("10.0.0.1")
+        assert result is not None and result.drifted is False
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_drift_allows_reconciling_push(self) -> None:
+        """Test a push of the last applied hostname is not skipped once drift is found."""
+        transport = SimulatedTransport(base_config=["hostname router"])
+        service = _service(transport)
+        scanner = DriftScanner(service, wave_size=1)
+        request = HostnameRequest(name="leaf-1", device="10.0.0.1", platform="cisco_ios")
+        await service.configure_hostname(request)
+        transport.running_config("10.0.0.1")[:] = ["hostname rogue"]
+
+        await scanner.scan_wave()
+        result = scanner.result("10.0.0.1")
+        assert result is not None and result.drifted is True
+
+        plan = await service.configure_hostname(request, dry_run=True)
+        assert plan.changed is True
+        assert plan.commands == ["hostname leaf-1"]
+
+        response = await service.configure_hostname(request)
+
+        assert response.success is True
+        assert response.cached is False
+        assert "hostname leaf-1" in transport.running_config("10.0.0.1")
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_config_skips_diff(
+        self,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an unchanged config and desired state reuse the previous verdict."""
+        transport = SimulatedTransport(base_config=["hostname router"])
+        service = _service(transport)
+        scanner = DriftScanner(service, pass_interval=0.0)
+        await scanner.scan_wave()
+        first = scanner.result("10.0.0.1")
+
+        def fail_read(snapshot_id: int) -> str:
+            raise AssertionError("config should not be read back")
+
+        monkeypatch.setattr(service.config_snapshots, "read", fail_read)
+        await scanner.scan_wave()
+
+        second = scanner.result("10.0.0.1")
+        assert first is not None and second is not None
+        assert second.drifted is True
+        assert second.snapshot_id == first.snapshot_id
+        assert second.checked_at >= first.checked_at
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_start_and_close(self) -> None:
+        """Test the background scan runs waves until closed."""
+        transport = SimulatedTransport()
+        service = _service(transport)
+        scanner = DriftScanner(service, wave_interval=0.001)
+
+        await scanner.start()
+        while scanner.passes == 0:
+            await asyncio.sleep(0.001)
+        await scanner.close()
+
+        assert scanner.report().checked == 3
+        await service.close()
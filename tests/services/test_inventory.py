@@ -0,0 +1,56 @@
+"""Tests for the inventory service."""
+
+from pathlib import Path
+
+import pytest
+
+from netconfig_api.inventory.selectors import SelectorError
+from netconfig_api.inventory.store import InventoryStore
+from netconfig_api.models.requests import Device
+from netconfig_api.services.inventory import InventoryService
+
+
+class TestInventoryService:
+    """Test cases for InventoryService."""
+
+    def test_upsert_select_delete(self) -> None:
+        """Test writes are visible to lookups and selectors."""
+        inventory = InventoryService()
+        inventory.upsert([
+            Device(ip="10.0.0.1", platform="cisco_ios", site="dc1", role="leaf"),
+            Device(ip="10.0.0.2", platform="arista_eos", site="dc1", role="spine"),
+        ])
+
+        assert len(inventory) == 2
+        assert inventory.get("10.0.0.2") is not None
+        assert [str(d.ip) for d in inventory.select("site=dc1 AND role=leaf")] == ["10.0.0.1"]
+        assert inventory.count("site=dc1") == 2
+
+        assert inventory.delete("10.0.0.1") is True
+        assert inventory.count("site=dc1") == 1
+
+    def test_incremental_upsert(self) -> None:
+        """Test small writes into a large inventory update the index in place."""
+        inventory = InventoryService()
+        inventory.upsert(
+            Device(ip=f"10.0.0.{i}", platform="cisco_ios", site="dc1") for i in range(1, 11)
+        )
+        inventory.upsert([Device(ip="10.0.0.1", platform="cisco_ios", site="dc2")])
+
+        assert inventory.count("site=dc1") == 9
+        assert inventory.count("site=dc2") == 1
+
+    def test_invalid_selector_raises_error(self) -> None:
+        """Test invalid selectors raise SelectorError."""
+        with pytest.raises(SelectorError):
+            InventoryService().select("site")
+
+    def test_reloads_after_external_change(self, tmp_path: Path) -> None:
+        """Test the index picks up writes made by another process."""
+        path = str(tmp_path / "inventory.db")
+        inventory = InventoryService(InventoryStore(path))
+        assert len(inventory) == 0
+
+        InventoryStore(path).upsert_many([Device(ip="10.0.0.1", platform="cisco_ios")])
+
+        assert inventory.get("10.0.0.1") is not None
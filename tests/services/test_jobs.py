@@ -0,0 +1,163 @@
+"""Tests for the background job manager."""
+
+import asyncio
+
+import pytest
+
+from netconfig_api.models.requests import HostnameResponse, JobStatus
+from netconfig_api.services.jobs import (
+    JobManager,
+    JobQueueClosedError,
+    JobQueueFullError,
+)
+
+
+def _response(hostname: str = "test-router") -> HostnameResponse:
+    """Build a successful HostnameResponse."""
+    return HostnameResponse(
+        success=True,
+        message="ok",
+        device="10.0.0.1",
+        hostname=hostname
+    )
+
+
+class TestJobManager:
+    """Test cases for JobManager."""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_to_completion(self) -> None:
+        """Test a submitted job is run by a worker and its result recorded."""
+        manager = JobManager(workers=2)
+        await manager.start()
+
+        async def operation() -> HostnameResponse:
+            return _response()
+
+        job = manager.submit(operation)
+        assert job.status == JobStatus.QUEUED
+        assert manager.get(job.id) is job
+
+        await manager.close()
+
+        assert job.status == JobStatus.COMPLETED
+        assert job.result == _response()
+        assert job.started_at is not None
+        assert job.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_failing_job_records_error(self) -> None:
+        """Test an operation that raises marks the job as failed."""
+        manager = JobManager(workers=1)
+        await manager.start()
+
+        async def operation() -> HostnameResponse:
+            raise RuntimeError("device exploded")
+
+        job = manager.submit(operation)
+        await manager.close()
+
+        assert job.status == JobStatus.FAILED
+        assert job.error == "device exploded"
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_jobs(self) -> None:
+        """Test submission fails fast once the queue is at capacity."""
+        manager = JobManager(workers=1, max_queued=2)
+        await manager.start()
+        release = asyncio.Event()
+
+        async def operation() -> HostnameResponse:
+            await release.wait()
+            return _response()
+
+        manager.submit(operation)
+        await asyncio.sleep(0)  # let the worker pick up the first job
+        manager.submit(operation)
+        manager.submit(operation)
+
+        with pytest.raises(JobQueueFullError):
+            manager.submit(operation)
+
+        release.set()
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_close_drains_queue_and_rejects_new_jobs(self) -> None:
+        """Test shutdown completes queued jobs before stopping workers."""
+        manager = JobManager(workers=2)
+        await manager.start()
+
+        async def operation() -> HostnameResponse:
+            await asyncio.sleep(0.01)
+            return _response()
+
+        jobs = [manager.submit(operation) for _ in range(10)]
+        await manager.close()
+
+        assert all(job.status == JobStatus.COMPLETED for job in jobs)
+        with pytest.raises(JobQueueClosedError):
+            manager.submit(operation)
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_jobs_after_drain_timeout(self) -> None:
+        """Test jobs still pending after the drain timeout are failed."""
+        manager = JobManager(workers=1)
+        await manager.start()
+
+        async def operation() -> HostnameResponse:
+            await asyncio.sleep(10)
+            return _response()
+
+        running = manager.submit(operation)
+        queued = manager.submit(operation)
+        await asyncio.sleep(0)
+        await manager.close(drain_timeout=0.01)
+
+        assert running.status == JobStatus.FAILED
+        assert queued.status == JobStatus.FAILED
+        assert queued.error == "Job cancelled during shutdown"
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_are_pruned(self) -> None:
+        """Test only max_retained jobs are kept for lookups."""
+        manager = JobManager(workers=1, max_retained=3)
+        await manager.start()
+
+        async def operation() -> HostnameResponse:
+            return _response()
+
+        jobs = []
+        for _ in range(5):
+            jobs.append(manager.submit(operation))
+            await asyncio.sleep(0.001)
+        await manager.close()
+
+        assert manager.get(jobs[0].id) is None
+        assert manager.get(jobs[-1].id) is jobs[-1]
+
+    @pytest.mark.asyncio
+    async def test_running_job_does_not_block_pruning(self) -> None:
+        """Test finished jobs behind a long-running one are still pruned."""
+        manager = JobManager(workers=2, max_retained=3)
+        await manager.start()
+        release = asyncio.Event()
+
+        async def slow() -> HostnameResponse:
+            await release.wait()
+            return _response()
+
+        async def fast() -> HostnameResponse:
+            return _response()
+
+        running = manager.submit(slow)
+        jobs = []
+        for _ in range(5):
+            jobs.append(manager.submit(fast))
+            await asyncio.sleep(0.001)
+
+        assert manager.get(running.id) is running
+        assert manager.get(jobs[0].id) is None
+        assert manager.get(jobs[-1].id) is jobs[-1]
+        release.set()
+        await manager.close()
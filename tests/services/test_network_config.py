@@ -1,9 +1,23 @@
 """Tests for network configuration service."""
 
+import asyncio
+
 import pytest
 
-from netconfig_api.models.requests import HostnameRequest, HostnameResponse
+from netconfig_api.models.operations import OPERATION_MODELS, ChangeSetRequest
+from netconfig_api.models.requests import (
+    BatchHostnameRequest,
+    BatchHostnameResponse,
+    BreakerState,
+    Device,
+    HostnameRequest,
+    HostnameResponse,
+)
 from netconfig_api.services.network_config import NetworkConfigService
+from netconfig_api.services.retry import CircuitBreakers, CircuitOpenError, RetryPolicy
+from netconfig_api.transports.pool import ConnectionPool
+from netconfig_api.transports.simulated import SimulatedTransport
+from netconfig_api.utils.device_platforms import HOSTNAME_OPERATION
 
 
 class TestNetworkConfigService:
@@ -12,7 +26,7 @@ class TestNetworkConfigService:
     @pytest.fixture
     def service(self) -> NetworkConfigService:
         """Create a NetworkConfigService instance for testing."""
-        return NetworkConfigService()
+        return NetworkConfigService(retry=RetryPolicy(base_delay=0.0))
 
     @pytest.mark.asyncio
     async def test_configure_hostname_success(self, service: NetworkConfigService) -> None:
@@ -99,12 +113,150 @@ class TestNetworkConfigService:
             assert response.device == "10.0.0.1"
 
     @pytest.mark.asyncio
-    async def test_simulate_device_configuration_success(
+    async def test_configure_hostname_batch(
+        self,
+        service: NetworkConfigService
+    ) -> None:
+        """Test batch hostname configuration preserves order and counts."""
+        batch = BatchHostnameRequest(
+            requests=[
+                HostnameRequest(
+                    name=f"edge-{index}",
+                    device=f"10.1.0.{index}",
+                    platform="juniper_junos"
+                )
+                for index in range(250, 256)
+            ],
+            concurrency=2
+        )
+
+        response = await service.configure_hostname_batch(batch)
+
+        assert isinstance(response, BatchHostnameResponse)
+        assert response.total == 6
+        assert response.failed == 1  # 10.1.0.254 is simulated unreachable
+        assert response.succeeded == 5
+        assert [result.device for result in response.results] == [
+            f"10.1.0.{index}" for index in range(250, 256)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_batch_renders_once_per_platform(
+        self,
+        service: NetworkConfigService
+    ) -> None:
+        """Test a batch renders each platform's shared command only once."""
+        batch = BatchHostnameRequest(
+            requests=[
+                HostnameRequest(
+                    name="edge",
+                    device=f"10.3.0.{index}",
+                    platform="cisco_ios" if index % 2 else "arista_eos"
+                )
+                for index in range(1, 21)
+            ]
+        )
+
+        response = await service.configure_hostname_batch(batch)
+
+        assert response.succeeded == 20
+        assert len(service.renderer._cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_batch_respects_concurrency(
+        self,
+        service: NetworkConfigService,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test batch hostname configuration never exceeds the concurrency limit."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_configure(request: HostnameRequest) -> HostnameResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return HostnameResponse(
+                success=True,
+                message="ok",
+                device=str(request.device),
+                hostname=request.name
+            )
+
+        monkeypatch.setattr(service, "configure_hostname", slow_configure)
+        batch = BatchHostnameRequest(
+            requests=[
+                HostnameRequest(
+                    name=f"edge-{index}",
+                    device=f"10.2.0.{index}",
+                    platform="cisco_ios"
+                )
+                for index in range(1, 31)
+            ],
+            concurrency=4
+        )
+
+        response = await service.configure_hostname_batch(batch)
+
+        assert response.succeeded == 30
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_platform_from_inventory(
+        self,
+        service: NetworkConfigService
+    ) -> None:
+        """Test the platform is looked up in the inventory when omitted."""
+        service.inventory.upsert([Device(ip="10.3.0.1", platform="juniper_junos")])
+
+        response = await service.configure_hostname(
+            HostnameRequest(name="inv-rtr", device="10.3.0.1")
+        )
+        unknown = await service.configure_hostname(
+            HostnameRequest(name="inv-rtr", device="10.3.0.2")
+        )
+
+        assert response.success is True
+        assert unknown.success is False
+        assert "not in the inventory" in unknown.message
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_batch_selector(
+        self,
+        service: NetworkConfigService
+    ) -> None:
+        """Test a selector batch applies inventory hostnames to matching devices."""
+        service.inventory.upsert([
+            Device(ip="10.4.0.1", platform="cisco_ios", hostname="dc1-leaf1", site="dc1", role="leaf"),
+            Device(ip="10.4.0.2", platform="arista_eos", site="dc1", role="leaf"),
+            Device(ip="10.4.0.3", platform="cisco_ios", hostname="dc1-spine1", site="dc1", role="spine"),
+        ])
+
+        response = await service.configure_hostname_batch(
+            BatchHostnameRequest(selector="site=dc1 AND role=leaf")
+        )
+        empty = await service.configure_hostname_batch(
+            BatchHostnameRequest(selector="site=dc9")
+        )
+
+        assert response.total == 2
+        assert response.succeeded == 1
+        assert {(result.device, result.success) for result in response.results} == {
+            ("10.4.0.1", True),
+            ("10.4.0.2", False),
+        }
+        assert empty.total == 0
+        assert empty.max_device_ms == 0.0
+
+    @pytest.mark.asyncio
+    async def test_execute_device_configuration_success(
         self,
         service: NetworkConfigService
     ) -> None:
-        """Test device configuration simulation success."""
-        result = await service._simulate_device_configuration(
+        """Test device configuration over the simulated transport succeeds."""
+        result = await service._execute_device_configuration(
             device_ip="192.168.1.1",
             command="hostname test-router",
             platform="cisco_ios"
@@ -113,12 +265,12 @@ class TestNetworkConfigService:
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_simulate_device_configuration_failure(
+    async def test_execute_device_configuration_failure(
         self,
         service: NetworkConfigService
     ) -> None:
-        """Test device configuration simulation failure."""
-        result = await service._simulate_device_configuration(
+        """Test device configuration fails for an unreachable device."""
+        result = await service._execute_device_configuration(
             device_ip="192.168.1.254",
             command="hostname test-router",
             platform="cisco_ios"
@@ -127,15 +279,576 @@ class TestNetworkConfigService:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_simulate_device_configuration_internal_network(
+    async def test_execute_device_configuration_internal_network(
         self,
         service: NetworkConfigService
     ) -> None:
-        """Test device configuration simulation with internal network."""
-        result = await service._simulate_device_configuration(
+        """Test device configuration with internal network."""
+        result = await service._execute_device_configuration(
             device_ip="10.1.1.1",
             command="hostname test-router",
             platform="cisco_ios"
         )
 
         assert result is True
+
+    @pytest.mark.asyncio
+    async def test_execute_device_configuration_retries(self) -> None:
+        """Test a failing device is retried before the push is reported failed."""
+        transport = SimulatedTransport()
+        service = NetworkConfigService(
+            pool=ConnectionPool(transport),
+            retry=RetryPolicy(attempts=3, base_delay=0.0),
+            breakers=CircuitBreakers(failure_threshold=10)
+        )
+
+        result = await service._execute_device_configuration(
+            device_ip="10.0.0.254",
+            command="hostname test-router",
+            platform="cisco_ios"
+        )
+
+        assert result is False
+        assert transport.handshakes == 3
+
+    @pytest.mark.asyncio
+    async def test_rejected_commands_are_not_retried(self) -> None:
+        """Test a device rejecting a command is neither retried nor counted as a failure."""
+        transport = SimulatedTransport(reject_commands=["invalid input"])
+        service = NetworkConfigService(
+            pool=ConnectionPool(transport),
+            retry=RetryPolicy(attempts=3, base_delay=0.0),
+            breakers=CircuitBreakers(failure_threshold=1)
+        )
+
+        result = await service._execute_device_configuration(
+            device_ip="10.0.0.1",
+            command="hostname invalid input",
+            platform="cisco_ios"
+        )
+
+        assert result is False
+        assert transport.handshakes == 1
+        assert transport.commits == 0
+        assert service.breakers.stats().devices == {}
+
+    @pytest.mark.asyncio
+    async def test_execute_device_configuration_timeout(self) -> None:
+        """Test an attempt that hangs is cut off at the retry policy's timeout."""
+        transport = SimulatedTransport(unreachable_delay=10.0)
+        service = NetworkConfigService(
+            pool=ConnectionPool(transport),
+            retry=RetryPolicy(attempts=1, timeout=0.05)
+        )
+
+        result = await asyncio.wait_for(
+            service._execute_device_configuration(
+                device_ip="10.0.0.254",
+                command="hostname test-router",
+                platform="cisco_ios"
+            ),
+            timeout=1.0
+        )
+
+        assert result is False
+        assert service.breakers.stats().devices["10.0.0.254"].consecutive_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast(self) -> None:
+        """Test a dead device stops being contacted once its breaker opens."""
+        transport = SimulatedTransport()
+        service = NetworkConfigService(
+            pool=ConnectionPool(transport),
+            retry=RetryPolicy(attempts=5, base_delay=0.0),
+            breakers=CircuitBreakers(failure_threshold=2, reset_timeout=60.0)
+        )
+
+        first = await service.configure_hostname(
+            HostnameRequest(name="rtr-1", device="10.0.0.254", platform="cisco_ios")
+        )
+        second = await service.configure_hostname(
+            HostnameRequest(name="rtr-2", device="10.0.0.254", platform="cisco_ios")
+        )
+        healthy = await service.configure_hostname(
+            HostnameRequest(name="rtr-3", device="10.0.0.1", platform="cisco_ios")
+        )
+
+        assert first.success is False
+        assert second.success is False
+        assert healthy.success is True
+        assert transport.handshakes == 3  # two attempts on the dead device, one healthy
+        assert service.breakers.stats().open == 1
+        with pytest.raises(CircuitOpenError):
+            await service.capture_config("10.0.0.254", "cisco_ios")
+
+    @pytest.mark.asyncio
+    async def test_interrupted_probe_releases_breaker(self) -> None:
+        """Test a probe that is cancelled or fails off-device does not block the device."""
+        service = NetworkConfigService(
+            pool=ConnectionPool(SimulatedTransport()),
+            breakers=CircuitBreakers(failure_threshold=1, reset_timeout=0.0)
+        )
+        service.breakers.record_failure("10.0.0.1")
+
+        async def hang(session: object) -> None:
+            await asyncio.sleep(10)
+
+        async def fail(session: object) -> None:
+            raise RuntimeError("unexpected output")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(service.run_on_device("10.0.0.1", "cisco_ios", hang), 0.05)
+        assert service.breakers.state("10.0.0.1") is BreakerState.OPEN
+
+        with pytest.raises(RuntimeError):
+            await service.run_on_device("10.0.0.1", "cisco_ios", fail)
+        assert service.breakers.state("10.0.0.1") is BreakerState.OPEN
+
+        response = await service.configure_hostname(
+            HostnameRequest(name="rtr-1", device="10.0.0.1", platform="cisco_ios")
+        )
+        assert response.success is True
+        assert service.breakers.state("10.0.0.1") is BreakerState.CLOSED
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_retries_stop_at_total_timeout(self) -> None:
+        """Test a device that times out is not retried past the total timeout."""
+        transport = SimulatedTransport(unreachable_delay=10.0)
+        service = NetworkConfigService(
+            pool=ConnectionPool(transport),
+            retry=RetryPolicy(attempts=3, timeout=0.05, base_delay=0.0, total_timeout=0.08)
+        )
+
+        result = await service._execute_device_configuration(
+            device_ip="10.0.0.254",
+            command="hostname test-router",
+            platform="cisco_ios"
+        )
+
+        assert result is False
+        assert transport.handshakes == 1
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_reuses_pooled_session(self) -> None:
+        """Test repeated configuration of a device performs a single handshake."""
+        transport = SimulatedTransport()
+        service = NetworkConfigService(pool=ConnectionPool(transport))
+        for index in range(5):
+            response = await service.configure_hostname(
+                HostnameRequest(
+                    name=f"test-router-{index}",
+                    device="10.0.0.1",
+                    platform="cisco_ios"
+                )
+            )
+            assert response.success is True
+
+        assert transport.handshakes == 1
+        assert transport.commands_sent == 5
+        assert service.pool.stats.hits == 4
+
+        await service.close()
+        assert transport.closes == 1
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_coalesces_concurrent_writes(self) -> None:
+        """Test concurrent hostname writes to one device are coalesced."""
+        transport = SimulatedTransport(command_latency=0.01)
+        service = NetworkConfigService(pool=ConnectionPool(transport))
+
+        responses = await asyncio.gather(*(
+            service.configure_hostname(
+                HostnameRequest(
+                    name=f"rtr-{index}",
+                    device="10.0.0.1",
+                    platform="cisco_ios"
+                )
+            )
+            for index in range(5)
+        ))
+
+        assert all(response.success for response in responses)
+        assert {response.hostname for response in responses} == {"rtr-4"}
+        assert transport.commands_sent == 1
+        assert service.scheduler.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_skips_unchanged_value(self) -> None:
+        """Test re-sending an applied hostname does not push to the device."""
+        transport = SimulatedTransport()
+        service = NetworkConfigService(pool=ConnectionPool(transport))
+        request = HostnameRequest(
+            name="steady-rtr",
+            device="10.0.0.1",
+            platform="cisco_ios"
+        )
+
+        first = await service.configure_hostname(request)
+        second = await service.configure_hostname(request)
+
+        assert first.cached is False
+        assert second.success is True
+        assert second.cached is True
+        assert "already configured" in second.message
+        assert transport.commands_sent == 1
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_state_expires(self) -> None:
+        """Test the applied-state cache is bypassed once its TTL expires."""
+        transport = SimulatedTransport()
+        service = NetworkConfigService(pool=ConnectionPool(transport), state_ttl=0.0)
+        request = HostnameRequest(
+            name="steady-rtr",
+            device="10.0.0.1",
+            platform="cisco_ios"
+        )
+
+        await service.configure_hostname(request)
+        response = await service.configure_hostname(request)
+
+        assert response.cached is False
+        assert transport.commands_sent == 2
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_idempotency_key(self) -> None:
+        """Test retries with the same idempotency key replay the first result."""
+        transport = SimulatedTransport(command_latency=0.01)
+        service = NetworkConfigService(pool=ConnectionPool(transport), state_ttl=0.0)
+        request = HostnameRequest(
+            name="retry-rtr",
+            device="10.0.0.1",
+            platform="cisco_ios"
+        )
+
+        concurrent = await asyncio.gather(
+            service.configure_hostname(request, idempotency_key="key-1"),
+            service.configure_hostname(request, idempotency_key="key-1")
+        )
+        later = await service.configure_hostname(request, idempotency_key="key-1")
+
+        assert [response.cached for response in concurrent] == [False, True]
+        assert later.cached is True
+        assert later.message == concurrent[0].message
+        assert transport.commands_sent == 1
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_idempotency_key_reuse(
+        self,
+        service: NetworkConfigService
+    ) -> None:
+        """Test reusing an idempotency key for a different request is rejected."""
+        await service.configure_hostname(
+            HostnameRequest(name="rtr-a", device="10.0.0.1", platform="cisco_ios"),
+            idempotency_key="key-2"
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            await service.configure_hostname(
+                HostnameRequest(name="rtr-b", device="10.0.0.1", platform="cisco_ios"),
+                idempotency_key="key-2"
+            )
+
+        assert "already used for a different request" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_idempotency_failure_not_replayed(
+        self,
+        service: NetworkConfigService
+    ) -> None:
+        """Test a failed attempt can be retried with the same key."""
+        request = HostnameRequest(
+            name="dead-rtr",
+            device="10.0.0.254",
+            platform="cisco_ios"
+        )
+
+        first = await service.configure_hostname(request, idempotency_key="key-3")
+        second = await service.configure_hostname(request, idempotency_key="key-3")
+
+        assert first.success is False
+        assert second.success is False
+        assert second.cached is False
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_dry_run(self) -> None:
+        """Test a dry run diffs against the last push without contacting the device."""
+        transport = SimulatedTransport()
+        service = NetworkConfigService(pool=ConnectionPool(transport))
+
+        unknown = await service.configure_hostname(
+            HostnameRequest(name="rtr-1", device="10.0.0.1", platform="juniper_junos"),
+            dry_run=True
+        )
+        assert unknown.dry_run is True
+        assert unknown.commands == ["set system host-name rtr-1"]
+        assert unknown.diff == ["+set system host-name rtr-1"]
+        assert unknown.changed is True
+        assert transport.handshakes == 0
+
+        await service.configure_hostname(
+            HostnameRequest(name="rtr-1", device="10.0.0.1", platform="juniper_junos")
+        )
+        sent = transport.commands_sent
+
+        same = await service.configure_hostname(
+            HostnameRequest(name="rtr-1", device="10.0.0.1", platform="juniper_junos"),
+            dry_run=True
+        )
+        renamed = await service.configure_hostname(
+            HostnameRequest(name="rtr-2", device="10.0.0.1", platform="juniper_junos"),
+            dry_run=True
+        )
+
+        assert same.changed is False
+        assert same.diff == []
+        assert renamed.diff == [
+            "-set system host-name rtr-1",
+            "+set system host-name rtr-2"
+        ]
+        assert transport.commands_sent == sent
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_dry_run_unsupported(
+        self,
+        service: NetworkConfigService
+    ) -> None:
+        """Test a dry run reports unsupported platforms as failures."""
+        response = await service.configure_hostname(
+            HostnameRequest(name="rtr-1", device="10.0.0.1", platform="unsupported"),
+            dry_run=True
+        )
+
+        assert response.success is False
+        assert "Unsupported platform" in response.message
+
+    @pytest.mark.asyncio
+    async def test_configure_hostname_batch_dry_run(self) -> None:
+        """Test a batch dry run plans every device in request order."""
+        transport = SimulatedTransport()
+        service = NetworkConfigService(pool=ConnectionPool(transport))
+        service.snapshots.set("10.4.0.1", HOSTNAME_OPERATION, "edge-1")
+        batch = BatchHostnameRequest(
+            requests=[
+                HostnameRequest(name=f"edge-{index}", device=f"10.4.0.{index}")
+                for index in range(1, 4)
+            ]
+            + [HostnameRequest(name="edge-4", device="10.4.0.4", platform="cisco_ios")]
+        )
+        service.inventory.upsert([Device(ip="10.4.0.1", platform="cisco_ios")])
+
+        response = await service.configure_hostname_batch(batch, dry_run=True)
+
+        assert [result.device for result in response.results] == [
+            f"10.4.0.{index}" for index in range(1, 5)
+        ]
+        assert response.succeeded == 2  # 10.4.0.2 and 10.4.0.3 are not in the inventory
+        assert response.changed == 1
+        assert response.results[0].changed is False
+        assert transport.handshakes == 0
+
+    @pytest.mark.asyncio
+    async def test_configure_operation(self) -> None:
+        """Test a catalog operation pushes its multi-line commands once."""
+        transport = SimulatedTransport()
+        service = NetworkConfigService(pool=ConnectionPool(transport))
+        request = OPERATION_MODELS["vlan"](
+            device="10.0.0.1",
+            platform="cisco_ios",
+            vlan_id=10,
+            name="users"
+        )
+
+        response = await service.configure_operation("vlan", request)
+        again = await service.configure_operation("vlan", request)
+
+        assert response.success is True
+        assert response.commands == ["vlan 10", " name users"]
+        assert transport.commands_sent == 2
+        assert again.cached is True
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_configure_operation_does_not_coalesce_objects(self) -> None:
+        """Test concurrent changes to different objects are all applied."""
+        transport = SimulatedTransport(command_latency=0.01)
+        service = NetworkConfigService(pool=ConnectionPool(transport))
+
+        responses = await asyncio.gather(*(
+            service.configure_operation(
+                "ntp_server",
+                OPERATION_MODELS["ntp_server"](
+                    device="10.0.0.1",
+                    platform="juniper_junos",
+                    server=f"10.0.0.{100 + index}"
+                )
+            )
+            for index in range(3)
+        ))
+
+        assert all(response.success for response in responses)
+        assert transport.commands_sent == 3
+        assert service.scheduler.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_configure_operation_unsupported_platform(
+        self,
+        service: NetworkConfigService
+    ) -> None:
+        """Test an operation without a template for the platform fails without a push."""
+        request = OPERATION_MODELS["vlan"](
+            device="10.0.0.1",
+            platform="cisco_iosxr",
+            vlan_id=10,
+            name="users"
+        )
+
+        response = await service.configure_operation("vlan", request)
+
+        assert response.success is False
+        assert "not supported on platform cisco_iosxr" in response.message
+
+    @pytest.mark.asyncio
+    async def test_configure_change_set(self) -> None:
+        """Test several operations are applied in one session and one commit."""
+        transport = SimulatedTransport()
+        service = NetworkConfigService(pool=ConnectionPool(transport))
+        request = ChangeSetRequest(
+            device="10.0.0.1",
+            platform="cisco_ios",
+            operations=[
+                {"operation": "hostname", "parameters": {"hostname": "edge-1"}},
+                {"operation": "ntp_server", "parameters": {"server": "10.0.0.100"}},
+                {"operation": "banner", "parameters": {"message": "Authorized access only"}},
+            ]
+        )
+
+        response = await service.configure_change_set(request)
+
+        assert response.success is True
+        assert response.commands == [
+            "hostname edge-1",
+            "ntp server 10.0.0.100",
+            "banner motd ^Authorized access only^"
+        ]
+        assert [result.operation for result in response.results] == [
+            "hostname", "ntp_server", "banner"
+        ]
+        assert all(result.success for result in response.results)
+        assert transport.handshakes == 1
+        assert transport.commits == 1
+        assert service.snapshots.get("10.0.0.1", "hostname") == "edge-1"
+
+        again = await service.configure_change_set(request)
+        hostname = await service.configure_hostname(
+            HostnameRequest(name="edge-1", device="10.0.0.1", platform="cisco_ios")
+        )
+
+        assert again.commands == []
+        assert all(result.cached for result in again.results)
+        assert hostname.cached is True
+        assert transport.commits == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_coalesced_write_runs_after_interleaved_change_set(self) -> None:
+        """Test a coalesced hostname write never jumps ahead of a change set."""
+        transport = SimulatedTransport(command_latency=0.01)
+        service = NetworkConfigService(pool=ConnectionPool(transport))
+
+        def hostname(name: str) -> HostnameRequest:
+            return HostnameRequest(name=name, device="10.0.0.1", platform="cisco_ios")
+
+        async def queued(depth: int) -> None:
+            while service.scheduler.stats().queue_depths.get("10.0.0.1", 0) < depth:
+                await asyncio.sleep(0.001)
+
+        first = asyncio.create_task(service.configure_hostname(hostname("a")))
+        await asyncio.sleep(0.005)
+        second = asyncio.create_task(service.configure_hostname(hostname("b")))
+        await queued(1)
+        change_set = asyncio.create_task(service.configure_change_set(ChangeSetRequest(
+            device="10.0.0.1",
+            platform="cisco_ios",
+            operations=[{"operation": "hostname", "parameters": {"hostname": "c"}}]
+        )))
+        await queued(2)
+        latest = asyncio.create_task(service.configure_hostname(hostname("d")))
+        results = await asyncio.gather(first, second, change_set, latest)
+
+        assert results[1].hostname == results[3].hostname == "d"
+        assert "hostname d" in transport.running_config("10.0.0.1")
+        assert "hostname c" not in transport.running_config("10.0.0.1")
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_configure_change_set_unsupported_operation(self) -> None:
+        """Test a change set with an unsupported operation applies nothing."""
+        transport = SimulatedTransport()
+        service = NetworkConfigService(pool=ConnectionPool(transport))
+        request = ChangeSetRequest(
+            device="10.0.0.1",
+            platform="cisco_iosxr",
+            operations=[
+                {"operation": "hostname", "parameters": {"hostname": "edge-1"}},
+                {"operation": "vlan", "parameters": {"vlan_id": 10, "name": "users"}},
+            ]
+        )
+
+        response = await service.configure_change_set(request)
+
+        assert response.success is False
+        assert "not supported on platform cisco_iosxr" in response.results[1].message
+        assert response.results[0].success is False
+        assert transport.handshakes == 0
+
+    @pytest.mark.asyncio
+    async def test_configure_change_set_unreachable(
+        self,
+        service: NetworkConfigService
+    ) -> None:
+        """Test every operation fails when the device cannot be reached."""
+        request = ChangeSetRequest(
+            device="10.0.0.254",
+            platform="arista_eos",
+            operations=[
+                {"operation": "hostname", "parameters": {"hostname": "edge-1"}},
+                {"operation": "vlan", "parameters": {"vlan_id": 10, "name": "users"}},
+            ]
+        )
+
+        response = await service.configure_change_set(request)
+
+        assert response.success is False
+        assert response.commands == ["hostname edge-1", "vlan 10", " name users"]
+        assert not any(result.success for result in response.results)
+
+    @pytest.mark.asyncio
+    async def test_capture_config(self) -> None:
+        """Test captured configs reflect pushes and unchanged configs are reused."""
+        transport = SimulatedTransport(base_config=["hostname router", "ntp server 10.0.0.100"])
+        service = NetworkConfigService(pool=ConnectionPool(transport))
+
+        before = await service.capture_config("10.0.0.1", "cisco_ios")
+        await service.configure_hostname(
+            HostnameRequest(name="rtr-1", device="10.0.0.1", platform="cisco_ios")
+        )
+        after = await service.capture_config("10.0.0.1", "cisco_ios")
+        again = await service.capture_config("10.0.0.1", "cisco_ios")
+
+        assert service.config_snapshots.read(after.id) == "hostname rtr-1\nntp server 10.0.0.100\n"
+        assert service.config_snapshots.diff(before.id, after.id) == [
+            "-hostname router",
+            "+hostname rtr-1"
+        ]
+        assert again == after
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_capture_config_unknown_device(
+        self,
+        service: NetworkConfigService
+    ) -> None:
+        """Test capturing a device without a known platform raises ValueError."""
+        with pytest.raises(ValueError):
+            await service.capture_config("10.0.0.1")
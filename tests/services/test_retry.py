@@ -0,0 +1,103 @@
+"""Tests for the retry policy and per-device circuit breakers."""
+
+import pytest
+
+from netconfig_api.models.requests import BreakerState
+from netconfig_api.services.retry import CircuitBreakers, CircuitOpenError, RetryPolicy
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy."""
+
+    def test_backoff_grows_and_is_capped(self) -> None:
+        """Test backoff delays stay within the exponential bound and the cap."""
+        policy = RetryPolicy(base_delay=0.5, max_delay=3.0)
+
+        for _ in range(100):
+            assert 0.0 <= policy.backoff(1) <= 0.5
+            assert 0.0 <= policy.backoff(2) <= 1.0
+            assert 0.0 <= policy.backoff(10) <= 3.0
+
+    def test_backoff_is_jittered(self) -> None:
+        """Test backoff delays are spread out rather than fixed."""
+        policy = RetryPolicy(base_delay=1.0)
+
+        assert len({policy.backoff(3) for _ in range(20)}) > 1
+
+
+class TestCircuitBreakers:
+    """Test cases for CircuitBreakers."""
+
+    def test_opens_at_threshold(self) -> None:
+        """Test a breaker opens after consecutive failures and rejects operations."""
+        breakers = CircuitBreakers(failure_threshold=3, reset_timeout=60.0)
+
+        for _ in range(2):
+            breakers.check("10.0.0.1")
+            breakers.record_failure("10.0.0.1")
+        assert breakers.state("10.0.0.1") is BreakerState.CLOSED
+
+        breakers.record_failure("10.0.0.1")
+
+        assert breakers.state("10.0.0.1") is BreakerState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breakers.check("10.0.0.1")
+        breakers.check("10.0.0.2")
+
+    def test_success_resets_failures(self) -> None:
+        """Test a success clears the failure count of a closed breaker."""
+        breakers = CircuitBreakers(failure_threshold=2)
+
+        breakers.record_failure("10.0.0.1")
+        breakers.record_success("10.0.0.1")
+        breakers.record_failure("10.0.0.1")
+
+        assert breakers.state("10.0.0.1") is BreakerState.CLOSED
+        assert breakers.stats().devices["10.0.0.1"].consecutive_failures == 1
+
+    def test_half_open_probe(self) -> None:
+        """Test one probe is let through after the reset timeout and closes the breaker."""
+        breakers = CircuitBreakers(failure_threshold=1, reset_timeout=0.0)
+        breakers.record_failure("10.0.0.1")
+
+        breakers.check("10.0.0.1")
+
+        assert breakers.state("10.0.0.1") is BreakerState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breakers.check("10.0.0.1")
+
+        breakers.record_success("10.0.0.1")
+
+        assert breakers.state("10.0.0.1") is BreakerState.CLOSED
+        assert breakers.stats().devices == {}
+
+    def test_failed_probe_reopens_for_longer(self) -> None:
+        """Test a failed probe reopens the breaker with a doubled reset timeout."""
+        breakers = CircuitBreakers(failure_threshold=1, reset_timeout=0.0)
+        breakers.record_failure("10.0.0.1")
+        breakers.check("10.0.0.1")
+        breakers.reset_timeout = 60.0
+
+        breakers.record_failure("10.0.0.1")
+
+        stats = breakers.stats()
+        assert stats.open == 1
+        device = stats.devices["10.0.0.1"]
+        assert device.state is BreakerState.OPEN
+        assert device.trips == 2
+        assert device.consecutive_failures == 2
+        assert device.retry_at is not None
+        with pytest.raises(CircuitOpenError):
+            breakers.check("10.0.0.1")
+
+    def test_released_probe_lets_next_operation_probe(self) -> None:
+        """Test a probe ended without a verdict does not leave the breaker half-open."""
+        breakers = CircuitBreakers(failure_threshold=1, reset_timeout=0.0)
+        breakers.record_failure("10.0.0.1")
+        breakers.check("10.0.0.1")
+
+        breakers.release("10.0.0.1")
+
+        assert breakers.state("10.0.0.1") is BreakerState.OPEN
+        breakers.check("10.0.0.1")
+        assert breakers.state("10.0.0.1") is BreakerState.HALF_OPEN
@@ -0,0 +1,128 @@
+"""Tests for the per-device operation scheduler."""
+
+import asyncio
+import contextvars
+
+import pytest
+
+from netconfig_api.services.scheduler import DeviceScheduler
+
+_CALLER: contextvars.ContextVar[str] = contextvars.ContextVar("caller", default="none")
+
+
+class TestDeviceScheduler:
+    """Test cases for DeviceScheduler."""
+
+    @pytest.fixture
+    def scheduler(self) -> DeviceScheduler:
+        """Create a DeviceScheduler instance for testing."""
+        return DeviceScheduler()
+
+    @pytest.mark.asyncio
+    async def test_serializes_same_device(self, scheduler: DeviceScheduler) -> None:
+        """Test operations on one device never overlap."""
+        in_flight = 0
+        peak = 0
+
+        async def operation(value: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return value
+
+        results = await asyncio.gather(*(
+            scheduler.run("10.0.0.1", f"op-{value}", lambda value=value: operation(value))
+            for value in range(5)
+        ))
+
+        assert results == [0, 1, 2, 3, 4]
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_parallel_across_devices(self, scheduler: DeviceScheduler) -> None:
+        """Test operations on different devices run concurrently."""
+        in_flight = 0
+        peak = 0
+
+        async def operation() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await asyncio.gather(*(
+            scheduler.run(f"10.0.0.{index}", "hostname", operation)
+            for index in range(1, 11)
+        ))
+
+        assert peak == 10
+
+    @pytest.mark.asyncio
+    async def test_coalesces_pending_writes(self, scheduler: DeviceScheduler) -> None:
+        """Test superseded pending writes are skipped and share the latest result."""
+        applied: list[str] = []
+        release = asyncio.Event()
+
+        async def apply(value: str) -> str:
+            if value == "first":
+                await release.wait()
+            applied.append(value)
+            return value
+
+        first = asyncio.create_task(
+            scheduler.run("10.0.0.1", "hostname", lambda: apply("first"))
+        )
+        await asyncio.sleep(0)
+        later = [
+            asyncio.create_task(
+                scheduler.run("10.0.0.1", "hostname", lambda value=value: apply(value))
+            )
+            for value in ("second", "third", "fourth")
+        ]
+        await asyncio.sleep(0)
+
+        stats = scheduler.stats()
+        assert stats.queue_depths == {"10.0.0.1": 1}
+        assert stats.active_devices == 1
+
+        release.set()
+        results = await asyncio.gather(first, *later)
+
+        assert applied == ["first", "fourth"]
+        assert results == ["first", "fourth", "fourth", "fourth"]
+        assert scheduler.coalesced == 2
+        assert scheduler.executed == 2
+        assert scheduler.stats().queue_depths == {}
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_callers(
+        self,
+        scheduler: DeviceScheduler
+    ) -> None:
+        """Test an operation error is raised to every coalesced caller."""
+
+        async def fail() -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await scheduler.run("10.0.0.1", "hostname", fail)
+
+        assert scheduler.stats().active_devices == 0
+
+    @pytest.mark.asyncio
+    async def test_runs_in_caller_context(self, scheduler: DeviceScheduler) -> None:
+        """Test each queued operation sees its own caller's context variables."""
+        async def operation() -> str:
+            await asyncio.sleep(0.001)
+            return _CALLER.get()
+
+        async def caller(name: str) -> str:
+            _CALLER.set(name)
+            return await scheduler.run("10.0.0.1", f"op-{name}", operation)
+
+        results = await asyncio.gather(*(caller(f"caller-{index}") for index in range(3)))
+
+        assert results == ["caller-0", "caller-1", "caller-2"]
@@ -0,0 +1,37 @@
+"""Tests for the device state snapshot store."""
+
+from netconfig_api.services.state import StateSnapshotStore
+
+
+class TestStateSnapshotStore:
+    """Test cases for StateSnapshotStore."""
+
+    def test_set_get_forget(self) -> None:
+        """Test values are recorded per device and operation and can be forgotten."""
+        store = StateSnapshotStore()
+
+        assert store.get("10.0.0.1", "hostname") is None
+        store.set("10.0.0.1", "hostname", "rtr-1")
+        store.set("10.0.0.2", "hostname", "rtr-2")
+
+        assert store.get("10.0.0.1", "hostname") == "rtr-1"
+        assert store.get("10.0.0.1", "banner") is None
+        assert len(store) == 2
+
+        store.forget("10.0.0.1", "hostname")
+        store.forget("10.0.0.9", "hostname")
+        assert store.get("10.0.0.1", "hostname") is None
+        assert len(store) == 1
+
+    def test_changed_since(self) -> None:
+        """Test changed devices are reported newest first, once each."""
+        store = StateSnapshotStore()
+        store.set("10.0.0.1", "hostname", "rtr-1")
+        version = store.version
+        store.set("10.0.0.2", "hostname", "rtr-2")
+        store.forget("10.0.0.3", "hostname")
+        store.set("10.0.0.2", "hostname", "rtr-3")
+
+        assert store.changed_since(version) == ["10.0.0.2", "10.0.0.3"]
+        assert store.changed_since(0) == ["10.0.0.2", "10.0.0.3", "10.0.0.1"]
+        assert store.changed_since(store.version) == []
@@ -0,0 +1,198 @@
+"""Tests for multi-device transactions."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from netconfig_api.models.requests import (
+    HostnameRequest,
+    TransactionDeviceStatus,
+    TransactionRequest,
+    TransactionState,
+)
+from netconfig_api.services.network_config import NetworkConfigService
+from netconfig_api.services.retry import RetryPolicy
+from netconfig_api.services.transactions import TransactionCoordinator
+from netconfig_api.transports.pool import ConnectionPool
+from netconfig_api.transports.simulated import SimulatedTransport
+
+
+def _coordinator(transport: SimulatedTransport) -> TransactionCoordinator:
+    """Create a coordinator whose device operations are tried once."""
+    service = NetworkConfigService(
+        pool=ConnectionPool(transport),
+        retry=RetryPolicy(attempts=1)
+    )
+    return TransactionCoordinator(service)
+
+
+def _transaction(*changes: tuple[str, str, str]) -> TransactionRequest:
+    """Build a transaction from (hostname, device, platform) tuples."""
+    return TransactionRequest(requests=[
+        HostnameRequest(name=name, device=device, platform=platform)
+        for name, device, platform in changes
+    ])
+
+
+class TestTransactionCoordinator:
+    """Test cases for TransactionCoordinator."""
+
+    @pytest.mark.asyncio
+    async def test_commit(self) -> None:
+        """Test every device is changed and confirmed commits are confirmed."""
+        transport = SimulatedTransport(base_config=["hostname router"])
+        transport.running_config("10.0.0.2")[:] = ["set system host-name old"]
+        coordinator = _coordinator(transport)
+
+        response = await coordinator.run(_transaction(
+            ("edge-1", "10.0.0.1", "cisco_ios"),
+            ("edge-2", "10.0.0.2", "juniper_junos"),
+        ))
+
+        assert response.state is TransactionState.COMMITTED
+        assert [result.status for result in response.results] == [
+            TransactionDeviceStatus.COMMITTED,
+            TransactionDeviceStatus.COMMITTED
+        ]
+        assert response.results[0].rollback_commands == ["hostname router"]
+        assert response.results[1].rollback_commands == ["set system host-name old"]
+        assert transport.configs["10.0.0.1"] == ["hostname edge-1"]
+        assert transport.configs["10.0.0.2"] == ["set system host-name edge-2"]
+        assert transport.pending_commits == {}
+        assert response.timings.total_ms >= response.timings.commit_ms
+        assert coordinator.service.snapshots.get("10.0.0.1", "hostname") == "edge-1"
+        await coordinator.service.close()
+
+    @pytest.mark.asyncio
+    async def test_abort_when_a_device_cannot_be_prepared(self) -> None:
+        """Test no device is changed when one is unreachable."""
+        transport = SimulatedTransport(base_config=["hostname router"])
+        coordinator = _coordinator(transport)
+
+        response = await coordinator.run(_transaction(
+            ("edge-1", "10.0.0.1", "cisco_ios"),
+            ("edge-2", "10.0.0.254", "cisco_ios"),
+        ))
+
+        assert response.state is TransactionState.ABORTED
+        assert response.results[0].status is TransactionDeviceStatus.PREPARED
+        assert response.results[1].status is TransactionDeviceStatus.FAILED
+        assert response.results[1].error is not None
+        assert transport.configs["10.0.0.1"] == ["hostname router"]
+        assert transport.commands_sent == 0
+        assert response.timings.commit_ms == 0.0
+
+    @pytest.mark.asyncio
+    async def test_unsupported_platform_contacts_no_device(self) -> None:
+        """Test a transaction with an unsupported platform aborts before any device is read."""
+        transport = SimulatedTransport()
+        coordinator = _coordinator(transport)
+
+        response = await coordinator.run(_transaction(
+            ("edge-1", "10.0.0.1", "cisco_ios"),
+            ("edge-2", "10.0.0.2", "unsupported_platform"),
+        ))
+
+        assert response.state is TransactionState.ABORTED
+        assert "Unsupported platform" in (response.results[1].error or "")
+        assert transport.handshakes == 0
+
+    @pytest.mark.asyncio
+    async def test_rollback_after_failed_commit(self) -> None:
+        """Test committed devices are restored when another device rejects its commit."""
+        transport = SimulatedTransport(
+            base_config=["hostname router"],
+            reject_commands=["hostname bad"]
+        )
+        transport.running_config("10.0.0.3")[:] = ["set system host-name old"]
+        coordinator = _coordinator(transport)
+
+        response = await coordinator.run(_transaction(
+            ("edge-1", "10.0.0.1", "cisco_ios"),
+            ("bad-2", "10.0.0.2", "arista_eos"),
+            ("edge-3", "10.0.0.3", "juniper_junos"),
+        ))
+
+        assert response.state is TransactionState.ROLLED_BACK
+        assert [result.status for result in response.results] == [
+            TransactionDeviceStatus.ROLLED_BACK,
+            TransactionDeviceStatus.FAILED,
+            TransactionDeviceStatus.ROLLED_BACK
+        ]
+        assert "rejected" in (response.results[1].error or "")
+        assert transport.configs["10.0.0.1"] == ["hostname router"]
+        assert transport.configs["10.0.0.2"] == ["hostname router"]
+        assert transport.configs["10.0.0.3"] == ["set system host-name old"]
+        assert transport.pending_commits == {}
+        assert response.timings.rollback_ms > 0.0
+        assert coordinator.service.snapshots.get("10.0.0.1", "hostname") is None
+
+    @pytest.mark.asyncio
+    async def test_rollback_removes_setting_without_previous_value(self) -> None:
+        """Test a device with no previous line is rolled back with a no command."""
+        transport = SimulatedTransport(reject_commands=["hostname bad"])
+        coordinator = _coordinator(transport)
+
+        response = await coordinator.run(_transaction(
+            ("edge-1", "10.0.0.1", "cisco_ios"),
+            ("bad-2", "10.0.0.2", "cisco_ios"),
+        ))
+
+        assert response.state is TransactionState.ROLLED_BACK
+        assert response.results[0].rollback_commands == ["no hostname"]
+        assert transport.configs["10.0.0.1"] == []
+
+    @pytest.mark.asyncio
+    async def test_rollback_keeps_write_made_after_prepare(self) -> None:
+        """Test rollback restores the config a device ran just before its commit."""
+        transport = SimulatedTransport(
+            base_config=["hostname router"],
+            command_latency=0.01,
+            reject_commands=["hostname bad"]
+        )
+        coordinator = _coordinator(transport)
+        service = coordinator.service
+
+        transaction = asyncio.create_task(coordinator.run(_transaction(
+            ("edge-1", "10.0.0.1", "cisco_ios"),
+            ("bad-2", "10.0.0.2", "cisco_ios"),
+        )))
+        while service.scheduler.stats().active_devices < 2:
+            await asyncio.sleep(0.001)
+        # Queued behind the prepare step, so it lands before the commit
+        write = await service.configure_hostname(
+            HostnameRequest(name="later", device="10.0.0.1", platform="cisco_ios")
+        )
+        response = await transaction
+
+        assert write.success is True
+        assert response.state is TransactionState.ROLLED_BACK
+        assert response.results[0].rollback_commands == ["hostname later"]
+        assert transport.configs["10.0.0.1"] == ["hostname later"]
+
+    @pytest.mark.asyncio
+    async def test_steps_are_attempted_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test device steps are not retried even when the service retries operations."""
+        transport = SimulatedTransport(reject_commands=["hostname bad"])
+        service = NetworkConfigService(
+            pool=ConnectionPool(transport),
+            retry=RetryPolicy(attempts=3, base_delay=0.0)
+        )
+        coordinator = TransactionCoordinator(service)
+        policies: list[RetryPolicy | None] = []
+        run_on_device = service.run_on_device
+
+        async def recording(*args: Any, retry: RetryPolicy | None = None) -> Any:
+            policies.append(retry)
+            return await run_on_device(*args, retry=retry)
+
+        monkeypatch.setattr(service, "run_on_device", recording)
+
+        await coordinator.run(_transaction(
+            ("edge-1", "10.0.0.1", "cisco_ios"),
+            ("bad-2", "10.0.0.2", "cisco_ios"),
+        ))
+
+        assert len(policies) == 5  # two prepares, two commits, one rollback
+        assert all(policy is not None and policy.attempts == 1 for policy in policies)
@@ -0,0 +1 @@
+"""Snapshot tests module."""
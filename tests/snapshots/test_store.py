@@ -0,0 +1,124 @@
+"""Tests for the config snapshot store."""
+
+from pathlib import Path
+
+import pytest
+
+from netconfig_api.snapshots.store import ConfigSnapshotStore, split_blocks
+
+
+def _config(interfaces: int, description: str = "uplink") -> str:
+    """Build an IOS-style config with one stanza per interface."""
+    lines = ["hostname rtr-1"]
+    for index in range(interfaces):
+        lines += [
+            f"interface Ethernet{index}",
+            f" description {description}-{index}",
+            f" ip address 10.{index // 256}.{index % 256}.1 255.255.255.0",
+            " no shutdown",
+        ]
+    return "".join(f"{line}\n" for line in lines)
+
+
+class TestSplitBlocks:
+    """Test cases for split_blocks."""
+
+    def test_blocks_reassemble(self) -> None:
+        """Test blocks concatenate back to the original config."""
+        config = _config(200).encode()
+        blocks = split_blocks(config)
+
+        assert len(blocks) > 1
+        assert b"".join(blocks) == config
+        assert all(block.endswith(b"\n") for block in blocks)
+
+    def test_edit_changes_few_blocks(self) -> None:
+        """Test a one-line edit leaves most blocks unchanged."""
+        old = _config(200)
+        new = old.replace(" description uplink-100\n", " description core-100\n")
+
+        old_blocks = set(split_blocks(old.encode()))
+        new_blocks = split_blocks(new.encode())
+
+        assert sum(1 for block in new_blocks if block not in old_blocks) == 1
+
+
+class TestConfigSnapshotStore:
+    """Test cases for ConfigSnapshotStore."""
+
+    def test_put_and_read(self) -> None:
+        """Test configs round-trip and history is newest first."""
+        store = ConfigSnapshotStore()
+        first = store.put("10.0.0.1", _config(10), taken_at=1.0)
+        second = store.put("10.0.0.1", _config(11), taken_at=2.0)
+
+        assert store.read(first.id) == _config(10)
+        assert store.read(second.id) == _config(11)
+        assert store.latest("10.0.0.1") == second
+        assert store.history("10.0.0.1") == [second, first]
+        assert store.get(first.id) == first
+        assert store.latest("10.0.0.2") is None
+        store.close()
+
+    def test_unchanged_config_is_not_stored_again(self) -> None:
+        """Test capturing an identical config returns the previous snapshot."""
+        store = ConfigSnapshotStore()
+        first = store.put("10.0.0.1", _config(10))
+
+        assert store.put("10.0.0.1", _config(10)) == first
+        assert store.stats().snapshots == 1
+        store.close()
+
+    def test_blocks_are_deduplicated(self) -> None:
+        """Test identical blocks are stored once across devices and versions."""
+        store = ConfigSnapshotStore()
+        store.put("10.0.0.1", _config(500))
+        single = store.stats()
+        store.put("10.0.0.2", _config(500))
+        store.put("10.0.0.1", _config(500).replace("uplink-250", "core-250"))
+
+        stats = store.stats()
+        assert stats.snapshots == 3
+        assert stats.blocks == single.blocks + 1
+        assert stats.stored_bytes < len(_config(500)) / 2
+        store.close()
+
+    def test_diff(self) -> None:
+        """Test diffs report only the changed lines."""
+        store = ConfigSnapshotStore()
+        old = store.put("10.0.0.1", _config(300))
+        new = store.put(
+            "10.0.0.1",
+            _config(300).replace(" description uplink-7\n", " description core-7\n")
+            + "ntp server 10.0.0.100\n"
+        )
+
+        assert store.diff(old.id, new.id) == [
+            "- description uplink-7",
+            "+ description core-7",
+            "+ntp server 10.0.0.100",
+        ]
+        assert store.diff(new.id, new.id) == []
+        store.close()
+
+    def test_missing_snapshot(self) -> None:
+        """Test reading an unknown snapshot raises KeyError."""
+        store = ConfigSnapshotStore()
+
+        with pytest.raises(KeyError):
+            store.read(42)
+        assert store.get(42) is None
+        store.close()
+
+    def test_shared_directory(self, tmp_path: Path) -> None:
+        """Test stores sharing a directory read each other's snapshots."""
+        writer = ConfigSnapshotStore(str(tmp_path))
+        reader = ConfigSnapshotStore(str(tmp_path))
+        own = reader.put("10.0.0.9", "hostname other\n")
+        assert reader.read(own.id) == "hostname other\n"
+
+        snapshot = writer.put("10.0.0.1", _config(50))
+
+        assert reader.read(snapshot.id) == _config(50)
+        writer.close()
+        reader.close()
@@ -0,0 +1,70 @@
+"""Smoke tests for the benchmark suite."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.run import compare, main, percentile, run_load
+from netconfig_api.main import app
+
+
+class TestBenchmarkHelpers:
+    """Test cases for benchmark helpers."""
+
+    def test_percentile(self) -> None:
+        """Test nearest-rank percentiles."""
+        samples = [float(value) for value in range(1, 101)]
+
+        assert percentile(samples, 0.50) == 50.0
+        assert percentile(samples, 0.99) == 99.0
+        assert percentile([], 0.50) == 0.0
+
+    def test_compare(self) -> None:
+        """Test comparison reports relative change per metric."""
+        baseline = {"micro": {"render": {"iterations": 10, "mean_us": 2.0}}}
+        current = {"micro": {"render": {"iterations": 10, "mean_us": 1.0}}}
+
+        assert compare(current, baseline) == ["micro.render.mean_us: 2.00 -> 1.00 (-50.0%)"]
+
+
+class TestBenchmarkRun:
+    """Test cases for running the benchmark suite."""
+
+    @pytest.mark.asyncio
+    async def test_run_load(self) -> None:
+        """Test the load generator drives the app and reports percentiles."""
+        result = await run_load(app, requests=20, concurrency=4)
+
+        assert result["errors"] == 0
+        assert result["requests_per_second"] > 0
+        assert result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"] <= result["max_ms"]
+
+    def test_main_writes_json(self, tmp_path: Path) -> None:
+        """Test the entry point writes results and compares against a baseline."""
+        output = tmp_path / "results.json"
+        args = [
+            "--iterations", "10",
+            "--requests", "10",
+            "--concurrency", "2",
+            "--inventory-size", "100",
+            "--output", str(output)
+        ]
+
+        main(args)
+        main([*args, "--baseline", str(output)])
+
+        results = json.loads(output.read_text())
+        assert set(results["micro"]) == {
+            "hostname_request_validation",
+            "get_hostname_command_template",
+            "get_command_template",
+            "configure_hostname",
+            "serialize_response_default",
+            "serialize_response_fast",
+            "serialize_batch_1000_default",
+            "serialize_batch_1000_fast",
+            "inventory_resolve_selector",
+            "inventory_select_devices",
+        }
+        assert results["load"]["hostname"]["requests"] == 10
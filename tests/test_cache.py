@@ -0,0 +1,52 @@
+"""Tests for in-memory caches."""
+
+import time
+
+from netconfig_api.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_get_and_set(self) -> None:
+        """Test values can be stored, replaced and removed."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        cache.set("a", 2)
+        assert cache.get("a") == 2
+        assert len(cache) == 1
+
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the least recently used entry is evicted when full."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_entries_expire(self) -> None:
+        """Test entries are dropped once their TTL has passed."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=0.01)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_clear(self) -> None:
+        """Test clear removes every entry."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10)
+        cache.set("a", 1)
+        cache.clear()
+        assert len(cache) == 0
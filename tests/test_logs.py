@@ -0,0 +1,197 @@
+"""Tests for the logging pipeline."""
+
+import io
+import json
+import logging
+import queue
+import sys
+from collections.abc import Iterator
+
+import pytest
+
+from netconfig_api.utils.logs import (
+    LOG_RECORDS_DROPPED,
+    REQUEST_ID,
+    JsonFormatter,
+    LogSettings,
+    RequestContextFilter,
+    _QueueingHandler,
+    configure_logging,
+    stop_logging,
+)
+
+
+def _record(level: int = logging.INFO, msg: str = "hello %s", args: tuple = ("world",)) -> logging.LogRecord:
+    """Create a log record."""
+    return logging.LogRecord("netconfig_api.test", level, __file__, 1, msg, args, None)
+
+
+@pytest.fixture
+def root_logger() -> Iterator[logging.Logger]:
+    """Restore the root logger's handlers and level after the test."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    stop_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestLogSettings:
+    """Test cases for LogSettings."""
+
+    def test_from_env(self) -> None:
+        """Test settings are read from NETCONFIG_LOG_* variables."""
+        settings = LogSettings.from_env({
+            "NETCONFIG_LOG_LEVEL": "WARNING",
+            "NETCONFIG_LOG_FORMAT": "json",
+            "NETCONFIG_LOG_SAMPLE_RATE": "0.1",
+            "NETCONFIG_LOG_QUEUE_SIZE": "500",
+        })
+
+        assert settings == LogSettings(
+            level="warning",
+            json_format=True,
+            sample_rate=0.1,
+            queue_size=500
+        )
+        assert LogSettings.from_env({}) == LogSettings()
+
+    @pytest.mark.parametrize("name, value", [
+        ("NETCONFIG_LOG_LEVEL", "loud"),
+        ("NETCONFIG_LOG_FORMAT", "xml"),
+        ("NETCONFIG_LOG_SAMPLE_RATE", "1.5"),
+        ("NETCONFIG_LOG_QUEUE_SIZE", "0"),
+    ])
+    def test_from_env_invalid(self, name: str, value: str) -> None:
+        """Test invalid values are rejected with the variable's name."""
+        with pytest.raises(ValueError, match=name):
+            LogSettings.from_env({name: value})
+
+
+class TestRequestContextFilter:
+    """Test cases for RequestContextFilter."""
+
+    def test_stamps_request_id(self) -> None:
+        """Test records carry the current request ID, or '-' outside a request."""
+        log_filter = RequestContextFilter()
+        outside = _record()
+        token = REQUEST_ID.set("req-1")
+        try:
+            inside = _record()
+            assert log_filter.filter(inside)
+        finally:
+            REQUEST_ID.reset(token)
+        assert log_filter.filter(outside)
+
+        assert inside.request_id == "req-1"
+        assert outside.request_id == "-"
+
+    def test_sampling_keeps_failures(self) -> None:
+        """Test sampled-out requests still log warnings and errors."""
+        log_filter = RequestContextFilter(sample_rate=0.0)
+        dropped = LOG_RECORDS_DROPPED.labels("sampled")
+        before = dropped.value
+        token = REQUEST_ID.set("req-2")
+        try:
+            assert not log_filter.filter(_record(logging.INFO))
+            assert log_filter.filter(_record(logging.WARNING))
+            assert log_filter.filter(_record(logging.ERROR))
+        finally:
+            REQUEST_ID.reset(token)
+
+        assert log_filter.filter(_record(logging.INFO))
+        assert dropped.value == before + 1
+
+    def test_sampling_is_per_request(self) -> None:
+        """Test a request's records are kept or dropped together."""
+        log_filter = RequestContextFilter(sample_rate=0.5)
+        kept = 0
+        for index in range(1000):
+            token = REQUEST_ID.set(f"request-{index}")
+            try:
+                decisions = {log_filter.filter(_record()) for _ in range(3)}
+            finally:
+                REQUEST_ID.reset(token)
+            assert len(decisions) == 1
+            kept += decisions.pop()
+
+        assert 400 < kept < 600
+
+
+class TestJsonFormatter:
+    """Test cases for JsonFormatter."""
+
+    def test_format(self) -> None:
+        """Test records become one JSON object with extra fields."""
+        record = _record()
+        record.request_id = "req-3"
+        record.device = "10.0.0.1"
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "netconfig_api.test"
+        assert entry["message"] == "hello world"
+        assert entry["request_id"] == "req-3"
+        assert entry["device"] == "10.0.0.1"
+        assert entry["timestamp"].endswith("+00:00")
+
+    def test_format_exception(self) -> None:
+        """Test exceptions are rendered into the entry."""
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed", None, True)
+            record.exc_info = sys.exc_info()
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        assert "request_id" not in entry
+        assert "RuntimeError: boom" in entry["exception"]
+
+
+class TestQueuedLogging:
+    """Test cases for the queued logging pipeline."""
+
+    def test_drops_when_queue_full(self) -> None:
+        """Test records are dropped rather than blocking when the writer falls behind."""
+        handler = _QueueingHandler(queue.Queue(1))
+        dropped = LOG_RECORDS_DROPPED.labels("queue_full")
+        before = dropped.value
+
+        handler.handle(_record())
+        handler.handle(_record())
+
+        assert handler.queue.qsize() == 1
+        assert dropped.value == before + 1
+        assert handler.queue.get_nowait().msg == "hello world"
+
+    def test_configure_logging_json(self, root_logger: logging.Logger) -> None:
+        """Test records are written as JSON lines by the background writer."""
+        stream = io.StringIO()
+        configure_logging(LogSettings(json_format=True), stream=stream)
+
+        token = REQUEST_ID.set("req-4")
+        try:
+            logging.getLogger("netconfig_api.test").info("pushed %d commands", 3)
+        finally:
+            REQUEST_ID.reset(token)
+        stop_logging()
+
+        entry = json.loads(stream.getvalue())
+        assert entry["message"] == "pushed 3 commands"
+        assert entry["request_id"] == "req-4"
+        assert root_logger.handlers == []
+
+    def test_configure_logging_text(self, root_logger: logging.Logger) -> None:
+        """Test text records include the request ID and respect the level."""
+        stream = io.StringIO()
+        configure_logging(LogSettings(level="warning"), stream=stream)
+
+        logging.getLogger("netconfig_api.test").info("hidden")
+        logging.getLogger("netconfig_api.test").warning("shown")
+        stop_logging()
+
+        assert stream.getvalue().rstrip().endswith("netconfig_api.test - WARNING - [-] shown")
+        assert "hidden" not in stream.getvalue()
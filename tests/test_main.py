@@ -2,7 +2,9 @@
 
 from fastapi.testclient import TestClient
 
-from netconfig_api.main import app
+from netconfig_api.main import app, network_config_service
+from netconfig_api.transports.pool import ConnectionPool
+from netconfig_api.transports.registry import LazyTransport
 
 client = TestClient(app)
 
@@ -46,3 +48,20 @@ class TestMainApp:
         data = response.json()
         assert data["info"]["title"] == "NetConfigAPI"
         assert data["info"]["version"] == "0.1.0"
+
+    def test_lifespan_manages_connection_pool(self, monkeypatch) -> None:
+        """Test the application lifespan starts and closes the device pool."""
+        # Closing the shared service's own pool would break every later test
+        pool = ConnectionPool(LazyTransport("simulated"))
+        monkeypatch.setattr(network_config_service, "pool", pool)
+
+        with TestClient(app) as lifespan_client:
+            response = lifespan_client.post(
+                "/api/v1/hostname",
+                json={"name": "pool-rtr", "device": "10.9.0.1", "platform": "cisco_ios"}
+            )
+            assert response.status_code == 200
+            assert response.json()["success"] is True
+            assert pool.open_sessions >= 1
+
+        assert pool.idle_sessions == 0
@@ -0,0 +1,60 @@
+"""Tests for metrics collectors."""
+
+import pytest
+
+from netconfig_api.utils.metrics import Counter, Histogram, Registry
+
+
+class TestMetrics:
+    """Test cases for Counter, Histogram and Registry."""
+
+    def test_counter_render(self) -> None:
+        """Test counters render one sample per label set."""
+        registry = Registry()
+        counter = Counter("requests_total", "Requests", ["outcome"], registry=registry)
+        counter.labels("ok").inc()
+        counter.labels("ok").inc(2)
+        counter.labels('bad"one').inc()
+
+        text = registry.render()
+
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{outcome="ok"} 3.0' in text
+        assert 'requests_total{outcome="bad\\"one"} 1.0' in text
+
+    def test_labels_are_cached(self) -> None:
+        """Test the same child is returned for the same label values."""
+        counter = Counter("cached_total", "Cached", ["a"], registry=Registry())
+
+        assert counter.labels("x") is counter.labels("x")
+
+    def test_wrong_label_count_raises_error(self) -> None:
+        """Test label values must match label names."""
+        counter = Counter("labelled_total", "Labelled", ["a"], registry=Registry())
+
+        with pytest.raises(ValueError):
+            counter.labels("x", "y")
+
+    def test_histogram_render(self) -> None:
+        """Test histogram buckets are cumulative with sum and count."""
+        registry = Registry()
+        histogram = Histogram("latency_seconds", "Latency", buckets=(0.1, 1.0), registry=registry)
+        child = histogram.labels()
+        for value in (0.05, 0.1, 0.5, 5.0):
+            child.observe(value)
+
+        text = registry.render()
+
+        assert 'latency_seconds_bucket{le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{le="1.0"} 3' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+        assert "latency_seconds_sum 5.65" in text
+        assert "latency_seconds_count 4" in text
+
+    def test_duplicate_registration_raises_error(self) -> None:
+        """Test metric names are unique within a registry."""
+        registry = Registry()
+        Counter("dup_total", "Duplicate", registry=registry)
+
+        with pytest.raises(ValueError):
+            Counter("dup_total", "Duplicate", registry=registry)
@@ -3,6 +3,11 @@
 import pytest
 from pydantic import ValidationError
 
+from netconfig_api.models.operations import (
+    OPERATION_MODELS,
+    ChangeSetRequest,
+    OperationRequest,
+)
 from netconfig_api.models.requests import HostnameRequest, HostnameResponse
 
 
@@ -92,10 +97,16 @@ class TestHostnameRequest:
             HostnameRequest()
 
         errors = exc_info.value.errors()
-        assert len(errors) == 3  # name, device, platform
+        assert len(errors) == 2  # name, device
 
         error_fields = {error["loc"][0] for error in errors}
-        assert error_fields == {"name", "device", "platform"}
+        assert error_fields == {"name", "device"}
+
+    def test_platform_is_optional(self) -> None:
+        """Test platform may be omitted and looked up in the inventory."""
+        request = HostnameRequest(name="example-rtr", device="192.168.1.1")
+
+        assert request.platform is None
 
 
 class TestHostnameResponse:
@@ -130,3 +141,65 @@ class TestHostnameResponse:
 
         assert response.success is False
         assert response.message == "Failed to connect to device"
+
+
+class TestOperationModels:
+    """Test cases for request models generated from the operation catalog."""
+
+    def test_model_per_operation(self) -> None:
+        """Test every catalog operation has a named request model."""
+        model = OPERATION_MODELS["ntp_server"]
+
+        assert issubclass(model, OperationRequest)
+        assert model.__name__ == "NtpServerRequest"
+        assert set(model.model_fields) == {"device", "platform", "server"}
+
+    def test_parameters(self) -> None:
+        """Test parameter values are returned as template strings."""
+        request = OPERATION_MODELS["vlan"](device="10.0.0.1", vlan_id=10, name="users")
+
+        assert request.parameters() == {"vlan_id": "10", "name": "users"}
+
+    @pytest.mark.parametrize(
+        "parameters",
+        [
+            {"vlan_id": 0, "name": "users"},
+            {"vlan_id": 4095, "name": "users"},
+            {"vlan_id": 10, "name": "users\nusername evil"},
+            {"vlan_id": 10},
+        ]
+    )
+    def test_catalog_constraints(self, parameters: dict) -> None:
+        """Test catalog constraints are enforced, including on injected commands."""
+        with pytest.raises(ValidationError):
+            OPERATION_MODELS["vlan"](device="10.0.0.1", **parameters)
+
+
+class TestChangeSetRequest:
+    """Test cases for ChangeSetRequest model."""
+
+    def test_operations_validated(self) -> None:
+        """Test each operation is validated by its generated model."""
+        request = ChangeSetRequest(
+            device="10.0.0.1",
+            operations=[
+                {"operation": "ntp_server", "parameters": {"server": "10.0.0.100"}},
+                {"operation": "vlan", "parameters": {"vlan_id": 10, "name": "users"}},
+            ]
+        )
+
+        requests = request.requests()
+        assert [type(item).__name__ for item in requests] == ["NtpServerRequest", "VlanRequest"]
+        assert str(requests[1].device) == "10.0.0.1"
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            {"operation": "unknown", "parameters": {}},
+            {"operation": "vlan", "parameters": {"vlan_id": 10}},
+        ]
+    )
+    def test_invalid_operation(self, operation: dict) -> None:
+        """Test unknown operations and invalid parameters are rejected."""
+        with pytest.raises(ValidationError):
+            ChangeSetRequest(device="10.0.0.1", operations=[operation])
@@ -0,0 +1,84 @@
+"""Tests for cached command rendering."""
+
+import pytest
+
+from netconfig_api.utils.device_platforms import (
+    HOSTNAME_OPERATION,
+    compile_template,
+    get_command_template,
+)
+from netconfig_api.utils.rendering import CommandRenderer
+
+
+class TestCompileTemplate:
+    """Test cases for compile_template."""
+
+    def test_collects_fields_in_order(self) -> None:
+        """Test placeholders are recorded once each, in first-use order."""
+        template = compile_template("cisco_ios", "banner", "{a} {b} {a}")
+
+        assert template.fields == ("a", "b")
+        assert template.render(a="x", b="y") == "x y x"
+
+    def test_rejects_positional_placeholders(self) -> None:
+        """Test templates must use named placeholders."""
+        with pytest.raises(ValueError):
+            compile_template("cisco_ios", "banner", "hostname {}")
+
+
+class TestCommandRenderer:
+    """Test cases for CommandRenderer."""
+
+    def test_render_caches_by_parameters(self) -> None:
+        """Test the same platform, operation and parameters render once."""
+        renderer = CommandRenderer()
+        template = get_command_template("juniper_junos", HOSTNAME_OPERATION)
+        assert template is not None
+
+        first = renderer.render(template, {"hostname": "edge-1"})
+        second = renderer.render(template, {"hostname": "edge-1", "unused": "x"})
+
+        assert first == second == "set system host-name edge-1"
+        assert len(renderer._cache) == 1
+
+    def test_render_missing_parameter(self) -> None:
+        """Test a missing placeholder value raises KeyError."""
+        renderer = CommandRenderer()
+        template = get_command_template("cisco_ios", HOSTNAME_OPERATION)
+        assert template is not None
+
+        with pytest.raises(KeyError):
+            renderer.render(template, {})
+
+    def test_render_batch_preserves_order(self) -> None:
+        """Test batch rendering groups by platform but returns input order."""
+        renderer = CommandRenderer()
+        ios = get_command_template("cisco_ios", HOSTNAME_OPERATION)
+        junos = get_command_template("juniper_junos", HOSTNAME_OPERATION)
+        assert ios is not None and junos is not None
+
+        rendered = renderer.render_batch([
+            (ios, {"hostname": "a"}),
+            (junos, {"hostname": "a"}),
+            (ios, {"hostname": "a"}),
+            (ios, {"hostname": "b"}),
+        ])
+
+        assert rendered == [
+            "hostname a",
+            "set system host-name a",
+            "hostname a",
+            "hostname b",
+        ]
+        assert len(renderer._cache) == 3
+
+    def test_clear(self) -> None:
+        """Test clearing drops every cached command set."""
+        renderer = CommandRenderer()
+        template = get_command_template("cisco_ios", HOSTNAME_OPERATION)
+        assert template is not None
+        renderer.render(template, {"hostname": "a"})
+
+        renderer.clear()
+
+        assert len(renderer._cache) == 0
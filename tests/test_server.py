@@ -0,0 +1,159 @@
+"""Tests for the production server launcher."""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+
+from netconfig_api.server import (
+    ServerSettings,
+    _worker_max_requests,
+    available_cpus,
+    bind_socket,
+    build_config,
+)
+
+
+def _free_port() -> int:
+    """Find a free TCP port on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+class TestServerSettings:
+    """Test cases for ServerSettings."""
+
+    def test_defaults(self) -> None:
+        """Test defaults use a single worker."""
+        settings = ServerSettings.from_env({})
+
+        assert settings.workers == 1
+        assert settings.port == 8000
+        assert settings.reuse_port is True
+        assert settings.preload is True
+
+    def test_from_env(self) -> None:
+        """Test settings are read from NETCONFIG_* variables."""
+        settings = ServerSettings.from_env({
+            "NETCONFIG_HOST": "127.0.0.1",
+            "NETCONFIG_PORT": "9000",
+            "NETCONFIG_WORKERS": "4",
+            "NETCONFIG_LOOP": "uvloop",
+            "NETCONFIG_HTTP": "httptools",
+            "NETCONFIG_REUSE_PORT": "false",
+            "NETCONFIG_PRELOAD": "0",
+            "NETCONFIG_MAX_REQUESTS": "1000",
+            "NETCONFIG_MAX_REQUESTS_JITTER": "100",
+            "NETCONFIG_GRACEFUL_TIMEOUT": "5",
+            "NETCONFIG_LOG_LEVEL": "WARNING",
+        })
+
+        assert settings == ServerSettings(
+            host="127.0.0.1",
+            port=9000,
+            workers=4,
+            loop="uvloop",
+            http="httptools",
+            reuse_port=False,
+            preload=False,
+            max_requests=1000,
+            max_requests_jitter=100,
+            graceful_timeout=5.0,
+            log_level="warning"
+        )
+
+    def test_workers_auto(self) -> None:
+        """Test NETCONFIG_WORKERS=auto uses the available CPUs."""
+        settings = ServerSettings.from_env({"NETCONFIG_WORKERS": "auto"})
+
+        assert settings.workers == available_cpus()
+
+    @pytest.mark.parametrize(
+        "environ",
+        [
+            {"NETCONFIG_PORT": "http"},
+            {"NETCONFIG_LOOP": "trio"},
+            {"NETCONFIG_WORKERS": "0"},
+        ]
+    )
+    def test_invalid_values_raise_error(self, environ: dict[str, str]) -> None:
+        """Test invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            ServerSettings.from_env(environ)
+
+
+class TestServerHelpers:
+    """Test cases for launcher helpers."""
+
+    def test_bind_socket_reuse_port(self) -> None:
+        """Test two sockets can share a port with SO_REUSEPORT."""
+        settings = ServerSettings(host="127.0.0.1", port=_free_port())
+
+        first = bind_socket(settings)
+        second = bind_socket(settings)
+        try:
+            assert first.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT) == 1
+            assert first.getsockname() == second.getsockname()
+        finally:
+            first.close()
+            second.close()
+
+    def test_worker_max_requests_jitter(self) -> None:
+        """Test request limits include jitter and are disabled by default."""
+        settings = ServerSettings(max_requests=100, max_requests_jitter=10)
+
+        assert _worker_max_requests(ServerSettings()) is None
+        assert all(100 <= (_worker_max_requests(settings) or 0) <= 110 for _ in range(50))
+
+    def test_build_config(self) -> None:
+        """Test settings are passed through to uvicorn."""
+        settings = ServerSettings(loop="asyncio", http="h11", keepalive_timeout=9)
+
+        config = build_config(settings, "netconfig_api.main:app", 500)
+
+        assert config.loop == "asyncio"
+        assert config.http == "h11"
+        assert config.timeout_keep_alive == 9
+        assert config.limit_max_requests == 500
+
+
+class TestServerProcess:
+    """End-to-end test of the multi-worker launcher."""
+
+    def test_multi_worker_serves_and_shuts_down(self) -> None:
+        """Test workers serve requests and exit cleanly on SIGTERM."""
+        port = _free_port()
+        env = {
+            **os.environ,
+            "NETCONFIG_HOST": "127.0.0.1",
+            "NETCONFIG_PORT": str(port),
+            "NETCONFIG_WORKERS": "2",
+            "NETCONFIG_GRACEFUL_TIMEOUT": "5",
+            "NETCONFIG_LOG_LEVEL": "warning",
+        }
+        process = subprocess.Popen(
+            [sys.executable, "-m", "netconfig_api.server"],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        try:
+            for _ in range(100):
+                try:
+                    response = httpx.get(f"http://127.0.0.1:{port}/health")
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.1)
+            else:
+                pytest.fail("Server did not start")
+
+            assert response.status_code == 200
+        finally:
+            process.send_signal(signal.SIGTERM)
+            assert process.wait(timeout=15) == 0
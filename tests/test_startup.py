@@ -0,0 +1,69 @@
+"""Tests for the cold-start profile and its budget."""
+
+import pytest
+
+from benchmarks.startup import (
+    STARTUP_BUDGET_MS,
+    by_package,
+    check_budget,
+    measure_first_request,
+    parse_importtime,
+)
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2000 |       2500 |   fastapi.routing
+import time:      1000 |       5000 | fastapi
+"""
+
+
+class TestStartupHelpers:
+    """Test cases for startup profile helpers."""
+
+    def test_parse_importtime(self) -> None:
+        """Test the importtime report is parsed into milliseconds per module."""
+        imports = parse_importtime(IMPORTTIME)
+
+        assert [entry["module"] for entry in imports] == ["_io", "fastapi.routing", "fastapi"]
+        assert imports[2] == {"module": "fastapi", "self_ms": 1.0, "cumulative_ms": 5.0}
+
+    def test_by_package(self) -> None:
+        """Test own import times are totalled per top-level package."""
+        assert by_package(parse_importtime(IMPORTTIME)) == {"fastapi": 3.0, "_io": 0.12}
+
+    def test_check_budget(self) -> None:
+        """Test slow starts and eagerly loaded modules are reported."""
+        results = {
+            "import_ms": 100.0,
+            "first_request_ms": 900.0,
+            "lazy_loaded": ["netconfig_api.transports.simulated"],
+        }
+
+        assert check_budget(results, {"import_ms": 500.0, "first_request_ms": 500.0}) == [
+            "first_request_ms: 900 ms exceeds budget of 500 ms",
+            "netconfig_api.transports.simulated is imported at startup instead of on first use",
+        ]
+
+
+class TestStartupBudget:
+    """Test the application starts within its budget."""
+
+    def test_lazy_modules_not_loaded_at_startup(self) -> None:
+        """Test a fresh process answers its first request without loading lazy modules."""
+        assert measure_first_request()["lazy_loaded"] == []
+
+    @pytest.mark.benchmark
+    def test_cold_start_within_budget(self) -> None:
+        """Test a fresh process imports the app and answers in budget.
+
+        Wall-clock budgets are only meaningful on a quiet machine, so this is
+        deselected by default and run with ``pytest -m benchmark``.
+        """
+        samples = [measure_first_request() for _ in range(3)]
+        best = {
+            "import_ms": min(sample["import_ms"] for sample in samples),
+            "first_request_ms": min(sample["first_request_ms"] for sample in samples),
+        }
+
+        assert check_budget(best, STARTUP_BUDGET_MS) == []
@@ -0,0 +1,82 @@
+"""Tests for streaming utilities."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable
+
+import pytest
+
+from netconfig_api.utils.streaming import bounded_as_completed, iter_lines
+
+
+async def _chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    """Yield the given chunks as an async stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+class TestIterLines:
+    """Test cases for iter_lines function."""
+
+    @pytest.mark.asyncio
+    async def test_splits_lines_across_chunks(self) -> None:
+        """Test that lines split across chunk boundaries are reassembled."""
+        lines = [
+            line async for line in iter_lines(
+                _chunks(b'{"a": 1}\n{"b"', b': 2}\n\n  \n{"c": 3}')
+            )
+        ]
+
+        assert lines == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+    @pytest.mark.asyncio
+    async def test_line_too_long_raises_error(self) -> None:
+        """Test that an unterminated oversized line raises ValueError."""
+        with pytest.raises(ValueError) as exc_info:
+            async for _ in iter_lines(_chunks(b"x" * 20), max_line_bytes=10):
+                pass
+
+        assert "exceeds 10 bytes" in str(exc_info.value)
+
+
+class TestBoundedAsCompleted:
+    """Test cases for bounded_as_completed function."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self) -> None:
+        """Test that results are yielded as soon as each awaitable finishes."""
+
+        async def delayed(value: int, delay: float) -> int:
+            await asyncio.sleep(delay)
+            return value
+
+        async def jobs() -> AsyncIterator[Awaitable[int]]:
+            yield delayed(1, 0.05)
+            yield delayed(2, 0.0)
+            yield delayed(3, 0.02)
+
+        results = [result async for result in bounded_as_completed(jobs(), 3)]
+
+        assert results == [2, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_respects_limit(self) -> None:
+        """Test that no more than the limit of awaitables run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def job(value: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return value
+
+        async def jobs() -> AsyncIterator[Awaitable[int]]:
+            for value in range(20):
+                yield job(value)
+
+        results = [result async for result in bounded_as_completed(jobs(), 3)]
+
+        assert sorted(results) == list(range(20))
+        assert peak == 3
@@ -0,0 +1,291 @@
+"""Tests for request tracing."""
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any
+
+import pytest
+
+from netconfig_api.utils.tracing import (
+    NOOP_SPAN,
+    InMemoryExporter,
+    OTLPExporter,
+    Span,
+    SpanKind,
+    Tracer,
+    TraceSettings,
+    otlp_payload,
+    parse_traceparent,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture
+def exporter() -> InMemoryExporter:
+    """Create an exporter collecting spans."""
+    return InMemoryExporter()
+
+
+@pytest.fixture
+def tracer(exporter: InMemoryExporter) -> Tracer:
+    """Create a tracer sampling every request."""
+    return Tracer(exporter, sample_rate=1.0)
+
+
+class TestTraceContext:
+    """Test cases for W3C trace-context parsing."""
+
+    def test_parse_traceparent(self) -> None:
+        """Test a valid header is parsed with its sampled flag and trace state."""
+        context = parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01", "vendor=abc")
+
+        assert context is not None
+        assert context.trace_id == TRACE_ID
+        assert context.span_id == PARENT_ID
+        assert context.sampled
+        assert context.trace_state == "vendor=abc"
+        assert context.traceparent == f"00-{TRACE_ID}-{PARENT_ID}-01"
+
+    @pytest.mark.parametrize("value", [
+        "",
+        "garbage",
+        f"00-{TRACE_ID}-{PARENT_ID}-01-extra",
+        f"ff-{TRACE_ID}-{PARENT_ID}-01",
+        f"00-{'0' * 32}-{PARENT_ID}-01",
+        f"00-{TRACE_ID}-{'0' * 16}-01",
+        f"00-{TRACE_ID.upper()}-{PARENT_ID}-01",
+    ])
+    def test_parse_invalid_traceparent(self, value: str) -> None:
+        """Test malformed headers are ignored."""
+        assert parse_traceparent(value) is None
+
+    def test_parse_future_version(self) -> None:
+        """Test later versions are parsed by their first four fields."""
+        context = parse_traceparent(f"01-{TRACE_ID}-{PARENT_ID}-00-more")
+
+        assert context is not None
+        assert not context.sampled
+
+
+class TestTracer:
+    """Test cases for Tracer."""
+
+    def test_disabled_without_exporter(self) -> None:
+        """Test nothing is traced without an exporter."""
+        tracer = Tracer(sample_rate=1.0)
+
+        assert tracer.start_trace("GET /") is NOOP_SPAN
+        assert tracer.span("child") is NOOP_SPAN
+
+    def test_unsampled(self, exporter: InMemoryExporter) -> None:
+        """Test unsampled requests produce no-op spans all the way down."""
+        tracer = Tracer(exporter, sample_rate=0.0)
+
+        with tracer.start_trace("GET /") as root:
+            with tracer.span("child") as child:
+                child.set_attribute("key", "value")
+            tracer.record("wait", 0.1)
+
+        assert root is NOOP_SPAN
+        assert exporter.spans == []
+
+    def test_span_tree(self, tracer: Tracer, exporter: InMemoryExporter) -> None:
+        """Test children share the root's trace and point at their parents."""
+        with tracer.start_trace("GET /", **{"http.method": "GET"}) as root:
+            with tracer.span("child", kind=SpanKind.CLIENT, device="10.0.0.1") as child:
+                with tracer.span("grandchild") as grandchild:
+                    pass
+            tracer.record("wait", 0.5)
+
+        assert [span.name for span in exporter.spans] == ["grandchild", "child", "wait", "GET /"]
+        assert {span.context.trace_id for span in exporter.spans} == {root.context.trace_id}
+        assert root.parent_id is None
+        assert child.parent_id == root.context.span_id
+        assert grandchild.parent_id == child.context.span_id
+        assert child.kind is SpanKind.CLIENT
+        assert child.attributes == {"device": "10.0.0.1"}
+        wait = exporter.named("wait")[0]
+        assert wait.end_ns - wait.start_ns == pytest.approx(500_000_000, rel=0.01)
+        assert tracer.current() is None
+
+    def test_record_since_parent_start(self, tracer: Tracer, exporter: InMemoryExporter) -> None:
+        """Test a recorded span without a duration starts with its parent."""
+        with tracer.start_trace("GET /") as root:
+            tracer.record("validation")
+
+        assert exporter.named("validation")[0].start_ns == root.start_ns
+
+    def test_continues_remote_trace(self, exporter: InMemoryExporter) -> None:
+        """Test an incoming traceparent's trace and sampling decision are kept."""
+        tracer = Tracer(exporter, sample_rate=0.0)
+
+        with tracer.start_trace("GET /", f"00-{TRACE_ID}-{PARENT_ID}-01", "vendor=abc") as root:
+            pass
+        unsampled = tracer.start_trace("GET /", f"00-{TRACE_ID}-{PARENT_ID}-00")
+
+        assert root.context.trace_id == TRACE_ID
+        assert root.parent_id == PARENT_ID
+        assert root.context.trace_state == "vendor=abc"
+        assert unsampled is NOOP_SPAN
+
+    def test_records_exceptions(self, tracer: Tracer, exporter: InMemoryExporter) -> None:
+        """Test an exception leaving a span marks it as failed."""
+        with pytest.raises(RuntimeError):
+            with tracer.start_trace("GET /"):
+                raise RuntimeError("boom")
+
+        assert exporter.spans[0].error == "RuntimeError: boom"
+
+    @pytest.mark.asyncio
+    async def test_spans_follow_tasks(self, tracer: Tracer, exporter: InMemoryExporter) -> None:
+        """Test spans opened in tasks a request starts are children of its span."""
+        async def work(index: int) -> None:
+            with tracer.span(f"work-{index}"):
+                await asyncio.sleep(0.001)
+
+        with tracer.start_trace("GET /") as root:
+            await asyncio.gather(*(asyncio.create_task(work(index)) for index in range(3)))
+
+        assert {span.parent_id for span in exporter.spans if span is not root} == {
+            root.context.span_id
+        }
+
+
+class TestTraceSettings:
+    """Test cases for TraceSettings."""
+
+    def test_from_env(self) -> None:
+        """Test settings are read from NETCONFIG_TRACE_* variables."""
+        settings = TraceSettings.from_env({
+            "NETCONFIG_TRACE_ENDPOINT": "http://collector:4318/v1/traces",
+            "NETCONFIG_TRACE_SAMPLE_RATE": "0.05",
+        })
+
+        assert settings == TraceSettings(
+            endpoint="http://collector:4318/v1/traces",
+            sample_rate=0.05
+        )
+        assert TraceSettings.from_env({}) == TraceSettings()
+
+    def test_from_env_invalid(self) -> None:
+        """Test an out of range sample rate is rejected."""
+        with pytest.raises(ValueError, match="NETCONFIG_TRACE_SAMPLE_RATE"):
+            TraceSettings.from_env({"NETCONFIG_TRACE_SAMPLE_RATE": "2"})
+
+
+class _RecordingExporter(OTLPExporter):
+    """OTLP exporter that records batches instead of posting them."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__("http://collector.invalid/v1/traces", **kwargs)
+        self.batches: list[list[str]] = []
+        self.sent = threading.Event()
+
+    def _send(self, spans: list[Span]) -> None:
+        self.batches.append([span.name for span in spans])
+        self.sent.set()
+
+
+class _Collector(BaseHTTPRequestHandler):
+    """OTLP/HTTP endpoint recording posted payloads."""
+
+    payloads: list[dict[str, Any]] = []
+
+    def do_POST(self) -> None:
+        """Record the payload."""
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.payloads.append(json.loads(body))
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep test output quiet."""
+
+
+@pytest.fixture
+def collector() -> Iterator[str]:
+    """Run a local OTLP/HTTP endpoint and return its traces URL."""
+    _Collector.payloads = []
+    server = HTTPServer(("127.0.0.1", 0), _Collector)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1/traces"
+    server.shutdown()
+    server.server_close()
+
+
+class TestOTLPExport:
+    """Test cases for OTLP export."""
+
+    def test_payload(self, tracer: Tracer, exporter: InMemoryExporter) -> None:
+        """Test spans are encoded as an OTLP JSON export request."""
+        with tracer.start_trace("GET /", f"00-{TRACE_ID}-{PARENT_ID}-01", attempt=2):
+            pass
+        exporter.spans[0].set_error("failed")
+
+        payload = otlp_payload(exporter.spans, "netconfig-api")
+
+        resource_spans = payload["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "netconfig-api"}}
+        ]
+        span = resource_spans["scopeSpans"][0]["spans"][0]
+        assert span["traceId"] == TRACE_ID
+        assert span["parentSpanId"] == PARENT_ID
+        assert span["kind"] == 2
+        assert span["attributes"] == [{"key": "attempt", "value": {"intValue": "2"}}]
+        assert span["status"] == {"code": 2, "message": "failed"}
+        assert int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
+
+    def test_batch_waits_for_interval(self) -> None:
+        """Test spans arriving within the interval are sent as one batch."""
+        exporter = _RecordingExporter(interval=0.2)
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        with tracer.start_trace("first"):
+            pass
+        time.sleep(0.05)
+        with tracer.start_trace("second"):
+            pass
+
+        assert not exporter.batches
+        assert exporter.sent.wait(1.0)
+        assert exporter.batches == [["first", "second"]]
+        exporter.shutdown()
+
+    def test_full_batch_is_sent_early(self) -> None:
+        """Test a batch is sent as soon as it is full, and the rest on shutdown."""
+        exporter = _RecordingExporter(batch_size=2, interval=60.0)
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        for name in ("a", "b", "c"):
+            with tracer.start_trace(name):
+                pass
+
+        assert exporter.sent.wait(1.0)
+        assert exporter.batches == [["a", "b"]]
+        exporter.shutdown()
+        assert exporter.batches == [["a", "b"], ["c"]]
+
+    def test_exporter_posts_batches(self, collector: str) -> None:
+        """Test the exporter sends queued spans to the collector on shutdown."""
+        exporter = OTLPExporter(collector, interval=60.0)
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        with tracer.start_trace("GET /"):
+            with tracer.span("child"):
+                pass
+        exporter.shutdown()
+
+        spans = [
+            span
+            for payload in _Collector.payloads
+            for span in payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        ]
+        assert [span["name"] for span in spans] == ["child", "GET /"]
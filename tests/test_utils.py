@@ -1,11 +1,20 @@
 """Tests for device platform utilities."""
 
+import json
+from pathlib import Path
+
 import pytest
 
 from netconfig_api.utils.device_platforms import (
+    COMMAND_REGISTRY,
+    HOSTNAME_OPERATION,
+    OPERATIONS,
+    SUPPORTED_PLATFORMS,
     SupportedPlatform,
+    get_command_template,
     get_hostname_command_template,
     get_supported_platforms,
+    load_operation_catalog,
     validate_platform,
 )
 
@@ -124,3 +133,87 @@ class TestGetHostnameCommandTemplate:
             get_hostname_command_template("unsupported_platform")
 
         assert "Unsupported platform: unsupported_platform" in str(exc_info.value)
+
+
+class TestCommandRegistry:
+    """Test cases for the precomputed command registry."""
+
+    def test_registry_covers_every_platform(self) -> None:
+        """Test every supported platform has a hostname template."""
+        assert SUPPORTED_PLATFORMS == {platform.value for platform in SupportedPlatform}
+        for platform in SupportedPlatform:
+            assert (platform.value, HOSTNAME_OPERATION) in COMMAND_REGISTRY
+
+    def test_registry_is_immutable(self) -> None:
+        """Test the registry cannot be modified at runtime."""
+        with pytest.raises(TypeError):
+            COMMAND_REGISTRY[("cisco_ios", "banner")] = None  # type: ignore[index]
+
+    def test_get_command_template_renders(self) -> None:
+        """Test the returned template carries a ready-to-call renderer."""
+        command_template = get_command_template("juniper_junos", HOSTNAME_OPERATION)
+
+        assert command_template is not None
+        assert command_template.template == "set system host-name {hostname}"
+        assert command_template.render(hostname="edge-1") == "set system host-name edge-1"
+
+    def test_get_command_template_unsupported(self) -> None:
+        """Test unsupported platforms and operations return None."""
+        assert get_command_template("unsupported_platform", HOSTNAME_OPERATION) is None
+        assert get_command_template("cisco_ios", "unsupported_operation") is None
+
+
+def _write_catalog(path: Path, parameters: dict, templates: dict) -> Path:
+    """Write a catalog with one operation named ``test``."""
+    catalog = path / "operations.json"
+    catalog.write_text(json.dumps({
+        "test": {"description": "Test", "parameters": parameters, "templates": templates}
+    }))
+    return catalog
+
+
+class TestOperationCatalog:
+    """Test cases for the declarative operation catalog."""
+
+    def test_default_catalog(self) -> None:
+        """Test the bundled catalog compiles into the registry."""
+        assert {"hostname", "ntp_server", "vlan", "banner"} <= set(OPERATIONS)
+        vlan = OPERATIONS["vlan"]
+        assert vlan.key == ("vlan_id",)
+        assert get_command_template("arista_eos", "vlan") is vlan.templates["arista_eos"]
+        assert get_command_template("cisco_iosxr", "vlan") is None
+        for operation in OPERATIONS.values():
+            for platform, template in operation.templates.items():
+                assert COMMAND_REGISTRY[(platform, operation.name)] is template
+
+    def test_load_catalog(self, tmp_path: Path) -> None:
+        """Test a valid catalog is loaded with compiled templates."""
+        catalog = _write_catalog(
+            tmp_path,
+            {"server": {"type": "ip"}},
+            {"cisco_ios": "ntp server {server}"}
+        )
+
+        operations = load_operation_catalog(catalog)
+
+        template = operations["test"].templates["cisco_ios"]
+        assert template.fields == ("server",)
+        assert template.render(server="10.0.0.1") == "ntp server 10.0.0.1"
+
+    @pytest.mark.parametrize(
+        ("parameters", "templates"),
+        [
+            ({"name": {"type": "string", "pattern": "^a$"}}, {"unknown": "x {name}"}),
+            ({"name": {"type": "string", "pattern": "^a$"}}, {"cisco_ios": "x {other}"}),
+            ({"name": {"type": "string"}}, {"cisco_ios": "x {name}"}),
+            ({"name": {"type": "list", "pattern": "^a$"}}, {"cisco_ios": "x {name}"}),
+            ({"device": {"type": "ip"}}, {"cisco_ios": "x {device}"}),
+            ({"name": {"pattern": "^a$"}}, {"cisco_ios": "x {name}"}),
+        ]
+    )
+    def test_malformed_catalog(self, tmp_path: Path, parameters: dict, templates: dict) -> None:
+        """Test malformed operations are rejected at load time."""
+        catalog = _write_catalog(tmp_path, parameters, templates)
+
+        with pytest.raises(ValueError):
+            load_operation_catalog(catalog)
@@ -0,0 +1 @@
+"""Transport tests module."""
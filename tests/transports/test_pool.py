@@ -0,0 +1,155 @@
+"""Tests for the device connection pool."""
+
+import asyncio
+
+import pytest
+
+from netconfig_api.transports.base import TransportError
+from netconfig_api.transports.pool import ConnectionPool
+from netconfig_api.transports.simulated import SimulatedTransport
+
+
+class TestConnectionPool:
+    """Test cases for ConnectionPool."""
+
+    @pytest.fixture
+    def transport(self) -> SimulatedTransport:
+        """Create a SimulatedTransport with a measurable handshake."""
+        return SimulatedTransport(handshake_latency=0.01)
+
+    @pytest.mark.asyncio
+    async def test_reuses_idle_session(self, transport: SimulatedTransport) -> None:
+        """Test sequential operations on a device share one session."""
+        pool = ConnectionPool(transport)
+
+        for _ in range(10):
+            async with pool.session("10.0.0.1", "cisco_ios") as session:
+                await session.send_config(["hostname r1"])
+
+        assert transport.handshakes == 1
+        assert pool.stats.hits == 9
+        assert pool.stats.misses == 1
+        assert pool.stats.hit_rate == pytest.approx(0.9)
+        assert pool.open_sessions == 1
+        assert pool.idle_sessions == 1
+
+    @pytest.mark.asyncio
+    async def test_pooling_avoids_handshake_latency(self) -> None:
+        """Test pooled operations are faster than reconnecting every time."""
+        transport = SimulatedTransport(handshake_latency=0.02)
+        pool = ConnectionPool(transport)
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        for _ in range(10):
+            async with pool.session("10.0.0.1", "cisco_ios") as session:
+                await session.send_config(["hostname r1"])
+        elapsed = loop.time() - started
+
+        assert elapsed < 10 * transport.handshake_latency / 2
+
+    @pytest.mark.asyncio
+    async def test_max_sessions_per_device(self, transport: SimulatedTransport) -> None:
+        """Test concurrent borrowers of one device wait for a free session."""
+        pool = ConnectionPool(transport, max_sessions_per_device=2)
+        peak = 0
+
+        async def borrow() -> None:
+            nonlocal peak
+            async with pool.session("10.0.0.1", "cisco_ios"):
+                peak = max(peak, pool.open_sessions - pool.idle_sessions)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(borrow() for _ in range(6)))
+
+        assert peak == 2
+        assert transport.handshakes == 2
+        assert pool.stats.waits > 0
+
+    @pytest.mark.asyncio
+    async def test_global_cap_evicts_lru_idle_session(
+        self,
+        transport: SimulatedTransport
+    ) -> None:
+        """Test the global cap evicts another device's idle session."""
+        pool = ConnectionPool(transport, max_sessions=2)
+
+        for device_ip in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+            async with pool.session(device_ip, "cisco_ios"):
+                pass
+
+        assert pool.open_sessions == 2
+        assert pool.stats.evictions == 1
+        assert transport.closes == 1
+
+        async with pool.session("10.0.0.3", "cisco_ios"):
+            pass
+        assert pool.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_block_discards_session(
+        self,
+        transport: SimulatedTransport
+    ) -> None:
+        """Test a session is closed rather than reused after an error."""
+        pool = ConnectionPool(transport)
+
+        with pytest.raises(TransportError):
+            async with pool.session("10.0.0.1", "cisco_ios"):
+                raise TransportError("session broke")
+
+        assert pool.open_sessions == 0
+        assert transport.closes == 1
+
+    @pytest.mark.asyncio
+    async def test_unreachable_device_releases_slot(
+        self,
+        transport: SimulatedTransport
+    ) -> None:
+        """Test a failed connect does not leak capacity."""
+        pool = ConnectionPool(transport, max_sessions_per_device=1)
+
+        for _ in range(3):
+            with pytest.raises(TransportError):
+                async with pool.session("10.0.0.254", "cisco_ios"):
+                    pass
+
+        assert pool.open_sessions == 0
+
+    @pytest.mark.asyncio
+    async def test_maintenance_evicts_idle_and_sends_keepalives(
+        self,
+        transport: SimulatedTransport
+    ) -> None:
+        """Test maintenance keeps fresh sessions alive and evicts stale ones."""
+        pool = ConnectionPool(transport, idle_timeout=0.05, keepalive_interval=0.0)
+
+        async with pool.session("10.0.0.1", "cisco_ios"):
+            pass
+
+        await pool.run_maintenance()
+        assert transport.keepalives == 1
+        assert pool.idle_sessions == 1
+
+        await asyncio.sleep(0.06)
+        await pool.run_maintenance()
+        assert pool.open_sessions == 0
+        assert pool.stats.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_close_closes_idle_sessions(
+        self,
+        transport: SimulatedTransport
+    ) -> None:
+        """Test closing the pool closes idle sessions and rejects new borrowers."""
+        pool = ConnectionPool(transport, maintenance_interval=0.01)
+        await pool.start()
+
+        async with pool.session("10.0.0.1", "cisco_ios"):
+            pass
+        await pool.close()
+
+        assert transport.closes == 1
+        with pytest.raises(TransportError):
+            async with pool.session("10.0.0.1", "cisco_ios"):
+                pass
@@ -0,0 +1,30 @@
+"""Tests for transports loaded by name on first use."""
+
+import pytest
+
+from netconfig_api.transports.registry import LazyTransport
+from netconfig_api.transports.simulated import SimulatedTransport
+
+
+class TestLazyTransport:
+    """Test cases for LazyTransport."""
+
+    def test_unknown_transport(self) -> None:
+        """Test an unknown transport name is rejected without importing anything."""
+        with pytest.raises(ValueError, match="Unknown transport: telnet"):
+            LazyTransport("telnet")
+
+    @pytest.mark.asyncio
+    async def test_loads_on_first_connect(self) -> None:
+        """Test the implementation is created with its options on first connect."""
+        transport = LazyTransport("simulated", base_config=["hostname router"])
+        assert not transport.loaded
+
+        session = await transport.connect("10.0.0.1", "cisco_ios")
+
+        assert transport.loaded
+        loaded = transport.load()
+        assert isinstance(loaded, SimulatedTransport)
+        assert loaded.handshakes == 1
+        assert await session.get_config() == "hostname router\n"
+        await session.close()